@@ -1,4 +1,5 @@
 import getopt
+import json
 import os
 import sys
 import logging
@@ -37,7 +38,19 @@ from pcs.cli.routing import (
     stonith,
     tag,
 )
+from pcs.common.communication_timing import CommunicationTiming
 from pcs.lib.errors import LibraryError
+from pcs.lib.pacemaker import cib_cache
+
+
+def _print_communication_timing(communication_timing):
+    print(
+        json.dumps(
+            {"communication_timing": communication_timing.get_summary()},
+            indent=2,
+        ),
+        file=sys.stderr,
+    )
 
 
 def _non_root_run(argv_cmd):
@@ -134,9 +147,10 @@ def main(argv=None):
     global filename, usefile
     utils.pcs_options = {}
 
-    # we want to support optional arguments for --wait, so if an argument
-    # is specified with --wait (ie. --wait=30) then we use them
+    # we want to support optional arguments for --wait and --watch, so if an
+    # argument is specified with them (ie. --wait=30) then we use them
     waitsecs = None
+    watchsecs = None
     new_argv = []
     for arg in argv:
         if arg.startswith("--wait="):
@@ -144,6 +158,11 @@ def main(argv=None):
             if tempsecs:
                 waitsecs = tempsecs
                 arg = "--wait"
+        elif arg.startswith("--watch="):
+            tempsecs = arg.replace("--watch=", "")
+            if tempsecs:
+                watchsecs = tempsecs
+                arg = "--watch"
         new_argv.append(arg)
     argv = new_argv
 
@@ -211,6 +230,8 @@ def main(argv=None):
             utils.filename = filename
         elif opt == "--corosync_conf":
             settings.corosync_conf_file = val
+        elif opt == "--debug-timing":
+            utils.communication_timing = CommunicationTiming()
         elif opt == "--version":
             print(settings.pcs_version)
             if full:
@@ -230,6 +251,8 @@ def main(argv=None):
             sys.exit()
         elif opt == "--wait":
             utils.pcs_options[opt] = waitsecs
+        elif opt == "--watch":
+            utils.pcs_options[opt] = watchsecs
         elif opt == "--request-timeout":
             request_timeout_valid = False
             try:
@@ -251,6 +274,9 @@ def main(argv=None):
     logger.propagate = 0
     logger.handlers = []
 
+    if not usefile:
+        cib_cache.enable()
+
     if (os.getuid() != 0) and (argv and argv[0] != "help") and not usefile:
         _non_root_run(argv)
     cmd_map = {
@@ -286,3 +312,6 @@ def main(argv=None):
         else:
             usage.main()
         sys.exit(1)
+    finally:
+        if utils.communication_timing is not None:
+            _print_communication_timing(utils.communication_timing)
@@ -10,3 +10,5 @@ class Env:
         self.known_hosts_getter = None
         self.debug = False
         self.request_timeout = None
+        self.communication_timing = None
+        self.wait_targeted = False
@@ -51,6 +51,8 @@ def cli_env_to_lib_env(cli_env):
         booth_files_data=cli_env.booth,
         known_hosts_getter=cli_env.known_hosts_getter,
         request_timeout=cli_env.request_timeout,
+        communication_timing=cli_env.communication_timing,
+        wait_targeted=cli_env.wait_targeted,
     )
 
 
@@ -170,6 +172,7 @@ def load_module(env, middleware_factory, name):
                 "stop_booth": booth.stop_booth,
                 "pull_config": booth.pull_config,
                 "get_status": booth.get_status,
+                "get_status_all": booth.get_status_all,
                 "ticket_grant": booth.ticket_grant,
                 "ticket_revoke": booth.ticket_revoke,
             },
@@ -284,6 +287,7 @@ def load_module(env, middleware_factory, name):
                 "standby_unstandby_all": node.standby_unstandby_all,
                 "standby_unstandby_list": node.standby_unstandby_list,
                 "standby_unstandby_local": node.standby_unstandby_local,
+                "update_nodes_attrs": node.update_nodes_attrs,
             },
         )
 
@@ -370,8 +374,10 @@ def load_module(env, middleware_factory, name):
                 "disable": resource.disable,
                 "disable_safe": resource.disable_safe,
                 "disable_simulate": resource.disable_simulate,
+                "disable_simulate_batch": resource.disable_simulate_batch,
                 "enable": resource.enable,
                 "get_failcounts": resource.get_failcounts,
+                "get_failcounts_summary": resource.get_failcounts_summary,
                 "group_add": resource.group_add,
                 "manage": resource.manage,
                 "move": resource.move,
@@ -407,6 +413,7 @@ def load_module(env, middleware_factory, name):
                 middleware_factory.corosync_conf_existing,
             ),
             {
+                "cluster_status_structured": status.cluster_status_structured,
                 "full_cluster_status_plaintext": (
                     status.full_cluster_status_plaintext
                 ),
@@ -22,6 +22,7 @@ ARG_TYPE_DELIMITER = "%"
 PCS_SHORT_OPTIONS = "hf:p:u:"
 PCS_LONG_OPTIONS = [
     "debug",
+    "debug-timing",
     "version",
     "help",
     "fullhelp",
@@ -35,6 +36,9 @@ PCS_LONG_OPTIONS = [
     "full",
     "local",
     "wait",
+    # resource commands - wait only for the resources to get to their expected
+    # state, do not wait for the cluster to settle
+    "wait-targeted",
     "config",
     "start",
     "enable",
@@ -67,6 +71,9 @@ PCS_LONG_OPTIONS = [
     "no-keys-sync",
     # in pcs status - do not display resource status on inactive node
     "hide-inactive",
+    # pcs status - refresh the status until interrupted
+    "watch",
+    "output-format=",
     # pcs resource (un)manage - enable or disable monitor operations
     "monitor",
     # TODO remove
@@ -449,6 +456,7 @@ class InputModifiers:
                 "--config": "--config" in options,
                 "--corosync": "--corosync" in options,
                 "--debug": "--debug" in options,
+                "--debug-timing": "--debug-timing" in options,
                 "--defaults": "--defaults" in options,
                 "--disabled": "--disabled" in options,
                 "--enable": "--enable" in options,
@@ -479,6 +487,7 @@ class InputModifiers:
                 "--skip-offline": "--skip-offline" in options,
                 "--start": "--start" in options,
                 "--strict": "--strict" in options,
+                "--wait-targeted": "--wait-targeted" in options,
                 # string values
                 "--after": options.get("--after", None),
                 "--before": options.get("--before", None),
@@ -489,9 +498,11 @@ class InputModifiers:
                 "--group": options.get("--group", None),
                 "--name": options.get("--name", None),
                 "--node": options.get("--node", None),
+                "--output-format": options.get("--output-format", None),
                 "--request-timeout": options.get("--request-timeout", None),
                 "--to": options.get("--to", None),
                 "--wait": options.get("--wait", False),
+                "--watch": options.get("--watch", False),
                 "-f": options.get("-f", None),
                 "-p": options.get("-p", None),
                 "-u": options.get("-u", None),
@@ -509,10 +520,10 @@ class InputModifiers:
         self, *supported_options, hint_syntax_changed: bool = False
     ):
         unsupported_options = (
-            # --debug is supported in all commands
+            # --debug and --debug-timing are supported in all commands
             self._defined_options
             - set(supported_options)
-            - set(["--debug"])
+            - set(["--debug", "--debug-timing"])
         )
         if unsupported_options:
             pluralize = lambda word: format_plural(unsupported_options, word)
@@ -549,6 +560,17 @@ class InputModifiers:
                 )
             )
 
+    def ensure_dependency_satisfied(self, main_option, dependent_options):
+        if main_option in self._defined_options:
+            return
+        missing_main = self._defined_options & set(dependent_options)
+        if missing_main:
+            raise CmdLineInputError(
+                "{} can be used only together with '{}'".format(
+                    format_list(sorted(missing_main)), main_option
+                )
+            )
+
     def is_specified(self, option: str) -> bool:
         return option in self._defined_options
 
@@ -3,6 +3,7 @@ from typing import (
     Any,
     Dict,
     Mapping,
+    Type,
 )
 
 from pcs.common import file_type_codes
@@ -19,7 +20,6 @@ from pcs.common.reports import (
     messages,
     types,
 )
-from pcs.common.tools import get_all_subclasses
 
 
 class CliReportMessage:
@@ -39,13 +39,33 @@ class CliReportMessage:
         return self._dto_obj.payload
 
 
+# report message code -> CLI class providing a custom message for it, filled
+# in when the classes are defined
+REPORT_MSG_MAP: Dict[str, Type["CliReportMessageCustom"]] = {}
+# CLI class -> class of its _obj, resolved once when the CLI class is defined
+_OBJ_CLASS_MAP: Dict[type, Type[item.ReportItemMessage]] = {}
+
+
 class CliReportMessageCustom(CliReportMessage):
     # pylint: disable=no-member
     _obj: item.ReportItemMessage
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)  # type: ignore
+        obj_class = get_type_hints(cls).get("_obj", item.ReportItemMessage)
+        if obj_class is item.ReportItemMessage:
+            return
+        _OBJ_CLASS_MAP[cls] = obj_class
+        # pylint: disable=protected-access
+        code = obj_class._code
+        if code:
+            if code in REPORT_MSG_MAP:
+                raise AssertionError()
+            REPORT_MSG_MAP[code] = cls
+
     def __init__(self, dto_obj: dto.ReportItemMessageDto) -> None:
         super().__init__(dto_obj)
-        self._obj = get_type_hints(self.__class__).get("_obj")(  # type: ignore
+        self._obj = _OBJ_CLASS_MAP[self.__class__](  # type: ignore
             **dto_obj.payload
         )
 
@@ -443,27 +463,20 @@ class UnableToGetAgentMetadata(CliReportMessageCustom):
         )
 
 
-def _create_report_msg_map() -> Dict[str, type]:
-    result: Dict[str, type] = {}
-    for report_msg_cls in get_all_subclasses(CliReportMessageCustom):
-        # pylint: disable=protected-access
-        code = (
-            get_type_hints(report_msg_cls)
-            .get("_obj", item.ReportItemMessage)
-            ._code
-        )
-        if code:
-            if code in result:
-                raise AssertionError()
-            result[code] = report_msg_cls
-    return result
-
+def report_item_msg_from_dto(obj: dto.ReportItemMessageDto) -> CliReportMessage:
+    return REPORT_MSG_MAP.get(obj.code, CliReportMessage)(obj)
 
-REPORT_MSG_MAP = _create_report_msg_map()
 
+def report_item_msg_text(obj: item.ReportItemMessage) -> str:
+    """
+    Return the text of a report message as it is shown by the CLI
 
-def report_item_msg_from_dto(obj: dto.ReportItemMessageDto) -> CliReportMessage:
-    return REPORT_MSG_MAP.get(obj.code, CliReportMessage)(obj)
+    The message is converted to a DTO only if the CLI has a custom text for it.
+    """
+    cli_msg_class = REPORT_MSG_MAP.get(obj.code)
+    if cli_msg_class is None:
+        return obj.message
+    return cli_msg_class(obj.to_dto()).message
 
 
 _file_role_to_option_translation: Mapping[file_type_codes.FileTypeCode, str] = {
@@ -6,7 +6,7 @@ from pcs.common.reports import (
     ReportItemList,
     ReportItemSeverity,
 )
-from .messages import report_item_msg_from_dto
+from .messages import report_item_msg_text
 
 
 def warn(message: str) -> None:
@@ -37,9 +37,8 @@ def process_library_reports(report_item_list: ReportItemList) -> None:
 
     critical_error = False
     for report_item in report_item_list:
-        report_dto = report_item.to_dto()
-        msg = report_item_msg_from_dto(report_dto.message).message
-        severity = report_dto.severity.level
+        msg = report_item_msg_text(report_item.message)
+        severity = report_item.severity.level
 
         if severity == ReportItemSeverity.WARNING:
             warn(msg)
@@ -9,7 +9,7 @@ from .output import (
     prepare_force_text,
     warn,
 )
-from .messages import report_item_msg_from_dto
+from .messages import report_item_msg_text
 
 
 class ReportProcessorToConsole(ReportProcessor):
@@ -18,9 +18,12 @@ class ReportProcessorToConsole(ReportProcessor):
         self.debug = debug
 
     def _do_report(self, report_item: ReportItem) -> None:
-        report_dto = report_item.to_dto()
-        msg = report_item_msg_from_dto(report_dto.message).message
-        severity = report_dto.severity.level
+        severity = report_item.severity.level
+        # debug reports may be many and big, do not even render them unless
+        # they are going to be printed
+        if severity == ReportItemSeverity.DEBUG and not self.debug:
+            return
+        msg = report_item_msg_text(report_item.message)
         if severity == ReportItemSeverity.ERROR:
             error(
                 "{msg}{force}".format(
@@ -29,5 +32,5 @@ class ReportProcessorToConsole(ReportProcessor):
             )
         elif severity == ReportItemSeverity.WARNING:
             warn(msg)
-        elif msg and (self.debug or severity != ReportItemSeverity.DEBUG):
+        elif msg:
             print(msg)
@@ -0,0 +1,132 @@
+"""
+Health of addresses of nodes remembered across requests and pcs processes
+
+A node may be reachable via several addresses (e.g. knet links). When one of
+them is down, trying it first makes each request to the node wait for the
+connection to time out. The cache remembers which addresses failed or worked
+recently, so the communicator tries the working ones first. Records expire,
+so a recovered address is preferred again eventually.
+"""
+import json
+import os
+import os.path
+import time
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from pcs import settings
+from pcs.common.host import Destination
+
+_KeyType = Tuple[str, str, Optional[int]]
+
+
+class AddressHealthCache:
+    def __init__(
+        self,
+        storage_path: Optional[str] = None,
+        expiry: Optional[float] = None,
+        get_time: Callable[[], float] = time.time,
+    ):
+        """
+        storage_path -- file to keep the records in, None for memory only
+        expiry -- seconds after which a record is not taken into account
+        get_time -- source of the current time
+        """
+        self._storage_path = storage_path
+        self._expiry = (
+            expiry if expiry is not None else settings.address_health_expiry
+        )
+        self._get_time = get_time
+        # key: (host label, addr, port), value: (is healthy, timestamp)
+        self._records: Dict[_KeyType, Tuple[bool, float]] = {}
+        self._changed = False
+
+    def load(self) -> "AddressHealthCache":
+        if self._storage_path is None:
+            return self
+        try:
+            with open(self._storage_path, encoding="utf-8") as storage:
+                record_list = json.load(storage)
+            for label, addr, port, healthy, timestamp in record_list:
+                self._records[(label, addr, port)] = (
+                    bool(healthy),
+                    float(timestamp),
+                )
+        except (OSError, ValueError, TypeError):
+            # the cache is just a hint, start from scratch if it is broken
+            self._records = {}
+        self._changed = False
+        return self
+
+    def save(self) -> None:
+        """
+        Store the records if they changed, expired records are dropped
+        """
+        if self._storage_path is None or not self._changed:
+            return
+        now = self._get_time()
+        record_list = [
+            [label, addr, port, healthy, timestamp]
+            for (label, addr, port), (healthy, timestamp) in sorted(
+                self._records.items(), key=lambda item: str(item[0])
+            )
+            if now - timestamp < self._expiry
+        ]
+        tmp_path = f"{self._storage_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(
+                os.path.dirname(self._storage_path), mode=0o700, exist_ok=True
+            )
+            with open(tmp_path, "w", encoding="utf-8") as storage:
+                json.dump(record_list, storage)
+            os.replace(tmp_path, self._storage_path)
+            self._changed = False
+        except OSError:
+            # e.g. running as a non-root user
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def mark_healthy(self, host_label: str, dest: Destination) -> None:
+        self._set(host_label, dest, True)
+
+    def mark_unhealthy(self, host_label: str, dest: Destination) -> None:
+        self._set(host_label, dest, False)
+
+    def _set(self, host_label: str, dest: Destination, healthy: bool) -> None:
+        self._records[(host_label, dest.addr, dest.port)] = (
+            healthy,
+            self._get_time(),
+        )
+        self._changed = True
+
+    def _get_health(
+        self, host_label: str, dest: Destination, now: float
+    ) -> Optional[bool]:
+        record = self._records.get((host_label, dest.addr, dest.port))
+        if record is None or now - record[1] >= self._expiry:
+            return None
+        return record[0]
+
+    def sort_dest_list(
+        self, host_label: str, dest_list: Sequence[Destination]
+    ) -> List[Destination]:
+        """
+        Return destinations in the order they should be tried in
+
+        Addresses known to work go first, addresses known to fail go last,
+        the original order is kept otherwise.
+        """
+        now = self._get_time()
+        order = {True: 0, None: 1, False: 2}
+        return sorted(
+            dest_list,
+            key=lambda dest: order[self._get_health(host_label, dest, now)],
+        )
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import (
+    Optional,
+    Sequence,
+)
+
+from pcs.common.interface.dto import DataTransferObject
+
+
+@dataclass(frozen=True)
+class BoothTicketStatusDto(DataTransferObject):
+    ticket: str
+    leader: Optional[str]
+    expires: Optional[str]
+    commit: Optional[str]
+
+
+@dataclass(frozen=True)
+class BoothInstanceStatusDto(DataTransferObject):
+    # pylint: disable=too-many-instance-attributes
+    instance_name: str
+    # None for the local host
+    host_name: Optional[str]
+    status_successfully_obtained: bool
+    daemon_running: bool
+    # site or arbitrator
+    daemon_type: Optional[str]
+    address: Optional[str]
+    ticket_list: Sequence[BoothTicketStatusDto]
+    peers_plaintext: str
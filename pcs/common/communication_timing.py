@@ -0,0 +1,139 @@
+"""
+Timing of requests to other nodes
+
+Communicators record each finished request into a CommunicationTiming
+instance if they have one. Times of the individual phases of requests are
+taken from curl, so it is possible to tell whether a node is slow to resolve,
+to connect to or to respond.
+"""
+import math
+from collections import defaultdict, namedtuple
+from typing import (
+    Any,
+    Dict,
+    List,
+    Sequence,
+)
+
+from pcs.common import pcs_pycurl as pycurl
+
+_PHASE_LIST = ("namelookup", "connect", "tls", "transfer", "total")
+
+
+class RequestTiming(
+    namedtuple(
+        "RequestTiming",
+        [
+            "host_label",
+            "addr",
+            "port",
+            "was_connected",
+            "attempt",
+            "namelookup",
+            "connect",
+            "tls",
+            "transfer",
+            "total",
+            "bytes_sent",
+            "bytes_received",
+        ],
+    )
+):
+    """
+    Times (in seconds) and sizes of one attempt to run a request
+
+    attempt -- number of addresses of the node tried before this one
+    namelookup -- time spent resolving the address
+    connect -- time spent establishing a TCP connection
+    tls -- time spent in the TLS handshake
+    transfer -- time from sending the request to receiving the whole response
+    total -- time of the whole attempt
+    """
+
+    @classmethod
+    def from_response(cls, response):
+        request = response.request
+        handle = response.handle
+
+        def getinfo(option):
+            return handle.getinfo(option) or 0
+
+        namelookup = getinfo(pycurl.NAMELOOKUP_TIME)
+        connect = getinfo(pycurl.CONNECT_TIME)
+        appconnect = getinfo(pycurl.APPCONNECT_TIME)
+        pretransfer = getinfo(pycurl.PRETRANSFER_TIME)
+        total = getinfo(pycurl.TOTAL_TIME)
+        return cls(
+            host_label=request.host_label,
+            addr=request.dest.addr,
+            port=request.dest.port,
+            was_connected=response.was_connected,
+            attempt=request.attempt,
+            namelookup=namelookup,
+            connect=max(0, connect - namelookup) if connect else 0,
+            tls=max(0, appconnect - connect) if appconnect else 0,
+            transfer=max(0, total - pretransfer) if pretransfer else 0,
+            total=total,
+            bytes_sent=len(request.encoded_data),
+            bytes_received=int(getinfo(pycurl.SIZE_DOWNLOAD)),
+        )
+
+
+class CommunicationTiming:
+    """
+    Collects timing of requests and provides a summary per node
+    """
+
+    def __init__(self):
+        self._timing_list: List[RequestTiming] = []
+
+    @property
+    def timing_list(self) -> List[RequestTiming]:
+        return list(self._timing_list)
+
+    def add_response(self, response) -> None:
+        self.add(RequestTiming.from_response(response))
+
+    def add(self, timing: RequestTiming) -> None:
+        self._timing_list.append(timing)
+
+    def get_summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return statistics of requests for each node
+
+        Times of phases are summarized by their median, 95th percentile and
+        maximum.
+        """
+        node_timing = defaultdict(list)
+        for timing in self._timing_list:
+            node_timing[timing.host_label].append(timing)
+        return {
+            host_label: _summarize(timing_list)
+            for host_label, timing_list in sorted(node_timing.items())
+        }
+
+
+def _summarize(timing_list: Sequence[RequestTiming]) -> Dict[str, Any]:
+    summary: Dict[str, Any] = {
+        "requests": len(timing_list),
+        "retries": sum(1 for timing in timing_list if timing.attempt > 0),
+        "connection_failures": sum(
+            1 for timing in timing_list if not timing.was_connected
+        ),
+        "bytes_sent": sum(timing.bytes_sent for timing in timing_list),
+        "bytes_received": sum(timing.bytes_received for timing in timing_list),
+    }
+    for phase in _PHASE_LIST:
+        value_list = sorted(getattr(timing, phase) for timing in timing_list)
+        summary[phase] = {
+            "p50": _percentile(value_list, 50),
+            "p95": _percentile(value_list, 95),
+            "max": value_list[-1],
+        }
+    return summary
+
+
+def _percentile(sorted_value_list: Sequence[float], percent: int) -> float:
+    # nearest-rank method, the result is always one of the measured values
+    rank = max(1, math.ceil(percent / 100 * len(sorted_value_list)))
+    return sorted_value_list[rank - 1]
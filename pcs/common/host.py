@@ -34,3 +34,62 @@ class PcsKnownHost(namedtuple("KnownHost", ["name", "token", "dest_list"])):
         if self.dest_list:
             return self.dest_list[0]
         return Destination(self.name, settings.pcsd_default_port)
+
+
+class KnownHostsIndex:
+    """
+    Known hosts looked up by their names and, as a fallback, by normalized
+    names and by addresses
+    """
+
+    def __init__(self, known_hosts):
+        """
+        dict known_hosts -- host name: PcsKnownHost
+        """
+        self._known_hosts = known_hosts
+        self._secondary_index = None
+
+    def get(self, host):
+        """
+        Return a PcsKnownHost matching the host or None
+
+        string host -- a host name or an address
+        """
+        known_host = self._known_hosts.get(host)
+        if known_host is not None:
+            return known_host
+        if self._secondary_index is None:
+            self._secondary_index = self._build_secondary_index()
+        return self._secondary_index.get(_normalize_host(host))
+
+    def _build_secondary_index(self):
+        name_index = {}
+        addr_index = {}
+        for known_host in self._known_hosts.values():
+            name_index.setdefault(_normalize_host(known_host.name), []).append(
+                known_host
+            )
+            for dest in known_host.dest_list:
+                addr_index.setdefault(_normalize_host(dest.addr), []).append(
+                    known_host
+                )
+        index = {}
+        # Only unambiguous entries are indexed, e.g. an address of an old
+        # entry may have been reused by a new host. Names take precedence over
+        # addresses.
+        for key_index in (addr_index, name_index):
+            for key, host_list in key_index.items():
+                unique_host_list = {host.name: host for host in host_list}
+                if len(unique_host_list) == 1:
+                    index[key] = host_list[0]
+                else:
+                    index.pop(key, None)
+        return index
+
+
+def _normalize_host(host):
+    # host names are case insensitive, IPv6 addresses may be in brackets
+    host = host.strip().lower()
+    if host.startswith("[") and host.endswith("]"):
+        host = host[1:-1]
+    return host.rstrip(".")
@@ -15,7 +15,11 @@ except ImportError:
 
 from pcs import settings
 from pcs.common import pcs_pycurl as pycurl
-from pcs.common.host import Destination
+from pcs.common.address_health import AddressHealthCache
+from pcs.common.host import (
+    Destination,
+    KnownHostsIndex,
+)
 
 
 def _find_value_for_possible_keys(value_dict, possible_key_list):
@@ -33,12 +37,20 @@ class HostNotFound(Exception):
 
 class NodeTargetFactory:
     def __init__(self, known_hosts):
-        self._known_hosts = known_hosts
+        self._known_hosts = KnownHostsIndex(known_hosts)
 
     def get_target(self, host_name):
         known_host = self._known_hosts.get(host_name)
         if known_host is None:
             raise HostNotFound(host_name)
+        if known_host.name != host_name:
+            # found by an address or a differently written name, keep the name
+            # the host has been referred to by
+            return RequestTarget(
+                host_name,
+                token=known_host.token,
+                dest_list=known_host.dest_list,
+            )
         return RequestTarget.from_known_host(known_host)
 
     def get_target_from_hostname(self, hostname):
@@ -49,11 +61,16 @@ class NodeTargetFactory:
 
 
 class RequestData(
-    namedtuple("RequestData", ["action", "structured_data", "data"])
+    namedtuple(
+        "RequestData", ["action", "structured_data", "data", "encoded_data"]
+    )
 ):
     """
     This class represents action and data asociated with action which will be
     send in request
+
+    Data are encoded only once, so one instance can be shared by requests to
+    many targets without copying the payload for each of them.
     """
 
     def __new__(cls, action, structured_data=()):
@@ -62,8 +79,9 @@ class RequestData(
         list structured_data -- list of tuples, data to send with specified
             action
         """
+        data = urlencode(structured_data)
         return super(RequestData, cls).__new__(
-            cls, action, structured_data, urlencode(structured_data)
+            cls, action, structured_data, data, data.encode("utf-8")
         )
 
 
@@ -108,16 +126,38 @@ class Request:
         """
         self._target = request_target
         self._data = request_data
-        self._current_dest_iterator = iter(self._target.dest_list)
-        self._current_dest = None
-        self.next_dest()
+        self._dest_list = list(self._target.dest_list)
+        self._dest_index = 0
 
     def next_dest(self):
         """
         Move to the next available host connection. Raises StopIteration when
         there is no connection to use.
         """
-        self._current_dest = next(self._current_dest_iterator)
+        if not self.has_next_dest:
+            raise StopIteration()
+        self._dest_index += 1
+
+    def set_dest_order(self, dest_list):
+        """
+        Try the destinations in the specified order and start with the first
+        one. Meant to be used before the request is sent.
+
+        list dest_list -- Destination list, destinations of the target
+        """
+        self._dest_list = list(dest_list)
+        self._dest_index = 0
+
+    @property
+    def has_next_dest(self):
+        return self._dest_index + 1 < len(self._dest_list)
+
+    @property
+    def attempt(self):
+        """
+        Number of destinations tried before the current one
+        """
+        return self._dest_index
 
     @property
     def url(self):
@@ -134,7 +174,7 @@ class Request:
 
     @property
     def dest(self):
-        return self._current_dest
+        return self._dest_list[self._dest_index]
 
     @property
     def host_label(self):
@@ -148,6 +188,10 @@ class Request:
     def data(self):
         return self._data.data
 
+    @property
+    def encoded_data(self):
+        return self._data.encoded_data
+
     @property
     def action(self):
         return self._data.action
@@ -250,11 +294,15 @@ class Response:
 
 
 class NodeCommunicatorFactory:
-    def __init__(self, communicator_logger, user, groups, request_timeout):
+    def __init__(
+        self, communicator_logger, user, groups, request_timeout, timing=None
+    ):
+        # pylint: disable=too-many-arguments
         self._logger = communicator_logger
         self._user = user
         self._groups = groups
         self._request_timeout = request_timeout
+        self._timing = timing
 
     def get_communicator(self, request_timeout=None):
         return self.get_simple_communicator(request_timeout=request_timeout)
@@ -262,13 +310,24 @@ class NodeCommunicatorFactory:
     def get_simple_communicator(self, request_timeout=None):
         timeout = request_timeout if request_timeout else self._request_timeout
         return Communicator(
-            self._logger, self._user, self._groups, request_timeout=timeout
+            self._logger,
+            self._user,
+            self._groups,
+            request_timeout=timeout,
+            timing=self._timing,
         )
 
     def get_multiaddress_communicator(self, request_timeout=None):
         timeout = request_timeout if request_timeout else self._request_timeout
         return MultiaddressCommunicator(
-            self._logger, self._user, self._groups, request_timeout=timeout
+            self._logger,
+            self._user,
+            self._groups,
+            request_timeout=timeout,
+            timing=self._timing,
+            address_health=AddressHealthCache(
+                settings.address_health_location
+            ).load(),
         )
 
 
@@ -281,8 +340,20 @@ class Communicator:
 
     curl_multi_select_timeout_default = 0.8  # in seconds
 
-    def __init__(self, communicator_logger, user, groups, request_timeout=None):
+    def __init__(
+        self,
+        communicator_logger,
+        user,
+        groups,
+        request_timeout=None,
+        timing=None,
+    ):
+        """
+        timing -- CommunicationTiming, records timing of finished requests
+        """
+        # pylint: disable=too-many-arguments
         self._logger = communicator_logger
+        self._timing = timing
         self._auth_cookies = _get_auth_cookies(user, groups)
         self._request_timeout = (
             request_timeout
@@ -308,14 +379,17 @@ class Communicator:
         list request_list -- Request objects to add to the queue
         """
         for request in request_list:
-            handle = _create_request_handle(
-                request, self._auth_cookies, self._request_timeout,
-            )
+            handle = self._create_handle(request)
             self._easy_handle_list.append(handle)
             self._multi_handle.add_handle(handle)
             if self._is_running:
                 self._logger.log_request_start(request)
 
+    def _create_handle(self, request):
+        return _create_request_handle(
+            request, self._auth_cookies, self._request_timeout,
+        )
+
     def start_loop(self):
         """
         Returns generator. When generator is invoked, all requests in queue
@@ -354,6 +428,8 @@ class Communicator:
                 # free up memory for next usage of this Communicator instance
                 self._multi_handle.remove_handle(response.handle)
                 self._logger.log_response(response)
+                if self._timing is not None:
+                    self._timing.add_response(response)
                 yield response
                 # if something was added to the queue in the meantime, run it
                 # immediately, so we don't need to wait until all responses will
@@ -412,10 +488,68 @@ class MultiaddressCommunicator(Communicator):
     it takes advantage of multiple hosts in RequestTarget. So if it is not
     possible to connect to target using first hostname, it will use next one
     until connection will be successful or there is no host left.
+
+    Addresses known to work are tried first and addresses known to be down
+    are tried last. Connecting to an address which is not the last one of its
+    target is limited by a short timeout, so a dead address does not hold
+    a request for the whole request timeout.
     """
 
+    def __init__(
+        self,
+        communicator_logger,
+        user,
+        groups,
+        request_timeout=None,
+        timing=None,
+        address_health=None,
+    ):
+        """
+        address_health -- AddressHealthCache, health of addresses
+        """
+        # pylint: disable=too-many-arguments
+        super().__init__(
+            communicator_logger,
+            user,
+            groups,
+            request_timeout=request_timeout,
+            timing=timing,
+        )
+        self._address_health = address_health
+
+    def add_requests(self, request_list):
+        if self._address_health is not None:
+            for request in request_list:
+                request.set_dest_order(
+                    self._address_health.sort_dest_list(
+                        request.host_label, request.target.dest_list
+                    )
+                )
+        super().add_requests(request_list)
+
+    def _create_handle(self, request):
+        handle = super()._create_handle(request)
+        if request.has_next_dest:
+            handle.setopt(
+                pycurl.CONNECTTIMEOUT,
+                min(
+                    settings.multiaddress_connect_timeout,
+                    self._request_timeout,
+                ),
+            )
+        return handle
+
     def start_loop(self):
         for response in super().start_loop():
+            if self._address_health is not None:
+                if response.was_connected:
+                    self._address_health.mark_healthy(
+                        response.request.host_label, response.request.dest
+                    )
+                else:
+                    self._address_health.mark_unhealthy(
+                        response.request.host_label, response.request.dest
+                    )
             if response.was_connected:
                 yield response
                 continue
@@ -423,10 +557,13 @@ class MultiaddressCommunicator(Communicator):
                 previous_dest = response.request.dest
                 response.request.next_dest()
                 self._logger.log_retry(response, previous_dest)
-                self.add_requests([response.request])
+                # keep the order of addresses of the request
+                super().add_requests([response.request])
             except StopIteration:
                 self._logger.log_no_more_addresses(response)
                 yield response
+        if self._address_health is not None:
+            self._address_health.save()
 
 
 class CommunicatorLoggerInterface:
@@ -508,7 +645,9 @@ def _create_request_handle(request, cookies, timeout):
     if cookies:
         handle.setopt(pycurl.COOKIE, _dict_to_cookies(cookies).encode("utf-8"))
     if request.data:
-        handle.setopt(pycurl.COPYPOSTFIELDS, request.data.encode("utf-8"))
+        # pycurl keeps a reference to the buffer, so curl does not need to
+        # copy it and requests with the same data share one buffer
+        handle.setopt(pycurl.POSTFIELDS, request.encoded_data)
     # add reference for request object and output bufers to handle, so later
     # we don't need to match these objects when they are returned from
     # pycurl after they've been processed
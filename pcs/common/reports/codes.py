@@ -152,6 +152,7 @@ LIVE_ENVIRONMENT_REQUIRED = M("LIVE_ENVIRONMENT_REQUIRED")
 LIVE_ENVIRONMENT_REQUIRED_FOR_LOCAL_NODE = M(
     "LIVE_ENVIRONMENT_REQUIRED_FOR_LOCAL_NODE"
 )
+CONFIG_RESTORE_NODE_FINISHED = M("CONFIG_RESTORE_NODE_FINISHED")
 COROSYNC_ADDRESS_IP_VERSION_WRONG_FOR_LINK = M(
     "COROSYNC_ADDRESS_IP_VERSION_WRONG_FOR_LINK"
 )
@@ -228,6 +229,7 @@ COROSYNC_TRANSPORT_UNSUPPORTED_OPTIONS = M(
     "COROSYNC_TRANSPORT_UNSUPPORTED_OPTIONS"
 )
 CRM_MON_ERROR = M("CRM_MON_ERROR")
+DEBUG_REPORTS_DROPPED = M("DEBUG_REPORTS_DROPPED")
 DEFAULTS_CAN_BE_OVERRIDEN = M("DEFAULTS_CAN_BE_OVERRIDEN")
 DEPRECATED_OPTION = M("DEPRECATED_OPTION")
 DR_CONFIG_ALREADY_EXIST = M("DR_CONFIG_ALREADY_EXIST")
@@ -273,6 +275,7 @@ NODE_ADDRESSES_ALREADY_EXIST = M("NODE_ADDRESSES_ALREADY_EXIST")
 NODE_ADDRESSES_CANNOT_BE_EMPTY = M("NODE_ADDRESSES_CANNOT_BE_EMPTY")
 NODE_ADDRESSES_DUPLICATION = M("NODE_ADDRESSES_DUPLICATION")
 NODE_ADDRESSES_UNRESOLVABLE = M("NODE_ADDRESSES_UNRESOLVABLE")
+NODE_ATTRIBUTE_NOT_FOUND = M("NODE_ATTRIBUTE_NOT_FOUND")
 NODE_COMMUNICATION_COMMAND_UNSUCCESSFUL = M(
     "NODE_COMMUNICATION_COMMAND_UNSUCCESSFUL"
 )
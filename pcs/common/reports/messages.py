@@ -917,6 +917,25 @@ class NodeCommunicationFinished(ReportItemMessage):
         )
 
 
+@dataclass(frozen=True)
+class DebugReportsDropped(ReportItemMessage):
+    """
+    Debug reports over a limit have not been kept
+
+    count -- number of debug reports which have not been kept
+    """
+
+    count: int
+    _code = codes.DEBUG_REPORTS_DROPPED
+
+    @property
+    def message(self) -> str:
+        return (
+            f"{self.count} debug {format_plural(self.count, 'report')} "
+            "dropped"
+        )
+
+
 @dataclass(frozen=True)
 class NodeCommunicationDebugInfo(ReportItemMessage):
     """
@@ -3119,6 +3138,27 @@ class ResourceOperationIntervalAdapted(ReportItemMessage):
         )
 
 
+@dataclass(frozen=True)
+class NodeAttributeNotFound(ReportItemMessage):
+    """
+    An attribute to be removed from a node is not set for the node
+
+    node -- specified node
+    attribute -- name of the attribute
+    """
+
+    node: str
+    attribute: str
+    _code = codes.NODE_ATTRIBUTE_NOT_FOUND
+
+    @property
+    def message(self) -> str:
+        return (
+            f"Attribute '{self.attribute}' does not exist for node "
+            f"'{self.node}'"
+        )
+
+
 @dataclass(frozen=True)
 class NodeNotFound(ReportItemMessage):
     """
@@ -4763,6 +4803,31 @@ class ClusterStartSuccess(ReportItemMessage):
         return f"{self.node}: Cluster started"
 
 
+@dataclass(frozen=True)
+class ConfigRestoreNodeFinished(ReportItemMessage):
+    """
+    Restoring configuration from a backup on a node has finished
+
+    node -- node the configuration has been restored on
+    node_result -- result returned by the node, None if the restore failed
+    finished_count -- number of nodes the restore has finished on so far
+    node_count -- number of all nodes the configuration is being restored on
+    """
+
+    node: str
+    node_result: Optional[str]
+    finished_count: int
+    node_count: int
+    _code = codes.CONFIG_RESTORE_NODE_FINISHED
+
+    @property
+    def message(self) -> str:
+        result = "Failed" if self.node_result is None else self.node_result
+        return (
+            f"{self.node}: {result} ({self.finished_count}/{self.node_count})"
+        )
+
+
 @dataclass(frozen=True)
 class ServiceNotInstalled(ReportItemMessage):
     node: str
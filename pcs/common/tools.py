@@ -2,12 +2,15 @@ from collections import namedtuple
 from enum import Enum
 import threading
 from typing import (
+    BinaryIO,
+    Iterable,
     MutableSet,
     Optional,
     TypeVar,
 )
 
 from lxml import etree
+from lxml.etree import _Element
 
 
 T = TypeVar("T", bound=type)
@@ -57,6 +60,34 @@ def xml_fromstring(xml):
     )
 
 
+def xml_fromstream(
+    stream: BinaryIO, skip_children_of: Iterable[str] = ()
+) -> _Element:
+    """
+    Parse xml while it is being read, without holding it whole in memory
+
+    stream -- binary file-like object to read the xml from
+    skip_children_of -- tags of elements to be kept empty, their children are
+        discarded as soon as they are parsed
+    """
+    skip_tags = frozenset(skip_children_of)
+    # depth of the currently parsed element within an element being emptied
+    skip_depth = 0
+    context = etree.iterparse(stream, events=("start", "end"), huge_tree=True)
+    for event, element in context:
+        if event == "start":
+            if skip_depth:
+                skip_depth += 1
+            elif element.tag in skip_tags:
+                skip_depth = 1
+        elif skip_depth:
+            skip_depth -= 1
+            if skip_depth:
+                element.clear()
+                element.getparent().remove(element)
+    return context.root
+
+
 class AutoNameEnum(str, Enum):
     def _generate_next_value_(name, start, count, last_values):
         # pylint: disable=no-self-argument
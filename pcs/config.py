@@ -55,12 +55,22 @@ from pcs.cli.reports.output import warn
 from pcs.common.reports import constraints as constraints_reports
 from pcs.common.str_tools import indent
 from pcs.lib.commands import quorum as lib_quorum
+from pcs.lib.communication.cluster import RestoreConfig
+from pcs.lib.communication.tools import run as run_com_cmd
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import is_service_running
 from pcs.lib.node import get_existing_nodes_names
 
 # pylint: disable=too-many-branches, too-many-locals, too-many-statements
 
+BACKUP_EXTENSIONS = {
+    ".tar.bz2": "bz2",
+    ".tar.gz": "gz",
+    ".tar.xz": "xz",
+}
+BACKUP_DEFAULT_EXTENSION = ".tar.bz2"
+BACKUP_DEFAULT_COMPRESSION = BACKUP_EXTENSIONS[BACKUP_DEFAULT_EXTENSION]
+
 
 def config_show(lib, argv, modifiers):
     """
@@ -236,32 +246,43 @@ def config_backup(lib, argv, modifiers):
         sys.exit(1)
 
     outfile_name = None
+    compression = BACKUP_DEFAULT_COMPRESSION
     if argv:
         outfile_name = argv[0]
-        if not outfile_name.endswith(".tar.bz2"):
-            outfile_name += ".tar.bz2"
+        for extension, extension_compression in BACKUP_EXTENSIONS.items():
+            if outfile_name.endswith(extension):
+                compression = extension_compression
+                break
+        else:
+            outfile_name += BACKUP_DEFAULT_EXTENSION
 
-    tar_data = config_backup_local()
+    # The tarball is written directly to its destination, so the files are
+    # never loaded in memory as a whole.
     if outfile_name:
-        ok, message = utils.write_file(
-            outfile_name, tar_data, permissions=0o600, binary=True
+        ok, message = utils.write_file_stream(
+            outfile_name,
+            lambda outfile: config_backup_local(outfile, compression),
+            permissions=0o600,
+            binary=True,
         )
         if not ok:
             utils.err(message)
     else:
         # in python3 stdout accepts str so we need to use buffer
-        sys.stdout.buffer.write(tar_data)
+        config_backup_local(sys.stdout.buffer, compression)
+        sys.stdout.buffer.flush()
 
 
-def config_backup_local():
+def config_backup_local(outfile, compression=BACKUP_DEFAULT_COMPRESSION):
     """
+    Write a tarball with the configuration files to a binary file object
+
     Commandline options: no options
     """
     file_list = config_backup_path_list()
-    tar_data = BytesIO()
 
     try:
-        tarball = tarfile.open(fileobj=tar_data, mode="w|bz2")
+        tarball = tarfile.open(fileobj=outfile, mode=f"w|{compression}")
         config_backup_add_version_to_tarball(tarball)
         for tar_path, path_info in file_list.items():
             if (
@@ -274,10 +295,6 @@ def config_backup_local():
     except (tarfile.TarError, EnvironmentError) as e:
         utils.err("unable to create tarball: %s" % e)
 
-    tar = tar_data.getvalue()
-    tar_data.close()
-    return tar
-
 
 def config_restore(lib, argv, modifiers):
     """
@@ -403,13 +420,15 @@ def config_restore_remote(infile_name, infile_obj):
         with open(infile_name, "rb") as tarball:
             tarball_data = tarball.read()
 
-    error_list = []
-    for node in node_list:
-        retval, error = utils.restoreConfig(node, tarball_data)
-        if retval != 0:
-            error_list.append(error)
-    if error_list:
-        utils.err("unable to restore all nodes\n" + "\n".join(error_list))
+    lib_env = utils.get_lib_env()
+    target_factory = lib_env.get_node_target_factory()
+    com_cmd = RestoreConfig(lib_env.report_processor, tarball_data)
+    com_cmd.set_targets(
+        [target_factory.get_target_from_hostname(node) for node in node_list]
+    )
+    run_com_cmd(lib_env.get_node_communicator(), com_cmd)
+    if com_cmd.has_errors:
+        utils.err("unable to restore all nodes")
 
 
 def config_restore_local(infile_name, infile_obj):
@@ -5,6 +5,8 @@ import xml.dom.minidom
 from xml.dom.minidom import parseString
 from enum import Enum
 
+from lxml import etree
+
 from pcs import (
     rule as rule_utils,
     settings,
@@ -254,9 +256,9 @@ def colocation_add(lib, argv, modifiers):
 
     score, nv_pairs = _parse_score_options(argv)
 
-    cib_dom = utils.get_cib_dom()
-    _validate_constraint_resource(cib_dom, resource1)
-    _validate_constraint_resource(cib_dom, resource2)
+    cib = utils.get_cib_facade()
+    _validate_constraint_resource(cib, resource1)
+    _validate_constraint_resource(cib, resource2)
 
     id_in_nvpairs = None
     for name, value in nv_pairs:
@@ -264,7 +266,7 @@ def colocation_add(lib, argv, modifiers):
             id_valid, id_error = utils.validate_xml_id(value, "constraint id")
             if not id_valid:
                 utils.err(id_error)
-            if utils.does_id_exist(cib_dom, value):
+            if utils.does_id_exist(cib, value):
                 utils.err(
                     "id '%s' is already in use, please specify another one"
                     % value
@@ -275,31 +277,30 @@ def colocation_add(lib, argv, modifiers):
             (
                 "id",
                 utils.find_unique_id(
-                    cib_dom,
-                    "colocation-%s-%s-%s" % (resource1, resource2, score),
+                    cib, "colocation-%s-%s-%s" % (resource1, resource2, score),
                 ),
             )
         )
 
-    (dom, constraintsElement) = getCurrentConstraints(cib_dom)
+    constraints_el = _get_facade_constraints(cib)
 
     # If one role is specified, the other should default to "started"
     if role1 != "" and role2 == "":
         role2 = DEFAULT_ROLE
     if role2 != "" and role1 == "":
         role1 = DEFAULT_ROLE
-    element = dom.createElement("rsc_colocation")
-    element.setAttribute("rsc", resource1)
-    element.setAttribute("with-rsc", resource2)
-    element.setAttribute("score", score)
+    element = etree.Element("rsc_colocation")
+    element.set("rsc", resource1)
+    element.set("with-rsc", resource2)
+    element.set("score", score)
     if role1 != "":
-        element.setAttribute("rsc-role", role1)
+        element.set("rsc-role", role1)
     if role2 != "":
-        element.setAttribute("with-rsc-role", role2)
+        element.set("with-rsc-role", role2)
     for nv_pair in nv_pairs:
-        element.setAttribute(nv_pair[0], nv_pair[1])
+        element.set(nv_pair[0], nv_pair[1])
     if not modifiers.get("--force"):
-        duplicates = colocation_find_duplicates(constraintsElement, element)
+        duplicates = colocation_find_duplicates(cib, element)
         if duplicates:
             utils.err(
                 "duplicate constraint already exists, use --force to override\n"
@@ -307,34 +308,37 @@ def colocation_add(lib, argv, modifiers):
                     [
                         "  "
                         + colocation_format.constraint_plain(
-                            {"options": dict(dup.attributes.items())}, True
+                            {"options": dict(dup.attrib)}, True
                         )
                         for dup in duplicates
                     ]
                 )
             )
-    constraintsElement.appendChild(element)
-    utils.replace_cib_configuration(dom)
+    cib.append(constraints_el, element)
+    utils.replace_cib_configuration(cib)
 
 
-def colocation_find_duplicates(dom, constraint_el):
+def colocation_find_duplicates(cib, constraint_el):
     """
     Commandline options: no options
+
+    CibFacade cib -- the CIB to search for duplicates in
+    etree constraint_el -- the constraint to find duplicates of
     """
 
     def normalize(const_el):
         return (
-            const_el.getAttribute("rsc"),
-            const_el.getAttribute("with-rsc"),
-            const_el.getAttribute("rsc-role").capitalize() or DEFAULT_ROLE,
-            const_el.getAttribute("with-rsc-role").capitalize() or DEFAULT_ROLE,
+            const_el.get("rsc", ""),
+            const_el.get("with-rsc", ""),
+            const_el.get("rsc-role", "").capitalize() or DEFAULT_ROLE,
+            const_el.get("with-rsc-role", "").capitalize() or DEFAULT_ROLE,
         )
 
     normalized_el = normalize(constraint_el)
     return [
         other_el
-        for other_el in dom.getElementsByTagName("rsc_colocation")
-        if not other_el.getElementsByTagName("resource_set")
+        for other_el in cib.get_elements_by_tag("rsc_colocation")
+        if other_el.find(".//resource_set") is None
         and constraint_el is not other_el
         and normalized_el == normalize(other_el)
     ]
@@ -442,9 +446,9 @@ def _order_add(resource1, resource2, options_list, modifiers):
       * -f - CIB file
       * --force - allow constraint for any resource, allow duplicate constraints
     """
-    cib_dom = utils.get_cib_dom()
-    _validate_constraint_resource(cib_dom, resource1)
-    _validate_constraint_resource(cib_dom, resource2)
+    cib = utils.get_cib_facade()
+    _validate_constraint_resource(cib, resource1)
+    _validate_constraint_resource(cib, resource2)
 
     order_options = []
     id_specified = False
@@ -462,7 +466,7 @@ def _order_add(resource1, resource2, options_list, modifiers):
                 )
                 if not id_valid:
                     utils.err(id_error)
-                if utils.does_id_exist(cib_dom, value):
+                if utils.does_id_exist(cib, value):
                     utils.err(
                         "id '%s' is already in use, please specify another one"
                         % value
@@ -506,18 +510,17 @@ def _order_add(resource1, resource2, options_list, modifiers):
 
     if not id_specified:
         order_id = "order-" + resource1 + "-" + resource2 + "-" + id_suffix
-        order_id = utils.find_unique_id(cib_dom, order_id)
+        order_id = utils.find_unique_id(cib, order_id)
         order_options.append(("id", order_id))
 
-    (dom, constraintsElement) = getCurrentConstraints()
-    element = dom.createElement("rsc_order")
-    element.setAttribute("first", resource1)
-    element.setAttribute("then", resource2)
+    element = etree.Element("rsc_order")
+    element.set("first", resource1)
+    element.set("then", resource2)
     for order_opt in order_options:
-        element.setAttribute(order_opt[0], order_opt[1])
-    constraintsElement.appendChild(element)
+        element.set(order_opt[0], order_opt[1])
+    cib.append(_get_facade_constraints(cib), element)
     if not modifiers.get("--force"):
-        duplicates = order_find_duplicates(constraintsElement, element)
+        duplicates = order_find_duplicates(cib, element)
         if duplicates:
             utils.err(
                 "duplicate constraint already exists, use --force to override\n"
@@ -525,7 +528,7 @@ def _order_add(resource1, resource2, options_list, modifiers):
                     [
                         "  "
                         + order_format.constraint_plain(
-                            {"options": dict(dup.attributes.items())}, True
+                            {"options": dict(dup.attrib)}, True
                         )
                         for dup in duplicates
                     ]
@@ -542,29 +545,30 @@ def _order_add(resource1, resource2, options_list, modifiers):
         + options
     )
 
-    utils.replace_cib_configuration(dom)
+    utils.replace_cib_configuration(cib)
 
 
-def order_find_duplicates(dom, constraint_el):
+def order_find_duplicates(cib, constraint_el):
     """
     Commandline options: no options
+
+    CibFacade cib -- the CIB to search for duplicates in
+    etree constraint_el -- the constraint to find duplicates of
     """
 
     def normalize(constraint_el):
-        # pylint: disable=line-too-long
         return (
-            constraint_el.getAttribute("first"),
-            constraint_el.getAttribute("then"),
-            constraint_el.getAttribute("first-action").lower()
-            or DEFAULT_ACTION,
-            constraint_el.getAttribute("then-action").lower() or DEFAULT_ACTION,
+            constraint_el.get("first", ""),
+            constraint_el.get("then", ""),
+            constraint_el.get("first-action", "").lower() or DEFAULT_ACTION,
+            constraint_el.get("then-action", "").lower() or DEFAULT_ACTION,
         )
 
     normalized_el = normalize(constraint_el)
     return [
         other_el
-        for other_el in dom.getElementsByTagName("rsc_order")
-        if not other_el.getElementsByTagName("resource_set")
+        for other_el in cib.get_elements_by_tag("rsc_order")
+        if other_el.find(".//resource_set") is None
         and constraint_el is not other_el
         and normalized_el == normalize(other_el)
     ]
@@ -1040,56 +1044,53 @@ def location_add(lib, argv, modifiers, skip_score_and_node_check=False):
         required_version = 2, 6, 0
 
     if required_version:
-        dom = utils.cluster_upgrade_to_version(required_version)
+        cib = utils.cluster_upgrade_to_version(required_version, facade=True)
     else:
-        dom = utils.get_cib_dom()
+        cib = utils.get_cib_facade()
 
     if rsc_type == RESOURCE_TYPE_RESOURCE:
         (
             rsc_valid,
             rsc_error,
             dummy_correct_id,
-        ) = utils.validate_constraint_resource(dom, rsc_value)
+        ) = utils.validate_constraint_resource(cib, rsc_value)
         if not rsc_valid:
             utils.err(rsc_error)
 
     # Verify current constraint doesn't already exist
     # If it does we replace it with the new constraint
-    dummy_dom, constraintsElement = getCurrentConstraints(dom)
-    elementsToRemove = []
+    constraints_el = _get_facade_constraints(cib)
     # If the id matches, or the rsc & node match, then we replace/remove
-    for rsc_loc in constraintsElement.getElementsByTagName("rsc_location"):
+    for rsc_loc in cib.get_elements_by_tag("rsc_location"):
         # pylint: disable=too-many-boolean-expressions
-        if rsc_loc.getAttribute("id") == constraint_id or (
-            rsc_loc.getAttribute("node") == node
+        if rsc_loc.get("id") == constraint_id or (
+            rsc_loc.get("node") == node
             and (
                 (
                     RESOURCE_TYPE_RESOURCE == rsc_type
-                    and rsc_loc.getAttribute("rsc") == rsc_value
+                    and rsc_loc.get("rsc") == rsc_value
                 )
                 or (
                     RESOURCE_TYPE_REGEXP == rsc_type
-                    and rsc_loc.getAttribute("rsc-pattern") == rsc_value
+                    and rsc_loc.get("rsc-pattern") == rsc_value
                 )
             )
         ):
-            elementsToRemove.append(rsc_loc)
-    for etr in elementsToRemove:
-        constraintsElement.removeChild(etr)
+            cib.remove(rsc_loc)
 
-    element = dom.createElement("rsc_location")
-    element.setAttribute("id", constraint_id)
+    element = etree.Element("rsc_location")
+    element.set("id", constraint_id)
     if rsc_type == RESOURCE_TYPE_RESOURCE:
-        element.setAttribute("rsc", rsc_value)
+        element.set("rsc", rsc_value)
     elif rsc_type == RESOURCE_TYPE_REGEXP:
-        element.setAttribute("rsc-pattern", rsc_value)
-    element.setAttribute("node", node)
-    element.setAttribute("score", score)
+        element.set("rsc-pattern", rsc_value)
+    element.set("node", node)
+    element.set("score", score)
     for option in options:
-        element.setAttribute(option[0], option[1])
-    constraintsElement.appendChild(element)
+        element.set(option[0], option[1])
+    cib.append(constraints_el, element)
 
-    utils.replace_cib_configuration(dom)
+    utils.replace_cib_configuration(cib)
 
 
 def location_remove(lib, argv, modifiers):
@@ -1296,6 +1297,18 @@ def getCurrentConstraints(passed_dom=None):
     return (dom, constraintsElement)
 
 
+def _get_facade_constraints(cib):
+    """
+    Commandline options: no options
+
+    CibFacade cib -- the CIB to get the constraints section from
+    """
+    constraints_el = cib.get_section("configuration/constraints")
+    if constraints_el is None:
+        utils.err("unable to process cib")
+    return constraints_el
+
+
 # If returnStatus is set, then we don't error out, we just print the error
 # and return false
 def constraint_rm(
@@ -1315,6 +1328,9 @@ def constraint_rm(
     if not argv:
         raise CmdLineInputError()
 
+    if passed_dom is None and constraintsElement is None:
+        return _constraint_rm_in_cib(argv, returnStatus)
+
     bad_constraint = False
     if len(argv) != 1:
         for arg in argv:
@@ -1366,6 +1382,56 @@ def constraint_rm(
     return None
 
 
+def _constraint_rm_in_cib(constraint_id_list, return_status):
+    """
+    Commandline options:
+      * -f - CIB file
+    """
+    # load and push the CIB only once no matter how many constraints are
+    # being removed
+    cib = utils.get_cib_facade()
+    bad_constraint = False
+    element_removed = False
+    for c_id in constraint_id_list:
+        if _constraint_rm_from_facade(cib, c_id):
+            element_removed = True
+        else:
+            utils.err("Unable to find constraint - '%s'" % c_id, False)
+            bad_constraint = True
+    if element_removed:
+        utils.replace_cib_configuration(cib)
+    if bad_constraint:
+        if return_status and len(constraint_id_list) == 1:
+            return False
+        sys.exit(1)
+    return True if return_status else None
+
+
+def _constraint_rm_from_facade(cib, c_id):
+    """
+    Remove a constraint or a constraint rule, return True if found
+
+    CibFacade cib -- the CIB to remove the constraint from
+    string c_id -- id of a constraint or a rule in a location constraint
+    """
+    element = cib.get_element_by_id(c_id)
+    constraints_el = cib.get_section("configuration/constraints")
+    if element is None or constraints_el is None:
+        return False
+    if element.getparent() is constraints_el:
+        cib.remove(element)
+        return True
+    if element.tag == "rule" and any(
+        ancestor is constraints_el for ancestor in element.iterancestors()
+    ):
+        parent = element.getparent()
+        cib.remove(element)
+        if not parent.findall(".//rule"):
+            cib.remove(parent)
+        return True
+    return False
+
+
 def constraint_ref(lib, argv, modifiers):
     """
     Options:
@@ -1442,6 +1508,85 @@ def remove_constraints_containing(
     return None
 
 
+def remove_constraints_containing_from_facade(cib, resource_id, output=False):
+    """
+    Commandline options: no options
+
+    CibFacade cib -- the CIB to remove the constraints from
+    string resource_id -- remove constraints referencing this resource
+    bool output -- print removed constraints
+    """
+    constraints, set_constraints = _find_constraints_containing_in_facade(
+        cib, resource_id
+    )
+    for c_id in constraints:
+        if output:
+            print("Removing Constraint - " + c_id)
+        _constraint_rm_from_facade(cib, c_id)
+
+    if set_constraints:
+        for resource_ref in cib.get_elements_by_tag("resource_ref"):
+            # If resource id is in a set, remove it from the set, if the set
+            # is empty, then we remove the set, if the parent of the set
+            # is empty then we remove it
+            if resource_ref.get("id") != resource_id:
+                continue
+            set_el = resource_ref.getparent()
+            cib.remove(resource_ref)
+            if output:
+                print(
+                    "Removing %s from set %s" % (resource_id, set_el.get("id"))
+                )
+            if set_el.find(".//resource_ref") is None:
+                print("Removing set %s" % set_el.get("id"))
+                set_constraint = set_el.getparent()
+                cib.remove(set_el)
+                if set_constraint.find(".//resource_set") is None:
+                    cib.remove(set_constraint)
+                    print("Removing constraint %s" % set_constraint.get("id"))
+
+
+def _find_constraints_containing_in_facade(cib, resource_id):
+    """
+    Commandline options: no options
+
+    CibFacade cib -- the CIB to look for the constraints in
+    string resource_id -- look for constraints referencing this resource
+    """
+    constraints_found = []
+    set_constraints = set()
+
+    resource_el = cib.get_resource(resource_id)
+    if resource_el is not None and resource_el.getparent().tag in (
+        "master",
+        "clone",
+    ):
+        (
+            constraints_found,
+            parent_set_constraints,
+        ) = _find_constraints_containing_in_facade(
+            cib, resource_el.getparent().get("id")
+        )
+        set_constraints.update(parent_set_constraints)
+
+    if cib.get_section("configuration/constraints") is None:
+        return [], []
+
+    attr_to_match = ["rsc", "first", "then", "with-rsc"]
+    for tag in ("rsc_colocation", "rsc_location", "rsc_order", "rsc_ticket"):
+        for constraint_el in cib.get_elements_by_tag(tag):
+            if any(
+                constraint_el.get(attr) == resource_id for attr in attr_to_match
+            ):
+                constraints_found.append(constraint_el.get("id"))
+
+    for resource_ref in cib.get_elements_by_tag("resource_ref"):
+        if resource_ref.get("id") == resource_id:
+            set_constraints.add(resource_ref.getparent().getparent().get("id"))
+
+    return constraints_found, list(set_constraints)
+
+
 def find_constraints_containing(resource_id, passed_dom=None):
     """
     Commandline options:
@@ -1507,6 +1652,21 @@ def remove_constraints_containing_node(dom, node, output=False):
     return dom
 
 
+def remove_constraints_containing_node_from_facade(cib, node, output=False):
+    """
+    Commandline options: no options
+
+    CibFacade cib -- the CIB to remove the constraints from
+    string node -- remove location constraints of this node
+    bool output -- print removed constraints
+    """
+    for constraint_el in cib.get_elements_by_tag("rsc_location"):
+        if constraint_el.get("node") == node:
+            if output:
+                print("Removing Constraint - %s" % constraint_el.get("id"))
+            cib.remove(constraint_el)
+
+
 def find_constraints_containing_node(dom, node):
     """
     Commandline options: no options
@@ -1520,25 +1680,27 @@ def find_constraints_containing_node(dom, node):
 
 # Re-assign any constraints referencing a resource to its parent (a clone
 # or master)
-def constraint_resource_update(old_id, dom):
+def constraint_resource_update(old_id, cib):
     """
     Commandline options: no options
+
+    CibFacade cib -- the CIB to update the constraints in
     """
-    new_id = None
-    clone_ms_parent = utils.dom_get_resource_clone_ms_parent(dom, old_id)
-    if clone_ms_parent:
-        new_id = clone_ms_parent.getAttribute("id")
-
-    if new_id:
-        constraints = dom.getElementsByTagName("rsc_location")
-        constraints += dom.getElementsByTagName("rsc_order")
-        constraints += dom.getElementsByTagName("rsc_colocation")
-        attrs_to_update = ["rsc", "first", "then", "with-rsc"]
-        for constraint in constraints:
+    resource_el = cib.get_any_resource(old_id)
+    if resource_el is None or resource_el.tag not in ("primitive", "group"):
+        return cib
+    clone_ms_parent = next(resource_el.iterancestors("clone", "master"), None)
+    if clone_ms_parent is None:
+        return cib
+
+    new_id = clone_ms_parent.get("id")
+    attrs_to_update = ["rsc", "first", "then", "with-rsc"]
+    for tag in ("rsc_location", "rsc_order", "rsc_colocation"):
+        for constraint_el in cib.get_elements_by_tag(tag):
             for attr in attrs_to_update:
-                if constraint.getAttribute(attr) == old_id:
-                    constraint.setAttribute(attr, new_id)
-    return dom
+                if constraint_el.get(attr) == old_id:
+                    constraint_el.set(attr, new_id)
+    return cib
 
 
 def constraint_rule(lib, argv, modifiers):
@@ -0,0 +1,88 @@
+import json
+
+from pcs.daemon import ruby_pcsd
+from pcs.daemon.app.sinatra_common import Sinatra
+from pcs.daemon.cluster_status import (
+    STATUS_FIELDS,
+    StatusCache,
+    StatusLoadError,
+)
+
+
+class ClusterStatus(Sinatra):
+    """
+    ClusterStatus serves structured status of cluster nodes and resources. The
+    status is loaded here while authentication and permissions are still
+    checked by the ruby pcsd.
+    """
+
+    def initialize(
+        self, ruby_pcsd_wrapper: ruby_pcsd.Wrapper, status_cache: StatusCache
+    ):
+        # pylint: disable=arguments-differ, attribute-defined-outside-init
+        super().initialize(ruby_pcsd_wrapper)
+        self.__status_cache = status_cache
+
+    def __get_fields(self):
+        fields = [
+            field
+            for value in self.get_query_arguments("fields")
+            for field in value.split(",")
+            if field
+        ]
+        return fields if fields else STATUS_FIELDS
+
+    async def get(self, *args, **kwargs):
+        del args, kwargs
+        fields = self.__get_fields()
+        unknown_fields = sorted(set(fields) - set(STATUS_FIELDS))
+        if unknown_fields:
+            self.set_status(400)
+            self.write(
+                "Unknown fields '{0}', supported fields are '{1}'".format(
+                    "', '".join(unknown_fields), "', '".join(STATUS_FIELDS)
+                )
+            )
+            return
+
+        auth_result = await self.ruby_pcsd_wrapper.request_permission_check(
+            self.request, "read"
+        )
+        if auth_result.status != 200:
+            self.send_sinatra_result(auth_result)
+            return
+        auth_user = json.loads(auth_result.body)
+
+        self.set_header("Content-Type", "application/json")
+        try:
+            snapshot = await self.__status_cache.get(
+                auth_user["username"], auth_user["usergroups"]
+            )
+        except StatusLoadError as e:
+            self.set_status(500)
+            self.write(json.dumps({"report_list": e.report_list}))
+            return
+
+        body, etag = snapshot.render(fields)
+        # Clients are expected to ask for the status every time, they only
+        # skip downloading it if it has not changed.
+        self.set_header("Cache-Control", "no-cache")
+        self.set_header("Etag", etag)
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+        self.write(body)
+
+
+def get_routes(
+    ruby_pcsd_wrapper: ruby_pcsd.Wrapper, status_cache: StatusCache,
+):
+    return [
+        (
+            r"/remote/cluster_status_structured",
+            ClusterStatus,
+            dict(
+                ruby_pcsd_wrapper=ruby_pcsd_wrapper, status_cache=status_cache
+            ),
+        ),
+    ]
@@ -1,4 +1,7 @@
-import os.path
+import os
+import stat
+
+from tornado.template import Template
 
 from pcs.daemon import session
 from pcs.daemon.app import session as app_session
@@ -9,6 +12,10 @@ from pcs.daemon.app.ui_common import AjaxMixin, StaticFile
 class SPAHandler(BaseHandler):
     __index = None
     __fallback = None
+    # Loaded page templates: path -> ((modification time, size), template).
+    # The templates are loaded and compiled only when their files change, they
+    # are rendered for each request.
+    __template_cache = {}
 
     def initialize(self, index, fallback):
         # pylint: disable=arguments-differ
@@ -19,13 +26,33 @@ class SPAHandler(BaseHandler):
 
     def get(self, *args, **kwargs):
         del args, kwargs
-        self.render(
-            self.__index
-            if os.path.isfile(str(self.__index))
-            # spa is probably not installed
-            else self.__fallback
+        # The page is small, let the browser check it by its etag every time.
+        self.set_header("Cache-Control", "no-cache")
+        self.write(
+            self.__get_template().generate(**self.get_template_namespace())
         )
 
+    def __get_template(self):
+        try:
+            page_path = self.__index
+            page_stat = os.stat(str(page_path))
+            if not stat.S_ISREG(page_stat.st_mode):
+                raise FileNotFoundError(page_path)
+        except OSError:
+            # spa is probably not installed
+            page_path = self.__fallback
+            page_stat = os.stat(page_path)
+
+        version = (page_stat.st_mtime_ns, page_stat.st_size)
+        cached = self.__template_cache.get(page_path, None)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        with open(page_path, "rb") as page_file:
+            template = Template(page_file.read(), name=page_path)
+        self.__template_cache[page_path] = (version, template)
+        return template
+
 
 class Login(SPAHandler, app_session.Mixin, AjaxMixin):
     def initialize(self, session_storage, index, fallback):
@@ -1,3 +1,7 @@
+import mimetypes
+import os.path
+import re
+
 from tornado.web import Finish, StaticFileHandler
 
 from pcs.daemon.app.common import EnhanceHeadersMixin
@@ -22,13 +26,33 @@ class AjaxMixin:
         return Finish()
 
 
+# Variants of static files compressed during build (see Makefile), in the order
+# of preference.
+PRECOMPRESSED_VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+
+# Names of web UI build assets contain a hash of their content, e.g.
+# main.0a1b2c3d.chunk.js. Such a file never changes, a new name is used instead.
+HASHED_FILE_NAME = re.compile(r"\.[0-9a-f]{8,}(\.chunk)?\.\w+$")
+HASHED_FILE_CACHE_SECONDS = 60 * 60 * 24 * 365
+
+
+def get_accepted_encodings(accept_encoding_header):
+    accepted = set()
+    for item in accept_encoding_header.split(","):
+        encoding, *params = [part.strip() for part in item.split(";")]
+        if any(param.replace(" ", "") in ("q=0", "q=0.0") for param in params):
+            continue
+        accepted.add(encoding.lower())
+    return accepted
+
+
 class StaticFile(EnhanceHeadersMixin, StaticFileHandler):
     # abstract method `data_received` does need to be overriden. This
     # method should be implemented to handle streamed request data.
     # BUT static files are not streamed SO:
     # pylint: disable=abstract-method
     def initialize(self, path, default_filename=None):
-        # pylint: disable=arguments-differ
+        # pylint: disable=arguments-differ, attribute-defined-outside-init
         super().initialize(path, default_filename)
         # In ruby server the header X-Content-Type-Options was sent and we
         # keep it here to keep compatibility for simplifying testing. There is
@@ -36,3 +60,52 @@ class StaticFile(EnhanceHeadersMixin, StaticFileHandler):
         # future.
         self.set_header_nosniff_content_type()
         self.set_strict_transport_security()
+        self.__content_encoding = None
+        self.__uncompressed_path = None
+
+    def validate_absolute_path(self, root, absolute_path):
+        # pylint: disable=attribute-defined-outside-init
+        absolute_path = super().validate_absolute_path(root, absolute_path)
+        if absolute_path is None:
+            return None
+        accepted_encodings = get_accepted_encodings(
+            self.request.headers.get("Accept-Encoding", "")
+        )
+        for encoding, suffix in PRECOMPRESSED_VARIANTS:
+            if encoding in accepted_encodings and os.path.isfile(
+                absolute_path + suffix
+            ):
+                self.__content_encoding = encoding
+                self.__uncompressed_path = absolute_path
+                # Validate the served variant as well, so that its stat (and
+                # not the stat of the uncompressed file) is used for the
+                # Content-Length and other headers.
+                return super().validate_absolute_path(
+                    root, absolute_path + suffix
+                )
+        return absolute_path
+
+    def get_content_type(self):
+        if self.__content_encoding is None:
+            return super().get_content_type()
+        mime_type, dummy_encoding = mimetypes.guess_type(
+            self.__uncompressed_path
+        )
+        return mime_type if mime_type else "application/octet-stream"
+
+    def get_cache_time(self, path, modified, mime_type):
+        if HASHED_FILE_NAME.search(path):
+            return HASHED_FILE_CACHE_SECONDS
+        return super().get_cache_time(path, modified, mime_type)
+
+    def set_extra_headers(self, path):
+        # Etag is computed from the content of the served variant, so it
+        # differs for compressed and uncompressed variants of a file.
+        self.set_header("Vary", "Accept-Encoding")
+        if self.__content_encoding is not None:
+            self.set_header("Content-Encoding", self.__content_encoding)
+        if HASHED_FILE_NAME.search(path):
+            self.set_header(
+                "Cache-Control",
+                f"public, max-age={HASHED_FILE_CACHE_SECONDS}, immutable",
+            )
@@ -0,0 +1,168 @@
+"""
+Structured cluster status served by the python daemon
+
+Dashboards poll the status often. The status is therefore loaded at most once
+per a short time for each user and it is shared by all requests of the user
+in the meantime. Each selection of status fields is serialized only once and
+identified by an ETag, so that clients can skip downloading a status which
+has not changed.
+"""
+# asyncio is used in a type annotation only
+# pylint: disable=unused-import
+import asyncio
+import hashlib
+import json
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from tornado.ioloop import IOLoop
+
+from pcs import settings
+from pcs.common.interface import dto
+from pcs.common.reports import (
+    ReportItem,
+    ReportItemList,
+    ReportProcessor,
+)
+from pcs.daemon import log
+from pcs.lib.commands.status import cluster_status_structured
+from pcs.lib.env import LibraryEnvironment
+from pcs.lib.errors import LibraryError
+
+STATUS_FIELDS = ("nodes", "resources")
+
+
+class StatusLoadError(Exception):
+    def __init__(self, report_list: List[Dict[str, Any]]):
+        """
+        report_list -- reports explaining the error, exported to dicts
+        """
+        super().__init__(report_list)
+        self.report_list = report_list
+
+
+class _ReportCollector(ReportProcessor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.items: ReportItemList = []
+
+    def _do_report(self, report_item: ReportItem) -> None:
+        self.items.append(report_item)
+
+
+def load_status(username: str, groups: Sequence[str]) -> Dict[str, Any]:
+    """
+    Load the structured cluster status as seen by the specified user
+
+    username -- user the status is loaded for, pacemaker applies their ACLs
+    groups -- groups of the user
+    """
+    report_processor = _ReportCollector()
+    env = LibraryEnvironment(
+        log.pcsd, report_processor, user_login=username, user_groups=groups,
+    )
+    try:
+        return cluster_status_structured(env)
+    except LibraryError as e:
+        # pylint: disable=no-member
+        raise StatusLoadError(
+            [
+                dto.to_dict(report_item.to_dto())
+                for report_item in report_processor.items + list(e.args)
+            ]
+        ) from e
+
+
+class StatusSnapshot:
+    def __init__(self, status: Dict[str, Any]):
+        self.status = status
+        self.__rendered: Dict[Tuple[str, ...], Tuple[bytes, str]] = {}
+
+    def render(self, fields: Iterable[str]) -> Tuple[bytes, str]:
+        """
+        Return the selected part of the status as json and its ETag
+
+        fields -- top level keys of the status to include
+        """
+        key = tuple(sorted(set(fields)))
+        if key not in self.__rendered:
+            body = json.dumps(
+                {field: self.status[field] for field in key}, sort_keys=True
+            ).encode()
+            etag = '"{0}"'.format(hashlib.sha1(body).hexdigest())
+            self.__rendered[key] = (body, etag)
+        return self.__rendered[key]
+
+
+class StatusCache:
+    def __init__(
+        self,
+        max_age: Optional[float] = None,
+        load: Callable[[str, Sequence[str]], Dict[str, Any]] = load_status,
+        get_time: Callable[[], float] = monotonic,
+    ):
+        """
+        max_age -- seconds for which a loaded status is shared
+        load -- blocking function loading the status for a user and groups
+        get_time -- source of the current time
+        """
+        self.__max_age = (
+            max_age
+            if max_age is not None
+            else settings.pcsd_cluster_status_cache_max_age
+        )
+        self.__load = load
+        self.__get_time = get_time
+        self.__entries: Dict[
+            Tuple[str, Tuple[str, ...]],
+            Tuple[float, "asyncio.Future[StatusSnapshot]"],
+        ] = {}
+
+    def __load_snapshot(
+        self, username: str, groups: Sequence[str]
+    ) -> StatusSnapshot:
+        return StatusSnapshot(self.__load(username, groups))
+
+    def __drop_expired(self, now: float) -> None:
+        for identity, (loaded_at, snapshot) in list(self.__entries.items()):
+            # a status being loaded is waited for even if it takes long
+            if snapshot.done() and now - loaded_at >= self.__max_age:
+                del self.__entries[identity]
+
+    async def get(self, username: str, groups: Sequence[str]) -> StatusSnapshot:
+        """
+        Return a recent status, load it if there is none
+
+        Requests coming while the status is being loaded wait for it instead
+        of loading it again. A failed load is not shared with later requests.
+
+        username -- user the status is loaded for
+        groups -- groups of the user
+        """
+        identity = (username, tuple(groups))
+        now = self.__get_time()
+        self.__drop_expired(now)
+        if identity not in self.__entries:
+            # crm_mon is run in a thread not to block other requests
+            self.__entries[identity] = (
+                now,
+                IOLoop.current().run_in_executor(
+                    None, self.__load_snapshot, username, groups
+                ),
+            )
+        dummy_loaded_at, snapshot = self.__entries[identity]
+        try:
+            return await snapshot
+        except StatusLoadError:
+            if self.__entries.get(identity, (None, None))[1] is snapshot:
+                del self.__entries[identity]
+            raise
@@ -0,0 +1,67 @@
+from time import time as now
+
+from tornado.ioloop import IOLoop
+from tornado.locks import Lock
+
+from pcs import settings
+from pcs.daemon import log, ruby_pcsd
+
+
+class Backoff:
+    """
+    Postpone config synchronization while configs are in sync with the cluster
+
+    Nodes exchange only versions and hashes of configs when nothing changed,
+    so a sync of an unchanged cluster is cheap. Still, there is no point in
+    running it at the full rate. Each run finding the configs in sync doubles
+    the interval up to a limit, any change resets it.
+    """
+
+    def __init__(self, max_multiplier=None):
+        self.__max_multiplier = max(
+            1,
+            max_multiplier
+            if max_multiplier is not None
+            else settings.pcsd_config_sync_max_backoff,
+        )
+        self.__multiplier = 1
+
+    def get_delay(
+        self, current_time: float, result: ruby_pcsd.SyncConfigsResult
+    ) -> float:
+        """
+        Return number of seconds to wait before the next synchronization
+
+        current_time -- unix timestamp
+        result -- result of the last synchronization
+        """
+        delay = max(0, result.next - current_time)
+        if not result.unchanged:
+            self.__multiplier = 1
+            return delay
+        delay *= self.__multiplier
+        self.__multiplier = min(2 * self.__multiplier, self.__max_multiplier)
+        return delay
+
+
+def config_sync(
+    sync_config_lock: Lock,
+    ruby_pcsd_wrapper: ruby_pcsd.Wrapper,
+    backoff: Backoff = None,
+):
+    backoff = backoff or Backoff()
+
+    async def config_synchronization():
+        async with sync_config_lock:
+            result = await ruby_pcsd_wrapper.sync_configs_result()
+        delay = backoff.get_delay(now(), result)
+        if result.unchanged:
+            log.pcsd.debug(
+                "Configs are in sync, next synchronization in %d seconds",
+                delay,
+            )
+        # Ruby reports the next run as a unix timestamp while the ioloop
+        # schedules by its own monotonic clock, so a delay is used.
+        IOLoop.current().call_later(delay, config_synchronization)
+
+    return config_synchronization
@@ -25,6 +25,8 @@ NOTIFY_SOCKET = "NOTIFY_SOCKET"
 PCSD_DEBUG = "PCSD_DEBUG"
 PCSD_DISABLE_GUI = "PCSD_DISABLE_GUI"
 PCSD_SESSION_LIFETIME = "PCSD_SESSION_LIFETIME"
+PCSD_SESSION_MAX_COUNT = "PCSD_SESSION_MAX_COUNT"
+PCSD_SESSION_PERSISTENT = "PCSD_SESSION_PERSISTENT"
 PCSD_DEV = "PCSD_DEV"
 PCSD_STATIC_FILES_DIR = "PCSD_STATIC_FILES_DIR"
 
@@ -39,6 +41,8 @@ Env = namedtuple(
         PCSD_DEBUG,
         PCSD_DISABLE_GUI,
         PCSD_SESSION_LIFETIME,
+        PCSD_SESSION_MAX_COUNT,
+        PCSD_SESSION_PERSISTENT,
         PCSD_STATIC_FILES_DIR,
         PCSD_DEV,
         "has_errors",
@@ -57,6 +61,8 @@ def prepare_env(environ, logger=None):
         loader.pcsd_debug(),
         loader.pcsd_disable_gui(),
         loader.session_lifetime(),
+        loader.session_max_count(),
+        loader.session_persistent(),
         loader.pcsd_static_files_dir(),
         loader.pcsd_dev(),
         loader.has_errors(),
@@ -160,6 +166,24 @@ class EnvLoader:
             )
             return session_lifetime
 
+    def session_max_count(self):
+        session_max_count = self.environ.get(
+            PCSD_SESSION_MAX_COUNT, settings.gui_session_max_count
+        )
+        try:
+            if int(session_max_count) < 1:
+                raise ValueError()
+            return int(session_max_count)
+        except ValueError:
+            self.errors.append(
+                f"Invalid PCSD_SESSION_MAX_COUNT value '{session_max_count}'"
+                " (it must be a positive integer)"
+            )
+            return session_max_count
+
+    def session_persistent(self):
+        return self.__has_true_in_environ(PCSD_SESSION_PERSISTENT)
+
     def pcsd_debug(self):
         return self.__has_true_in_environ(PCSD_DEBUG)
 
@@ -37,6 +37,12 @@ def get_request_id():
     return __id_dict["id"]
 
 
+class SyncConfigsResult(namedtuple("SyncConfigsResult", "next, unchanged")):
+    @classmethod
+    def from_response(cls, response):
+        return cls(response["next"], response.get("unchanged", False))
+
+
 class SinatraResult(namedtuple("SinatraResult", "headers, status, body")):
     @classmethod
     def from_response(cls, response):
@@ -264,9 +270,32 @@ class Wrapper:
             await convert_yielded(self.run_ruby(SINATRA_REMOTE, request))
         )
 
+    async def request_permission_check(
+        self, request: HTTPServerRequest, permission
+    ) -> SinatraResult:
+        """
+        Let ruby authenticate a request and check permission of its user
+
+        On success, the body contains the username and groups of the user.
+        """
+        return await self.request_remote(
+            HTTPServerRequest(
+                method="GET",
+                uri=f"/remote/check_permission?permission={permission}",
+                headers=request.headers.copy(),
+            )
+        )
+
     async def sync_configs(self):
+        return (await self.sync_configs_result()).next
+
+    async def sync_configs_result(self) -> SyncConfigsResult:
         try:
-            return (await convert_yielded(self.run_ruby(SYNC_CONFIGS)))["next"]
+            return SyncConfigsResult.from_response(
+                await convert_yielded(self.run_ruby(SYNC_CONFIGS))
+            )
         except HTTPError:
             log.pcsd.error("Config synchronization failed")
-            return int(now()) + DEFAULT_SYNC_CONFIG_DELAY
+            return SyncConfigsResult(
+                int(now()) + DEFAULT_SYNC_CONFIG_DELAY, False
+            )
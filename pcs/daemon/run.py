@@ -10,8 +10,10 @@ from tornado.web import Application
 from pcs import settings
 from pcs.common.system import is_systemd
 from pcs.daemon import log, ruby_pcsd, session, ssl, systemd
-from pcs.daemon.app import sinatra_ui, sinatra_remote, ui
+from pcs.daemon.app import cluster_status, sinatra_ui, sinatra_remote, ui
 from pcs.daemon.app.common import RedirectHandler
+from pcs.daemon.cluster_status import StatusCache
+from pcs.daemon.config_sync import config_sync
 from pcs.daemon.env import prepare_env
 from pcs.daemon.http_server import HttpsServerManage
 
@@ -19,6 +21,7 @@ from pcs.daemon.http_server import HttpsServerManage
 class SignalInfo:
     # pylint: disable=too-few-public-methods
     server_manage = None
+    session_storage = None
     ioloop_started = False
 
 
@@ -27,6 +30,9 @@ def handle_signal(incomming_signal, frame):
     log.pcsd.warning("Caught signal: %s, shutting down", incomming_signal)
     if SignalInfo.server_manage:
         SignalInfo.server_manage.stop()
+    if SignalInfo.session_storage:
+        # Store the last access time of sessions.
+        SignalInfo.session_storage.save()
     if SignalInfo.ioloop_started:
         IOLoop.current().stop()
     raise SystemExit(0)
@@ -36,15 +42,6 @@ def sign_ioloop_started():
     SignalInfo.ioloop_started = True
 
 
-def config_sync(sync_config_lock: Lock, ruby_pcsd_wrapper: ruby_pcsd.Wrapper):
-    async def config_synchronization():
-        async with sync_config_lock:
-            next_run_time = await ruby_pcsd_wrapper.sync_configs()
-        IOLoop.current().call_at(next_run_time, config_synchronization)
-
-    return config_synchronization
-
-
 def configure_app(
     session_storage: session.Storage,
     ruby_pcsd_wrapper: ruby_pcsd.Wrapper,
@@ -53,13 +50,18 @@ def configure_app(
     disable_gui=False,
     debug=False,
 ):
+    status_cache = StatusCache()
+
     def make_app(https_server_manage: HttpsServerManage):
         """
         https_server_manage -- allows to controll the server (specifically
             reload its SSL certificates). A relevant handler should get this
             object via the method `initialize`.
         """
-        routes = sinatra_remote.get_routes(
+        # Urls served here must precede the generic urls passed to ruby.
+        routes = cluster_status.get_routes(
+            ruby_pcsd_wrapper, status_cache
+        ) + sinatra_remote.get_routes(
             ruby_pcsd_wrapper, sync_config_lock, https_server_manage,
         )
 
@@ -104,8 +106,17 @@ def main():
     ruby_pcsd_wrapper = ruby_pcsd.Wrapper(
         settings.pcsd_ruby_socket, debug=env.PCSD_DEBUG,
     )
+    SignalInfo.session_storage = session.Storage(
+        env.PCSD_SESSION_LIFETIME,
+        max_count=env.PCSD_SESSION_MAX_COUNT,
+        storage_file=(
+            settings.pcsd_session_storage_location
+            if env.PCSD_SESSION_PERSISTENT
+            else None
+        ),
+    ).load()
     make_app = configure_app(
-        session.Storage(env.PCSD_SESSION_LIFETIME),
+        SignalInfo.session_storage,
         ruby_pcsd_wrapper,
         sync_config_lock,
         env.PCSD_STATIC_FILES_DIR,
@@ -1,7 +1,13 @@
+import heapq
+import json
+import os
 import random
 import string
+from collections import OrderedDict
 from time import time as now
 
+from pcs.daemon import log
+
 
 class Session:
     def __init__(
@@ -11,6 +17,7 @@ class Session:
         groups=None,
         is_authenticated=False,
         ajax_id=None,
+        last_access=None,
     ):
         # Session id propageted via cookies.
         self.__sid = sid
@@ -32,6 +39,9 @@ class Session:
         self.__groups = groups or []
         # The moment of the last access. The only muttable attribute.
         self.refresh()
+        if last_access is not None:
+            # Used when the session is restored from a persistent storage.
+            self.__last_access = last_access
 
     @property
     def is_authenticated(self):
@@ -68,43 +78,140 @@ class Session:
     def was_unused_last(self, seconds):
         return now() > self.__last_access + seconds
 
+    @property
+    def last_access(self):
+        # Reading the moment of the last access must not refresh the session.
+        return self.__last_access
+
+    @property
+    def is_authenticated_no_refresh(self):
+        # Used by the storage, which must not refresh sessions it manages.
+        return self.__is_authenticated
+
+    def to_dict(self):
+        return dict(
+            sid=self.__sid,
+            username=self.__username,
+            groups=self.__groups,
+            is_authenticated=self.__is_authenticated,
+            ajax_id=self.__ajax_id,
+            last_access=self.__last_access,
+        )
+
 
 class Storage:
-    def __init__(self, lifetime_seconds):
-        self.__sessions = {}
+    """
+    Keeps sessions of pcsd users.
+
+    Sessions are kept in the order of their use so the least recently used
+    session can be evicted when the storage is full. Expiration times are kept
+    in a heap so dropping expired sessions does not need to check all of them.
+    Authenticated sessions can be stored in a file so they survive a restart
+    of pcsd.
+    """
+
+    def __init__(self, lifetime_seconds, max_count=None, storage_file=None):
+        """
+        int lifetime_seconds -- how long an unused session stays valid
+        int max_count -- maximal number of kept sessions, None means unlimited
+        string storage_file -- path to a file to keep authenticated sessions in
+        """
+        self.__sessions = OrderedDict()
+        # Items are (expiration time, sid). The heap may contain outdated
+        # items - a session could have been refreshed, destroyed or replaced.
+        # Those are fixed lazily when they get to the top of the heap.
+        self.__expiration_heap = []
+        self.__scheduled_sids = set()
         self.__lifetime_seconds = lifetime_seconds
+        self.__max_count = max_count
+        self.__storage_file = storage_file
 
     def provide(self, sid=None) -> Session:
         if self.__is_valid_sid(sid):
+            self.__sessions.move_to_end(sid)
             return self.__sessions[sid].refresh()
         return self.__register(self.__generate_sid())
 
     def drop_expired(self):
-        obsolete_sid_list = [
-            sid
-            for sid, session in self.__sessions.items()
-            if session.was_unused_last(self.__lifetime_seconds)
-        ]
-        for sid in obsolete_sid_list:
-            del self.__sessions[sid]
+        while self.__expiration_heap and self.__expiration_heap[0][0] < now():
+            dummy_expiration_time, sid = heapq.heappop(self.__expiration_heap)
+            self.__scheduled_sids.discard(sid)
+            if sid not in self.__sessions:
+                # The session has been already destroyed or evicted.
+                continue
+            if self.__sessions[sid].was_unused_last(self.__lifetime_seconds):
+                del self.__sessions[sid]
+            else:
+                # The session has been used since it was put to the heap.
+                self.__schedule_expiration(sid)
 
     def destroy(self, sid):
         if sid in self.__sessions:
+            was_authenticated = self.__sessions[sid].is_authenticated_no_refresh
             del self.__sessions[sid]
+            if was_authenticated:
+                self.save()
         return self
 
     def login(self, sid, username, groups, ajax_id=None) -> Session:
-        return self.__register(
+        session = self.__register(
             self.__valid_sid(sid),
             username=username,
             groups=groups,
             is_authenticated=True,
             ajax_id=ajax_id,
         )
+        self.save()
+        return session
 
     def rejected_user(self, sid, username) -> Session:
         return self.__register(self.__valid_sid(sid), username=username)
 
+    def save(self):
+        """
+        Write valid authenticated sessions into the storage file if it is set
+        """
+        if not self.__storage_file:
+            return
+        session_list = []
+        for session in self.__sessions.values():
+            if session.is_authenticated_no_refresh and not (
+                session.was_unused_last(self.__lifetime_seconds)
+            ):
+                session_list.append(session.to_dict())
+        tmp_file = f"{self.__storage_file}.tmp"
+        try:
+            with os.fdopen(
+                os.open(tmp_file, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600),
+                "w",
+                encoding="utf-8",
+            ) as file:
+                json.dump(session_list, file)
+            os.replace(tmp_file, self.__storage_file)
+        except OSError as e:
+            log.pcsd.warning(
+                "Unable to save sessions to '%s': %s", self.__storage_file, e
+            )
+
+    def load(self):
+        """
+        Restore sessions from the storage file if it is set and exists
+        """
+        if not self.__storage_file or not os.path.exists(self.__storage_file):
+            return self
+        try:
+            with open(self.__storage_file, encoding="utf-8") as file:
+                session_list = json.load(file)
+            for session_data in session_list:
+                session = Session(**session_data)
+                if not session.was_unused_last(self.__lifetime_seconds):
+                    self.__add(session_data["sid"], session)
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            log.pcsd.warning(
+                "Unable to load sessions from '%s': %s", self.__storage_file, e
+            )
+        return self
+
     def __is_valid_sid(self, sid):
         return not (
             sid is None
@@ -117,11 +224,33 @@ class Storage:
     def __valid_sid(self, sid):
         return sid if self.__is_valid_sid(sid) else self.__generate_sid()
 
-    def __register(self, *args, **kwargs) -> Session:
-        session = Session(*args, **kwargs)
-        self.__sessions[session.sid] = session
+    def __register(self, sid, **kwargs) -> Session:
+        return self.__add(sid, Session(sid, **kwargs))
+
+    def __add(self, sid, session) -> Session:
+        self.__sessions[sid] = session
+        self.__sessions.move_to_end(sid)
+        self.__schedule_expiration(sid)
+        if self.__max_count is not None:
+            while len(self.__sessions) > self.__max_count:
+                # Evict the least recently used session. Its item in the
+                # expiration heap is removed lazily.
+                self.__sessions.popitem(last=False)
         return session
 
+    def __schedule_expiration(self, sid):
+        # Expiration of a session can only be postponed (by refreshing or
+        # replacing the session). So if there already is an item for the
+        # session in the heap, it is popped sooner than the session expires and
+        # the session is rescheduled then.
+        if sid in self.__scheduled_sids:
+            return
+        self.__scheduled_sids.add(sid)
+        heapq.heappush(
+            self.__expiration_heap,
+            (self.__sessions[sid].last_access + self.__lifetime_seconds, sid,),
+        )
+
     def __generate_sid(self):
         for _ in range(10):
             sid = "".join(
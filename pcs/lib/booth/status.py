@@ -1,4 +1,11 @@
+import shlex
+from typing import (
+    Dict,
+    List,
+)
+
 from pcs import settings
+from pcs.common.booth import BoothTicketStatusDto
 from pcs.common import reports
 from pcs.common.reports.item import ReportItem
 from pcs.common.str_tools import join_multilines
@@ -52,3 +59,50 @@ def get_peers_status(runner, name=None):
             )
         )
     return stdout
+
+
+def parse_daemon_status(daemon_status: str) -> Dict[str, str]:
+    """
+    Return variables describing a booth daemon from "booth status" output
+
+    daemon_status -- e.g. booth_lockfile='/var/run/booth/booth.pid'
+        booth_lockpid=1234 booth_type=site booth_state=started
+    """
+    try:
+        word_list = shlex.split(daemon_status)
+    except ValueError:
+        return {}
+    status_vars = {}
+    for word in word_list:
+        name, separator, value = word.partition("=")
+        if separator:
+            status_vars[name] = value
+    return status_vars
+
+
+def parse_tickets_status(tickets_status: str) -> List[BoothTicketStatusDto]:
+    """
+    Return tickets from "booth list" output
+
+    tickets_status -- lines like: ticket: T1, leader: 10.0.0.1,
+        expires: 2021-03-05 12:27:09, commit: 2021-03-05 12:26:44
+    """
+    ticket_list = []
+    for line in tickets_status.splitlines():
+        info = {}
+        for part in line.split(","):
+            key, separator, value = part.partition(":")
+            if separator:
+                info[key.strip()] = value.strip()
+        if not info.get("ticket"):
+            continue
+        leader = info.get("leader")
+        ticket_list.append(
+            BoothTicketStatusDto(
+                ticket=info["ticket"],
+                leader=(None if leader in (None, "", "NONE") else leader),
+                expires=info.get("expires"),
+                commit=info.get("commit"),
+            )
+        )
+    return ticket_list
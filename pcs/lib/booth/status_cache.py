@@ -0,0 +1,124 @@
+"""
+Status of local booth instances shared by pcs processes for a short time
+
+Monitoring of tickets asks for the status of all booth instances often, which
+costs three booth processes per instance. Statuses are kept in a file for a
+few seconds, so checks done shortly one after another reuse them. Commands
+changing the state of booth (granting tickets, starting daemons) drop the
+stored statuses.
+"""
+import json
+import os
+import os.path
+import time
+from typing import (
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+)
+
+import dacite
+
+from pcs import settings
+from pcs.common.booth import BoothInstanceStatusDto
+from pcs.common.interface import dto
+
+
+class BoothStatusCache:
+    def __init__(
+        self,
+        storage_path: Optional[str] = None,
+        max_age: Optional[float] = None,
+        get_time: Callable[[], float] = time.time,
+    ):
+        """
+        storage_path -- file to keep the statuses in, None for memory only
+        max_age -- seconds after which a status is not used
+        get_time -- source of the current time
+        """
+        self._storage_path = storage_path
+        self._max_age = (
+            max_age
+            if max_age is not None
+            else settings.booth_status_cache_max_age
+        )
+        self._get_time = get_time
+        # key: instance name, value: (status, timestamp)
+        self._records: Dict[str, Tuple[BoothInstanceStatusDto, float]] = {}
+        self._changed = False
+
+    def load(self) -> "BoothStatusCache":
+        if self._storage_path is None or self._max_age <= 0:
+            return self
+        try:
+            with open(self._storage_path, encoding="utf-8") as storage:
+                record_list = json.load(storage)
+            for status_dict, timestamp in record_list:
+                status = dto.from_dict(BoothInstanceStatusDto, status_dict)
+                self._records[status.instance_name] = (
+                    status,
+                    float(timestamp),
+                )
+        except (OSError, ValueError, TypeError, dacite.DaciteError):
+            # the cache is just an optimization, start from scratch if it is
+            # missing or broken
+            self._records = {}
+        self._changed = False
+        return self
+
+    def save(self) -> None:
+        """
+        Store the statuses if they changed, expired statuses are dropped
+        """
+        if self._storage_path is None or not self._changed:
+            return
+        now = self._get_time()
+        record_list = [
+            [dto.to_dict(status), timestamp]
+            for dummy_name, (status, timestamp) in sorted(self._records.items())
+            if now - timestamp < self._max_age
+        ]
+        tmp_path = f"{self._storage_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(
+                os.path.dirname(self._storage_path), mode=0o700, exist_ok=True
+            )
+            with open(tmp_path, "w", encoding="utf-8") as storage:
+                json.dump(record_list, storage)
+            os.replace(tmp_path, self._storage_path)
+            self._changed = False
+        except OSError:
+            # e.g. running as a non-root user
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def get(self, instance_name: str) -> Optional[BoothInstanceStatusDto]:
+        record = self._records.get(instance_name)
+        if record is None or self._get_time() - record[1] >= self._max_age:
+            return None
+        return record[0]
+
+    def put(self, status: BoothInstanceStatusDto) -> None:
+        if self._max_age <= 0:
+            return
+        self._records[status.instance_name] = (status, self._get_time())
+        self._changed = True
+
+
+def invalidate(storage_path: Optional[str] = None) -> None:
+    """
+    Drop stored statuses after booth state has been changed
+
+    storage_path -- file the statuses are kept in
+    """
+    try:
+        os.remove(
+            storage_path
+            if storage_path is not None
+            else settings.booth_status_cache_location
+        )
+    except OSError:
+        pass
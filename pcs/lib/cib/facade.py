@@ -0,0 +1,261 @@
+"""
+Lxml based access to a CIB for the legacy CLI code
+
+The legacy commands used to work with xml.dom.minidom and looked up elements
+by walking the whole document over and over again. CibFacade parses the CIB
+once with lxml and keeps an index of ids and tags of configuration elements,
+so the lookups the legacy code does the most are cheap even for large CIBs.
+"""
+from collections import defaultdict
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
+
+from lxml import etree
+from lxml.etree import _Element
+
+from pcs.lib.xml_tools import etree_to_str
+
+
+# elements having an id attribute which does not serve as an id, they refer
+# to other elements instead
+_ID_REFERENCE_TAGS = frozenset(
+    ("acl_target", "role", "obj_ref", "resource_ref")
+)
+
+_RESOURCE_TAGS = ("primitive", "group", "clone", "master", "bundle")
+
+
+class _Indexes:
+    # pylint: disable=too-few-public-methods
+    def __init__(self) -> None:
+        self.id_index: Dict[str, List[_Element]] = defaultdict(list)
+        self.tag_index: Dict[str, List[_Element]] = defaultdict(list)
+        # pacemaker creates an implicit resource for the pacemaker_remote
+        # connection named the same as the value of the remote-node meta
+        # attribute, so such values are considered to be ids
+        self.remote_node_ids: Set[str] = set()
+
+
+class CibFacade:
+    """
+    Indexed view of a CIB tree
+    """
+
+    def __init__(self, cib: _Element):
+        """
+        cib -- any element of a CIB tree, the whole tree is used
+        """
+        self._cib = cib.getroottree().getroot()
+        self._indexes: Optional[_Indexes] = None
+
+    @classmethod
+    def from_string(cls, cib_xml: str) -> "CibFacade":
+        """
+        Parse a CIB string
+
+        cib_xml -- CIB as a string
+        """
+        parser = etree.XMLParser(huge_tree=True, remove_blank_text=False)
+        return cls(etree.fromstring(cib_xml.encode(), parser))
+
+    @property
+    def cib(self) -> _Element:
+        return self._cib
+
+    def to_string(self) -> str:
+        return etree_to_str(self._cib)
+
+    def invalidate(self) -> None:
+        """
+        Drop the indexes, call this after modifying the tree directly
+        """
+        self._indexes = None
+
+    def _configuration_sections(self) -> Iterable[_Element]:
+        # do not index /cib/status, it may contain references to previously
+        # existing and deleted resources
+        if self._cib.tag != "cib":
+            return [self._cib]
+        return [
+            section
+            for section in self._cib
+            if isinstance(section.tag, str) and section.tag != "status"
+        ]
+
+    def _ensure_indexes(self) -> _Indexes:
+        if self._indexes is None:
+            self._indexes = _Indexes()
+            for section in self._configuration_sections():
+                for element in section.iter():
+                    _index_element(self._indexes, element)
+        return self._indexes
+
+    def get_elements_by_id(self, element_id: str) -> List[_Element]:
+        """
+        Return configuration elements with the specified id
+        """
+        return list(self._ensure_indexes().id_index.get(element_id, []))
+
+    def get_element_by_id(
+        self, element_id: str, tag: Optional[str] = None
+    ) -> Optional[_Element]:
+        """
+        Return the configuration element with the specified id or None
+
+        tag -- if set, the element must be of this tag
+        """
+        for element in self.get_elements_by_id(element_id):
+            if tag is None or element.tag == tag:
+                return element
+        return None
+
+    def get_elements_by_tag(self, tag: str) -> List[_Element]:
+        """
+        Return configuration elements of the specified tag in document order
+        """
+        return list(self._ensure_indexes().tag_index.get(tag, []))
+
+    def does_id_exist(self, check_id: str) -> bool:
+        indexes = self._ensure_indexes()
+        return (
+            check_id in indexes.id_index or check_id in indexes.remote_node_ids
+        )
+
+    def find_unique_id(
+        self, check_id: str, reserved_ids: Optional[Iterable[str]] = None
+    ) -> str:
+        """
+        Return check_id if it is not used, otherwise add a number to its end
+        and increment it until an unused id is found
+
+        reserved_ids -- ids to consider as already used
+        """
+        reserved = set(reserved_ids) if reserved_ids else set()
+        counter = 1
+        temp_id = check_id
+        while temp_id in reserved or self.does_id_exist(temp_id):
+            temp_id = "{0}-{1}".format(check_id, counter)
+            counter += 1
+        return temp_id
+
+    def get_resource(self, resource_id: str) -> Optional[_Element]:
+        return self.get_element_by_id(resource_id, "primitive")
+
+    def get_group(self, group_id: str) -> Optional[_Element]:
+        return self.get_element_by_id(group_id, "group")
+
+    def get_clone(self, clone_id: str) -> Optional[_Element]:
+        return self.get_element_by_id(clone_id, "clone")
+
+    def get_master(self, master_id: str) -> Optional[_Element]:
+        return self.get_element_by_id(master_id, "master")
+
+    def get_bundle(self, bundle_id: str) -> Optional[_Element]:
+        return self.get_element_by_id(bundle_id, "bundle")
+
+    def get_any_resource(self, resource_id: str) -> Optional[_Element]:
+        """
+        Return a primitive, group, clone, master or bundle with the id
+        """
+        for element in self.get_elements_by_id(resource_id):
+            if element.tag in _RESOURCE_TAGS:
+                return element
+        return None
+
+    def get_section(self, section: str) -> Optional[_Element]:
+        """
+        Return a CIB section specified by a path, e.g. configuration/resources
+        """
+        return self._cib.find("./{0}".format(section))
+
+    def append(
+        self,
+        parent: _Element,
+        element: _Element,
+        before: Optional[_Element] = None,
+    ) -> _Element:
+        """
+        Append the element to the parent and index it
+
+        before -- if set, put the element in front of this child of the parent
+        """
+        if before is None:
+            parent.append(element)
+        else:
+            before.addprevious(element)
+        if self._indexes is not None:
+            for child in element.iter():
+                _index_element(self._indexes, child)
+        return element
+
+    def set_attribute(self, element: _Element, name: str, value: str) -> None:
+        """
+        Set an attribute of an element and keep the indexes up to date
+        """
+        if self._indexes is not None:
+            _unindex_element(self._indexes, element)
+        element.set(name, value)
+        if self._indexes is not None:
+            _index_element(self._indexes, element)
+
+    def remove(self, element: _Element) -> None:
+        """
+        Remove the element from the tree and from the indexes
+        """
+        # unindex before removing, remote-node nvpairs are recognized by
+        # their parents
+        if self._indexes is not None:
+            for child in element.iter():
+                _unindex_element(self._indexes, child)
+        parent = element.getparent()
+        if parent is not None:
+            parent.remove(element)
+
+
+def _index_element(indexes: _Indexes, element: _Element) -> None:
+    if not isinstance(element.tag, str):
+        return
+    indexes.tag_index[element.tag].append(element)
+    element_id = element.get("id")
+    if element_id is not None and element.tag not in _ID_REFERENCE_TAGS:
+        indexes.id_index[element_id].append(element)
+    if _is_remote_node_nvpair(element):
+        indexes.remote_node_ids.add(element.get("value", ""))
+
+
+def _unindex_element(indexes: _Indexes, element: _Element) -> None:
+    if not isinstance(element.tag, str):
+        return
+    _remove_from_index(indexes.tag_index, element.tag, element)
+    element_id = element.get("id")
+    if element_id is not None and element.tag not in _ID_REFERENCE_TAGS:
+        _remove_from_index(indexes.id_index, element_id, element)
+    if _is_remote_node_nvpair(element):
+        indexes.remote_node_ids.discard(element.get("value", ""))
+
+
+def _is_remote_node_nvpair(element: _Element) -> bool:
+    if element.tag != "nvpair" or element.get("name") != "remote-node":
+        return False
+    meta_attributes = element.getparent()
+    if meta_attributes is None or meta_attributes.tag != "meta_attributes":
+        return False
+    resource = meta_attributes.getparent()
+    return resource is not None and resource.tag == "primitive"
+
+
+def _remove_from_index(
+    index: Dict[str, List[_Element]], key: str, element: _Element
+) -> None:
+    element_list = index.get(key)
+    if not element_list:
+        return
+    # compare by identity, lxml elements are not comparable by value
+    index[key] = [item for item in element_list if item is not element]
+    if not index[key]:
+        del index[key]
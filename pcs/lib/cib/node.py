@@ -58,6 +58,72 @@ def update_node_instance_attrs(
     append_when_useful(cib_nodes, node_el)
 
 
+def update_node_utilization(
+    cib, id_provider, node_name, attrs, state_nodes=None
+):
+    """
+    Update nvpairs in utilization for a node specified by its name.
+
+    Works the same way as update_node_instance_attrs, the utilization element
+    is created if needed.
+
+    etree cib -- cib
+    IdProvider id_provider -- elements' ids generator
+    string node_name -- name of the node to be updated
+    dict attrs -- attrs to update, e.g. {'A': '1', 'B': ''}
+    iterable state_nodes -- optional list of node state objects
+    """
+    if not attrs:
+        return
+
+    cib_nodes = get_nodes(cib)
+    node_el = _ensure_node_exists(cib_nodes, node_name, state_nodes)
+    utilization_el = node_el.find("./utilization")
+    if utilization_el is None:
+        utilization_el = etree.Element(
+            "utilization",
+            id=id_provider.allocate_id(
+                "nodes-{0}-utilization".format(node_el.get("id"))
+            ),
+        )
+    update_nvset(utilization_el, attrs, id_provider)
+    # do not create a new utilization if we are only removing values from it
+    append_when_useful(node_el, utilization_el, attribs_important=False)
+    # do not create a new node if we are only removing values from it
+    append_when_useful(cib_nodes, node_el, attribs_important=False)
+
+
+def get_node_instance_attrs(cib, node_name):
+    """
+    Return instance attributes of a node as update_node_instance_attrs sees them
+
+    etree cib -- cib
+    string node_name -- name of the node
+    """
+    # only the first instance_attributes element is updated, see
+    # update_node_instance_attrs
+    return {
+        nvpair.get("name"): nvpair.get("value", "")
+        for nvpair in get_nodes(cib).xpath(
+            "./node[@uname=$node_name]/instance_attributes[1]/nvpair",
+            node_name=node_name,
+        )
+    }
+
+
+def get_node_names(cib):
+    """
+    Return names of nodes defined in the nodes section of the cib
+
+    etree cib -- cib
+    """
+    return [
+        node_el.get("uname")
+        for node_el in get_nodes(cib).iterfind("./node")
+        if node_el.get("uname")
+    ]
+
+
 def _ensure_node_exists(tree, node_name, state_nodes=None):
     """
     Make sure node with specified name exists
@@ -1,6 +1,10 @@
+from functools import lru_cache
+import re
 from typing import (
     Any,
+    Iterable,
     Iterator,
+    List,
     Optional,
     Tuple,
 )
@@ -61,8 +65,9 @@ _token_to_node_expr_type = {
     "version": NODE_ATTR_TYPE_VERSION,
 }
 
-
-pyparsing.ParserElement.enablePackrat()
+# Number of distinct rule strings whose parsed trees are kept. Parsed trees
+# are immutable, so they can be shared.
+_PARSED_RULE_CACHE_SIZE = 256
 
 
 class RuleParseError(Exception):
@@ -92,13 +97,21 @@ def parse_rule(rule_string: str) -> BoolExpr:
     """
     if not rule_string:
         return BoolExpr(BOOL_AND, [])
+    return __parse_rule_cached(rule_string)
+
 
-    try:
-        parsed = __get_rule_parser().parseString(rule_string, parseAll=True)[0]
-    except pyparsing.ParseException as e:
-        raise RuleParseError(
-            rule_string, e.line, e.lineno, e.col, e.loc, e.args[2],
-        ) from e
+@lru_cache(maxsize=_PARSED_RULE_CACHE_SIZE)
+def __parse_rule_cached(rule_string: str) -> BoolExpr:
+    parsed = _FastRuleParser(rule_string).parse()
+    if parsed is None:
+        try:
+            parsed = __get_rule_parser().parseString(
+                rule_string, parseAll=True
+            )[0]
+        except pyparsing.ParseException as e:
+            raise RuleParseError(
+                rule_string, e.line, e.lineno, e.col, e.loc, e.args[2],
+            ) from e
 
     if not isinstance(parsed, BoolExpr):
         # If we only got a representation on an inner rule element instead of a
@@ -109,6 +122,185 @@ def parse_rule(rule_string: str) -> BoolExpr:
     return parsed
 
 
+class _FastParserUnsupported(Exception):
+    pass
+
+
+class _FastRuleParser:
+    """
+    Recursive descent parser of the most common rule forms
+
+    It understands node attribute, 'date gt|lt', resource and op expressions
+    joined by 'and' / 'or' and brackets. Rules which contain anything else or
+    which may be understood differently by the pyparsing grammar are left for
+    the pyparsing parser. It returns the same trees as the pyparsing parser.
+    """
+
+    _token_re = re.compile(r"\(|\)|[^\s()]+")
+    # pyparsing only skips these whitespace characters between tokens
+    _unsupported_whitespace_re = re.compile(r"[^\S \t\n\r]")
+    _rsc_re = re.compile(
+        r"(?P<standard>[^\s:()]+)?:(?P<provider>[^\s:()]+)?:(?P<type>[^\s:()]+)?"
+    )
+    _interval_re = re.compile(r"interval=([0-9]+[a-zA-Z]*)", re.IGNORECASE)
+    # all keywords of the grammar
+    _keywords = frozenset(
+        list(_token_to_date_expr_unary_op)
+        + list(_token_to_node_expr_unary_op)
+        + list(_token_to_node_expr_binary_op)
+        + list(_token_to_node_expr_type)
+        + [
+            "and",
+            "or",
+            "date",
+            "date-spec",
+            "duration",
+            "in_range",
+            "interval",
+            "op",
+            "resource",
+            "to",
+        ]
+    )
+    # characters pyparsing considers a part of a keyword
+    _keyword_chars = frozenset(pyparsing.alphanums + "_$")
+
+    def __init__(self, rule_string: str):
+        self._tokens = (
+            []
+            if self._unsupported_whitespace_re.search(rule_string)
+            else self._token_re.findall(rule_string)
+        )
+        self._pos = 0
+
+    def parse(self) -> Optional[RuleExprPart]:
+        """
+        Return a parsed rule or None if the rule is not supported
+        """
+        if not self._tokens:
+            return None
+        try:
+            parsed = self._bool_expr()
+            if self._pos != len(self._tokens):
+                return None
+            return parsed
+        except _FastParserUnsupported:
+            return None
+
+    def _peek(self) -> Optional[str]:
+        if self._pos < len(self._tokens):
+            return self._tokens[self._pos]
+        return None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise _FastParserUnsupported()
+        self._pos += 1
+        return token
+
+    def _keyword(self, token: Optional[str]) -> Optional[str]:
+        if token is None:
+            return None
+        lower_token = token.lower()
+        if lower_token in self._keywords:
+            return lower_token
+        return None
+
+    def _is_end_of_expr(self) -> bool:
+        token = self._peek()
+        return token is None or token == ")" or token.lower() in ("and", "or")
+
+    def _value(self) -> str:
+        token = self._next()
+        if token in ("(", ")"):
+            raise _FastParserUnsupported()
+        lower_token = token.lower()
+        for keyword in self._keywords:
+            # pyparsing matches a keyword at the beginning of a token when the
+            # keyword is followed by a non-keyword character, e.g. 'date-x'
+            if lower_token.startswith(keyword) and (
+                len(token) == len(keyword)
+                or token[len(keyword)] not in self._keyword_chars
+            ):
+                raise _FastParserUnsupported()
+        return token
+
+    def _bool_expr(self) -> RuleExprPart:
+        operand_left = self._operand()
+        operator_operand_list: List[Tuple[str, RuleExprPart]] = []
+        operator = self._keyword(self._peek())
+        while operator is not None and operator in ("and", "or"):
+            self._next()
+            operator_operand_list.append((operator, self._operand()))
+            operator = self._keyword(self._peek())
+        return _build_bool_expr(operand_left, operator_operand_list)
+
+    def _operand(self) -> RuleExprPart:
+        if self._peek() == "(":
+            self._next()
+            parsed = self._bool_expr()
+            if self._next() != ")":
+                raise _FastParserUnsupported()
+            return parsed
+        parsed = self._simple_expr()
+        if not self._is_end_of_expr():
+            raise _FastParserUnsupported()
+        return parsed
+
+    def _simple_expr(self) -> RuleExprPart:
+        # pylint: disable=too-many-return-statements
+        first = self._next()
+        keyword = self._keyword(first)
+        if keyword in _token_to_node_expr_unary_op:
+            return NodeAttrExpr(
+                _token_to_node_expr_unary_op[keyword], self._value(), None, None
+            )
+        if keyword == "date":
+            operator = self._keyword(self._next())
+            if operator not in _token_to_date_expr_unary_op:
+                raise _FastParserUnsupported()
+            return DateUnaryExpr(
+                _token_to_date_expr_unary_op[operator], self._value()
+            )
+        if keyword == "resource":
+            match = self._rsc_re.fullmatch(self._value())
+            if not match:
+                raise _FastParserUnsupported()
+            return RscExpr(
+                match.group("standard"),
+                match.group("provider"),
+                match.group("type"),
+            )
+        if keyword == "op":
+            name = self._value()
+            interval = None
+            if not self._is_end_of_expr():
+                match = self._interval_re.fullmatch(self._next())
+                if not match:
+                    raise _FastParserUnsupported()
+                interval = match.group(1)
+            return OpExpr(name, interval)
+        # node attribute binary expression, the attribute name must not be
+        # a keyword
+        self._pos -= 1
+        attr_name = self._value()
+        operator = self._keyword(self._next())
+        if operator not in _token_to_node_expr_binary_op:
+            raise _FastParserUnsupported()
+        attr_type = self._keyword(self._peek())
+        if attr_type in _token_to_node_expr_type:
+            self._next()
+        else:
+            attr_type = None
+        return NodeAttrExpr(
+            _token_to_node_expr_binary_op[operator],
+            attr_name,
+            self._value(),
+            _token_to_node_expr_type[attr_type] if attr_type else None,
+        )
+
+
 def __operator_operands(
     token_list: pyparsing.ParseResults,
 ) -> Iterator[Tuple[Any, Any]]:
@@ -125,14 +317,22 @@ def __operator_operands(
 def __build_bool_tree(token_list: pyparsing.ParseResults) -> RuleExprPart:
     # See pyparsing examples
     # https://github.com/pyparsing/pyparsing/blob/master/examples/eval_arith.py
+    return _build_bool_expr(
+        token_list[0][0], __operator_operands(token_list[0][1:])
+    )
+
+
+def _build_bool_expr(
+    operand_left: RuleExprPart,
+    operator_operand_list: Iterable[Tuple[str, RuleExprPart]],
+) -> RuleExprPart:
     token_to_operator = {
         "and": BOOL_AND,
         "or": BOOL_OR,
     }
-    operand_left = token_list[0][0]
     last_operator: Optional[str] = None
-    operand_list = []
-    for operator, operand_right in __operator_operands(token_list[0][1:]):
+    operand_list: List[RuleExprPart] = []
+    for operator, operand_right in operator_operand_list:
         # In each iteration, we get a bool_op ("and" or "or") and the right
         # operand.
         if last_operator == operator or last_operator is None:
@@ -262,8 +462,11 @@ def __get_date_common_parser_part() -> pyparsing.ParserElement:
     )
 
 
+@lru_cache(maxsize=None)
 def __get_rule_parser() -> pyparsing.ParserElement:
-    # This function defines the rule grammar
+    # This function defines the rule grammar. The grammar is built only once
+    # and only when the fast parser is not able to handle a rule.
+    pyparsing.ParserElement.enablePackrat()
 
     # How to add new rule expressions:
     #   1 Create new grammar rules in a way similar to existing rsc_expr and
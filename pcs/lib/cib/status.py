@@ -81,8 +81,14 @@ def _parse_failure_name(name):
 
 
 def filter_resources_failcounts(
-    failcounts, resource=None, node=None, operation=None, interval=None
+    failcounts,
+    resource=None,
+    node=None,
+    operation=None,
+    interval=None,
+    since=None,
 ):
+    # pylint: disable=too-many-arguments
     return [
         failure
         for failure in failcounts
@@ -93,5 +99,51 @@ def filter_resources_failcounts(
             and
             # 5 != "5", failure["interval"] is a string already
             (interval is None or failure["interval"] == str(interval))
+            and (since is None or failure["last_failure"] >= since)
         )
     ]
+
+
+def _add_fail_counts(fail_count_a, fail_count_b):
+    # infinity is a maximal value and cannot be increased
+    if "INFINITY" in (fail_count_a, fail_count_b):
+        return "INFINITY"
+    return fail_count_a + fail_count_b
+
+
+def get_failcounts_totals(failcounts, key):
+    """
+    Sum failcounts per resource or per node, the most failing ones first
+
+    Return a list of dicts {
+        <key>: string -- resource id or node name,
+        "fail_count": "INFINITY" or int -- sum of fail counts,
+        "last_failure": int -- the latest last failure timestamp,
+    }
+
+    list failcounts -- failcounts as returned by get_resources_failcounts
+    string key -- "resource" or "node"
+    """
+    totals = {}
+    for failure in failcounts:
+        total = totals.setdefault(
+            failure[key],
+            {key: failure[key], "fail_count": 0, "last_failure": 0},
+        )
+        total["fail_count"] = _add_fail_counts(
+            total["fail_count"], failure["fail_count"]
+        )
+        total["last_failure"] = max(
+            total["last_failure"], failure["last_failure"]
+        )
+    return sorted(
+        totals.values(),
+        key=lambda total: (
+            -(
+                float("inf")
+                if total["fail_count"] == "INFINITY"
+                else total["fail_count"]
+            ),
+            total[key],
+        ),
+    )
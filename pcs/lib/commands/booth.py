@@ -1,13 +1,30 @@
 import base64
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import partial
 import os.path
-from typing import Optional
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from pcs import settings
 from pcs.common import file_type_codes
 from pcs.common import reports
+from pcs.common.booth import (
+    BoothInstanceStatusDto,
+    BoothTicketStatusDto,
+)
 from pcs.common.file import FileAlreadyExists, RawFileError
-from pcs.common.reports import ReportProcessor
+from pcs.common.interface import dto
+from pcs.common.reports import (
+    ReportItemList,
+    ReportProcessor,
+)
 from pcs.common.reports import codes as report_codes
 from pcs.common.reports.item import (
     get_severity,
@@ -22,15 +39,21 @@ from pcs.lib.booth import (
     constants,
     resource,
     status,
+    status_cache,
 )
 from pcs.lib.cib.tools import get_resources, IdProvider
 from pcs.lib.communication.booth import (
     BoothGetConfig,
+    BoothGetStatusAll,
     BoothSendConfig,
 )
-from pcs.lib.communication.tools import run_and_raise
+from pcs.lib.communication.tools import (
+    run as run_com,
+    run_and_raise,
+)
 from pcs.lib.env import LibraryEnvironment
 from pcs.lib.errors import LibraryError
+from pcs.lib.external import CommandRunner
 from pcs.lib.file.instance import FileInstance
 from pcs.lib.file.raw_file import GhostFile, raw_file_error_report
 from pcs.lib.interface.config import ParserErrorException
@@ -526,6 +549,7 @@ def _ticket_operation(
     stdout, stderr, return_code = env.cmd_runner().run(
         [settings.booth_binary, operation, "-s", site_ip, ticket_name]
     )
+    status_cache.invalidate()
 
     if return_code != 0:
         raise LibraryError(
@@ -697,6 +721,7 @@ def start_booth(env: LibraryEnvironment, instance_name=None):
 
     try:
         external.start_service(env.cmd_runner(), "booth", instance_name)
+        status_cache.invalidate()
     except external.StartServiceError as e:
         raise LibraryError(
             ReportItem.error(
@@ -733,6 +758,7 @@ def stop_booth(env: LibraryEnvironment, instance_name=None):
 
     try:
         external.stop_service(env.cmd_runner(), "booth", instance_name)
+        status_cache.invalidate()
     except external.StopServiceError as e:
         raise LibraryError(
             ReportItem.error(
@@ -836,6 +862,141 @@ def get_status(env: LibraryEnvironment, instance_name=None):
     }
 
 
+def get_status_all(
+    env: LibraryEnvironment, host_list: Iterable[str] = (),
+) -> List[Mapping[str, Any]]:
+    """
+    Return status and tickets of all local booth instances and optionally of
+    booth instances running on other hosts
+
+    env
+    host_list -- names of hosts (e.g. arbitrators) to get booth status from
+    """
+    if env.ghost_file_codes:
+        raise LibraryError(
+            ReportItem.error(
+                reports.messages.LiveEnvironmentRequired(env.ghost_file_codes)
+            )
+        )
+    report_processor = env.report_processor
+    target_list = []
+    if host_list:
+        target_factory = env.get_node_target_factory()
+        report_list, target_list = target_factory.get_target_list_with_reports(
+            host_list, allow_skip=False, report_none_host_found=False
+        )
+        if report_processor.report_list(report_list).has_errors:
+            raise LibraryError()
+
+    local_status_list = _get_local_status_list(
+        env.cmd_runner(), report_processor
+    )
+
+    remote_status_list = []
+    if target_list:
+        com_cmd = BoothGetStatusAll(report_processor)
+        com_cmd.set_targets(target_list)
+        remote_status_list = run_com(env.get_node_communicator(), com_cmd)
+
+    return [
+        dto.to_dict(instance_status)
+        for instance_status in local_status_list + remote_status_list
+    ]
+
+
+def _get_local_status_list(
+    runner: CommandRunner, report_processor: ReportProcessor
+) -> List[BoothInstanceStatusDto]:
+    instance_list = sorted(
+        file_name[: -len(".conf")]
+        for file_name in config_files.get_all_configs_file_names()
+    )
+    cache = status_cache.BoothStatusCache(
+        settings.booth_status_cache_location
+    ).load()
+    local_status_list = []
+    with ThreadPoolExecutor(
+        max_workers=max(
+            1, min(settings.booth_status_max_workers, len(instance_list))
+        )
+    ) as executor:
+        # Look each instance up in the cache only once, a cached status may
+        # expire in the meantime.
+        cached_or_future_list: List[Union[BoothInstanceStatusDto, Future]] = []
+        for instance_name in instance_list:
+            cached = cache.get(instance_name)
+            cached_or_future_list.append(
+                cached
+                if cached is not None
+                else executor.submit(
+                    _get_instance_status, runner, instance_name
+                )
+            )
+        for cached_or_future in cached_or_future_list:
+            if isinstance(cached_or_future, BoothInstanceStatusDto):
+                local_status_list.append(cached_or_future)
+                continue
+            instance_status, report_list = cached_or_future.result()
+            report_processor.report_list(report_list)
+            if instance_status.status_successfully_obtained:
+                cache.put(instance_status)
+            local_status_list.append(instance_status)
+    cache.save()
+    return local_status_list
+
+
+def _get_instance_status(
+    runner: CommandRunner, instance_name: str
+) -> Tuple[BoothInstanceStatusDto, ReportItemList]:
+    daemon_running = False
+    daemon_info: Mapping[str, str] = {}
+    ticket_list: List[BoothTicketStatusDto] = []
+    peers_plaintext = ""
+    try:
+        daemon_info = status.parse_daemon_status(
+            status.get_daemon_status(runner, instance_name)
+        )
+        daemon_running = daemon_info.get("booth_state") == "started"
+        # Tickets and peers cannot be obtained from a stopped daemon.
+        if daemon_running:
+            ticket_list = status.parse_tickets_status(
+                status.get_tickets_status(runner, instance_name)
+            )
+            peers_plaintext = status.get_peers_status(runner, instance_name)
+    except LibraryError as e:
+        # A broken instance must not prevent getting status of the others.
+        return (
+            BoothInstanceStatusDto(
+                instance_name=instance_name,
+                host_name=None,
+                status_successfully_obtained=False,
+                daemon_running=daemon_running,
+                daemon_type=daemon_info.get("booth_type"),
+                address=daemon_info.get("booth_addr_string"),
+                ticket_list=[],
+                peers_plaintext="",
+            ),
+            [
+                # pylint: disable=no-member
+                ReportItem.warning(report_item.message)
+                for report_item in e.args
+            ],
+        )
+    return (
+        BoothInstanceStatusDto(
+            instance_name=instance_name,
+            host_name=None,
+            status_successfully_obtained=True,
+            daemon_running=daemon_running,
+            daemon_type=daemon_info.get("booth_type"),
+            address=daemon_info.get("booth_addr_string"),
+            ticket_list=ticket_list,
+            peers_plaintext=peers_plaintext,
+        ),
+        [],
+    )
+
+
 def _find_resource_elements_for_operation(
     report_processor: ReportProcessor,
     resources_section,
@@ -9,6 +9,7 @@ from typing import (
     Mapping,
     Optional,
     Sequence,
+    Union,
 )
 
 from pcs import settings
@@ -60,8 +61,10 @@ from pcs.lib.communication.sbd import (
     DisableSbdService,
 )
 from pcs.lib.communication.tools import (
+    RunBatch,
     run as run_com,
     run_and_raise,
+    run_and_raise_all,
 )
 from pcs.lib.corosync import (
     config_facade,
@@ -302,11 +305,11 @@ def setup(
     # Validate the nodes
     com_cmd = GetHostInfo(report_processor)
     com_cmd.set_targets(target_list)
+    host_info_dict = run_com(env.get_node_communicator(), com_cmd)
     report_processor.report_list(
-        _host_check_cluster_setup(
-            run_com(env.get_node_communicator(), com_cmd), force
-        )
+        _host_check_cluster_setup(host_info_dict, force)
     )
+    use_batch = _is_request_batch_supported(host_info_dict, target_list)
 
     # If there is an error reading the file, this will report it and exit
     # safely before any change is made to the nodes.
@@ -318,29 +321,27 @@ def setup(
     # Validation done. If errors occured, an exception has been raised and we
     # don't get below this line.
 
-    # Destroy cluster on all nodes.
-    com_cmd = cluster.Destroy(env.report_processor)
-    com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
-
-    # Distribute auth tokens.
-    com_cmd = UpdateKnownHosts(
-        env.report_processor,
-        known_hosts_to_add=env.get_known_hosts(
-            [target.label for target in target_list]
+    # Prepare the nodes for the new cluster. Nothing of this makes the nodes
+    # part of the cluster, so it is all sent in one request per node if the
+    # nodes support it.
+    com_cmd_list = [
+        # Destroy cluster on all nodes.
+        cluster.Destroy(env.report_processor),
+        # Distribute auth tokens.
+        UpdateKnownHosts(
+            env.report_processor,
+            known_hosts_to_add=env.get_known_hosts(
+                [target.label for target in target_list]
+            ),
+            known_hosts_to_remove=[],
         ),
-        known_hosts_to_remove=[],
-    )
-    com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
-
-    # TODO This should be in the file distribution call but so far we don't
-    # have a call which allows to save and delete files at the same time.
-    com_cmd = RemoveFilesWithoutForces(
-        env.report_processor, {"pcsd settings": {"type": "pcsd_settings"}},
-    )
-    com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+        # TODO This should be in the file distribution call but so far we
+        # don't have a call which allows to save and delete files at the same
+        # time.
+        RemoveFilesWithoutForces(
+            env.report_processor, {"pcsd settings": {"type": "pcsd_settings"}},
+        ),
+    ]
 
     if not no_keys_sync:
         # Distribute configuration files except corosync.conf. Sending
@@ -359,9 +360,9 @@ def setup(
         actions.update(
             node_communication_format.pcmk_authkey_file(pcmk_authkey)
         )
-        com_cmd = DistributeFilesWithoutForces(env.report_processor, actions)
-        com_cmd.set_targets(target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        com_cmd_list.append(
+            DistributeFilesWithoutForces(env.report_processor, actions)
+        )
 
         # Distribute and reload pcsd SSL certificate
         if sync_ssl_certs:
@@ -379,11 +380,17 @@ def setup(
             ssl_cert = ssl.dump_cert(
                 ssl.generate_cert(ssl_key_raw, target_list[0].label)
             )
-            com_cmd = SendPcsdSslCertAndKey(
-                env.report_processor, ssl_cert, ssl_key
+            com_cmd_list.append(
+                SendPcsdSslCertAndKey(env.report_processor, ssl_cert, ssl_key)
             )
-            com_cmd.set_targets(target_list)
-            run_and_raise(env.get_node_communicator(), com_cmd)
+
+    run_and_raise_all(
+        env.get_node_communicator(),
+        env.report_processor,
+        com_cmd_list,
+        target_list,
+        batch=use_batch,
+    )
 
     # Create and distribute corosync.conf. Once a node saves corosync.conf it
     # is considered to be in a cluster.
@@ -413,7 +420,7 @@ def setup(
         raise LibraryError()
 
     # Optionally enable and start cluster services.
-    if enable:
+    if enable and not (start and use_batch):
         com_cmd = EnableCluster(env.report_processor)
         com_cmd.set_targets(target_list)
         run_and_raise(env.get_node_communicator(), com_cmd)
@@ -423,6 +430,7 @@ def setup(
             env.report_processor,
             target_list,
             wait_timeout=wait_timeout,
+            enable=enable and use_batch,
         )
 
 
@@ -895,15 +903,19 @@ def add_nodes(
     # Validate new nodes. All new nodes have to be online.
     com_cmd = GetHostInfo(report_processor)
     com_cmd.set_targets(new_nodes_target_list)
+    host_info_dict = run_com(env.get_node_communicator(), com_cmd)
     report_processor.report_list(
         _host_check_cluster_setup(
-            run_com(env.get_node_communicator(), com_cmd),
+            host_info_dict,
             force,
             # version of services may not be the same across the existing
             # cluster nodes, so it's not easy to make this check properly
             check_services_versions=False,
         )
     )
+    use_batch = _is_request_batch_supported(
+        host_info_dict, new_nodes_target_list
+    )
 
     # Validate SBD on new nodes
     if is_sbd_enabled:
@@ -1174,7 +1186,7 @@ def add_nodes(
     run_and_raise(env.get_node_communicator(), com_cmd)
 
     # Optionally enable and start cluster services.
-    if enable:
+    if enable and not (start and use_batch):
         com_cmd = EnableCluster(env.report_processor)
         com_cmd.set_targets(new_nodes_target_list)
         run_and_raise(env.get_node_communicator(), com_cmd)
@@ -1184,6 +1196,7 @@ def add_nodes(
             env.report_processor,
             new_nodes_target_list,
             wait_timeout=wait_timeout,
+            enable=enable and use_batch,
         )
 
 
@@ -1204,7 +1217,12 @@ def _start_cluster(
     report_processor: ReportProcessor,
     target_list,
     wait_timeout=False,
+    enable=False,
 ):
+    """
+    enable -- enable cluster services in the same request as starting them,
+        the targets must support batch requests
+    """
     # Large clusters take longer time to start up. So we make the timeout
     # longer for each 8 nodes:
     #  1 -  8 nodes: 1 * timeout
@@ -1216,7 +1234,12 @@ def _start_cluster(
     timeout = int(
         settings.default_request_timeout * math.ceil(len(target_list) / 8.0)
     )
-    com_cmd = StartCluster(report_processor)
+    start_cmd = StartCluster(report_processor)
+    com_cmd: Union[StartCluster, RunBatch] = (
+        RunBatch(report_processor, [EnableCluster(report_processor), start_cmd])
+        if enable
+        else start_cmd
+    )
     com_cmd.set_targets(target_list)
     run_and_raise(
         communicator_factory.get_communicator(request_timeout=timeout), com_cmd
@@ -1271,6 +1294,20 @@ def _wait_for_pacemaker_to_start(
     return error_report_list
 
 
+def _is_request_batch_supported(host_info_dict, target_list):
+    """
+    Tell whether all targets are able to run several requests in one
+
+    dict host_info_dict -- host name: host info as returned by GetHostInfo
+    list target_list -- RequestTarget list
+    """
+    return all(
+        "pcs.request-batch"
+        in host_info_dict.get(target.label, {}).get("pcsd_capabilities", [])
+        for target in target_list
+    )
+
+
 def _host_check_cluster_setup(
     host_info_dict, force, check_services_versions=True
 ):
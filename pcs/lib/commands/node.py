@@ -2,7 +2,13 @@ from contextlib import contextmanager
 
 from pcs.common import reports
 from pcs.common.reports.item import ReportItem
-from pcs.lib.cib.node import update_node_instance_attrs
+from pcs.lib import validate
+from pcs.lib.cib.node import (
+    get_node_instance_attrs,
+    get_node_names,
+    update_node_instance_attrs,
+    update_node_utilization,
+)
 from pcs.lib.cib.tools import IdProvider
 from pcs.lib.errors import LibraryError
 from pcs.lib.pacemaker.live import (
@@ -116,6 +122,108 @@ def maintenance_unmaintenance_all(lib_env, maintenance, wait=False):
     )
 
 
+def update_nodes_attrs(
+    lib_env, node_attrs, node_utilization=None, wait=False, force_flags=()
+):
+    """
+    Update attributes and utilization of many nodes in one CIB push
+
+    LibraryEnvironment lib_env
+    dict node_attrs -- node name: {attribute name: value}, an empty value
+        removes the attribute
+    dict node_utilization -- node name: {utilization name: value}, an empty
+        value removes the utilization attribute
+    mixed wait -- False: no wait, None: wait with default timeout, str or int:
+        wait with specified timeout
+    iterable force_flags -- list of flags codes, FORCE allows removing node
+        attributes which do not exist
+    """
+    node_utilization = node_utilization or {}
+    with cib_runner_nodes(lib_env, wait) as (cib, dummy_runner, state_nodes):
+        known_nodes = set(get_node_names(cib)) | {
+            node.attrs.name for node in state_nodes
+        }
+        report_list = [
+            ReportItem.error(reports.messages.NodeNotFound(node))
+            for node in sorted(set(node_attrs) | set(node_utilization))
+            if node not in known_nodes
+        ]
+        attrs_report_list, attrs_to_update = _get_node_attrs_to_update(
+            cib, node_attrs, known_nodes, reports.codes.FORCE in force_flags
+        )
+        report_list.extend(attrs_report_list)
+        report_list.extend(_validate_node_utilization(node_utilization))
+        if lib_env.report_processor.report_list(report_list).has_errors:
+            raise LibraryError()
+
+        # one id provider for all the nodes, so that the ids allocated for
+        # new elements do not collide
+        id_provider = IdProvider(cib)
+        for node, attrs in attrs_to_update.items():
+            update_node_instance_attrs(
+                cib, id_provider, node, attrs, state_nodes=state_nodes
+            )
+        for node, attrs in node_utilization.items():
+            update_node_utilization(
+                cib, id_provider, node, attrs, state_nodes=state_nodes
+            )
+
+
+def _get_node_attrs_to_update(cib, node_attrs, known_nodes, force):
+    """
+    Validate removing node attributes, return reports and attrs to be updated
+
+    etree cib -- cib to read the current node attributes from
+    dict node_attrs -- node name: {attribute name: value}
+    set known_nodes -- names of nodes existing in the cluster
+    bool force -- allow removing node attributes which do not exist
+    """
+    report_list = []
+    # Removing attributes which do not exist does nothing. It is an error
+    # unless forced, the same way as it is for crm_attribute.
+    attrs_to_update = {}
+    for node, attrs in sorted(node_attrs.items()):
+        if node not in known_nodes:
+            continue
+        existing_attrs = get_node_instance_attrs(cib, node)
+        missing_attrs = sorted(
+            name
+            for name, value in attrs.items()
+            if value == "" and name not in existing_attrs
+        )
+        if not force:
+            report_list.extend(
+                ReportItem.error(
+                    reports.messages.NodeAttributeNotFound(node, name),
+                    force_code=reports.codes.FORCE,
+                )
+                for name in missing_attrs
+            )
+        attrs_to_update[node] = {
+            name: value
+            for name, value in attrs.items()
+            if name not in missing_attrs
+        }
+    return report_list, attrs_to_update
+
+
+def _validate_node_utilization(node_utilization):
+    """
+    dict node_utilization -- node name: {utilization name: value}
+    """
+    report_list = []
+    for utilization in node_utilization.values():
+        validator_list = []
+        for name in utilization:
+            validator = validate.ValueInteger(name)
+            validator.empty_string_valid = True
+            validator_list.append(validator)
+        report_list.extend(
+            validate.ValidatorAll(validator_list).validate(utilization)
+        )
+    return report_list
+
+
 def _create_standby_unstandby_dict(standby):
     return {"standby": "on" if standby else ""}
 
@@ -1,6 +1,8 @@
 # pylint: disable=too-many-lines
 from contextlib import contextmanager
+from copy import deepcopy
 from functools import partial
+import time
 from typing import (
     cast,
     Any,
@@ -21,6 +23,7 @@ from pcs.common.interface import dto
 from pcs.common import reports
 from pcs.common.reports import ReportItemList
 from pcs.common.reports.item import ReportItem
+from pcs.common.str_tools import format_list
 from pcs.common.tools import Version
 from pcs.lib.cib import (
     resource,
@@ -33,7 +36,6 @@ from pcs.lib.cib.tag import (
 from pcs.lib.cib.tools import (
     find_element_by_tag_and_id,
     get_resources,
-    get_status,
     IdProvider,
 )
 from pcs.lib.env import LibraryEnvironment
@@ -42,17 +44,21 @@ from pcs.lib.node import get_existing_nodes_names_addrs
 from pcs.lib.errors import LibraryError
 from pcs.lib.pacemaker import simulate as simulate_tools
 from pcs.lib.pacemaker.live import (
+    get_cib_dom,
     has_resource_unmove_unban_expired_support,
     resource_ban,
     resource_move,
     resource_unmove_unban,
     simulate_cib,
+    simulate_cib_list,
+    wait_for_cluster_state,
     wait_for_idle,
 )
 from pcs.lib.pacemaker.state import (
     ensure_resource_state,
     get_resource_state,
     info_resource_state,
+    is_resource_failed,
     is_resource_managed,
     ResourceNotFound,
 )
@@ -63,7 +69,10 @@ from pcs.lib.pacemaker.values import (
 from pcs.lib.resource_agent import (
     find_valid_resource_agent_by_name as get_agent,
 )
-from pcs.lib.validate import ValueTimeInterval
+from pcs.lib.validate import (
+    ValuePositiveInteger,
+    ValueTimeInterval,
+)
 
 
 WaitType = Union[None, bool, int]
@@ -90,16 +99,82 @@ def _push_cib_wait(
         [_Element, str], ReportItem
     ] = info_resource_state,
 ) -> None:
-    env.push_cib(wait=wait)
-    if wait is not False and wait_for_resource_ids:
+    if wait is False or not wait_for_resource_ids:
+        env.push_cib(wait=wait)
+        return
+    resource_ids = list(wait_for_resource_ids)
+    report_list: ReportItemList = []
+    # Reporting the state of a resource is not an expectation, there is
+    # nothing to wait for in a targeted way.
+    if env.wait_targeted and resource_state_reporter is not info_resource_state:
+        env.push_cib()
+        state, report_list = _wait_for_resource_state(
+            env,
+            wait,
+            resource_ids,
+            lambda state: [
+                res_id
+                for res_id in resource_ids
+                if resource_state_reporter(state, res_id).severity.level
+                == reports.ReportItemSeverity.ERROR
+            ],
+        )
+    else:
+        env.push_cib(wait=wait)
         state = env.get_cluster_state()
-        if env.report_processor.report_list(
+    if env.report_processor.report_list(
+        [resource_state_reporter(state, res_id) for res_id in resource_ids]
+        + report_list
+    ).has_errors:
+        raise LibraryError()
+
+
+def _wait_for_resource_state(
+    env: LibraryEnvironment,
+    wait: WaitType,
+    resource_id_list: Iterable[str],
+    get_unexpected_resources: Callable[[_Element], List[str]],
+) -> Tuple[_Element, ReportItemList]:
+    """
+    Wait for resources to get to an expected state, return the cluster state
+    and a timeout report if the resources did not get there in time
+
+    wait -- False: no wait, None: wait default timeout, int: wait timeout
+    resource_id_list -- resources to wait for
+    get_unexpected_resources -- ids of resources not in the expected state
+    """
+    runner = env.cmd_runner()
+    timeout = env.get_wait_timeout(wait)
+    if not env.wait_targeted:
+        wait_for_idle(runner, timeout)
+        return env.get_cluster_state(), []
+
+    def is_done(state):
+        return not get_unexpected_resources(state) or any(
+            is_resource_failed(state, res_id) for res_id in resource_id_list
+        )
+
+    state, remaining = wait_for_cluster_state(runner, is_done, timeout)
+    unexpected_resources = get_unexpected_resources(state)
+    if not unexpected_resources:
+        return state, []
+    if remaining == 0:
+        return (
+            state,
             [
-                resource_state_reporter(state, res_id)
-                for res_id in wait_for_resource_ids
-            ]
-        ).has_errors:
-            raise LibraryError()
+                ReportItem.error(
+                    reports.messages.WaitForIdleTimedOut(
+                        "Resource(s) not in the expected state: {}".format(
+                            format_list(unexpected_resources)
+                        )
+                    )
+                )
+            ],
+        )
+    # A resource failed. Let pacemaker finish its recovery the same way
+    # waiting for idle does and report the state it ends up in.
+    wait_for_idle(runner, remaining)
+    return env.get_cluster_state(), []
 
 
 def _ensure_disabled_after_wait(disabled_after_wait):
@@ -908,20 +983,29 @@ def bundle_update(
 def _disable_validate_and_edit_cib(
     env: LibraryEnvironment, cib: _Element, resource_or_tag_ids: Iterable[str],
 ) -> List[_Element]:
+    resource_el_list, report_list = _disable_edit_cib(
+        cib, resource_or_tag_ids, env.get_cluster_state()
+    )
+    if env.report_processor.report_list(report_list).has_errors:
+        raise LibraryError()
+    return resource_el_list
+
+
+def _disable_edit_cib(
+    cib: _Element, resource_or_tag_ids: Iterable[str], cluster_state: _Element,
+) -> Tuple[List[_Element], ReportItemList]:
     resource_el_list, report_list = _find_resources_expand_tags(
         cib, resource_or_tag_ids
     )
-    env.report_processor.report_list(report_list)
-    if env.report_processor.report_list(
+    report_list.extend(
         _resource_list_enable_disable(
             resource_el_list,
             resource.common.disable,
             IdProvider(cib),
-            env.get_cluster_state(),
+            cluster_state,
         )
-    ).has_errors:
-        raise LibraryError()
-    return resource_el_list
+    )
+    return resource_el_list, report_list
 
 
 def _disable_get_element_ids(
@@ -962,6 +1046,20 @@ def _disable_run_simulate(
     strict: bool,
 ) -> Tuple[str, Set[str]]:
     plaintext_status, transitions, dummy_cib = simulate_cib(cmd_runner, cib)
+    return (
+        plaintext_status,
+        _disable_get_other_affected(
+            transitions, disabled_resource_ids, inner_resource_ids, strict
+        ),
+    )
+
+
+def _disable_get_other_affected(
+    transitions: _Element,
+    disabled_resource_ids: Set[str],
+    inner_resource_ids: Set[str],
+    strict: bool,
+) -> Set[str]:
     simulated_operations = simulate_tools.get_operations_from_transitions(
         transitions
     )
@@ -984,8 +1082,7 @@ def _disable_run_simulate(
 
     # Stopping a clone stops all its inner resources. That should not block
     # stopping the clone.
-    other_affected = other_affected - inner_resource_ids
-    return plaintext_status, other_affected
+    return other_affected - inner_resource_ids
 
 
 def disable(
@@ -1100,6 +1197,95 @@ def disable_simulate(
     )
 
 
+def disable_simulate_batch(
+    env: LibraryEnvironment,
+    scenario_list: Iterable[Iterable[str]],
+    strict: bool,
+) -> List[Mapping[str, Union[str, List[str]]]]:
+    """
+    Simulate disallowing resources to be started, each scenario separately
+
+    The CIB and the cluster state are loaded only once for all the scenarios
+    and the scenarios are simulated in parallel.
+
+    env -- provides all for communication with externals
+    scenario_list -- each item contains ids of resources to become disabled
+        together, or in case of tag ids, all resources in tags
+    bool strict -- if False, allow resources to be migrated
+    """
+    if not env.is_cib_live:
+        raise LibraryError(
+            ReportItem.error(
+                reports.messages.LiveEnvironmentRequired([file_type_codes.CIB])
+            )
+        )
+
+    cib = env.get_cib()
+    cluster_state = env.get_cluster_state()
+    scenario_cib_list = []
+    scenario_ids_list = []
+    report_list: ReportItemList = []
+    for resource_or_tag_ids in scenario_list:
+        scenario_cib = deepcopy(cib)
+        resource_el_list, scenario_report_list = _disable_edit_cib(
+            scenario_cib, resource_or_tag_ids, cluster_state
+        )
+        report_list.extend(scenario_report_list)
+        scenario_cib_list.append(scenario_cib)
+        scenario_ids_list.append(_disable_get_element_ids(resource_el_list))
+    if env.report_processor.report_list(report_list).has_errors:
+        raise LibraryError()
+
+    return [
+        _disable_simulate_scenario_result(
+            disabled_resource_id_set,
+            inner_resource_id_set,
+            plaintext_status,
+            transitions,
+            strict,
+        )
+        for (
+            (disabled_resource_id_set, inner_resource_id_set),
+            (plaintext_status, transitions, dummy_cib),
+        ) in zip(
+            scenario_ids_list,
+            simulate_cib_list(env.cmd_runner(), scenario_cib_list),
+        )
+    ]
+
+
+def _disable_simulate_scenario_result(
+    disabled_resource_id_set: Set[str],
+    inner_resource_id_set: Set[str],
+    plaintext_status: str,
+    transitions: _Element,
+    strict: bool,
+) -> Mapping[str, Union[str, List[str]]]:
+    operation_list = simulate_tools.get_operations_from_transitions(transitions)
+    exclude = disabled_resource_id_set | inner_resource_id_set
+    return dict(
+        disabled_resource_list=sorted(disabled_resource_id_set),
+        plaintext_simulated_status=plaintext_status,
+        other_affected_resource_list=sorted(
+            _disable_get_other_affected(
+                transitions,
+                disabled_resource_id_set,
+                inner_resource_id_set,
+                strict,
+            )
+        ),
+        stopped_resource_list=simulate_tools.get_resources_left_stopped(
+            operation_list, exclude=exclude
+        ),
+        demoted_resource_list=simulate_tools.get_resources_left_demoted(
+            operation_list, exclude=exclude
+        ),
+        moved_resource_list=simulate_tools.get_resources_moved(
+            operation_list, exclude=exclude
+        ),
+    )
+
+
 def enable(
     env: LibraryEnvironment,
     resource_or_tag_ids: Iterable[str],
@@ -1302,19 +1488,7 @@ def group_add(
         )
 
 
-def get_failcounts(
-    env, resource=None, node=None, operation=None, interval=None
-):
-    # pylint: disable=redefined-outer-name
-    """
-    List resources failcounts, optionally filtered by a resource, node or op
-
-    LibraryEnvironment env
-    string resource -- show failcounts for the specified resource only
-    string node -- show failcounts for the specified node only
-    string operation -- show failcounts for the specified operation only
-    string interval -- show failcounts for the specified operation interval only
-    """
+def _validate_failcounts_filter(operation, interval):
     report_items = []
     if interval is not None and operation is None:
         report_items.append(
@@ -1328,18 +1502,38 @@ def get_failcounts(
         report_items.extend(
             ValueTimeInterval("interval").validate({"interval": interval})
         )
+    return report_items
+
+
+def _load_failcounts(env):
+    # Failcounts are node attributes, the operation history is not needed.
+    return cib_status.get_resources_failcounts(
+        get_cib_dom(env.cmd_runner(), scope="status", skip_children_of=["lrm"])
+    )
+
+
+def get_failcounts(
+    env, resource=None, node=None, operation=None, interval=None
+):
+    # pylint: disable=redefined-outer-name
+    """
+    List resources failcounts, optionally filtered by a resource, node or op
+
+    LibraryEnvironment env
+    string resource -- show failcounts for the specified resource only
+    string node -- show failcounts for the specified node only
+    string operation -- show failcounts for the specified operation only
+    string interval -- show failcounts for the specified operation interval only
+    """
+    report_items = _validate_failcounts_filter(operation, interval)
     if report_items:
         raise LibraryError(*report_items)
 
     interval_ms = (
         None if interval is None else timeout_to_seconds(interval) * 1000
     )
-
-    all_failcounts = cib_status.get_resources_failcounts(
-        get_status(env.get_cib())
-    )
     return cib_status.filter_resources_failcounts(
-        all_failcounts,
+        _load_failcounts(env),
         resource=resource,
         node=node,
         operation=operation,
@@ -1347,6 +1541,61 @@ def get_failcounts(
     )
 
 
+def get_failcounts_summary(
+    env,
+    resource=None,
+    node=None,
+    operation=None,
+    interval=None,
+    within=None,
+    top=None,
+):
+    # pylint: disable=redefined-outer-name
+    # pylint: disable=too-many-arguments
+    """
+    Sum resources failcounts per resource and per node, the most failing first
+
+    LibraryEnvironment env
+    string resource -- count failcounts of the specified resource only
+    string node -- count failcounts on the specified node only
+    string operation -- count failcounts of the specified operation only
+    string interval -- count failcounts of the specified operation interval only
+    string within -- count only failcounts which last failed within the time
+    string top -- list only this many most failing resources
+    """
+    report_items = _validate_failcounts_filter(operation, interval)
+    if within is not None:
+        report_items.extend(
+            ValueTimeInterval("within").validate({"within": within})
+        )
+    if top is not None:
+        report_items.extend(ValuePositiveInteger("top").validate({"top": top}))
+    if report_items:
+        raise LibraryError(*report_items)
+
+    failcounts = cib_status.filter_resources_failcounts(
+        _load_failcounts(env),
+        resource=resource,
+        node=node,
+        operation=operation,
+        interval=(
+            None if interval is None else timeout_to_seconds(interval) * 1000
+        ),
+        since=(
+            None
+            if within is None
+            else int(time.time()) - timeout_to_seconds(within)
+        ),
+    )
+    resource_totals = cib_status.get_failcounts_totals(failcounts, "resource")
+    return {
+        "resources": (
+            resource_totals if top is None else resource_totals[: int(top)]
+        ),
+        "nodes": cib_status.get_failcounts_totals(failcounts, "node"),
+    }
+
+
 def move(env, resource_id, node=None, master=False, lifetime=None, wait=False):
     """
     Create a constraint to move a resource
@@ -1464,17 +1713,28 @@ class _MoveBanTemplate:
 
         # process wait
         if wait is not False:
-            wait_for_idle(env.cmd_runner(), env.get_wait_timeout(wait))
-            resource_running_on_after = get_resource_state(
-                env.get_cluster_state(), resource_id
-            )
-            if env.report_processor.report(
-                self._report_wait_result(
+
+            def report_wait_result(state):
+                return self._report_wait_result(
                     resource_id,
                     node,
                     resource_running_on_before,
-                    resource_running_on_after,
+                    get_resource_state(state, resource_id),
                 )
+
+            state, report_list = _wait_for_resource_state(
+                env,
+                wait,
+                [resource_id],
+                lambda state: (
+                    [resource_id]
+                    if report_wait_result(state).severity.level
+                    == reports.ReportItemSeverity.ERROR
+                    else []
+                ),
+            )
+            if env.report_processor.report_list(
+                [report_wait_result(state)] + report_list
             ).has_errors:
                 raise LibraryError()
 
@@ -1,9 +1,15 @@
 import os.path
+import time
 from typing import (
+    Any,
+    Callable,
+    Dict,
     Iterable,
     List,
     Mapping,
     NamedTuple,
+    Optional,
+    Tuple,
 )
 
 from lxml.etree import _Element
@@ -34,13 +40,47 @@ from pcs.lib.external import (
 from pcs.lib.node import get_existing_nodes_names
 from pcs.lib.node_communication import NodeTargetLibFactory
 from pcs.lib.pacemaker.live import (
+    get_cluster_status_dom,
     get_cluster_status_text,
     get_ticket_status_text,
 )
+from pcs.lib.pacemaker.state import (
+    get_nodes_status,
+    get_resources_status,
+)
 from pcs.lib.resource_agent import STONITH_ACTION_REPLACED_BY
 from pcs.lib.sbd import get_sbd_service_name
 
 
+class StatusSourceCache:
+    """
+    Results of slow sources of the cluster status kept between refreshes
+
+    Checking local services runs several processes and checking node
+    reachability connects to all nodes. When the status is refreshed
+    repeatedly, these are refreshed less often than the rest of the status.
+    """
+
+    def __init__(
+        self, max_age: float, get_time: Callable[[], float] = time.monotonic,
+    ):
+        """
+        max_age -- seconds after which a result is loaded again
+        get_time -- source of the current time
+        """
+        self._max_age = max_age
+        self._get_time = get_time
+        self._results: Dict[str, Tuple[float, Any]] = {}
+
+    def get(self, name: str, load: Callable[[], Any]) -> Any:
+        now = self._get_time()
+        result = self._results.get(name)
+        if result is None or now - result[0] >= self._max_age:
+            result = (now, load())
+            self._results[name] = result
+        return result[1]
+
+
 class _ServiceStatus(NamedTuple):
     service: str
     display_always: bool
@@ -52,6 +92,7 @@ def full_cluster_status_plaintext(
     env: LibraryEnvironment,
     hide_inactive_resources: bool = False,
     verbose: bool = False,
+    slow_sources_cache: Optional[StatusSourceCache] = None,
 ) -> str:
     """
     Return full cluster status as plaintext
@@ -59,6 +100,8 @@ def full_cluster_status_plaintext(
     env -- LibraryEnvironment
     hide_inactive_resources -- if True, do not display non-running resources
     verbose -- if True, display more info
+    slow_sources_cache -- reuse results of slow status sources from previous
+        calls, for refreshing the status repeatedly
     """
     # pylint: disable=too-many-branches
     # pylint: disable=too-many-locals
@@ -106,21 +149,31 @@ def full_cluster_status_plaintext(
         ) = get_ticket_status_text(runner)
     # get extra info if live
     if live:
-        try:
-            is_sbd_running = is_service_running(runner, get_sbd_service_name())
-        except LibraryError:
-            pass
-        local_services_status = _get_local_services_status(runner)
+
+        def cached(name: str, load: Callable[[], Any]) -> Any:
+            if slow_sources_cache is None:
+                return load()
+            return slow_sources_cache.get(name, load)
+
+        is_sbd_running = cached("sbd_running", lambda: _is_sbd_running(runner))
+        local_services_status = cached(
+            "local_services", lambda: _get_local_services_status(runner)
+        )
         if verbose and corosync_conf:
             node_name_list, node_names_report_list = get_existing_nodes_names(
                 corosync_conf
             )
             report_processor.report_list(node_names_report_list)
-            node_reachability = _get_node_reachability(
-                env.get_node_target_factory(),
-                env.get_node_communicator(),
-                report_processor,
-                node_name_list,
+            node_reachability = cached(
+                "node_reachability:{0}".format(
+                    ",".join(sorted(node_name_list))
+                ),
+                lambda: _get_node_reachability(
+                    env.get_node_target_factory(),
+                    env.get_node_communicator(),
+                    report_processor,
+                    node_name_list,
+                ),
             )
 
     # check stonith configuration
@@ -171,6 +224,19 @@ def full_cluster_status_plaintext(
     return "\n".join(parts)
 
 
+def cluster_status_structured(env: LibraryEnvironment) -> Dict[str, Any]:
+    """
+    Return status of cluster nodes and resources as a structure
+
+    env -- LibraryEnvironment
+    """
+    cluster_state = get_cluster_status_dom(env.cmd_runner())
+    return {
+        "nodes": get_nodes_status(cluster_state),
+        "resources": get_resources_status(cluster_state),
+    }
+
+
 def _stonith_warnings(cib: _Element, is_sbd_running: bool) -> List[str]:
     warning_list = []
 
@@ -213,6 +279,13 @@ def _stonith_warnings(cib: _Element, is_sbd_running: bool) -> List[str]:
     return warning_list
 
 
+def _is_sbd_running(runner: CommandRunner) -> bool:
+    try:
+        return is_service_running(runner, get_sbd_service_name())
+    except LibraryError:
+        return False
+
+
 def _get_local_services_status(runner: CommandRunner) -> List[_ServiceStatus]:
     service_def = [
         # (service name, display even if not enabled nor running)
@@ -1,7 +1,14 @@
 import base64
+import dataclasses
 import json
+from typing import List
+
+import dacite
 
 from pcs.common import reports
+from pcs.common.booth import BoothInstanceStatusDto
+from pcs.common.interface import dto
+from pcs.common.reports import ReportItemSeverity
 from pcs.common.reports.item import ReportItem
 from pcs.common.node_communicator import RequestData
 from pcs.lib.communication.tools import (
@@ -11,6 +18,7 @@ from pcs.lib.communication.tools import (
     SkipOfflineMixin,
     SimpleResponseProcessingMixin,
 )
+from pcs.lib.node_communication import response_to_report_item
 
 
 class BoothSendConfig(
@@ -174,3 +182,57 @@ class BoothSaveFiles(
                     reports.messages.InvalidResponseFormat(target.label)
                 )
             )
+
+
+class BoothGetStatusAll(
+    AllSameDataMixin, AllAtOnceStrategyMixin, RunRemotelyBase,
+):
+    """
+    Get status of all booth instances running on the targets
+    """
+
+    def __init__(self, report_processor):
+        super().__init__(report_processor)
+        self._status_list: List[BoothInstanceStatusDto] = []
+
+    def _get_request_data(self):
+        return RequestData("remote/booth_get_status_all", [("data_json", "{}")])
+
+    def _process_response(self, response):
+        # An unreachable host must not prevent getting status from the others.
+        report = response_to_report_item(
+            response, severity=ReportItemSeverity.WARNING
+        )
+        if report is not None:
+            self._report(report)
+            return
+        target = response.request.target
+        try:
+            output = json.loads(response.data)
+            if output["status"] != "success":
+                self._report(
+                    ReportItem.warning(
+                        reports.messages.NodeCommunicationCommandUnsuccessful(
+                            target.label,
+                            response.request.action,
+                            output["status_msg"] or "",
+                        )
+                    )
+                )
+                return
+            self._status_list.extend(
+                dataclasses.replace(
+                    dto.from_dict(BoothInstanceStatusDto, status_dict),
+                    host_name=target.label,
+                )
+                for status_dict in output["data"]
+            )
+        except (KeyError, TypeError, ValueError, dacite.DaciteError):
+            self._report(
+                ReportItem.warning(
+                    reports.messages.InvalidResponseFormat(target.label)
+                )
+            )
+
+    def on_complete(self) -> List[BoothInstanceStatusDto]:
+        return self._status_list
@@ -1,3 +1,5 @@
+import hashlib
+
 from pcs.common import reports
 from pcs.common.node_communicator import RequestData
 from pcs.common.reports.item import ReportItem
@@ -5,6 +7,7 @@ from pcs.lib.corosync import live as corosync_live
 from pcs.lib.communication.tools import (
     AllAtOnceStrategyMixin,
     AllSameDataMixin,
+    LimitedParallelStrategyMixin,
     OneByOneStrategyMixin,
     RunRemotelyBase,
     SkipOfflineMixin,
@@ -123,3 +126,48 @@ class GetQuorumStatus(AllSameDataMixin, OneByOneStrategyMixin, RunRemotelyBase):
 
     def on_complete(self):
         return self._has_failure, self._quorum_status
+
+
+class RestoreConfig(
+    AllSameDataMixin, LimitedParallelStrategyMixin, RunRemotelyBase
+):
+    """
+    Send a backup tarball to nodes and let them restore it
+    """
+
+    # The whole tarball is sent to each node. Limit the number of nodes it is
+    # being sent to at the same time.
+    _max_parallel = 8
+
+    def __init__(self, report_processor, tarball_data):
+        super().__init__(report_processor)
+        # The tarball is encoded only once, all requests share the data.
+        self._request_data = RequestData(
+            "remote/config_restore",
+            [
+                ("tarball", tarball_data),
+                # Nodes verify they received an undamaged tarball.
+                ("tarball_sha256", hashlib.sha256(tarball_data).hexdigest()),
+            ],
+        )
+        self._finished_count = 0
+
+    def _get_request_data(self):
+        return self._request_data
+
+    def _process_response(self, response):
+        self._finished_count += 1
+        report_item = self._get_response_report(response)
+        self._report(
+            ReportItem.info(
+                reports.messages.ConfigRestoreNodeFinished(
+                    response.request.target.label,
+                    response.data.strip() if report_item is None else None,
+                    self._finished_count,
+                    len(self._target_list),
+                )
+            )
+        )
+        if report_item is not None:
+            self._report(report_item)
+        return self._get_next_list()
@@ -1,6 +1,12 @@
+from itertools import islice
+import json
+
 from pcs.common import reports
 from pcs.common.reports.item import ReportItem
-from pcs.common.node_communicator import Request
+from pcs.common.node_communicator import (
+    Request,
+    RequestData,
+)
 from pcs.common.reports import ReportItemSeverity
 from pcs.lib.node_communication import response_to_report_item
 from pcs.lib.errors import LibraryError
@@ -203,6 +209,30 @@ class OneByOneStrategyMixin(StrategyBase):
             return []
 
 
+class LimitedParallelStrategyMixin(StrategyBase):
+    """
+    Communication strategy in which requests are executed in parallel, but at
+    most _max_parallel of them at the same time. Whenever a request finishes,
+    the next one is available by calling method _get_next_list.
+    """
+
+    # pylint: disable=abstract-method
+    _max_parallel = 8
+    __iter = None
+
+    def get_initial_request_list(self):
+        self.__iter = iter(self._prepare_initial_requests())
+        return list(islice(self.__iter, self._max_parallel))
+
+    def _get_next_list(self):
+        """
+        Returns a list which contains another Request object from
+        _prepare_initial_requests or an empty list when there is no request
+        left.
+        """
+        return list(islice(self.__iter, 1))
+
+
 class AllAtOnceStrategyMixin(StrategyBase):
     """
     Communication strategy in which all requests are executed at once in
@@ -244,10 +274,11 @@ class AllSameDataMixin:
         raise NotImplementedError()
 
     def _prepare_initial_requests(self):
-        return [
-            Request(target, self._get_request_data())
-            for target in self.__target_list
-        ]
+        if not self.__target_list:
+            return []
+        # serialize the data only once and share them by all requests
+        request_data = self._get_request_data()
+        return [Request(target, request_data) for target in self.__target_list]
 
     def add_request(self, target):
         """
@@ -351,3 +382,162 @@ class SkipOfflineMixin:
             forceable=self._failure_forceable,
             report_pcsd_too_old_on_404=self._report_pcsd_too_old_on_404,
         )
+
+
+class BatchResponse:
+    """
+    Response to one request of a batch, see RunBatch
+
+    It provides the same interface as pcs.common.node_communicator.Response
+    so that communication commands are able to process it.
+    """
+
+    def __init__(self, request, response_code, data):
+        """
+        Request request -- the request the response belongs to
+        int response_code -- http response code of the request
+        string data -- output of the request
+        """
+        self._request = request
+        self._response_code = response_code
+        self._data = data
+
+    @property
+    def request(self):
+        return self._request
+
+    @property
+    def was_connected(self):
+        return True
+
+    @property
+    def errno(self):
+        return None
+
+    @property
+    def error_msg(self):
+        return None
+
+    @property
+    def data(self):
+        return self._data
+
+    @property
+    def response_code(self):
+        return self._response_code
+
+
+class RunBatch(AllSameDataMixin, AllAtOnceStrategyMixin, RunRemotelyBase):
+    """
+    Run several communication commands with one request per target
+
+    Each node runs requests of the commands in the specified order and stops
+    once one of them fails. Responses to the requests are passed to the
+    commands as if the requests were sent separately. Only commands sending the
+    same request to all targets and not sending any further requests can be
+    run in a batch. Nodes must support the pcs.request-batch capability.
+    """
+
+    _report_pcsd_too_old_on_404 = True
+
+    def __init__(self, report_processor, com_cmd_list):
+        """
+        list com_cmd_list -- communication commands to run, the commands must
+            use AllSameDataMixin and AllAtOnceStrategyMixin
+        """
+        super().__init__(report_processor)
+        self._com_cmd_list = list(com_cmd_list)
+        self._request_data_list = []
+
+    def set_targets(self, target_list):
+        super().set_targets(target_list)
+        for com_cmd in self._com_cmd_list:
+            com_cmd.set_targets(target_list)
+
+    def _get_request_data(self):
+        # pylint: disable=protected-access
+        self._request_data_list = [
+            com_cmd._get_request_data() for com_cmd in self._com_cmd_list
+        ]
+        action_list = [
+            dict(
+                # "remote/<command>" urls are the only ones supported by pcsd
+                command=request_data.action[len("remote/") :],
+                params=dict(request_data.structured_data),
+            )
+            for request_data in self._request_data_list
+        ]
+        return RequestData(
+            "remote/run_batch",
+            [("data_json", json.dumps(dict(actions=action_list)))],
+        )
+
+    def _process_response(self, response):
+        report = self._get_response_report(response)
+        if report:
+            self._report(report)
+            return
+        target = response.request.target
+        try:
+            result_list = [
+                (int(result["status_code"]), str(result["output"]))
+                for result in json.loads(response.data)["results"]
+            ]
+        except (ValueError, TypeError, KeyError):
+            result_list = None
+        if (
+            result_list is None
+            or len(result_list) > len(self._com_cmd_list)
+            or (
+                # a node stops running the requests only if one of them fails
+                len(result_list) < len(self._com_cmd_list)
+                and (not result_list or 200 <= result_list[-1][0] < 300)
+            )
+        ):
+            self._report(
+                ReportItem.error(
+                    reports.messages.InvalidResponseFormat(target.label)
+                )
+            )
+            return
+        for com_cmd, request_data, (response_code, output) in zip(
+            self._com_cmd_list, self._request_data_list, result_list
+        ):
+            com_cmd.on_response(
+                BatchResponse(
+                    Request(target, request_data), response_code, output
+                )
+            )
+
+    def before(self):
+        for com_cmd in self._com_cmd_list:
+            com_cmd.before()
+
+    def on_complete(self):
+        return [com_cmd.on_complete() for com_cmd in self._com_cmd_list]
+
+    @property
+    def has_errors(self):
+        return super().has_errors or any(
+            com_cmd.has_errors for com_cmd in self._com_cmd_list
+        )
+
+
+def run_and_raise_all(
+    communicator, report_processor, cmd_list, target_list, batch=False
+):
+    """
+    Run communication commands one after another, stop on the first failure
+
+    NodeCommunicator communicator -- object used for communication
+    report_processor -- report processor of the commands
+    list cmd_list -- communication commands, see RunBatch for restrictions
+    list target_list -- RequestTarget list, run the commands on these targets
+    bool batch -- send only one request per target running all the commands,
+        see RunBatch
+    """
+    if batch:
+        cmd_list = [RunBatch(report_processor, cmd_list)]
+    for cmd in cmd_list:
+        cmd.set_targets(target_list)
+        run_and_raise(communicator, cmd)
@@ -1,5 +1,6 @@
 # pylint: disable=too-many-lines
 from collections import Counter, defaultdict, namedtuple
+from functools import lru_cache
 from itertools import zip_longest
 from typing import Optional
 
@@ -31,6 +32,9 @@ _QDEVICE_NET_OPTIONAL_OPTIONS = (
 )
 
 
+_NODE_OPTIONS = frozenset(["addrs", "name"])
+
+
 class _LinkAddrType(namedtuple("_LinkAddrType", "link addr_type")):
     pass
 
@@ -128,10 +132,8 @@ def create(
     nodes_with_empty_addr = set()
     # First, validate each node on its own. Also extract some info which will
     # be needed when validating the nodelist and inter-node dependencies.
+    report_items.extend(_validate_node_names(node_list))
     for i, node in enumerate(node_list, 1):
-        report_items.extend(
-            validate.ValidatorAll(_get_node_name_validators(i)).validate(node)
-        )
         if "name" in node and node["name"]:
             # Count occurrences of each node name. Do not bother counting
             # missing or empty names. They must be fixed anyway.
@@ -277,6 +279,38 @@ def _get_node_name_validators(node_index):
     ]
 
 
+def _validate_node_names(node_list):
+    """
+    Validate names of all the nodes at once
+
+    list node_list -- nodes data; list of dict: name, addrs
+    """
+    report_items = []
+    for i, node in enumerate(node_list, 1):
+        name = node.get("name")
+        # Nodes are mostly valid. Validators are only built for nodes failing
+        # this check, to report all their issues including the node index.
+        if (
+            node.keys() <= _NODE_OPTIONS
+            and isinstance(name, str)
+            and name
+            and validate.is_corosync_value(name)
+        ):
+            continue
+        report_items.extend(
+            validate.ValidatorAll(_get_node_name_validators(i)).validate(node)
+        )
+    return report_items
+
+
+def _validate_node_addr_value(addr):
+    if validate.is_corosync_value(addr):
+        return []
+    return validate.ValueCorosyncValue(
+        "addr", option_name_for_report="node address"
+    ).validate({"addr": addr})
+
+
 def _addr_type_analyzer():
     cache = dict()
 
@@ -346,9 +380,7 @@ def _validate_addr_type(
                 )
             )
         )
-    report_items += validate.ValueCorosyncValue(
-        "addr", option_name_for_report="node address"
-    ).validate({"addr": addr})
+    report_items += _validate_node_addr_value(addr)
 
 
 def _report_unresolvable_addresses_if_any(
@@ -413,10 +445,8 @@ def add_nodes(
 
     # First, validate each node on its own. Also extract some info which will
     # be needed when validating the nodelist and inter-node dependencies.
+    report_items.extend(_validate_node_names(node_list))
     for i, node in enumerate(node_list, 1):
-        report_items.extend(
-            validate.ValidatorAll(_get_node_name_validators(i)).validate(node)
-        )
         if "name" in node and node["name"]:
             # Count occurrences of each node name. Do not bother counting
             # missing or empty names. They must be fixed anyway.
@@ -472,9 +502,7 @@ def add_nodes(
                         )
                     )
                 )
-            report_items += validate.ValueCorosyncValue(
-                "addr", option_name_for_report="node address"
-            ).validate({"addr": addr})
+            report_items += _validate_node_addr_value(addr)
 
         new_addr_types_per_node.append(addr_types)
     # Report all empty and unresolvable addresses at once instead on each own.
@@ -619,9 +647,12 @@ def _check_link_options_count(link_count, max_allowed_link_count):
     return report_items
 
 
-def _get_link_options_validators_udp(options, allow_empty_values=False):
+@lru_cache()
+def _get_link_options_validators_udp(allow_empty_values=False):
     # This only returns validators checking single values. Add checks for
     # intervalues relationships as needed.
+    # The validators do not depend on validated options, so they are built
+    # only once and shared by all links.
     validators = [
         validate.ValueIpAddress("bindnetaddr"),
         validate.ValueIn("broadcast", ("0", "1")),
@@ -632,18 +663,16 @@ def _get_link_options_validators_udp(options, allow_empty_values=False):
     if allow_empty_values:
         for val in validators:
             val.empty_string_valid = True
-    return (
+    return tuple(
         [validate.NamesIn(constants.LINK_OPTIONS_UDP, option_type="link")]
-        + _get_unsuitable_keys_and_values_validators(
-            options, option_type="link"
-        )
+        + _get_unsuitable_keys_and_values_validators(option_type="link")
         + validators
     )
 
 
 def _update_link_options_udp(new_options, current_options):
     report_items = validate.ValidatorAll(
-        _get_link_options_validators_udp(new_options, allow_empty_values=True)
+        _get_link_options_validators_udp(allow_empty_values=True)
     ).validate(new_options)
 
     # default values taken from `man corosync.conf`
@@ -682,7 +711,7 @@ def create_link_list_udp(link_list, max_allowed_link_count):
 
     options = link_list[0]
     report_items = validate.ValidatorAll(
-        _get_link_options_validators_udp(options, allow_empty_values=False)
+        _get_link_options_validators_udp(allow_empty_values=False)
     ).validate(options)
     # default values taken from `man corosync.conf`
     if options.get("broadcast", "0") == "1" and "mcastaddr" in options:
@@ -754,11 +783,14 @@ def create_link_list_knet(link_list, max_allowed_link_count):
     return report_items
 
 
+@lru_cache()
 def _get_link_options_validators_knet(
-    options, allow_empty_values=False, including_linknumber=True
+    allow_empty_values=False, including_linknumber=True
 ):
     # This only returns validators checking single values. Add checks for
     # intervalues relationships as needed.
+    # The validators do not depend on validated options, so they are built
+    # only once and shared by all links.
     validators = [
         validate.ValueIntegerInRange("link_priority", 0, 255),
         validate.ValuePortNumber("mcastport"),
@@ -786,27 +818,26 @@ def _get_link_options_validators_knet(
     if allow_empty_values:
         for val in validators:
             val.empty_string_valid = True
-    return (
+    return tuple(
         [validate.NamesIn(allowed_options, option_type="link")]
-        + _get_unsuitable_keys_and_values_validators(
-            options, option_type="link"
-        )
+        + _get_unsuitable_keys_and_values_validators(option_type="link")
         + validators
     )
 
 
+@lru_cache()
 def _get_link_options_validators_knet_relations():
     types = dict(option_type="link", prerequisite_type="link")
-    return [
+    return (
         validate.DependsOnOption(["ping_interval"], "ping_timeout", **types),
         validate.DependsOnOption(["ping_timeout"], "ping_interval", **types),
-    ]
+    )
 
 
 def _add_link_options_knet(options):
     return validate.ValidatorAll(
         _get_link_options_validators_knet(
-            options, allow_empty_values=False, including_linknumber=True
+            allow_empty_values=False, including_linknumber=True
         )
         + _get_link_options_validators_knet_relations()
     ).validate(options)
@@ -829,7 +860,7 @@ def _update_link_options_knet(new_options, current_options):
 
     return validate.ValidatorAll(
         _get_link_options_validators_knet(
-            new_options, allow_empty_values=True, including_linknumber=False
+            allow_empty_values=True, including_linknumber=False
         )
     ).validate(new_options) + validate.ValidatorAll(
         _get_link_options_validators_knet_relations()
@@ -1232,7 +1263,7 @@ def create_transport_udp(generic_options, compression_options, crypto_options):
         validate.ValueIn("ip_version", constants.IP_VERSION_VALUES),
         validate.ValuePositiveInteger("netmtu"),
     ] + _get_unsuitable_keys_and_values_validators(
-        generic_options, option_type="udp/udpu transport"
+        option_type="udp/udpu transport"
     )
     report_items = validate.ValidatorAll(validators).validate(generic_options)
 
@@ -1280,9 +1311,7 @@ def create_transport_knet(generic_options, compression_options, crypto_options):
         validate.ValueIn("ip_version", constants.IP_VERSION_VALUES),
         validate.ValueNonnegativeInteger("knet_pmtud_interval"),
         validate.ValueIn("link_mode", ("active", "passive", "rr")),
-    ] + _get_unsuitable_keys_and_values_validators(
-        generic_options, option_type="knet transport"
-    )
+    ] + _get_unsuitable_keys_and_values_validators(option_type="knet transport")
 
     compression_allowed = [
         "level",
@@ -1296,9 +1325,7 @@ def create_transport_knet(generic_options, compression_options, crypto_options):
             "model", "a compression model e.g. zlib, lz4 or bzip2"
         ),
         validate.ValueNonnegativeInteger("threshold"),
-    ] + _get_unsuitable_keys_and_values_validators(
-        compression_options, option_type="compression"
-    )
+    ] + _get_unsuitable_keys_and_values_validators(option_type="compression")
 
     crypto_allowed = [
         "cipher",
@@ -1312,9 +1339,7 @@ def create_transport_knet(generic_options, compression_options, crypto_options):
             "hash", ("none", "md5", "sha1", "sha256", "sha384", "sha512")
         ),
         validate.ValueIn("model", ("nss", "openssl")),
-    ] + _get_unsuitable_keys_and_values_validators(
-        crypto_options, option_type="crypto"
-    )
+    ] + _get_unsuitable_keys_and_values_validators(option_type="crypto")
 
     report_items = (
         validate.ValidatorAll(generic_validators).validate(generic_options)
@@ -1392,7 +1417,7 @@ def create_totem(options):
         validate.ValueNonnegativeInteger("token_retransmit"),
         validate.ValueNonnegativeInteger("token_retransmits_before_loss_const"),
         validate.ValueNonnegativeInteger("window_size"),
-    ] + _get_unsuitable_keys_and_values_validators(options, option_type="totem")
+    ] + _get_unsuitable_keys_and_values_validators(option_type="totem")
     return validate.ValidatorAll(validators).validate(options)
 
 
@@ -1474,9 +1499,7 @@ def update_quorum_options(options, has_qdevice, current_options):
 
 def _validate_quorum_options(options, has_qdevice, allow_empty_values):
     report_items = validate.ValidatorAll(
-        _get_quorum_options_validators(
-            options, allow_empty_values=allow_empty_values
-        )
+        _get_quorum_options_validators(allow_empty_values=allow_empty_values)
     ).validate(options)
 
     if has_qdevice:
@@ -1497,7 +1520,7 @@ def _validate_quorum_options(options, has_qdevice, allow_empty_values):
     return report_items
 
 
-def _get_quorum_options_validators(options, allow_empty_values=False):
+def _get_quorum_options_validators(allow_empty_values=False):
     allowed_bool = ("0", "1")
     validators = [
         validate.ValueIn("auto_tie_breaker", allowed_bool),
@@ -1510,9 +1533,7 @@ def _get_quorum_options_validators(options, allow_empty_values=False):
             val.empty_string_valid = True
     return (
         [validate.NamesIn(constants.QUORUM_OPTIONS, option_type="quorum")]
-        + _get_unsuitable_keys_and_values_validators(
-            options, option_type="quorum"
-        )
+        + _get_unsuitable_keys_and_values_validators(option_type="quorum")
         + validators
     )
 
@@ -1561,14 +1582,10 @@ def add_quorum_device(
     return (
         model_report_items
         + validate.ValidatorAll(
-            _get_unsuitable_keys_and_values_validators(
-                model_options, "quorum device model"
-            )
+            _get_unsuitable_keys_and_values_validators("quorum device model")
         ).validate(model_options)
         + validate.ValidatorAll(
-            _get_qdevice_generic_options_validators(
-                generic_options, force_options=force_options
-            )
+            _get_qdevice_generic_options_validators(force_options=force_options)
         ).validate(generic_options)
         + _qdevice_add_heuristics_options(heuristics_options, force_options)
     )
@@ -1605,15 +1622,11 @@ def update_quorum_device(
     return (
         model_report_items
         + validate.ValidatorAll(
-            _get_unsuitable_keys_and_values_validators(
-                model_options, "quorum device model"
-            )
+            _get_unsuitable_keys_and_values_validators("quorum device model")
         ).validate(model_options)
         + validate.ValidatorAll(
             _get_qdevice_generic_options_validators(
-                generic_options,
-                allow_empty_values=True,
-                force_options=force_options,
+                allow_empty_values=True, force_options=force_options,
             )
         ).validate(generic_options)
         + _qdevice_update_heuristics_options(heuristics_options, force_options)
@@ -1637,7 +1650,7 @@ def _qdevice_add_heuristics_options(options, force_options=False):
     ]
     return (
         validate.ValidatorAll(
-            _get_unsuitable_keys_and_values_validators(options, "heuristics")
+            _get_unsuitable_keys_and_values_validators("heuristics")
         ).validate(options)
         + validate.ValidatorAll(validators_nonexec).validate(options_nonexec)
         + validate.ValidatorAll(validators_exec).validate(options_exec)
@@ -1660,7 +1673,7 @@ def _qdevice_update_heuristics_options(options, force_options=False):
     # No validation necessary for values of exec options - they are either
     # empty (meaning they will be removed) or nonempty strings.
     return validate.ValidatorAll(
-        _get_unsuitable_keys_and_values_validators(options, "heuristics")
+        _get_unsuitable_keys_and_values_validators("heuristics")
     ).validate(options) + validate.ValidatorAll(validators_nonexec).validate(
         options_nonexec
     )
@@ -1702,7 +1715,7 @@ def _qdevice_update_model_net_options(options, node_ids, force_options=False):
 
 
 def _get_qdevice_generic_options_validators(
-    options, allow_empty_values=False, force_options=False
+    allow_empty_values=False, force_options=False
 ):
     severity = reports.item.get_severity(
         reports.codes.FORCE_OPTIONS, force_options
@@ -1725,7 +1738,7 @@ def _get_qdevice_generic_options_validators(
                 severity=severity,
             )
         ]
-        + _get_unsuitable_keys_and_values_validators(options, "quorum device")
+        + _get_unsuitable_keys_and_values_validators("quorum device")
         + validators
     )
 
@@ -1832,7 +1845,8 @@ def _get_option_after_update(
     return current_options.get(option_name, default_value)
 
 
-def _get_unsuitable_keys_and_values_validators(option_dict, option_type=None):
-    return [validate.CorosyncOption(option_type=option_type)] + [
-        validate.ValueCorosyncValue(name) for name in option_dict
+def _get_unsuitable_keys_and_values_validators(option_type=None):
+    return [
+        validate.CorosyncOption(option_type=option_type),
+        validate.CorosyncValues(),
     ]
@@ -38,12 +38,11 @@ from pcs.lib.pacemaker.live import (
     ensure_cib_version,
     get_cib,
     get_cib_xml,
-    get_cluster_status_xml,
+    get_cluster_status_dom,
     push_cib_diff_xml,
     replace_cib_configuration,
     wait_for_idle,
 )
-from pcs.lib.pacemaker.state import get_cluster_state_dom
 from pcs.lib.pacemaker.values import get_valid_timeout_seconds
 from pcs.lib.tools import write_tmpfile
 from pcs.lib.xml_tools import etree_to_str
@@ -65,6 +64,8 @@ class LibraryEnvironment:
         booth_files_data=None,
         known_hosts_getter=None,
         request_timeout=None,
+        communication_timing=None,
+        wait_targeted=False,
     ):
         # pylint: disable=too-many-arguments
         self._logger = logger
@@ -75,6 +76,7 @@ class LibraryEnvironment:
         self._corosync_conf_data = corosync_conf_data
         self._booth_files_data = booth_files_data or {}
         self._request_timeout = request_timeout
+        self._wait_targeted = wait_targeted
         # TODO tokens probably should not be inserted from outside, but we're
         # postponing dealing with them, because it's not that easy to move
         # related code currently - it's in pcsd
@@ -90,6 +92,7 @@ class LibraryEnvironment:
             self.user_login,
             self.user_groups,
             self._request_timeout,
+            timing=communication_timing,
         )
         self.__loaded_booth_env = None
         self.__loaded_dr_env = None
@@ -112,6 +115,14 @@ class LibraryEnvironment:
     def user_groups(self):
         return self._user_groups
 
+    @property
+    def wait_targeted(self) -> bool:
+        """
+        Wait only until resources get to their expected state instead of
+        waiting for the cluster to settle
+        """
+        return self._wait_targeted
+
     @property
     def ghost_file_codes(self):
         codes = set()
@@ -173,7 +184,7 @@ class LibraryEnvironment:
         return self.__loaded_cib_to_modify
 
     def get_cluster_state(self):
-        return get_cluster_state_dom(get_cluster_status_xml(self.cmd_runner()))
+        return get_cluster_status_dom(self.cmd_runner())
 
     def get_wait_timeout(self, wait):
         if wait is False:
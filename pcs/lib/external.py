@@ -1,8 +1,18 @@
+import io
 import re
 from shlex import quote as shell_quote
 import signal
 import subprocess
-from typing import Optional
+import tempfile
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 from pcs import settings
 from pcs.common import reports
@@ -64,6 +74,95 @@ class CommandRunner:
     def run(
         self, args, stdin_string=None, env_extend=None, binary_output=False
     ):
+        log_args, env_vars = self._log_start(args, stdin_string, env_extend)
+        try:
+            process = self._popen(
+                args,
+                env_vars,
+                stdin=(
+                    subprocess.PIPE
+                    if stdin_string is not None
+                    else subprocess.DEVNULL
+                ),
+                stderr=subprocess.PIPE,
+                # decodes newlines and in python3 also converts bytes to str
+                universal_newlines=(not binary_output),
+            )
+            out_std, out_err = process.communicate(stdin_string)
+            retval = process.returncode
+        except OSError as e:
+            raise LibraryError(
+                ReportItem.error(
+                    reports.messages.RunExternalProcessError(
+                        log_args, e.strerror,
+                    )
+                )
+            ) from e
+
+        self._log_finish(log_args, retval, out_std, out_err)
+        return out_std, out_err, retval
+
+    def run_stream(
+        self,
+        args: List[str],
+        consume_stdout: Callable[[BinaryIO], Any],
+        env_extend: Optional[Mapping[str, str]] = None,
+    ) -> Tuple[Any, str, str, int]:
+        """
+        Run a process and let stdout be processed while it is being read
+
+        The whole stdout is never held in memory. Only its beginning is kept
+        for error messages and debug output.
+
+        args -- the command to run
+        consume_stdout -- process the binary stdout, return the result
+        env_extend -- environment variables to be added for the process
+
+        Return the result of consume_stdout (None if it failed and so did the
+        process), the beginning of stdout, stderr and the exit code. If
+        consume_stdout fails and the process succeeds, the error is raised.
+        """
+        log_args, env_vars = self._log_start(args, None, env_extend)
+        try:
+            # Stderr goes to a file, a full stderr pipe would block the process
+            # while its stdout is being consumed.
+            with tempfile.TemporaryFile() as stderr_file:
+                process = self._popen(
+                    args,
+                    env_vars,
+                    stdin=subprocess.DEVNULL,
+                    stderr=stderr_file,
+                    universal_newlines=False,
+                )
+                stdout = _StdoutHeadKeeper(process.stdout)
+                result, consume_error = _consume_stream(
+                    consume_stdout, io.BufferedReader(stdout)
+                )
+                # let the process finish even if its output is not needed
+                stdout.drain()
+                process.stdout.close()
+                retval = process.wait()
+                stderr_file.seek(0)
+                # decode the same way as universal_newlines does
+                out_err = io.TextIOWrapper(stderr_file).read()
+        except OSError as e:
+            raise LibraryError(
+                ReportItem.error(
+                    reports.messages.RunExternalProcessError(
+                        log_args, e.strerror,
+                    )
+                )
+            ) from e
+
+        out_std = stdout.get_head()
+        self._log_finish(log_args, retval, out_std, out_err)
+        if consume_error is not None:
+            if retval == 0:
+                raise consume_error
+            result = None
+        return result, out_std, out_err, retval
+
+    def _log_start(self, args, stdin_string, env_extend):
         # Allow overriding default settings. If a piece of code really wants to
         # set own PATH or CIB_file, we must allow it. I.e. it wants to run
         # a pacemaker tool on a CIB in a file but cannot afford the risk of
@@ -104,40 +203,23 @@ class CommandRunner:
                 )
             )
         )
+        return log_args, env_vars
+
+    @staticmethod
+    def _popen(args, env_vars, **kwargs):
+        # pylint: disable=subprocess-popen-preexec-fn
+        # this is OK as pcs is only single-threaded application
+        return subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            preexec_fn=(lambda: signal.signal(signal.SIGPIPE, signal.SIG_DFL)),
+            close_fds=True,
+            shell=False,
+            env=env_vars,
+            **kwargs,
+        )
 
-        try:
-            # pylint: disable=subprocess-popen-preexec-fn
-            # this is OK as pcs is only single-threaded application
-            process = subprocess.Popen(
-                args,
-                # Some commands react differently if they get anything via stdin
-                stdin=(
-                    subprocess.PIPE
-                    if stdin_string is not None
-                    else subprocess.DEVNULL
-                ),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                preexec_fn=(
-                    lambda: signal.signal(signal.SIGPIPE, signal.SIG_DFL)
-                ),
-                close_fds=True,
-                shell=False,
-                env=env_vars,
-                # decodes newlines and in python3 also converts bytes to str
-                universal_newlines=(not binary_output),
-            )
-            out_std, out_err = process.communicate(stdin_string)
-            retval = process.returncode
-        except OSError as e:
-            raise LibraryError(
-                ReportItem.error(
-                    reports.messages.RunExternalProcessError(
-                        log_args, e.strerror,
-                    )
-                )
-            ) from e
-
+    def _log_finish(self, log_args, retval, out_std, out_err):
         self._logger.debug(
             (
                 "Finished running: {args}\nReturn value: {retval}"
@@ -154,7 +236,57 @@ class CommandRunner:
                 )
             )
         )
-        return out_std, out_err, retval
+
+
+def _consume_stream(
+    consume: Callable[[BinaryIO], Any], stream: BinaryIO
+) -> Tuple[Any, Optional[Exception]]:
+    """
+    Return the result of consume or the exception it raised
+    """
+    try:
+        return consume(stream), None
+    # pylint: disable=broad-except
+    except Exception as e:
+        return None, e
+
+
+class _StdoutHeadKeeper(io.RawIOBase):
+    """
+    Binary stdout of a process which remembers how it started
+    """
+
+    def __init__(self, stream: BinaryIO, head_size: int = 4096):
+        super().__init__()
+        self._stream = stream
+        self._head_size = head_size
+        self._head = b""
+        self._size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._read_stream(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def drain(self) -> None:
+        while self._read_stream(65536):
+            pass
+
+    def get_head(self) -> str:
+        head = self._head.decode("utf-8", errors="replace")
+        if self._size > len(self._head):
+            head += "\n... ({0} bytes in total)".format(self._size)
+        return head
+
+    def _read_stream(self, size: int) -> bytes:
+        data = self._stream.read(size)
+        if len(self._head) < self._head_size:
+            self._head += data[: self._head_size - len(self._head)]
+        self._size += len(data)
+        return data
 
 
 def _get_service_name(service, instance=None):
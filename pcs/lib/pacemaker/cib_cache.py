@@ -0,0 +1,178 @@
+"""
+Snapshot of the CIB shared by all CIB accessors of a pcs process
+
+Loading the CIB means transferring the whole CIB from pacemaker, which is
+slow for big CIBs, and pcs commands often load it several times. Every change
+of the CIB bumps at least one of its admin_epoch, epoch and num_updates
+attributes. A snapshot of the CIB is therefore reused as long as the version
+of the live CIB matches the version of the snapshot. The version is obtained
+by querying the cib element without its children, which is cheap.
+
+The snapshot is kept in memory of the process only. The cache is disabled
+unless the pcs CLI enables it, so the library does not change its behavior
+when used from elsewhere.
+"""
+from collections import namedtuple
+import re
+from typing import (
+    Callable,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+
+CibVersion = namedtuple("CibVersion", "admin_epoch epoch num_updates")
+
+
+_CIB_TAG_RE = re.compile(r"<cib\b[^>]*>")
+_ATTR_RE = re.compile(r"""([\w:-]+)\s*=\s*(["'])(.*?)\2""", re.DOTALL)
+
+
+def get_cib_version(cib_xml: str) -> Optional[CibVersion]:
+    """
+    Return the version of a CIB without parsing the whole CIB
+
+    cib_xml -- the CIB or just its cib element
+    """
+    match = _CIB_TAG_RE.search(cib_xml)
+    if match is None:
+        return None
+    attrs = {
+        name: value for name, dummy_quote, value in _ATTR_RE.findall(match[0])
+    }
+    try:
+        return CibVersion(
+            int(attrs.get("admin_epoch", "0")),
+            int(attrs["epoch"]),
+            int(attrs.get("num_updates", "0")),
+        )
+    except (KeyError, ValueError):
+        return None
+
+
+class CibSnapshotCache:
+    def __init__(self) -> None:
+        self._identity: Optional[str] = None
+        self._version: Optional[CibVersion] = None
+        self._cib_xml: Optional[str] = None
+
+    def has_snapshot(self, identity: str) -> bool:
+        """
+        Tell whether there is a snapshot worth validating
+
+        identity -- who the CIB is loaded for, the CIB content depends on ACLs
+        """
+        return self._cib_xml is not None and self._identity == identity
+
+    def get(
+        self, identity: str, version: Optional[CibVersion]
+    ) -> Optional[str]:
+        """
+        Return the snapshot if it matches the live CIB version
+
+        identity -- who the CIB is loaded for, the CIB content depends on ACLs
+        version -- version of the live CIB
+        """
+        if version is None or not self.has_snapshot(identity):
+            return None
+        return self._cib_xml if version == self._version else None
+
+    def put(self, identity: str, cib_xml: str) -> None:
+        """
+        Store a freshly loaded CIB as the snapshot
+
+        identity -- who the CIB is loaded for, the CIB content depends on ACLs
+        """
+        version = get_cib_version(cib_xml)
+        if version is None:
+            return
+        self._identity = identity
+        self._version = version
+        self._cib_xml = cib_xml
+
+
+_cache: Optional[CibSnapshotCache] = None
+
+
+def enable() -> None:
+    """
+    Start caching the CIB in the current process
+    """
+    # pylint: disable=global-statement
+    global _cache
+    _cache = CibSnapshotCache()
+
+
+def is_enabled() -> bool:
+    return _cache is not None
+
+
+def disable() -> None:
+    # pylint: disable=global-statement
+    global _cache
+    _cache = None
+
+
+def _get_identity(env_vars: Mapping[str, str]) -> Optional[str]:
+    # Return who the CIB is loaded for or None if it cannot be cached
+    if env_vars.get("CIB_file"):
+        # reading a file is cheap and the file is changed behind our back
+        return None
+    return "{0}:{1}".format(
+        env_vars.get("CIB_user", ""), env_vars.get("CIB_user_groups", "")
+    )
+
+
+def load_cib_xml(
+    env_vars: Mapping[str, str],
+    load_cib: Callable[[], Tuple[str, bool]],
+    load_cib_element: Callable[[], Tuple[str, bool]],
+) -> Tuple[str, bool]:
+    """
+    Return the CIB from the snapshot if it is up to date, load it otherwise
+
+    env_vars -- environment variables pacemaker tools are run with
+    load_cib -- load the whole CIB, return its xml and whether it succeeded
+    load_cib_element -- load the cib element without children, return its xml
+        and whether it succeeded
+    """
+    cache = _cache
+    identity = _get_identity(env_vars) if cache is not None else None
+    if cache is None or identity is None:
+        return load_cib()
+    # With no snapshot, checking the version would only cost a process.
+    if cache.has_snapshot(identity):
+        cib_element_xml, success = load_cib_element()
+        if success:
+            cib_xml = cache.get(identity, get_cib_version(cib_element_xml))
+            if cib_xml is not None:
+                return cib_xml, True
+    cib_xml, success = load_cib()
+    if success:
+        cache.put(identity, cib_xml)
+    return cib_xml, success
+
+
+def get_snapshot_cib_xml(
+    env_vars: Mapping[str, str],
+    load_cib_element: Callable[[], Tuple[str, bool]],
+) -> Optional[str]:
+    """
+    Return the CIB from the snapshot if there is one and it is up to date
+
+    Unlike load_cib_xml, the whole CIB is never loaded here. This is meant for
+    queries which are cheaper to run against the live CIB than loading it.
+
+    env_vars -- environment variables pacemaker tools are run with
+    load_cib_element -- load the cib element without children, return its xml
+        and whether it succeeded
+    """
+    cache = _cache
+    identity = _get_identity(env_vars) if cache is not None else None
+    if cache is None or identity is None or not cache.has_snapshot(identity):
+        return None
+    cib_element_xml, success = load_cib_element()
+    if not success:
+        return None
+    return cache.get(identity, get_cib_version(cib_element_xml))
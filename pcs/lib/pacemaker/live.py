@@ -1,6 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import math
 import os.path
 import re
+import time
 from typing import (
+    Callable,
+    Dict,
     Iterable,
     List,
     Optional,
@@ -17,6 +23,7 @@ from pcs.common.reports.item import ReportItem
 from pcs.common.str_tools import join_multilines
 from pcs.common.tools import (
     format_os_error,
+    xml_fromstream,
     xml_fromstring,
     Version,
 )
@@ -24,7 +31,11 @@ from pcs.common.types import CibRuleInEffectStatus
 from pcs.lib.cib.tools import get_pacemaker_version_by_which_cib_was_validated
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import CommandRunner
-from pcs.lib.pacemaker.state import ClusterState
+from pcs.lib.pacemaker import cib_cache
+from pcs.lib.pacemaker.state import (
+    ClusterState,
+    read_cluster_state_dom,
+)
 from pcs.lib.tools import write_tmpfile
 from pcs.lib.xml_tools import etree_to_str
 
@@ -58,6 +69,23 @@ def get_cluster_status_xml(runner):
     return stdout
 
 
+def get_cluster_status_dom(runner: CommandRunner) -> _Element:
+    """
+    Load the cluster status without holding the whole crm_mon output in memory
+    """
+    dom, stdout, stderr, retval = runner.run_stream(
+        [__exec("crm_mon"), "--one-shot", "--as-xml", "--inactive"],
+        read_cluster_state_dom,
+    )
+    if retval != 0:
+        raise CrmMonErrorException(
+            ReportItem.error(
+                reports.messages.CrmMonError(join_multilines([stderr, stdout]))
+            )
+        )
+    return dom
+
+
 def get_cluster_status_text(
     runner: CommandRunner, hide_inactive_resources: bool, verbose: bool,
 ) -> Tuple[str, List[str]]:
@@ -105,23 +133,89 @@ def get_cib_xml_cmd_results(runner, scope=None):
     return stdout, stderr, returncode
 
 
+def _get_cib_element_xml(runner):
+    stdout, dummy_stderr, retval = runner.run(
+        [
+            __exec("cibadmin"),
+            "--local",
+            "--query",
+            "--xpath",
+            "/cib",
+            "--no-children",
+        ]
+    )
+    return stdout, retval == 0
+
+
 def get_cib_xml(runner, scope=None):
-    stdout, stderr, retval = get_cib_xml_cmd_results(runner, scope)
+    if scope:
+        stdout, stderr, retval = get_cib_xml_cmd_results(runner, scope)
+    else:
+        results = []
+
+        def load_cib():
+            results.append(get_cib_xml_cmd_results(runner))
+            return results[-1][0], results[-1][2] == 0
+
+        cib_xml, success = cib_cache.load_cib_xml(
+            runner.env_vars, load_cib, lambda: _get_cib_element_xml(runner),
+        )
+        if success:
+            return cib_xml
+        stdout, stderr, retval = results[-1]
     if retval != 0:
-        if retval == __EXITCODE_CIB_SCOPE_VALID_BUT_NOT_PRESENT and scope:
+        raise _get_cib_load_error(retval, scope, stdout, stderr)
+    return stdout
+
+
+def get_cib_dom(
+    runner: CommandRunner,
+    scope: Optional[str] = None,
+    skip_children_of: Iterable[str] = (),
+) -> _Element:
+    """
+    Load and parse the CIB without holding its whole xml in memory
+
+    The operation history in the status section is often most of the CIB.
+    Callers which do not need it save a lot of memory by skipping it.
+
+    scope -- load only the specified section of the CIB
+    skip_children_of -- tags of elements to be loaded empty, e.g. "status" if
+        only the configuration is needed or "lrm" to drop the operation history
+        while keeping node attributes
+    """
+    command = [__exec("cibadmin"), "--local", "--query"]
+    if scope:
+        command.append("--scope={0}".format(scope))
+
+    def parse(stream):
+        try:
+            return xml_fromstream(stream, skip_children_of)
+        except etree.XMLSyntaxError as e:
             raise LibraryError(
-                ReportItem.error(
-                    reports.messages.CibLoadErrorScopeMissing(
-                        scope, join_multilines([stderr, stdout])
-                    )
-                )
-            )
-        raise LibraryError(
+                ReportItem.error(reports.messages.CibLoadErrorBadFormat(str(e)))
+            ) from e
+
+    cib, stdout, stderr, retval = runner.run_stream(command, parse)
+    if retval != 0:
+        raise _get_cib_load_error(retval, scope, stdout, stderr)
+    return cib
+
+
+def _get_cib_load_error(retval, scope, stdout, stderr):
+    if retval == __EXITCODE_CIB_SCOPE_VALID_BUT_NOT_PRESENT and scope:
+        return LibraryError(
             ReportItem.error(
-                reports.messages.CibLoadError(join_multilines([stderr, stdout]))
+                reports.messages.CibLoadErrorScopeMissing(
+                    scope, join_multilines([stderr, stdout])
+                )
             )
         )
-    return stdout
+    return LibraryError(
+        ReportItem.error(
+            reports.messages.CibLoadError(join_multilines([stderr, stdout]))
+        )
+    )
 
 
 def parse_cib_xml(xml):
@@ -393,7 +487,10 @@ def simulate_cib(runner, cib):
     CommandRunner runner -- runner
     etree cib -- cib tree to simulate
     """
-    cib_xml = etree_to_str(cib)
+    return _simulate_cib_xml_parsed(runner, etree_to_str(cib))
+
+
+def _simulate_cib_xml_parsed(runner, cib_xml):
     try:
         plaintext_result, transitions_xml, new_cib_xml = simulate_cib_xml(
             runner, cib_xml
@@ -409,6 +506,44 @@ def simulate_cib(runner, cib):
         ) from e
 
 
+def simulate_cib_list(
+    runner: CommandRunner,
+    cib_list: Iterable[_Element],
+    max_workers: Optional[int] = None,
+) -> List[Tuple[str, _Element, _Element]]:
+    """
+    Run crm_simulate for several CIBs, return results in the order of the CIBs
+
+    crm_simulate processes run in parallel. Each distinct CIB is simulated
+    only once, CIBs with the same content share the result.
+
+    runner -- runner
+    cib_list -- cib trees to simulate
+    max_workers -- max number of crm_simulate processes running at once
+    """
+    digest_list = []
+    digest_to_cib_xml: Dict[str, str] = {}
+    for cib in cib_list:
+        cib_xml = etree_to_str(cib)
+        digest = hashlib.sha256(cib_xml.encode("utf-8")).hexdigest()
+        digest_list.append(digest)
+        digest_to_cib_xml.setdefault(digest, cib_xml)
+
+    with ThreadPoolExecutor(
+        max_workers=(max_workers or settings.simulate_max_workers)
+    ) as executor:
+        digest_to_future = {
+            digest: executor.submit(_simulate_cib_xml_parsed, runner, cib_xml)
+            for digest, cib_xml in digest_to_cib_xml.items()
+        }
+        # result() raises the exception raised in the worker, if any
+        digest_to_result = {
+            digest: future.result()
+            for digest, future in digest_to_future.items()
+        }
+    return [digest_to_result[digest] for digest in digest_list]
+
+
 ### wait for idle
 
 
@@ -444,6 +579,40 @@ def wait_for_idle(runner, timeout=None):
         )
 
 
+def wait_for_cluster_state(
+    runner: CommandRunner,
+    is_done: Callable[[_Element], bool],
+    timeout: Optional[int] = None,
+    get_time: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Tuple[_Element, Optional[int]]:
+    """
+    Poll the cluster state until it satisfies a condition or a timeout expires
+
+    Unlike waiting for idle, this does not wait for transitions unrelated to
+    the condition. The cluster state is polled often at first, as the expected
+    changes usually happen shortly, and less often later.
+
+    runner -- preconfigured object for running external programs
+    is_done -- tells whether a cluster state ends the waiting
+    timeout -- seconds to wait, None for no limit
+    Return the last cluster state and the number of seconds left to the
+    timeout (0 if it expired, None if there is no limit).
+    """
+    deadline = None if timeout is None else get_time() + timeout
+    interval = settings.cluster_state_poll_interval_min
+    while True:
+        state = get_cluster_status_dom(runner)
+        remaining = None if deadline is None else deadline - get_time()
+        if is_done(state) or (remaining is not None and remaining <= 0):
+            break
+        sleep(interval if remaining is None else min(interval, remaining))
+        interval = min(interval * 2, settings.cluster_state_poll_interval_max)
+    if remaining is None:
+        return state, None
+    return state, max(0, math.ceil(remaining))
+
+
 ### nodes
 
 
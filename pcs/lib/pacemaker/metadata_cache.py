@@ -0,0 +1,85 @@
+"""
+Persistent cache of data derived from pacemaker daemons' metadata
+
+Running 'pacemaker-<daemon> metadata' forks a process and its output only
+changes when pacemaker is upgraded. Data derived from the output is stored in
+a file together with paths, mtimes and sizes of the daemon binaries and is
+reused until any of the binaries changes. The data are combined with pcs-side
+definitions as well, so the pcs version is a part of the key too.
+"""
+import json
+import os
+import os.path
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from pcs import settings
+
+T = TypeVar("T")
+
+
+def get_cached(
+    cache_name: str, daemon_path_list: Iterable[str], loader: Callable[[], T]
+) -> T:
+    """
+    Return data from the cache or load and store them if they are not cached
+
+    cache_name -- name of the cache file
+    daemon_path_list -- binaries whose metadata the data are derived from
+    loader -- function loading the data, the data must be JSON serializable
+    """
+    key = _get_key(daemon_path_list)
+    if key is None:
+        # a binary is missing, let the loader deal with it
+        return loader()
+    cache_path = os.path.join(
+        settings.pacemaker_metadata_cache_location, f"{cache_name}.json"
+    )
+    cached = _read(cache_path)
+    if cached is not None and cached.get("key") == key:
+        return cached["data"]
+    data = loader()
+    _write(cache_path, {"key": key, "data": data})
+    return data
+
+
+def _get_key(daemon_path_list: Iterable[str]) -> Optional[List[Any]]:
+    key: List[Any] = [settings.pcs_version]
+    for path in daemon_path_list:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key.append([path, stat.st_mtime_ns, stat.st_size])
+    return key
+
+
+def _read(cache_path: str) -> Optional[Any]:
+    try:
+        with open(cache_path, encoding="utf-8") as cache_file:
+            cached = json.load(cache_file)
+        return cached if isinstance(cached, dict) else None
+    except (OSError, ValueError):
+        # the cache is just an optimization, data are loaded if it is broken
+        return None
+
+
+def _write(cache_path: str, cached: Any) -> None:
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), mode=0o755, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as cache_file:
+            json.dump(cached, cache_file)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # e.g. running as a non-root user, the data has been loaded anyway
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
@@ -81,6 +81,35 @@ def get_resources_left_demoted(operation_list, exclude=None):
     )
 
 
+def get_resources_moved(operation_list, exclude=None):
+    """
+    Get names of resources which are moved to other nodes by the provided
+    operation list
+
+    list operation_list -- result of get_operations_from_transitions
+    iterable exclude -- resources to exclude from the result
+    """
+    exclude = exclude or set()
+    left_nodes = defaultdict(set)
+    reached_nodes = defaultdict(set)
+    for res_op in operation_list:
+        resource = res_op["primitive_id"]
+        operation = res_op["operation"]
+        if operation in ("stop", "migrate_to"):
+            left_nodes[resource].add(res_op["on_node"])
+        elif operation in ("start", "migrate_from"):
+            reached_nodes[resource].add(res_op["on_node"])
+    return sorted(
+        [
+            resource
+            for resource, nodes in reached_nodes.items()
+            if resource in left_nodes
+            and nodes - left_nodes[resource]
+            and resource not in exclude
+        ]
+    )
+
+
 def _resources_with_imbalanced_operations(
     operation_list, increment_op, decrement_op, exclude
 ):
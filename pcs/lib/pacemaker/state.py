@@ -4,13 +4,17 @@ Hide information about underlaying xml is desired too.
 """
 import os.path
 from collections import defaultdict
-from typing import Dict, Any
+from typing import Any, BinaryIO, Dict, List
 
 from lxml import etree
+from lxml.etree import _Element as _XmlElement
 
 from pcs import settings
 from pcs.common import reports
-from pcs.common.tools import xml_fromstring
+from pcs.common.tools import (
+    xml_fromstream,
+    xml_fromstring,
+)
 from pcs.common.reports.item import ReportItem
 from pcs.lib.errors import LibraryError
 from pcs.lib.pacemaker.values import (
@@ -154,9 +158,9 @@ def _validate_cluster_state_dom(dom):
         etree.RelaxNG(file=settings.crm_mon_schema).assertValid(dom)
 
 
-def get_cluster_state_dom(xml):
+def _get_valid_cluster_state_dom(parse):
     try:
-        dom = xml_fromstring(xml)
+        dom = parse()
         _validate_cluster_state_dom(dom)
         return dom
     except (etree.XMLSyntaxError, etree.DocumentInvalid) as e:
@@ -165,6 +169,19 @@ def get_cluster_state_dom(xml):
         ) from e
 
 
+def get_cluster_state_dom(xml):
+    return _get_valid_cluster_state_dom(lambda: xml_fromstring(xml))
+
+
+def read_cluster_state_dom(stream: BinaryIO):
+    """
+    Parse and validate the cluster state while it is being read
+
+    stream -- binary file-like object providing xml output of crm_mon
+    """
+    return _get_valid_cluster_state_dom(lambda: xml_fromstream(stream))
+
+
 class ClusterState(_Element):
     sections = {
         "summary": ("summary", _SummarySection),
@@ -176,6 +193,104 @@ class ClusterState(_Element):
         super().__init__(self.dom)
 
 
+_STATUS_BOOLEAN_ATTRS = frozenset(
+    [
+        "active",
+        "blocked",
+        "cached",
+        "disabled",
+        "expected_up",
+        "failed",
+        "failure_ignored",
+        "is_dc",
+        "maintenance",
+        "managed",
+        "multi_state",
+        "online",
+        "orphaned",
+        "shutdown",
+        "standby",
+        "standby_onfail",
+        "unclean",
+        "unique",
+    ]
+)
+_STATUS_INTEGER_ATTRS = frozenset(
+    ["nodes_running_on", "number_resources", "resources_running"]
+)
+
+
+def _status_attrs_to_dict(element: _XmlElement) -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    for name, value in element.attrib.items():
+        converted: Any = value
+        if name in _STATUS_INTEGER_ATTRS:
+            converted = int(value)
+        elif name in _STATUS_BOOLEAN_ATTRS:
+            converted = is_true(value)
+        result[str(name)] = converted
+    return result
+
+
+def _resource_status_to_dict(element: _XmlElement) -> Dict[str, Any]:
+    result = dict(_status_attrs_to_dict(element), kind=element.tag)
+    if element.tag == "resource":
+        result["nodes"] = [
+            _status_attrs_to_dict(node) for node in element.iterfind("node")
+        ]
+    elif element.tag == "bundle":
+        result["replicas"] = [
+            dict(
+                _status_attrs_to_dict(replica),
+                members=_resource_list_status_to_dict(replica),
+            )
+            for replica in element.iterfind("replica")
+        ]
+    else:
+        result["members"] = _resource_list_status_to_dict(element)
+    return result
+
+
+def _resource_list_status_to_dict(parent: _XmlElement) -> List[Dict[str, Any]]:
+    return [
+        _resource_status_to_dict(element)
+        for element in parent
+        if element.tag in ("resource", "group", "clone", "bundle")
+    ]
+
+
+def get_nodes_status(cluster_state: _XmlElement) -> List[Dict[str, Any]]:
+    """
+    Return the status of cluster nodes as a list of dicts
+
+    cluster_state -- status of the cluster
+    """
+    node_list = []
+    for node in cluster_state.iterfind("nodes/node"):
+        node_status = _status_attrs_to_dict(node)
+        # unlike in resources, where it names a pending operation, "pending"
+        # is a flag in nodes
+        node_status["pending"] = is_true(node_status.get("pending", ""))
+        node_list.append(node_status)
+    return node_list
+
+
+def get_resources_status(cluster_state: _XmlElement) -> List[Dict[str, Any]]:
+    """
+    Return the status of resources as a list of dicts
+
+    Groups and clones list their resources in "members", bundles list their
+    replicas in "replicas" and primitives list nodes they run on in "nodes".
+    The kind of each item is stored in "kind" as named in crm_mon output.
+
+    cluster_state -- status of the cluster
+    """
+    resources_el = cluster_state.find("resources")
+    if resources_el is None:
+        return []
+    return _resource_list_status_to_dict(resources_el)
+
+
 def _id_xpath_predicate(resource_id):
     return """(@id="{0}" or starts-with(@id, "{0}:"))""".format(resource_id)
 
@@ -183,7 +298,19 @@ def _id_xpath_predicate(resource_id):
 def _get_primitives_for_state_check(
     cluster_state, resource_id, expected_running
 ):
-    primitives = cluster_state.xpath(
+    return [
+        element
+        for element in _find_primitives_for_state_check(
+            cluster_state, resource_id, expected_running
+        )
+        if not is_true(element.attrib.get("failed", ""))
+    ]
+
+
+def _find_primitives_for_state_check(
+    cluster_state, resource_id, expected_running
+):
+    return cluster_state.xpath(
         """
         .//resource[{predicate_id}]
         |
@@ -200,11 +327,6 @@ def _get_primitives_for_state_check(
             predicate_position=("last()" if expected_running else "1"),
         )
     )
-    return [
-        element
-        for element in primitives
-        if not is_true(element.attrib.get("failed", ""))
-    ]
 
 
 def _get_primitive_roles_with_nodes(primitive_el_list):
@@ -229,6 +351,21 @@ def get_resource_state(cluster_state, resource_id):
     )
 
 
+def is_resource_failed(cluster_state, resource_id):
+    """
+    Check if any instance of the resource checked for its state has failed
+
+    etree cluster_state -- status of the cluster
+    string resource_id -- id of the resource
+    """
+    return any(
+        is_true(element.attrib.get("failed", ""))
+        for element in _find_primitives_for_state_check(
+            cluster_state, resource_id, expected_running=True
+        )
+    )
+
+
 def info_resource_state(cluster_state, resource_id):
     roles_with_nodes = get_resource_state(cluster_state, resource_id)
     if not roles_with_nodes:
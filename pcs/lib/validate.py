@@ -59,6 +59,7 @@ from pcs.lib.cib.tools import IdProvider
 _FLOAT_RE = re.compile(r"^[-+]?(\d+|(\d*\.\d+)|(\d+\.\d*))([eE][+-]?\d+)?$")
 _INTEGER_RE = re.compile(r"^[+-]?[0-9]+$")
 _PCMK_DATESPEC_PART_RE = re.compile(r"^(?P<since>[0-9]+)(-(?P<until>[0-9]+))?$")
+_COROSYNC_FORBIDDEN_CHARACTERS = frozenset("{}\n\r")
 
 TypeOptionName = str
 TypeOptionValue = str
@@ -508,10 +509,7 @@ class ValueCorosyncValue(ValueValidator):
     """
 
     def _validate_value(self, value: ValuePair) -> ReportItemList:
-        if not isinstance(value.normalized, str):
-            return []
-        forbidden_characters = "{}\n\r"
-        if set(value.normalized) & set(forbidden_characters):
+        if not is_corosync_value(value.normalized):
             # We must be strict and do not allow to override this validation,
             # otherwise setting a cratfed option value could be misused for
             # setting arbitrary corosync.conf settings.
@@ -534,6 +532,28 @@ class ValueCorosyncValue(ValueValidator):
         return []
 
 
+class CorosyncValues(ValidatorInterface):
+    """
+    Report INVALID_OPTION_VALUE for each value in the option_dict which is not
+    a valid corosync value
+
+    This does the same as ValueCorosyncValue run for each option in the
+    option_dict, without creating a validator for each option.
+    """
+
+    def validate(self, option_dict: TypeOptionMap) -> ReportItemList:
+        report_list = []
+        for name, value in option_dict.items():
+            normalized = (
+                value.normalized if isinstance(value, ValuePair) else value
+            )
+            if not is_corosync_value(normalized):
+                report_list.extend(
+                    ValueCorosyncValue(name).validate({name: value})
+                )
+        return report_list
+
+
 class ValueFloat(ValuePredicateBase):
     """
     Report INVALID_OPTION_VALUE when the value is not a float number
@@ -826,6 +846,17 @@ class ValueVersion(ValuePredicateBase):
 ### predicates
 
 
+def is_corosync_value(value: Any) -> bool:
+    """
+    Check that the specified value cannot break the structure of corosync.conf
+
+    value -- value to check, only strings are checked
+    """
+    if not isinstance(value, str):
+        return True
+    return _COROSYNC_FORBIDDEN_CHARACTERS.isdisjoint(value)
+
+
 def is_empty_string(value: TypeOptionValue) -> bool:
     """
     Check if the specified value is an empty string
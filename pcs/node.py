@@ -6,6 +6,7 @@ from pcs.cli.common.errors import (
     ERR_NODE_LIST_AND_ALL_MUTUALLY_EXCLUSIVE,
 )
 from pcs.cli.common.parse_args import prepare_options
+from pcs.common import reports
 import pcs.lib.pacemaker.live as lib_pacemaker
 
 
@@ -13,10 +14,9 @@ def node_attribute_cmd(lib, argv, modifiers):
     """
     Options:
       * -f - CIB file (in lib wrapper)
-      * --force - allows not unique recipient values
+      * --force - no error if attribute to delete doesn't exist
       * --name - specify attribute name to filter out
     """
-    del lib
     modifiers.ensure_only_supported("-f", "--force", "--name")
     if modifiers.get("--name") and len(argv) > 1:
         raise CmdLineInputError()
@@ -25,8 +25,14 @@ def node_attribute_cmd(lib, argv, modifiers):
     elif len(argv) == 1:
         attribute_show_cmd(argv.pop(0), filter_attr=modifiers.get("--name"))
     else:
-        # --force is used only when setting attributes
-        attribute_set_cmd(argv.pop(0), argv)
+        node_list, option_list = _split_nodes_and_options(argv)
+        attrs = prepare_options(option_list)
+        lib.node.update_nodes_attrs(
+            {node: attrs for node in node_list},
+            force_flags=(
+                [reports.codes.FORCE] if modifiers.get("--force") else []
+            ),
+        )
 
 
 def node_utilization_cmd(lib, argv, modifiers):
@@ -35,7 +41,6 @@ def node_utilization_cmd(lib, argv, modifiers):
       * -f - CIB file (in lib wrapper)
       * --name - specify attribute name to filter out
     """
-    del lib
     modifiers.ensure_only_supported("-f", "--name")
     if modifiers.get("--name") and len(argv) > 1:
         raise CmdLineInputError()
@@ -44,7 +49,27 @@ def node_utilization_cmd(lib, argv, modifiers):
     elif len(argv) == 1:
         print_node_utilization(argv.pop(0), filter_name=modifiers.get("--name"))
     else:
-        set_node_utilization(argv.pop(0), argv)
+        node_list, option_list = _split_nodes_and_options(argv)
+        utilization = prepare_options(option_list)
+        lib.node.update_nodes_attrs(
+            {}, node_utilization={node: utilization for node in node_list},
+        )
+
+
+def _split_nodes_and_options(argv):
+    """
+    Split arguments to a list of nodes and a list of name=value options
+
+    Commandline options: no options
+    """
+    node_list = []
+    for arg in argv:
+        if "=" in arg:
+            break
+        node_list.append(arg)
+    if not node_list or len(node_list) == len(argv):
+        raise CmdLineInputError()
+    return node_list, argv[len(node_list) :]
 
 
 def node_maintenance_cmd(lib, argv, modifiers, enable):
@@ -87,52 +112,6 @@ def node_standby_cmd(lib, argv, modifiers, enable):
         lib.node.standby_unstandby_local(enable, wait)
 
 
-def set_node_utilization(node, argv):
-    """
-    Commandline options:
-      * -f - CIB file
-    """
-    nvpair_dict = prepare_options(argv)
-    if not nvpair_dict:
-        return
-    only_removing = True
-    for value in nvpair_dict.values():
-        if value != "":
-            only_removing = False
-            break
-
-    cib = utils.get_cib_dom()
-    node_el = utils.dom_get_node(cib, node)
-    if node_el is None:
-        if utils.usefile:
-            utils.err("Unable to find a node: {0}".format(node))
-
-        for attrs in utils.getNodeAttributesFromPacemaker():
-            if attrs.name == node and attrs.type == "remote":
-                node_attrs = attrs
-                break
-        else:
-            utils.err("Unable to find a node: {0}".format(node))
-
-        nodes_section_list = cib.getElementsByTagName("nodes")
-        if not nodes_section_list:
-            utils.err("Unable to get nodes section of cib")
-
-        if only_removing:
-            # Do not create new node if we are only removing values from it.
-            return
-
-        dom = nodes_section_list[0].ownerDocument
-        node_el = dom.createElement("node")
-        node_el.setAttribute("id", node_attrs.id)
-        node_el.setAttribute("type", node_attrs.type)
-        node_el.setAttribute("uname", node_attrs.name)
-        nodes_section_list[0].appendChild(node_el)
-
-    utils.dom_update_utilization(node_el, nvpair_dict, "nodes-")
-    utils.replace_cib_configuration(cib)
-
-
 def print_node_utilization(filter_node=None, filter_name=None):
     """
     Commandline options:
@@ -195,16 +174,6 @@ def attribute_show_cmd(filter_node=None, filter_attr=None):
     attribute_print(node_attributes)
 
 
-def attribute_set_cmd(node, argv):
-    """
-    Commandline options:
-      * -f - CIB file
-      * --force - no error if attribute to delete doesn't exist
-    """
-    for name, value in prepare_options(argv).items():
-        utils.set_node_attribute(name, value, node)
-
-
 def attribute_print(node_attributes):
     """
     Commandline options: no options
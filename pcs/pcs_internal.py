@@ -1,6 +1,7 @@
 import sys
 import json
 import logging
+from typing import Optional
 
 from pcs import settings, utils
 from pcs.cli.common.env_cli import Env
@@ -9,21 +10,26 @@ from pcs.common.interface import dto
 from pcs.common.reports import (
     ReportItem,
     ReportItemList,
+    ReportItemSeverity,
     ReportProcessor,
+    messages,
 )
 from pcs.lib.errors import LibraryError
 
 
 SUPPORTED_COMMANDS = {
+    "booth.get_status_all",
     "cluster.add_nodes",
     "cluster.remove_nodes",
     "cluster.setup",
     "node.maintenance_unmaintenance_list",
     "node.standby_unstandby_list",
+    "node.update_nodes_attrs",
     "resource.create",
     "resource.create_as_clone",
     "resource.create_in_group",
     "resource.disable",
+    "resource.disable_simulate_batch",
     "resource.enable",
     "resource.manage",
     "resource.unmanage",
@@ -53,19 +59,50 @@ def get_cli_env(options):
     # they will be printed to stdout. We are not printing the messages. Instead
     # we get all the messages the processor got. So the value of the parameter
     # does not matter.
-    env.report_processor = LibraryReportProcessor()
+    env.report_processor = LibraryReportProcessor(
+        debug_limit=settings.pcs_internal_debug_report_limit
+    )
     env.request_timeout = (
         options.get("request_timeout") or settings.default_request_timeout
     )
+    env.wait_targeted = bool(options.get("wait_targeted", False))
     return env
 
 
 class LibraryReportProcessor(ReportProcessor):
-    processed_items: ReportItemList = []
+    def __init__(self, debug_limit: Optional[int] = None) -> None:
+        """
+        debug_limit -- keep at most this many debug reports, None for no limit
+        """
+        super().__init__()
+        self.processed_items: ReportItemList = []
+        self.debug_limit = debug_limit
+        self.debug_count = 0
+        self.debug_dropped = 0
 
     def _do_report(self, report_item: ReportItem) -> None:
+        if report_item.severity.level == ReportItemSeverity.DEBUG:
+            # Big operations produce thousands of debug reports, each carrying
+            # stdin and stdout of a process. Keep only the first ones.
+            if (
+                self.debug_limit is not None
+                and self.debug_count >= self.debug_limit
+            ):
+                self.debug_dropped += 1
+                return
+            self.debug_count += 1
         self.processed_items.append(report_item)
 
+    def get_report_list(self) -> ReportItemList:
+        """
+        Return kept reports, tell how many debug reports have been dropped
+        """
+        if not self.debug_dropped:
+            return list(self.processed_items)
+        return self.processed_items + [
+            ReportItem.debug(messages.DebugReportsDropped(self.debug_dropped))
+        ]
+
 
 def export_reports(report_list):
     return [report_item_to_dict(report) for report in report_list]
@@ -97,7 +134,7 @@ def main():
         _exit(
             "success",
             report_list=export_reports(
-                cli_env.report_processor.processed_items
+                cli_env.report_processor.get_report_list()
             ),
             data=(
                 dto.to_dict(output_data)
@@ -109,7 +146,7 @@ def main():
         _exit(
             "error",
             report_list=export_reports(
-                cli_env.report_processor.processed_items + list(e.args)
+                cli_env.report_processor.get_report_list() + list(e.args)
             ),
         )
     except json.JSONDecodeError as e:
@@ -1,8 +1,10 @@
 # pylint: disable=too-many-lines
 import sys
+from collections import defaultdict
 from xml.dom.minidom import parseString
 import re
 import textwrap
+import datetime
 import time
 import json
 
@@ -14,6 +16,8 @@ from typing import (
     Sequence,
 )
 
+from lxml import etree
+
 from pcs import (
     usage,
     utils,
@@ -52,10 +56,7 @@ from pcs.lib.cib.resource.common import (
     find_one_resource,
     find_resources_to_delete,
 )
-from pcs.lib.cib.tools import (
-    get_resources,
-    get_tags,
-)
+from pcs.lib.cib.tools import get_resources
 from pcs.lib.commands.resource import (
     _validate_guest_change,
     _get_nodes_to_validate_against,
@@ -378,7 +379,7 @@ def resource_op_add_cmd(lib, argv, modifiers):
 
     # add the requested operation
     utils.replace_cib_configuration(
-        resource_operation_add(utils.get_cib_dom(), res_id, argv)
+        resource_operation_add(utils.get_cib_facade(), res_id, argv)
     )
 
 
@@ -625,6 +626,8 @@ def resource_create(lib, argv, modifiers):
       * --disabled - created reource will be disabled
       * --no-default-ops - do not add default operations
       * --wait
+      * --wait-targeted - wait only for the resources to get to the
+        expected state
       * -f - CIB file
     """
     modifiers.ensure_only_supported(
@@ -635,8 +638,10 @@ def resource_create(lib, argv, modifiers):
         "--disabled",
         "--no-default-ops",
         "--wait",
+        "--wait-targeted",
         "-f",
     )
+    modifiers.ensure_dependency_satisfied("--wait", ["--wait-targeted"])
     if len(argv) < 2:
         raise CmdLineInputError()
 
@@ -784,8 +789,13 @@ def resource_move(lib, argv, modifiers):
       * -f - CIB file
       * --master
       * --wait
+      * --wait-targeted - wait only for the resources to get to the
+        expected state
     """
-    modifiers.ensure_only_supported("-f", "--master", "--wait")
+    modifiers.ensure_only_supported(
+        "-f", "--master", "--wait", "--wait-targeted"
+    )
+    modifiers.ensure_dependency_satisfied("--wait", ["--wait-targeted"])
 
     if not argv:
         raise CmdLineInputError("must specify a resource to move")
@@ -808,8 +818,13 @@ def resource_ban(lib, argv, modifiers):
       * -f - CIB file
       * --master
       * --wait
+      * --wait-targeted - wait only for the resources to get to the
+        expected state
     """
-    modifiers.ensure_only_supported("-f", "--master", "--wait")
+    modifiers.ensure_only_supported(
+        "-f", "--master", "--wait", "--wait-targeted"
+    )
+    modifiers.ensure_dependency_satisfied("--wait", ["--wait-targeted"])
 
     if not argv:
         raise CmdLineInputError("must specify a resource to ban")
@@ -949,29 +964,28 @@ def resource_update(lib, args, modifiers, deal_with_guest_change=True):
                 cib_upgraded = True
                 break
 
-    cib_xml = utils.get_cib()
-    dom = utils.get_cib_dom(cib_xml=cib_xml)
-
-    resource = utils.dom_get_resource(dom, res_id)
-    if not resource:
-        clone = utils.dom_get_clone(dom, res_id)
-        master = utils.dom_get_master(dom, res_id)
-        if clone or master:
-            if master:
-                clone = transform_master_to_clone(master)
-            clone_child = utils.dom_elem_get_clone_ms_resource(clone)
-            if clone_child:
-                child_id = clone_child.getAttribute("id")
+    cib = utils.get_cib_facade()
+
+    resource = cib.get_resource(res_id)
+    if resource is None:
+        clone = cib.get_clone(res_id)
+        master = cib.get_master(res_id)
+        if clone is not None or master is not None:
+            if master is not None:
+                clone = transform_master_to_clone(cib, master)
+            clone_child = _get_clone_ms_child(clone)
+            if clone_child is not None:
+                child_id = clone_child.get("id")
                 return resource_update_clone(
-                    dom, clone, child_id, args, wait, wait_timeout
+                    cib, clone, child_id, args, wait, wait_timeout
                 )
         utils.err("Unable to find resource: %s" % res_id)
 
     params = utils.convert_args_to_tuples(ra_values)
 
-    resClass = resource.getAttribute("class")
-    resProvider = resource.getAttribute("provider")
-    resType = resource.getAttribute("type")
+    resClass = resource.get("class", "")
+    resProvider = resource.get("provider", "")
+    resType = resource.get("type", "")
     try:
         if resClass == "stonith":
             metadata = lib_ra.StonithAgent(utils.cmd_runner(), resType)
@@ -986,7 +1000,7 @@ def resource_update(lib, args, modifiers, deal_with_guest_change=True):
             metadata,
             dict(params),
             res_id,
-            get_resources(lib_pacemaker.get_cib(cib_xml)),
+            get_resources(cib.cib),
             force=modifiers.get("--force"),
         )
         if report_list:
@@ -1003,9 +1017,9 @@ def resource_update(lib, args, modifiers, deal_with_guest_change=True):
     except LibraryError as e:
         process_library_reports(e.args)
 
-    utils.dom_update_instance_attr(resource, params)
+    utils.facade_update_instance_attr(cib, resource, params)
 
-    remote_node_name = utils.dom_get_resource_remote_node_name(resource)
+    remote_node_name = _get_resource_remote_node_name(resource)
 
     if remote_node_name == guest_node.get_guest_option_value(
         prepare_options(meta_values)
@@ -1028,16 +1042,13 @@ def resource_update(lib, args, modifiers, deal_with_guest_change=True):
             prepare_options(meta_values), modifiers.get("--force"),
         )
 
-    utils.dom_update_meta_attr(
-        resource, utils.convert_args_to_tuples(meta_values)
+    utils.facade_update_meta_attr(
+        cib, resource, utils.convert_args_to_tuples(meta_values)
     )
 
-    operations = resource.getElementsByTagName("operations")
-    if not operations:
-        operations = dom.createElement("operations")
-        resource.appendChild(operations)
-    else:
-        operations = operations[0]
+    operations = resource.find("operations")
+    if operations is None:
+        operations = cib.append(resource, etree.Element("operations"))
 
     for op_argv in op_values:
         if not op_argv:
@@ -1062,32 +1073,30 @@ def resource_update(lib, args, modifiers, deal_with_guest_change=True):
 
         updating_op = None
         updating_op_before = None
-        for existing_op in operations.getElementsByTagName("op"):
-            if updating_op:
+        for existing_op in operations.iterfind(".//op"):
+            if updating_op is not None:
                 updating_op_before = existing_op
                 break
-            existing_op_name = existing_op.getAttribute("name")
-            existing_op_role = existing_op.getAttribute("role")
+            existing_op_name = existing_op.get("name", "")
+            existing_op_role = existing_op.get("role", "")
             if existing_op_role == op_role and existing_op_name == op_name:
                 updating_op = existing_op
                 continue
 
-        if updating_op:
-            updating_op.parentNode.removeChild(updating_op)
-        dom = resource_operation_add(
-            dom,
+        if updating_op is not None:
+            cib.remove(updating_op)
+        cib = resource_operation_add(
+            cib,
             res_id,
             op_argv,
             validate_strict=False,
             before_op=updating_op_before,
         )
 
-    utils.replace_cib_configuration(dom)
+    utils.replace_cib_configuration(cib)
 
-    if (
-        remote_node_name
-        and remote_node_name
-        != utils.dom_get_resource_remote_node_name(resource)
+    if remote_node_name and remote_node_name != _get_resource_remote_node_name(
+        resource
     ):
         # if the resource was a remote node and it is not anymore, (or its name
         # changed) we need to tell pacemaker about it
@@ -1114,23 +1123,23 @@ def resource_update(lib, args, modifiers, deal_with_guest_change=True):
     return None
 
 
-def resource_update_clone(dom, clone, res_id, args, wait, wait_timeout):
+def resource_update_clone(cib, clone, res_id, args, wait, wait_timeout):
     """
     Commandline options:
       * -f - CIB file
     """
-    dom, dummy_clone_id = resource_clone_create(
-        dom, [res_id] + args, update_existing=True
+    cib, dummy_clone_id = resource_clone_create(
+        cib, [res_id] + args, update_existing=True
     )
 
-    utils.replace_cib_configuration(dom)
+    utils.replace_cib_configuration(cib)
 
     if wait:
         args = ["crm_resource", "--wait"]
         if wait_timeout:
             args.extend(["--timeout=%s" % wait_timeout])
         output, retval = utils.run(args)
-        running_on = utils.resource_running_on(clone.getAttribute("id"))
+        running_on = utils.resource_running_on(clone.get("id"))
         if retval == 0:
             print(running_on["message"])
         else:
@@ -1142,28 +1151,30 @@ def resource_update_clone(dom, clone, res_id, args, wait, wait_timeout):
                 msg.append("\n" + output)
             utils.err("\n".join(msg).strip())
 
-    return dom
+    return cib
 
 
-def transform_master_to_clone(master_element):
-    # create a new clone element with the same id
-    dom = master_element.ownerDocument
-    clone_element = dom.createElement("clone")
-    clone_element.setAttribute("id", master_element.getAttribute("id"))
-    # place it next to the master element
-    master_element.parentNode.insertBefore(clone_element, master_element)
+def transform_master_to_clone(cib, master_element):
+    # create a new clone element with the same id, place it next to the master
+    # element
+    clone_element = cib.append(
+        master_element.getparent(),
+        etree.Element("clone", id=master_element.get("id")),
+        before=master_element,
+    )
     # move all master's children to the clone
-    while master_element.firstChild:
-        clone_element.appendChild(master_element.firstChild)
+    clone_element.text = master_element.text
+    for child in list(master_element):
+        clone_element.append(child)
     # remove the master
-    master_element.parentNode.removeChild(master_element)
+    cib.remove(master_element)
     # set meta to make the clone promotable
-    utils.dom_update_meta_attr(clone_element, [("promotable", "true")])
+    utils.facade_update_meta_attr(cib, clone_element, [("promotable", "true")])
     return clone_element
 
 
 def resource_operation_add(
-    dom, res_id, argv, validate_strict=True, before_op=None
+    cib, res_id, argv, validate_strict=True, before_op=None
 ):
     """
     Commandline options:
@@ -1173,8 +1184,8 @@ def resource_operation_add(
         usage.resource(["op"])
         sys.exit(1)
 
-    res_el = utils.dom_get_resource(dom, res_id)
-    if not res_el:
+    res_el = cib.get_resource(res_id)
+    if res_el is None:
         utils.err("Unable to find resource: %s" % res_id)
 
     op_name = argv.pop(0)
@@ -1231,47 +1242,44 @@ def resource_operation_add(
             id_valid, id_error = utils.validate_xml_id(value, "operation id")
             if not id_valid:
                 utils.err(id_error)
-            if utils.does_id_exist(dom, value):
+            if utils.does_id_exist(cib, value):
                 utils.err(
                     "id '%s' is already in use, please specify another one"
                     % value
                 )
     if generate_id:
         op_id = "%s-%s-interval-%s" % (res_id, op_name, interval)
-        op_id = utils.find_unique_id(dom, op_id)
+        op_id = utils.find_unique_id(cib, op_id)
 
-    op_el = dom.createElement("op")
-    op_el.setAttribute("id", op_id)
+    op_el = etree.Element("op", id=op_id)
     for key, val in op_properties:
         if key == "OCF_CHECK_LEVEL":
-            attrib_el = dom.createElement("instance_attributes")
-            attrib_el.setAttribute(
-                "id", utils.find_unique_id(dom, "params-" + op_id)
+            attrib_el = etree.SubElement(
+                op_el,
+                "instance_attributes",
+                id=utils.find_unique_id(cib, "params-" + op_id),
             )
-            op_el.appendChild(attrib_el)
-            nvpair_el = dom.createElement("nvpair")
-            nvpair_el.setAttribute("name", key)
-            nvpair_el.setAttribute("value", val)
-            nvpair_el.setAttribute(
-                "id", utils.find_unique_id(dom, "-".join((op_id, key, val)))
+            etree.SubElement(
+                attrib_el,
+                "nvpair",
+                name=key,
+                value=val,
+                id=utils.find_unique_id(cib, "-".join((op_id, key, val))),
             )
-            attrib_el.appendChild(nvpair_el)
         else:
-            op_el.setAttribute(key, val)
+            op_el.set(key, val)
 
-    operations = res_el.getElementsByTagName("operations")
-    if not operations:
-        operations = dom.createElement("operations")
-        res_el.appendChild(operations)
+    operations = res_el.find("operations")
+    if operations is None:
+        operations = cib.append(res_el, etree.Element("operations"))
     else:
-        operations = operations[0]
         duplicate_op_list = utils.operation_exists(operations, op_el)
         if duplicate_op_list:
             utils.err(
                 "operation %s with interval %ss already specified for %s:\n%s"
                 % (
-                    op_el.getAttribute("name"),
-                    timeout_to_seconds(op_el.getAttribute("interval"), True),
+                    op_el.get("name"),
+                    timeout_to_seconds(op_el.get("interval"), True),
                     res_id,
                     "\n".join(
                         [operation_to_string(op) for op in duplicate_op_list]
@@ -1289,7 +1297,7 @@ def resource_operation_add(
                 )
                 utils.err(
                     msg.format(
-                        action=op_el.getAttribute("name"),
+                        action=op_el.get("name"),
                         res=res_id,
                         op="\n".join(
                             [
@@ -1300,8 +1308,8 @@ def resource_operation_add(
                     )
                 )
 
-    operations.insertBefore(op_el, before_op)
-    return dom
+    cib.append(operations, op_el, before=before_op)
+    return cib
 
 
 def resource_operation_remove(res_id, argv):
@@ -1389,28 +1397,28 @@ def resource_meta(lib, argv, modifiers):
         prepare_options(argv), modifiers.get("--force"),
     )
 
-    dom = utils.get_cib_dom()
+    cib = utils.get_cib_facade()
 
-    master = utils.dom_get_master(dom, res_id)
-    if master:
-        resource_el = transform_master_to_clone(master)
+    master = cib.get_master(res_id)
+    if master is not None:
+        resource_el = transform_master_to_clone(cib, master)
     else:
-        resource_el = utils.dom_get_any_resource(dom, res_id)
-    if resource_el is None:
+        resource_el = cib.get_any_resource(res_id)
+    if resource_el is None or resource_el.tag == "bundle":
         utils.err("unable to find a resource/clone/group: %s" % res_id)
 
     if modifiers.is_specified("--wait"):
         wait_timeout = utils.validate_wait_get_timeout()
 
-    remote_node_name = utils.dom_get_resource_remote_node_name(resource_el)
-    utils.dom_update_meta_attr(resource_el, utils.convert_args_to_tuples(argv))
+    remote_node_name = _get_resource_remote_node_name(resource_el)
+    utils.facade_update_meta_attr(
+        cib, resource_el, utils.convert_args_to_tuples(argv)
+    )
 
-    utils.replace_cib_configuration(dom)
+    utils.replace_cib_configuration(cib)
 
-    if (
-        remote_node_name
-        and remote_node_name
-        != utils.dom_get_resource_remote_node_name(resource_el)
+    if remote_node_name and remote_node_name != _get_resource_remote_node_name(
+        resource_el
     ):
         # if the resource was a remote node and it is not anymore, (or its name
         # changed) we need to tell pacemaker about it
@@ -1518,16 +1526,14 @@ def resource_clone(lib, argv, modifiers, promotable=False):
         raise CmdLineInputError()
 
     res = argv[0]
-    cib_dom = utils.get_cib_dom()
+    cib = utils.get_cib_facade()
 
     if modifiers.is_specified("--wait"):
         wait_timeout = utils.validate_wait_get_timeout()
 
-    cib_dom, clone_id = resource_clone_create(
-        cib_dom, argv, promotable=promotable
-    )
-    cib_dom = constraint.constraint_resource_update(res, cib_dom)
-    utils.replace_cib_configuration(cib_dom)
+    cib, clone_id = resource_clone_create(cib, argv, promotable=promotable)
+    cib = constraint.constraint_resource_update(res, cib)
+    utils.replace_cib_configuration(cib)
 
     if modifiers.is_specified("--wait"):
         args = ["crm_resource", "--wait"]
@@ -1547,46 +1553,39 @@ def resource_clone(lib, argv, modifiers, promotable=False):
             utils.err("\n".join(msg).strip())
 
 
-def resource_clone_create(
-    cib_dom, argv, update_existing=False, promotable=False
-):
+def resource_clone_create(cib, argv, update_existing=False, promotable=False):
     """
     Commandline options: no options
+
+    CibFacade cib -- the CIB to create or update the clone in
     """
     name = argv.pop(0)
 
-    resources_el = cib_dom.getElementsByTagName("resources")[0]
-    element = utils.dom_get_resource(resources_el, name) or utils.dom_get_group(
-        resources_el, name
-    )
-    if not element:
+    resources_el = cib.get_section("configuration/resources")
+    element = cib.get_any_resource(name)
+    if element is None or element.tag not in ("primitive", "group"):
         utils.err("unable to find group or resource: %s" % name)
+    parent_el = element.getparent()
 
-    if element.parentNode.tagName == "bundle":
+    if parent_el.tag == "bundle":
         utils.err("cannot clone bundle resource")
 
     if not update_existing:
-        if utils.dom_get_resource_clone(
-            cib_dom, name
-        ) or utils.dom_get_resource_masterslave(cib_dom, name):
-            utils.err("%s is already a clone resource" % name)
-
-        if utils.dom_get_group_clone(
-            cib_dom, name
-        ) or utils.dom_get_group_masterslave(cib_dom, name):
+        if next(element.iterancestors("clone", "master"), None) is not None:
+            if element.tag == "primitive":
+                utils.err("%s is already a clone resource" % name)
             utils.err("cannot clone a group that has already been cloned")
     else:
-        if element.parentNode.tagName != "clone":
+        if parent_el.tag != "clone":
             utils.err("%s is not currently a clone" % name)
-        clone = element.parentNode
+        clone = parent_el
 
     # If element is currently in a group and it's the last member, we get rid
-    # of the group
-    if (
-        element.parentNode.tagName == "group"
-        and element.parentNode.getElementsByTagName("primitive").length <= 1
-    ):
-        element.parentNode.parentNode.removeChild(element.parentNode)
+    # of the group. Move the element out of the group first, so that it stays
+    # in the CIB indexes.
+    if parent_el.tag == "group" and len(parent_el.findall("primitive")) <= 1:
+        parent_el.addnext(element)
+        cib.remove(parent_el)
 
     parts = parse_clone_args(argv, promotable=promotable)
     if not update_existing:
@@ -1596,20 +1595,18 @@ def resource_clone_create(
             validate_id(clone_id, reporter=report_list)
             if report_list:
                 raise CmdLineInputError("invalid id '{}'".format(clone_id))
-            if utils.does_id_exist(cib_dom, clone_id):
+            if utils.does_id_exist(cib, clone_id):
                 raise CmdLineInputError(
                     "id '{}' already exists".format(clone_id),
                 )
         else:
-            clone_id = utils.find_unique_id(cib_dom, name + "-clone")
-        clone = cib_dom.createElement("clone")
-        clone.setAttribute("id", clone_id)
-        clone.appendChild(element)
-        resources_el.appendChild(clone)
+            clone_id = utils.find_unique_id(cib, name + "-clone")
+        clone = cib.append(resources_el, etree.Element("clone", id=clone_id))
+        clone.append(element)
 
-    utils.dom_update_meta_attr(clone, sorted(parts["meta"].items()))
+    utils.facade_update_meta_attr(cib, clone, sorted(parts["meta"].items()))
 
-    return cib_dom, clone.getAttribute("id")
+    return cib, clone.get("id")
 
 
 def resource_clone_master_remove(lib, argv, modifiers):
@@ -1710,20 +1707,22 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
         )
         return bool(roles_with_nodes)
 
+    # The CIB is loaded once and all the changes are pushed at once. It is
+    # loaded again only if stopping the resource has changed it.
+    cib = utils.get_cib_facade()
+
     # if the resource is referenced in tags then exit with an error message
-    cib_xml = utils.get_cib()
-    xml_etree = lib_pacemaker.get_cib(cib_xml)
     resource_el, dummy_report_list = find_one_resource(
-        get_resources(xml_etree), resource_id
+        get_resources(cib.cib), resource_id
     )
     if resource_el is not None:
+        obj_ref_index = defaultdict(list)
+        for obj_ref in cib.get_elements_by_tag("obj_ref"):
+            if obj_ref.getparent().tag == "tag":
+                obj_ref_index[obj_ref.get("id", "")].append(obj_ref)
         tag_obj_ref_list = []
         for el in find_resources_to_delete(resource_el):
-            xpath_result = get_tags(xml_etree).xpath(
-                './/tag/obj_ref[@id="{0}"]'.format(el.get("id", "")),
-            )
-            if xpath_result:
-                tag_obj_ref_list.extend(xpath_result)
+            tag_obj_ref_list.extend(obj_ref_index.get(el.get("id", ""), []))
         if tag_obj_ref_list:
             tag_id_list = sorted(
                 {
@@ -1740,21 +1739,24 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
                 )
             )
 
-    dom = utils.get_cib_dom(cib_xml)
     # if resource is a clone or a master, work with its child instead
-    cloned_resource = utils.dom_get_clone_ms_resource(dom, resource_id)
-    if cloned_resource:
-        resource_id = cloned_resource.getAttribute("id")
-
-    bundle_el = utils.dom_get_bundle(dom, resource_id)
+    clone_ms_el = cib.get_clone(resource_id)
+    if clone_ms_el is None:
+        clone_ms_el = cib.get_master(resource_id)
+    if clone_ms_el is not None:
+        cloned_resource = _get_clone_ms_child(clone_ms_el)
+        if cloned_resource is not None:
+            resource_id = cloned_resource.get("id")
+
+    bundle_el = cib.get_bundle(resource_id)
     if bundle_el is not None:
-        primitive_el = utils.dom_get_resource_bundle(bundle_el)
+        primitive_el = bundle_el.find("./primitive")
         if primitive_el is None:
             print("Deleting bundle '{0}'".format(resource_id))
         else:
             print(
                 "Deleting bundle '{0}' and its inner resource '{1}'".format(
-                    resource_id, primitive_el.getAttribute("id")
+                    resource_id, primitive_el.get("id")
                 )
             )
 
@@ -1778,29 +1780,31 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
                     msg.append("\n" + output)
                 utils.err("\n".join(msg).strip())
             print("Stopped")
+            cib = utils.get_cib_facade()
+            bundle_el = cib.get_bundle(resource_id)
+            primitive_el = bundle_el.find("./primitive")
 
+        remote_node_name = None
         if primitive_el is not None:
-            resource_remove(primitive_el.getAttribute("id"))
-        utils.replace_cib_configuration(
-            remove_resource_references(utils.get_cib_dom(), resource_id, output)
-        )
-        args = [
-            "cibadmin",
-            "-o",
-            "resources",
-            "-D",
-            "--xpath",
-            "//bundle[@id='{0}']".format(resource_id),
-        ]
-        dummy_cmdoutput, retVal = utils.run(args)
-        if retVal != 0:
-            utils.err("Unable to remove resource '{0}'".format(resource_id))
+            # the inner resource is stopped with the bundle
+            remote_node_name = _remove_primitive_from_facade(
+                cib, primitive_el, True
+            )
+        _remove_resource_references_from_facade(cib, resource_id, output)
+        cib.remove(bundle_el)
+        utils.replace_cib_configuration(cib)
+        if remote_node_name and not utils.usefile:
+            _remove_remote_node_from_cluster(
+                remote_node_name, is_remove_remote_context
+            )
         return True
 
-    if utils.does_exist('//group[@id="' + resource_id + '"]'):
+    group_el = cib.get_group(resource_id)
+    if group_el is not None:
         print(f"Removing group: {resource_id} (and all resources within group)")
-        group = utils.get_cib_xpath('//group[@id="' + resource_id + '"]')
-        group_dom = parseString(group)
+        group_primitive_id_list = [
+            res.get("id") for res in group_el.iterfind(".//primitive")
+        ]
         print("Stopping all resources in group: %s..." % resource_id)
         resource_disable([resource_id])
         if "--force" not in utils.pcs_options and not utils.usefile:
@@ -1808,10 +1812,7 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
             if retval != 0 and "unrecognized option '--wait'" in output:
                 output = ""
                 retval = 0
-                for res in reversed(
-                    group_dom.documentElement.getElementsByTagName("primitive")
-                ):
-                    res_id = res.getAttribute("id")
+                for res_id in reversed(group_primitive_id_list):
                     res_stopped = False
                     for _ in range(15):
                         time.sleep(1)
@@ -1822,10 +1823,7 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
                         break
             stopped = True
             state = utils.getClusterState()
-            for res in group_dom.documentElement.getElementsByTagName(
-                "primitive"
-            ):
-                res_id = res.getAttribute("id")
+            for res_id in group_primitive_id_list:
                 if utils.resource_running_on(res_id, state)["is_running"]:
                     stopped = False
                     break
@@ -1837,26 +1835,27 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
                 if retval != 0 and output:
                     msg.append("\n" + output)
                 utils.err("\n".join(msg).strip())
-        for res in group_dom.documentElement.getElementsByTagName("primitive"):
-            resource_remove(res.getAttribute("id"))
+        # disabling the group has changed the CIB
+        cib = utils.get_cib_facade()
+        remote_node_name_list = [
+            _remove_primitive_from_facade(cib, cib.get_resource(res_id), True)
+            for res_id in group_primitive_id_list
+        ]
+        utils.replace_cib_configuration(cib)
+        if not utils.usefile:
+            for remote_node_name in remote_node_name_list:
+                if remote_node_name:
+                    _remove_remote_node_from_cluster(
+                        remote_node_name, is_remove_remote_context
+                    )
         sys.exit(0)
 
     # now we know resource is not a group, a clone, a master nor a bundle
     # because of the conditions above
-    if not utils.does_exist(
-        '//resources/descendant::primitive[@id="' + resource_id + '"]'
-    ):
+    primitive_el = cib.get_resource(resource_id)
+    if primitive_el is None:
         utils.err("Resource '{0}' does not exist.".format(resource_id))
 
-    group_xpath = '//group/primitive[@id="' + resource_id + '"]/..'
-    group = utils.get_cib_xpath(group_xpath)
-    num_resources_in_group = 0
-
-    if group != "":
-        num_resources_in_group = len(
-            parseString(group).documentElement.getElementsByTagName("primitive")
-        )
-
     if (
         "--force" not in utils.pcs_options
         and not utils.usefile
@@ -1886,123 +1885,108 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
                 msg.append("\n" + output)
             utils.err("\n".join(msg).strip())
         print("Stopped")
+        cib = utils.get_cib_facade()
+        primitive_el = cib.get_resource(resource_id)
 
-    utils.replace_cib_configuration(
-        remove_resource_references(utils.get_cib_dom(), resource_id, output)
-    )
-    dom = utils.get_cib_dom()
-    resource_el = utils.dom_get_resource(dom, resource_id)
-    remote_node_name = None
-    if resource_el:
-        remote_node_name = utils.dom_get_resource_remote_node_name(resource_el)
-        if remote_node_name:
-            dom = constraint.remove_constraints_containing_node(
-                dom, remote_node_name, output
-            )
-            utils.replace_cib_configuration(dom)
-            dom = utils.get_cib_dom()
-
-    if group == "" or num_resources_in_group > 1:
-        master_xpath = f'//master/primitive[@id="{resource_id}"]/..'
-        clone_xpath = f'//clone/primitive[@id="{resource_id}"]/..'
-        if utils.get_cib_xpath(clone_xpath) != "":
-            args = ["cibadmin", "-o", "resources", "-D", "--xpath", clone_xpath]
-        elif utils.get_cib_xpath(master_xpath) != "":
-            args = [
-                "cibadmin",
-                "-o",
-                "resources",
-                "-D",
-                "--xpath",
-                master_xpath,
-            ]
-        else:
-            args = [
-                "cibadmin",
-                "-o",
-                "resources",
-                "-D",
-                "--xpath",
-                f"//primitive[@id='{resource_id}']",
-            ]
+    remote_node_name = _remove_primitive_from_facade(cib, primitive_el, output)
+    utils.replace_cib_configuration(cib)
+    if remote_node_name and not utils.usefile:
+        _remove_remote_node_from_cluster(
+            remote_node_name, is_remove_remote_context
+        )
+    return True
+
+
+def _get_clone_ms_child(clone_ms_el):
+    """
+    Commandline options: no options
+    """
+    for child in clone_ms_el:
+        if child.tag in ("group", "primitive"):
+            return child
+    return None
+
+
+def _get_resource_remote_node_name(resource_el):
+    """
+    Commandline options: no options
+    """
+    if resource_el.tag != "primitive":
+        return None
+    if (
+        resource_el.get("class", "").lower() == "ocf"
+        and resource_el.get("provider", "").lower() == "pacemaker"
+        and resource_el.get("type", "").lower() == "remote"
+    ):
+        return resource_el.get("id")
+    for nvpair in resource_el.iterfind(".//meta_attributes//nvpair"):
+        if nvpair.get("name") == "remote-node":
+            return nvpair.get("value", "")
+    return None
+
+
+def _remove_primitive_from_facade(cib, primitive_el, output):
+    """
+    Remove a primitive and everything referencing it, return its remote node
+
+    Commandline options: no options
+
+    CibFacade cib -- the CIB to remove the primitive from
+    etree primitive_el -- the primitive to be removed
+    mixed output -- print what is being removed
+    """
+    resource_id = primitive_el.get("id")
+    _remove_resource_references_from_facade(cib, resource_id, output)
+    remote_node_name = _get_resource_remote_node_name(primitive_el)
+    if remote_node_name:
+        constraint.remove_constraints_containing_node_from_facade(
+            cib, remote_node_name, output
+        )
+
+    parent_el = primitive_el.getparent()
+    if parent_el.tag != "group" or len(parent_el.findall(".//primitive")) > 1:
+        to_remove_el = (
+            parent_el if parent_el.tag in ("clone", "master") else primitive_el
+        )
         if output is True:
             print("Deleting Resource - " + resource_id)
-        output, retVal = utils.run(args)
-        if retVal != 0:
-            utils.err(
-                f"unable to remove resource: {resource_id}, it may still be "
-                "referenced in constraints."
-            )
     else:
-        top_master_xpath = (
-            f'//master/group/primitive[@id="{resource_id}"]/../..'
-        )
-        top_clone_xpath = f'//clone/group/primitive[@id="{resource_id}"]/../..'
-        top_master = utils.get_cib_xpath(top_master_xpath)
-        top_clone = utils.get_cib_xpath(top_clone_xpath)
-        if top_master != "":
-            to_remove_xpath = top_master_xpath
-            msg = "and group and M/S"
-            to_remove_dom = parseString(top_master).getElementsByTagName(
-                "master"
-            )
-            to_remove_id = to_remove_dom[0].getAttribute("id")
-            utils.replace_cib_configuration(
-                remove_resource_references(
-                    utils.get_cib_dom(),
-                    to_remove_dom[0]
-                    .getElementsByTagName("group")[0]
-                    .getAttribute("id"),
-                )
-            )
-        elif top_clone != "":
-            to_remove_xpath = top_clone_xpath
-            msg = "and group and clone"
-            to_remove_dom = parseString(top_clone).getElementsByTagName("clone")
-            to_remove_id = to_remove_dom[0].getAttribute("id")
-            utils.replace_cib_configuration(
-                remove_resource_references(
-                    utils.get_cib_dom(),
-                    to_remove_dom[0]
-                    .getElementsByTagName("group")[0]
-                    .getAttribute("id"),
-                )
+        # the last resource of a group, remove the group and its clone too
+        top_el = parent_el.getparent()
+        if top_el.tag in ("master", "clone"):
+            msg = (
+                "and group and M/S"
+                if top_el.tag == "master"
+                else "and group and clone"
             )
+            _remove_resource_references_from_facade(cib, parent_el.get("id"))
+            to_remove_el = top_el
         else:
-            to_remove_xpath = group_xpath
             msg = "and group"
-            to_remove_dom = parseString(group).getElementsByTagName("group")
-            to_remove_id = to_remove_dom[0].getAttribute("id")
-
-        utils.replace_cib_configuration(
-            remove_resource_references(
-                utils.get_cib_dom(), to_remove_id, output
-            )
+            to_remove_el = parent_el
+        _remove_resource_references_from_facade(
+            cib, to_remove_el.get("id"), output
         )
-
-        args = ["cibadmin", "-o", "resources", "-D", "--xpath", to_remove_xpath]
         if output is True:
             print("Deleting Resource (" + msg + ") - " + resource_id)
-        dummy_cmdoutput, retVal = utils.run(args)
-        if retVal != 0:
-            if output is True:
-                utils.err(
-                    "Unable to remove resource '%s' (do constraints exist?)"
-                    % (resource_id)
-                )
-            return False
-    if remote_node_name and not utils.usefile:
-        if not is_remove_remote_context:
-            warn(
-                "This command is not sufficient for removing remote and guest "
-                "nodes. To complete the removal, remove pacemaker authkey and "
-                "stop and disable pacemaker_remote on the node(s) manually."
-            )
-        output, retval = utils.run(["crm_resource", "--wait"])
-        output, retval = utils.run(
-            ["crm_node", "--force", "--remove", remote_node_name]
+    cib.remove(to_remove_el)
+    return remote_node_name
+
+
+def _remove_remote_node_from_cluster(
+    remote_node_name, is_remove_remote_context
+):
+    """
+    Commandline options: no options
+    """
+    if not is_remove_remote_context:
+        warn(
+            "This command is not sufficient for removing remote and guest "
+            "nodes. To complete the removal, remove pacemaker authkey and "
+            "stop and disable pacemaker_remote on the node(s) manually."
         )
-    return True
+    utils.run(["crm_resource", "--wait"])
+    utils.run(["crm_node", "--force", "--remove", remote_node_name])
 
 
 # moved to pcs.lib.cib.fencing_topology.remove_device_from_all_levels
@@ -2051,6 +2035,52 @@ def remove_resource_references(
     return dom
 
 
+def _remove_resource_references_from_facade(cib, resource_id, output=False):
+    """
+    Commandline options: no options
+
+    CibFacade cib -- the CIB to remove the references from
+    string resource_id -- remove references to this resource
+    mixed output -- print removed constraints
+    """
+    for obj_ref in cib.get_elements_by_tag("obj_ref"):
+        if obj_ref.get("id") == resource_id:
+            tag = obj_ref.getparent()
+            cib.remove(obj_ref)
+            if tag.find(".//obj_ref") is None:
+                _remove_resource_references_from_facade(
+                    cib, tag.get("id"), output=output
+                )
+                cib.remove(tag)
+    constraint.remove_constraints_containing_from_facade(
+        cib, resource_id, output
+    )
+    _stonith_level_rm_device_from_facade(cib, resource_id)
+    for permission in cib.get_elements_by_tag("acl_permission"):
+        if permission.get("reference") == resource_id:
+            cib.remove(permission)
+
+
+def _stonith_level_rm_device_from_facade(cib, stn_id):
+    """
+    Commandline options: no options
+    """
+    topology_el_list = cib.get_elements_by_tag("fencing-topology")
+    if not topology_el_list:
+        return
+    topology_el = topology_el_list[0]
+    for level_el in topology_el.findall(".//fencing-level"):
+        device_list = level_el.get("devices", "").split(",")
+        if stn_id in device_list:
+            new_device_list = [dev for dev in device_list if dev != stn_id]
+            if new_device_list:
+                level_el.set("devices", ",".join(new_device_list))
+            else:
+                cib.remove(level_el)
+    if topology_el.find(".//fencing-level") is None:
+        cib.remove(topology_el)
+
+
 # This removes a resource from a group, but keeps it in the config
 def resource_group_rm(cib_dom, group_name, resource_ids):
     """
@@ -2314,10 +2344,19 @@ def resource_disable_cmd(lib, argv, modifiers):
       * --simulate - do not push the CIB, print its effects
       * --no-strict - allow disable if other resource is affected
       * --wait
+      * --wait-targeted - wait only for the resources to get to the
+        expected state
     """
     modifiers.ensure_only_supported(
-        "-f", "--brief", "--safe", "--simulate", "--no-strict", "--wait"
+        "-f",
+        "--brief",
+        "--safe",
+        "--simulate",
+        "--no-strict",
+        "--wait",
+        "--wait-targeted",
     )
+    modifiers.ensure_dependency_satisfied("--wait", ["--wait-targeted"])
     modifiers.ensure_not_mutually_exclusive("-f", "--simulate", "--wait")
     modifiers.ensure_not_incompatible("--simulate", {"-f", "--safe", "--wait"})
     modifiers.ensure_not_incompatible("--safe", {"-f", "--simulate", "--brief"})
@@ -2356,9 +2395,16 @@ def resource_safe_disable_cmd(
       * --no-strict - allow disable if other resource is affected
       * --simulate - do not push the CIB, print its effects
       * --wait
+      * --wait-targeted - wait only for the resources to get to the
+        expected state
     """
     modifiers.ensure_only_supported(
-        "--brief", "--force", "--no-strict", "--simulate", "--wait"
+        "--brief",
+        "--force",
+        "--no-strict",
+        "--simulate",
+        "--wait",
+        "--wait-targeted",
     )
     modifiers.ensure_not_incompatible("--force", {"--no-strict", "--simulate"})
     custom_options = {}
@@ -2373,7 +2419,12 @@ def resource_safe_disable_cmd(
         lib,
         argv,
         modifiers.get_subset(
-            "--wait", "--no-strict", "--simulate", "--brief", **custom_options
+            "--wait",
+            "--wait-targeted",
+            "--no-strict",
+            "--simulate",
+            "--brief",
+            **custom_options,
         ),
     )
 
@@ -2382,9 +2433,12 @@ def resource_enable_cmd(lib, argv, modifiers):
     """
     Options:
       * --wait
+      * --wait-targeted - wait only for the resources to get to the
+        expected state
       * -f - CIB file
     """
-    modifiers.ensure_only_supported("--wait", "-f")
+    modifiers.ensure_only_supported("--wait", "--wait-targeted", "-f")
+    modifiers.ensure_dependency_satisfied("--wait", ["--wait-targeted"])
     if not argv:
         raise CmdLineInputError("You must specify resource(s) to enable")
     resources = argv
@@ -2644,10 +2698,10 @@ def is_managed(resource_id):
 def resource_failcount(lib, argv, modifiers):
     """
     Options:
-      * --full
+      * --full - failcount show only
+      * --output-format - failcount summary only, text or json
       * -f - CIB file
     """
-    modifiers.ensure_only_supported("-f", "--full")
     if not argv:
         raise CmdLineInputError()
 
@@ -2659,26 +2713,42 @@ def resource_failcount(lib, argv, modifiers):
         raise_command_replaced("pcs resource cleanup")
 
     resource = argv.pop(0) if argv and "=" not in argv[0] else None
-    parsed_options = prepare_options_allowed(
-        argv, {"node", "operation", "interval"}
-    )
-    node = parsed_options.get("node")
-    operation = parsed_options.get("operation")
-    interval = parsed_options.get("interval")
 
     if command == "show":
+        modifiers.ensure_only_supported("-f", "--full")
+        parsed_options = prepare_options_allowed(
+            argv, {"node", "operation", "interval"}
+        )
         print(
             resource_failcount_show(
                 lib,
                 resource,
-                node,
-                operation,
-                interval,
+                parsed_options.get("node"),
+                parsed_options.get("operation"),
+                parsed_options.get("interval"),
                 modifiers.get("--full"),
             )
         )
         return
 
+    if command == "summary":
+        modifiers.ensure_only_supported("-f", "--output-format")
+        parsed_options = prepare_options_allowed(
+            argv, {"node", "operation", "interval", "within", "top"}
+        )
+        output_format = modifiers.get("--output-format") or "text"
+        if output_format not in ("text", "json"):
+            raise CmdLineInputError(
+                "Unknown output format '{0}', supported formats are: text, "
+                "json".format(output_format)
+            )
+        print(
+            resource_failcount_summary(
+                lib, resource, parsed_options, output_format == "json"
+            )
+        )
+        return
+
     raise CmdLineInputError()
 
 
@@ -2796,6 +2866,41 @@ def resource_failcount_show(lib, resource, node, operation, interval, full):
     return "\n".join(result_lines)
 
 
+def __format_failure_total(name, total):
+    """
+    Commandline options: no options
+    """
+    last_failure = datetime.datetime.fromtimestamp(
+        total["last_failure"]
+    ).isoformat(sep=" ")
+    return f"  {name}: {total['fail_count']} (last failure {last_failure})"
+
+
+def resource_failcount_summary(lib, resource, options, as_json):
+    """
+    Commandline options:
+      * -f - CIB file
+    """
+    summary = lib.resource.get_failcounts_summary(resource=resource, **options)
+    if as_json:
+        return json.dumps(summary)
+    if not summary["resources"]:
+        return __headline_resource_failures(
+            True,
+            resource,
+            options.get("node"),
+            options.get("operation"),
+            options.get("interval"),
+        )
+    result_lines = ["Resources with most failures:"]
+    for total in summary["resources"]:
+        result_lines.append(__format_failure_total(total["resource"], total))
+    result_lines.append("Failures per node:")
+    for total in summary["nodes"]:
+        result_lines.append(__format_failure_total(total["node"], total))
+    return "\n".join(result_lines)
+
+
 def resource_node_lines(node):
     """
     Commandline options: no options
@@ -2968,16 +3073,14 @@ def operation_to_string(op_el):
     Commandline options: no options
     """
     parts = []
-    parts.append(op_el.getAttribute("name"))
-    for name, value in sorted(op_el.attributes.items()):
+    parts.append(op_el.get("name", ""))
+    for name, value in sorted(op_el.attrib.items()):
         if name in ["id", "name"]:
             continue
         parts.append(name + "=" + value)
-    for nvpair in op_el.getElementsByTagName("nvpair"):
-        parts.append(
-            nvpair.getAttribute("name") + "=" + nvpair.getAttribute("value")
-        )
-    parts.append("(" + op_el.getAttribute("id") + ")")
+    for nvpair in op_el.iterfind(".//nvpair"):
+        parts.append(nvpair.get("name", "") + "=" + nvpair.get("value", ""))
+    parts.append("(" + op_el.get("id", "") + ")")
     return " ".join(parts)
 
 
@@ -3367,9 +3470,14 @@ def resource_bundle_create_cmd(lib, argv, modifiers):
       * --force - allow unknown options
       * --disabled - create as a stopped bundle
       * --wait
+      * --wait-targeted - wait only for the resources to get to the
+        expected state
       * -f - CIB file
     """
-    modifiers.ensure_only_supported("--force", "--disabled", "--wait", "-f")
+    modifiers.ensure_only_supported(
+        "--force", "--disabled", "--wait", "--wait-targeted", "-f"
+    )
+    modifiers.ensure_dependency_satisfied("--wait", ["--wait-targeted"])
     if not argv:
         raise CmdLineInputError()
 
@@ -3395,9 +3503,14 @@ def resource_bundle_reset_cmd(lib, argv, modifiers):
       * --force - allow unknown options
       * --disabled - create as a stopped bundle
       * --wait
+      * --wait-targeted - wait only for the resources to get to the
+        expected state
       * -f - CIB file
     """
-    modifiers.ensure_only_supported("--force", "--disabled", "--wait", "-f")
+    modifiers.ensure_only_supported(
+        "--force", "--disabled", "--wait", "--wait-targeted", "-f"
+    )
+    modifiers.ensure_dependency_satisfied("--wait", ["--wait-targeted"])
     if not argv:
         raise CmdLineInputError()
 
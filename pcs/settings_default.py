@@ -50,6 +50,9 @@ pcsd_settings_conf_location = os.path.join(
     pcsd_var_location, "pcs_settings.conf"
 )
 pcsd_dr_config_location = os.path.join(pcsd_var_location, "disaster-recovery")
+pacemaker_metadata_cache_location = os.path.join(
+    pcsd_var_location, "pacemaker-metadata"
+)
 pcsd_exec_location = "/usr/lib/pcsd/"
 pcsd_log_location = "/var/log/pcsd/pcsd.log"
 pcsd_default_port = 2224
@@ -95,3 +98,37 @@ pcsd_gem_path = "vendor/bundle/ruby"
 ruby_executable = "/usr/bin/ruby"
 
 gui_session_lifetime_seconds = 60 * 60
+gui_session_max_count = 10000
+pcsd_session_storage_location = os.path.join(pcsd_var_location, "sessions")
+# Config synchronization runs less often while configs are in sync with the
+# cluster, up to this multiple of the configured sync interval
+pcsd_config_sync_max_backoff = 4
+# Multiaddress communication: a timeout for connecting to an address of a node
+# which has other addresses left to try, and for how long (in seconds) the
+# health of addresses is remembered
+multiaddress_connect_timeout = 5
+address_health_expiry = 10 * 60
+address_health_location = os.path.join(pcsd_var_location, "address-health")
+# pcs_internal (pcsd running pcs library commands) returns at most this many
+# debug reports of a command, set to None to return all of them
+pcs_internal_debug_report_limit = 1000
+# --wait-targeted of resource commands: the cluster state is polled in
+# intervals growing from min to max seconds
+cluster_state_poll_interval_min = 0.25
+cluster_state_poll_interval_max = 2
+# Max number of crm_simulate processes running at once when simulating
+# several changes of the CIB
+simulate_max_workers = 4
+# pcs status --watch: default refresh interval and how often (in seconds)
+# services and node reachability are checked
+status_watch_interval = 2
+status_watch_slow_sources_interval = 30
+# Status of all booth instances: how many instances are queried at once and
+# for how many seconds their statuses are shared by pcs processes (0 disables
+# sharing)
+booth_status_max_workers = 4
+booth_status_cache_max_age = 5
+booth_status_cache_location = os.path.join(pcsd_var_location, "booth-status")
+# Structured cluster status served by pcsd is shared by requests of the same
+# user for this many seconds
+pcsd_cluster_status_cache_max_age = 2
@@ -1,17 +1,31 @@
+from datetime import datetime
+import hashlib
+import json
 import sys
 import os
+import re
+import time
 
-from pcs import utils
+from pcs import settings, utils
 from pcs.common import reports
 from pcs.common.reports.item import ReportItem
 from pcs.cli.common.errors import CmdLineInputError
 from pcs.cli.reports import process_library_reports
+from pcs.cli.reports.messages import report_item_msg_text
+from pcs.lib.commands.status import StatusSourceCache
 from pcs.lib.node import get_existing_nodes_names
 from pcs.lib.errors import LibraryError
 from pcs.lib.pacemaker.state import ClusterState
 
 # pylint: disable=too-many-branches, too-many-locals, too-many-statements
 
+# crm_mon prints when the status was obtained ("Last updated") and when the CIB
+# was changed ("Last change"), e.g. "  * Last updated: Mon Jan  6 ..." with
+# pacemaker 2.0.3+ or "Last updated: Mon Jan  6 ..." with older versions.
+_CRM_MON_TIME_LINE_RE = re.compile(
+    r"^\s*(\*\s+)?Last (updated|change):.*$", re.MULTILINE
+)
+
 
 def full_status(lib, argv, modifiers):
     """
@@ -21,6 +35,8 @@ def full_status(lib, argv, modifiers):
       * -f - CIB file, crm_mon accepts CIB_file environment variable
       * --corosync_conf - file corocync.conf
       * --request-timeout - HTTP timeout for node authorization check
+      * --watch - refresh the status until interrupted
+      * --output-format - format of the refreshed status: text, json
     """
     modifiers.ensure_only_supported(
         "--hide-inactive",
@@ -28,15 +44,113 @@ def full_status(lib, argv, modifiers):
         "-f",
         "--corosync_conf",
         "--request-timeout",
+        "--watch",
+        "--output-format",
     )
     if argv:
         raise CmdLineInputError()
-    print(
-        lib.status.full_cluster_status_plaintext(
-            hide_inactive_resources=modifiers.get("--hide-inactive"),
-            verbose=modifiers.get("--full"),
+    modifiers.ensure_dependency_satisfied("--watch", ["--output-format"])
+    if not modifiers.is_specified("--watch"):
+        print(
+            lib.status.full_cluster_status_plaintext(
+                hide_inactive_resources=modifiers.get("--hide-inactive"),
+                verbose=modifiers.get("--full"),
+            )
         )
+        return
+
+    interval = modifiers.get("--watch") or settings.status_watch_interval
+    try:
+        interval = float(interval)
+    except ValueError:
+        interval = 0
+    if interval <= 0:
+        raise CmdLineInputError(
+            "'{0}' is not a valid --watch value, use a positive number".format(
+                modifiers.get("--watch")
+            )
+        )
+    output_format = modifiers.get("--output-format") or "text"
+    if output_format not in ("text", "json"):
+        raise CmdLineInputError(
+            "Unknown output format '{0}', supported formats are: text, "
+            "json".format(output_format)
+        )
+    slow_sources_cache = StatusSourceCache(
+        settings.status_watch_slow_sources_interval
     )
+    try:
+        watch_status(
+            lambda: lib.status.full_cluster_status_plaintext(
+                hide_inactive_resources=modifiers.get("--hide-inactive"),
+                verbose=modifiers.get("--full"),
+                slow_sources_cache=slow_sources_cache,
+            ),
+            interval,
+            output_format == "json",
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+def _get_status_digest(status_text, error_list):
+    # The time lines change on every refresh even if nothing else does, they
+    # must not make the status look changed.
+    return hashlib.sha256(
+        "\n".join(
+            [_CRM_MON_TIME_LINE_RE.sub("", status_text)] + error_list
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def watch_status(
+    get_status, interval, json_lines, sleep=time.sleep, now=datetime.now
+):
+    """
+    Print the status whenever it changes, never return
+
+    callable get_status -- return the current status text
+    float interval -- seconds between refreshes of the status
+    bool json_lines -- print each change as a JSON object on one line
+    """
+    clear_screen = not json_lines and sys.stdout.isatty()
+    last_digest = None
+    while True:
+        error_list = []
+        try:
+            status_text = get_status()
+        except LibraryError as e:
+            # Keep watching, the status is often unavailable for a moment
+            # during an incident, e.g. while pacemaker is restarting.
+            status_text = ""
+            # pylint: disable=no-member
+            error_list = [
+                report_item_msg_text(report_item.message)
+                for report_item in e.args
+            ] or ["Unable to get the cluster status"]
+        digest = _get_status_digest(status_text, error_list)
+        if digest != last_digest:
+            last_digest = digest
+            timestamp = now().isoformat(timespec="seconds")
+            if json_lines:
+                event = dict(time=timestamp, digest=digest)
+                if error_list:
+                    event["errors"] = error_list
+                else:
+                    event["status"] = status_text
+                print(json.dumps(event))
+            else:
+                if clear_screen:
+                    print("\033[H\033[2J", end="")
+                print(f"Last change: {timestamp}")
+                print()
+                for error_text in error_list:
+                    print(f"Error: {error_text}")
+                print(status_text)
+                if not clear_screen:
+                    print()
+            sys.stdout.flush()
+        sleep(interval)
 
 
 # Parse crm_mon for status
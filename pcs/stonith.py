@@ -115,6 +115,8 @@ def stonith_create(lib, argv, modifiers):
       * --disabled - created reource will be disabled
       * --no-default-ops - do not add default operations
       * --wait
+      * --wait-targeted - wait only for the resources to get to the
+        expected state
       * -f - CIB file
     """
     modifiers.ensure_only_supported(
@@ -125,8 +127,10 @@ def stonith_create(lib, argv, modifiers):
         "--disabled",
         "--no-default-ops",
         "--wait",
+        "--wait-targeted",
         "-f",
     )
+    modifiers.ensure_dependency_satisfied("--wait", ["--wait-targeted"])
     if modifiers.is_specified("--before") and modifiers.is_specified("--after"):
         raise error(
             "you cannot specify both --before and --after{0}".format(
@@ -180,10 +180,18 @@ Options:
                        A few commands only use the specified file in read-only
                        mode since their effect is not a CIB modification.
     --debug            Print all network traffic and external commands run.
+    --debug-timing     Print a summary of times and sizes of requests sent to
+                       other nodes per node as JSON to stderr.
     --version          Print pcs version information. List pcs capabilities if
                        --full is specified.
     --request-timeout  Timeout for each outgoing request to another node in
                        seconds. Default is 60s.
+    --wait-targeted    Used with --wait in resource create, enable, disable,
+                       move, ban, bundle create|reset and stonith create. Wait
+                       only until the resources get to their expected state
+                       instead of waiting for the whole cluster to settle.
+                       Resources depending on the changed ones may still be
+                       starting or stopping when pcs returns.
     --force            Override checks and errors, the exact behavior depends on
                        the command. WARNING: Using the --force option is
                        strongly discouraged unless you know what you are doing.
@@ -733,6 +741,15 @@ Commands:
         failcounts per resource and node. Use 'pcs resource cleanup' or 'pcs
         resource refresh' to reset failcounts.
 
+    failcount summary [<resource id>] [node=<node>] [operation=<operation>
+            [interval=<interval>]] [within=<time>] [top=<count>]
+            [--output-format=text|json]
+        Show failcounts summed per resource and per node, the most failing
+        first, optionally filtered by a resource, node, operation and its
+        interval. If within is specified, count only failures which last
+        occurred within the specified time (e.g. 1h). If top is specified,
+        list only the specified number of the most failing resources.
+
     relocate dry-run [resource1] [resource2] ...
         The same as 'relocate run' but has no effect on the cluster.
 
@@ -1780,8 +1797,13 @@ Usage: pcs status [commands]...
 View current cluster and resource status
 Commands:
     [status] [--full] [--hide-inactive]
+            [--watch[=n] [--output-format=text|json]]
         View all information about the cluster and resources (--full provides
-        more details, --hide-inactive hides inactive resources).
+        more details, --hide-inactive hides inactive resources). If --watch is
+        specified, pcs refreshes the status every 'n' seconds (2 by default)
+        and shows it again when it changes, until interrupted. Status of
+        services and nodes is checked less often. With --output-format=json,
+        each change of the status is printed as a JSON object on one line.
 
     resources [--hide-inactive]
         Show status of all currently configured resources. If --hide-inactive
@@ -1836,6 +1858,9 @@ Commands:
     backup [filename]
         Creates the tarball containing the cluster configuration files.
         If filename is not specified the standard output will be used.
+        The tarball is compressed by gzip, xz or bzip2 if the filename ends
+        with '.tar.gz', '.tar.xz' or '.tar.bz2' respectively. Otherwise,
+        bzip2 is used and '.tar.bz2' is appended to the filename.
 
     restore [--local] [filename]
         Restores the cluster configuration files on all nodes from the backup.
@@ -1919,13 +1944,15 @@ Usage: pcs node <command>
 Manage cluster nodes
 
 Commands:
-    attribute [[<node>] [--name <name>] | <node> <name>=<value> ...]
+    attribute [[<node>] [--name <name>] | <node>... <name>=<value> ...]
         Manage node attributes.  If no parameters are specified, show attributes
         of all nodes.  If one parameter is specified, show attributes
         of specified node.  If --name is specified, show specified attribute's
         value from all nodes.  If more parameters are specified, set attributes
-        of specified node.  Attributes can be removed by setting an attribute
-        without a value.
+        of specified node(s).  Attributes can be removed by setting an attribute
+        without a value.  Removing an attribute which does not exist is an
+        error unless --force is specified.  Attributes of more nodes are set in
+        one CIB update.
 
     maintenance [--all | <node>...] [--wait[=n]]
         Put specified node(s) into maintenance mode, if no nodes or options are
@@ -1965,8 +1992,8 @@ Commands:
         the operation not succeeded yet. If 'n' is not specified it defaults
         to 60 minutes.
 
-    utilization [[<node>] [--name <name>] | <node> <name>=<value> ...]
-        Add specified utilization options to specified node.  If node is not
+    utilization [[<node>] [--name <name>] | <node>... <name>=<value> ...]
+        Add specified utilization options to specified node(s).  If node is not
         specified, shows utilization of all nodes.  If --name is specified,
         shows specified utilization value from all nodes. If utilization options
         are not specified, shows utilization of specified node.  Utilization
@@ -26,6 +26,8 @@ from typing import (
     Tuple,
 )
 
+from lxml import etree as lxml_etree
+
 from pcs import settings, usage
 
 from pcs.common import (
@@ -53,6 +55,7 @@ from pcs.cli.reports import (
 import pcs.cli.booth.env
 from pcs.cli.file import metadata as cli_file_metadata
 
+from pcs.lib.cib.facade import CibFacade
 import pcs.lib.corosync.config_parser as corosync_conf_parser
 from pcs.lib.corosync.config_facade import ConfigFacade as corosync_conf_facade
 from pcs.lib.env import LibraryEnvironment
@@ -68,6 +71,7 @@ from pcs.lib.external import (
 )
 from pcs.lib.file.instance import FileInstance as LibFileInstance
 from pcs.lib.interface.config import ParserErrorException
+from pcs.lib.pacemaker import cib_cache, metadata_cache
 from pcs.lib.pacemaker.state import ClusterState
 from pcs.lib.pacemaker.values import (
     is_boolean,
@@ -88,6 +92,8 @@ usefile = False
 filename = ""
 # Note: not properly typed
 pcs_options: Dict[Any, Any] = {}
+# set in pcs module if --debug-timing is specified
+communication_timing = None
 
 
 class UnknownPropertyException(Exception):
@@ -98,13 +104,16 @@ def getValidateWithVersion(dom):
     """
     Commandline options: no options
     """
-    cib = dom.getElementsByTagName("cib")
-    if len(cib) != 1:
-        err("Bad cib")
-
-    cib = cib[0]
+    if isinstance(dom, CibFacade):
+        if dom.cib.tag != "cib":
+            err("Bad cib")
+        version = dom.cib.get("validate-with", "")
+    else:
+        cib = dom.getElementsByTagName("cib")
+        if len(cib) != 1:
+            err("Bad cib")
+        version = cib[0].getAttribute("validate-with")
 
-    version = cib.getAttribute("validate-with")
     r = re.compile(r"pacemaker-(\d+)\.(\d+)\.?(\d+)?")
     m = r.match(version)
     major = int(m.group(1))
@@ -148,13 +157,15 @@ def cluster_upgrade():
     print("Cluster CIB has been upgraded to latest version")
 
 
-def cluster_upgrade_to_version(required_version):
+def cluster_upgrade_to_version(required_version, facade=False):
     """
     Commandline options:
       * -f - CIB file
+
+    bool facade -- return the CIB as a CibFacade instead of a minidom document
     """
     checkAndUpgradeCIB(*required_version)
-    dom = get_cib_dom()
+    dom = get_cib_facade() if facade else get_cib_dom()
     current_version = getValidateWithVersion(dom)
     if current_version < required_version:
         err(
@@ -478,15 +489,6 @@ def destroyCluster(node, quiet=False):
     )
 
 
-def restoreConfig(node, tarball_data):
-    """
-    Commandline options:
-      * --request-timeout - timeout for HTTP requests
-    """
-    data = urlencode({"tarball": tarball_data})
-    return sendHTTPRequest(node, "remote/config_restore", data, False, True)
-
-
 def pauseConfigSyncing(node, delay_seconds=300):
     """
     Commandline options:
@@ -1116,6 +1118,17 @@ def does_exist(xpath_query):
     Commandline options:
       * -f - CIB file
     """
+    if not usefile:
+        # Validating a snapshot costs the same as the query. The CIB is not
+        # loaded just for the query, though, if there is no snapshot yet.
+        cib_xml = cib_cache.get_snapshot_cib_xml(os.environ, _load_cib_element)
+        if cib_xml is not None:
+            try:
+                return bool(
+                    _get_snapshot_facade(cib_xml).cib.xpath(xpath_query)
+                )
+            except (lxml_etree.XMLSyntaxError, lxml_etree.XPathError):
+                pass
     args = ["cibadmin", "-Q", "--xpath", xpath_query]
     dummy_output, retval = run(args)
     if retval != 0:
@@ -1324,6 +1337,8 @@ def validate_constraint_resource(dom, resource_id):
     Commandline options:
       * --force - allow constraint on any resource
     """
+    if isinstance(dom, CibFacade):
+        return _validate_constraint_resource_facade(dom, resource_id)
     resource_el = (
         dom_get_clone(dom, resource_id)
         or dom_get_master(dom, resource_id)
@@ -1347,24 +1362,66 @@ def validate_constraint_resource(dom, resource_id):
         # bundle
         return True, "", resource_id
 
+    return _validate_constraint_resource_in_parent(
+        resource_id, clone_el.tagName, clone_el.getAttribute("id")
+    )
+
+
+def _validate_constraint_resource_facade(cib, resource_id):
+    """
+    Commandline options:
+      * --force - allow constraint on any resource
+    """
+    if (
+        cib.get_clone(resource_id) is not None
+        or cib.get_master(resource_id) is not None
+        or cib.get_bundle(resource_id) is not None
+    ):
+        # clones, masters and bundles are always valid
+        return True, "", resource_id
+
+    resource_el = cib.get_resource(resource_id)
+    if resource_el is None:
+        resource_el = cib.get_group(resource_id)
+    if resource_el is None:
+        return False, "Resource '%s' does not exist" % resource_id, None
+
+    clone_el = next(resource_el.iterancestors("clone", "master"), None)
+    if clone_el is None and resource_el.tag == "primitive":
+        clone_el = next(resource_el.iterancestors("bundle"), None)
+    if clone_el is None:
+        # a primitive and a group is valid if not in a clone nor a master nor a
+        # bundle
+        return True, "", resource_id
+
+    return _validate_constraint_resource_in_parent(
+        resource_id, clone_el.tag, clone_el.get("id")
+    )
+
+
+def _validate_constraint_resource_in_parent(resource_id, parent_tag, parent_id):
+    """
+    Commandline options:
+      * --force - allow constraint on any resource
+    """
     if "--force" in pcs_options:
-        return True, "", clone_el.getAttribute("id")
+        return True, "", parent_id
 
-    if clone_el.tagName in ["clone", "master"]:
+    if parent_tag in ["clone", "master"]:
         return (
             False,
             "%s is a clone resource, you should use the clone id: %s "
             "when adding constraints. Use --force to override."
-            % (resource_id, clone_el.getAttribute("id")),
-            clone_el.getAttribute("id"),
+            % (resource_id, parent_id),
+            parent_id,
         )
-    if clone_el.tagName == "bundle":
+    if parent_tag == "bundle":
         return (
             False,
             "%s is a bundle resource, you should use the bundle id: %s "
             "when adding constraints. Use --force to override."
-            % (resource_id, clone_el.getAttribute("id")),
-            clone_el.getAttribute("id"),
+            % (resource_id, parent_id),
+            parent_id,
         )
     return True, "", resource_id
 
@@ -1577,15 +1634,46 @@ def get_cib_xpath(xpath_query):
     return output
 
 
+def _load_cib_snapshot():
+    def load_cib():
+        output, retval = run(["cibadmin", "-l", "-Q"])
+        return output, retval == 0
+
+    env_vars = dict(os.environ)
+    if usefile:
+        env_vars["CIB_file"] = filename
+    return cib_cache.load_cib_xml(env_vars, load_cib, _load_cib_element)
+
+
+def _load_cib_element():
+    output, retval = run(
+        ["cibadmin", "-l", "-Q", "--xpath", "/cib", "--no-children"],
+        ignore_stderr=True,
+    )
+    return output, retval == 0
+
+
+# cib xml: facade of the last snapshot queried by does_exist
+_snapshot_facade: Dict[str, CibFacade] = {}
+
+
+def _get_snapshot_facade(cib_xml):
+    if cib_xml not in _snapshot_facade:
+        _snapshot_facade.clear()
+        _snapshot_facade[cib_xml] = CibFacade.from_string(cib_xml)
+    return _snapshot_facade[cib_xml]
+
+
 def get_cib(scope=None):
     """
     Commandline options:
       * -f - CIB file
     """
-    command = ["cibadmin", "-l", "-Q"]
     if scope:
-        command.append("--scope=%s" % scope)
-    output, retval = run(command)
+        output, retval = run(["cibadmin", "-l", "-Q", "--scope=%s" % scope])
+    else:
+        output, success = _load_cib_snapshot()
+        retval = 0 if success else 1
     if retval != 0:
         if retval == 105 and scope:
             err("unable to get cib, scope '%s' not present in cib" % scope)
@@ -1609,6 +1697,20 @@ def get_cib_dom(cib_xml=None):
         err("unable to get cib")
 
 
+def get_cib_facade(cib_xml=None):
+    """
+    Commandline options:
+      * -f - CIB file
+    """
+    # pylint: disable=bare-except
+    if cib_xml is None:
+        cib_xml = get_cib()
+    try:
+        return CibFacade.from_string(cib_xml)
+    except:
+        err("unable to get cib")
+
+
 def get_cib_etree(cib_xml=None):
     """
     Commandline options:
@@ -1643,6 +1745,8 @@ def replace_cib_configuration(dom):
         # run(...) calls subprocess.Popen.communicate which calls encode...
         # so there is bytes to str conversion
         new_dom = ET.tostring(dom).decode()
+    elif isinstance(dom, CibFacade):
+        new_dom = dom.to_string()
     elif hasattr(dom, "toxml"):
         new_dom = dom.toxml()
     else:
@@ -1676,38 +1780,56 @@ def is_valid_cib_scope(scope):
 # DEPRECATED use lxml version available in pcs.lib.cib.tools
 def does_id_exist(dom, check_id):
     """
+    Commandline options: no options
+    """
+    if isinstance(dom, CibFacade):
+        return dom.does_id_exist(check_id)
+    return check_id in _get_dom_id_set(dom)
+
+
+def _get_dom_id_set(dom):
+    """
+    Return all ids used in the xml dom passed, collected in one pass
+
     Commandline options: no options
     """
     # do not search in /cib/status, it may contain references to previously
     # existing and deleted resources and thus preventing creating them again
     if is_etree(dom):
-        for elem in dom.findall(
-            str('(/cib/*[name()!="status"]|/*[name()!="cib"])/*')
-        ):
-            if elem.get("id") == check_id:
-                return True
+        return {
+            elem.get("id")
+            for elem in dom.findall(
+                str('(/cib/*[name()!="status"]|/*[name()!="cib"])/*')
+            )
+            if elem.get("id") is not None
+        }
+    document = (
+        dom if isinstance(dom, xml.dom.minidom.Document) else dom.ownerDocument
+    )
+    cib_list = dom_get_children_by_tag_name(document, "cib")
+    if cib_list:
+        section_list = [
+            section
+            for cib in cib_list
+            for section in cib.childNodes
+            if section.nodeType == xml.dom.minidom.Node.ELEMENT_NODE
+            and section.tagName != "status"
+        ]
     else:
-        document = (
-            dom
-            if isinstance(dom, xml.dom.minidom.Document)
-            else dom.ownerDocument
-        )
-        cib_found = False
-        for cib in dom_get_children_by_tag_name(document, "cib"):
-            cib_found = True
-            for section in cib.childNodes:
-                if section.nodeType != xml.dom.minidom.Node.ELEMENT_NODE:
-                    continue
-                if section.tagName == "status":
-                    continue
-                for elem in section.getElementsByTagName("*"):
-                    if elem.getAttribute("id") == check_id:
-                        return True
-        if not cib_found:
-            for elem in document.getElementsByTagName("*"):
-                if elem.getAttribute("id") == check_id:
-                    return True
-    return False
+        section_list = [document]
+    id_set = set()
+    for section in section_list:
+        # iterate over the nodes without building NodeLists, that is what
+        # makes getElementsByTagName("*") slow on large CIBs
+        node_stack = list(reversed(section.childNodes))
+        while node_stack:
+            node = node_stack.pop()
+            if node.nodeType != xml.dom.minidom.Node.ELEMENT_NODE:
+                continue
+            if node.hasAttribute("id"):
+                id_set.add(node.getAttribute("id"))
+            node_stack.extend(reversed(node.childNodes))
+    return id_set
 
 
 # Returns check_id if it doesn't exist in the dom, otherwise it adds an integer
@@ -1717,9 +1839,12 @@ def find_unique_id(dom, check_id):
     """
     Commandline options: no options
     """
+    if isinstance(dom, CibFacade):
+        return dom.find_unique_id(check_id)
+    id_set = _get_dom_id_set(dom)
     counter = 1
     temp_id = check_id
-    while does_id_exist(dom, temp_id):
+    while temp_id in id_set:
         temp_id = check_id + "-" + str(counter)
         counter += 1
     return temp_id
@@ -1733,13 +1858,12 @@ def operation_exists(operations_el, op_el):
     Commandline options: no options
     """
     existing = []
-    op_name = op_el.getAttribute("name")
-    op_interval = get_timeout_seconds(op_el.getAttribute("interval"), True)
-    for op in operations_el.getElementsByTagName("op"):
+    op_name = op_el.get("name", "")
+    op_interval = get_timeout_seconds(op_el.get("interval", ""), True)
+    for op in operations_el.iterfind(".//op"):
         if (
-            op.getAttribute("name") == op_name
-            and get_timeout_seconds(op.getAttribute("interval"), True)
-            == op_interval
+            op.get("name", "") == op_name
+            and get_timeout_seconds(op.get("interval", ""), True) == op_interval
         ):
             existing.append(op)
     return existing
@@ -1750,18 +1874,18 @@ def operation_exists_by_name(operations_el, op_el):
     Commandline options: no options
     """
     existing = []
-    op_name = op_el.getAttribute("name")
-    op_role = op_el.getAttribute("role") or "Started"
+    op_name = op_el.get("name", "")
+    op_role = op_el.get("role") or "Started"
     ocf_check_level = None
     if op_name == "monitor":
         ocf_check_level = get_operation_ocf_check_level(op_el)
 
-    for op in operations_el.getElementsByTagName("op"):
-        if op.getAttribute("name") == op_name:
+    for op in operations_el.iterfind(".//op"):
+        if op.get("name", "") == op_name:
             if op_name != "monitor":
                 existing.append(op)
             elif (
-                op.getAttribute("role") or "Started"
+                op.get("role") or "Started"
             ) == op_role and ocf_check_level == get_operation_ocf_check_level(
                 op
             ):
@@ -1773,10 +1897,9 @@ def get_operation_ocf_check_level(operation_el):
     """
     Commandline options: no options
     """
-    for attr_el in operation_el.getElementsByTagName("instance_attributes"):
-        for nvpair_el in attr_el.getElementsByTagName("nvpair"):
-            if nvpair_el.getAttribute("name") == "OCF_CHECK_LEVEL":
-                return nvpair_el.getAttribute("value")
+    for nvpair_el in operation_el.iterfind(".//instance_attributes//nvpair"):
+        if nvpair_el.get("name") == "OCF_CHECK_LEVEL":
+            return nvpair_el.get("value", "")
     return None
 
 
@@ -1808,63 +1931,6 @@ def get_node_attributes(filter_node=None, filter_attr=None):
     return nas
 
 
-def set_node_attribute(prop, value, node):
-    """
-    Commandline options:
-      * -f - CIB file
-      * --force - no error if attribute to delete doesn't exist
-    """
-    if value == "":
-        o, r = run(
-            [
-                "crm_attribute",
-                "-t",
-                "nodes",
-                "--node",
-                node,
-                "--name",
-                prop,
-                "--query",
-            ]
-        )
-        if r != 0 and "--force" not in pcs_options:
-            err(
-                "attribute: '%s' doesn't exist for node: '%s'" % (prop, node),
-                False,
-            )
-            # This return code is used by pcsd
-            sys.exit(2)
-        o, r = run(
-            [
-                "crm_attribute",
-                "-t",
-                "nodes",
-                "--node",
-                node,
-                "--name",
-                prop,
-                "--delete",
-            ]
-        )
-    else:
-        o, r = run(
-            [
-                "crm_attribute",
-                "-t",
-                "nodes",
-                "--node",
-                node,
-                "--name",
-                prop,
-                "--update",
-                value,
-            ]
-        )
-
-    if r != 0:
-        err("unable to set attribute %s\n%s" % (prop, o))
-
-
 # If the property exists, remove it and replace it with the new property
 # If the value is blank, then we just remove it
 def set_cib_property(prop, value, cib_dom=None):
@@ -2198,6 +2264,19 @@ def stop_service(service):
 
 def write_file(path, data, permissions=0o644, binary=False):
     """
+    Commandline options:
+      * --force - overwrite a file if it already exists
+    """
+    return write_file_stream(
+        path, lambda outfile: outfile.write(data), permissions, binary
+    )
+
+
+def write_file_stream(path, write_data, permissions=0o644, binary=False):
+    """
+    Write a file by a callback which gets the opened file, remove the file if
+    the callback fails
+
     Commandline options:
       * --force - overwrite a file if it already exists
     """
@@ -2213,12 +2292,23 @@ def write_file(path, data, permissions=0o644, binary=False):
         with os.fdopen(
             os.open(path, os.O_WRONLY | os.O_CREAT, permissions), mode
         ) as outfile:
-            outfile.write(data)
+            write_data(outfile)
     except EnvironmentError as e:
+        _remove_partially_written_file(path)
         return False, "unable to write to '%s': %s" % (path, e)
+    except BaseException:
+        _remove_partially_written_file(path)
+        raise
     return True, ""
 
 
+def _remove_partially_written_file(path):
+    try:
+        os.remove(path)
+    except EnvironmentError:
+        pass
+
+
 def tar_add_file_data(
     tarball,
     data,
@@ -2530,15 +2620,84 @@ def dom_update_meta_attr(dom_element, attributes):
     )
 
 
-def dom_update_instance_attr(dom_element, attributes):
+def facade_update_nvset(cib, element, nvpair_tuples, tag_name, id_candidate):
     """
     Commandline options: no options
+
+    CibFacade cib -- the CIB the element belongs to
     """
-    dom_update_nvset(
-        dom_element,
+    # Do not ever remove the nvset element, see dom_update_nvset
+    if not nvpair_tuples:
+        return
+
+    only_removing = all(value == "" for dummy_name, value in nvpair_tuples)
+    # only look at the element's own nvsets, not at its children's ones
+    nvset_element_list = element.findall(tag_name)
+
+    # Do not create new nvset if we are only removing values from it.
+    if not nvset_element_list and only_removing:
+        return
+
+    if not nvset_element_list:
+        nvset_element = cib.append(
+            element,
+            lxml_etree.Element(tag_name, id=cib.find_unique_id(id_candidate)),
+        )
+    else:
+        nvset_element = nvset_element_list[0]
+
+    for name, value in nvpair_tuples:
+        facade_update_nv_pair(
+            cib, nvset_element, name, value, nvset_element.get("id") + "-"
+        )
+
+
+def facade_update_nv_pair(cib, nvset_element, name, value, id_prefix=""):
+    """
+    Commandline options: no options
+
+    CibFacade cib -- the CIB the nvset belongs to
+    """
+    for nvpair in nvset_element.iterfind("nvpair"):
+        if nvpair.get("name") == name:
+            if value == "":
+                cib.remove(nvpair)
+            else:
+                cib.set_attribute(nvpair, "value", value)
+            return nvset_element
+    if value != "":
+        cib.append(
+            nvset_element,
+            lxml_etree.Element(
+                "nvpair", id=id_prefix + name, name=name, value=value
+            ),
+        )
+    return nvset_element
+
+
+def facade_update_meta_attr(cib, element, attributes):
+    """
+    Commandline options: no options
+    """
+    facade_update_nvset(
+        cib,
+        element,
+        attributes,
+        "meta_attributes",
+        element.get("id") + "-meta_attributes",
+    )
+
+
+def facade_update_instance_attr(cib, element, attributes):
+    """
+    Commandline options: no options
+    """
+    facade_update_nvset(
+        cib,
+        element,
         attributes,
         "instance_attributes",
-        dom_element.getAttribute("id") + "-instance_attributes",
+        element.get("id") + "-instance_attributes",
     )
 
 
@@ -2601,6 +2760,34 @@ def is_valid_cib_value(value_type, value, enum_options=()):
 
 
 def get_cluster_properties_definition():
+    """
+    Commandline options: no options
+    """
+    # The definition only changes when pacemaker is upgraded, so it is cached
+    # instead of running three daemons on every property command.
+    sources = _get_cluster_properties_sources()
+    return metadata_cache.get_cached(
+        "cluster-properties-definition",
+        [source["path"] for source in sources],
+        lambda: _load_cluster_properties_definition(sources),
+    )
+
+
+def _get_cluster_properties_sources():
+    """
+    Commandline options: no options
+    """
+    return [
+        {
+            "name": "pacemaker-schedulerd",
+            "path": settings.pacemaker_schedulerd,
+        },
+        {"name": "pacemaker-controld", "path": settings.pacemaker_controld,},
+        {"name": "pacemaker-based", "path": settings.pacemaker_based,},
+    ]
+
+
+def _load_cluster_properties_definition(sources):
     """
     Commandline options: no options
     """
@@ -2636,14 +2823,6 @@ def get_cluster_properties_definition():
         "pe-input-series-max": "PE Input Storage",
         "enable-acl": "Enable ACLs",
     }
-    sources = [
-        {
-            "name": "pacemaker-schedulerd",
-            "path": settings.pacemaker_schedulerd,
-        },
-        {"name": "pacemaker-controld", "path": settings.pacemaker_controld,},
-        {"name": "pacemaker-based", "path": settings.pacemaker_based,},
-    ]
     definition = {}
     for source in sources:
         stdout, stderr, retval = cmd_runner().run([source["path"], "metadata"])
@@ -2752,6 +2931,8 @@ def get_lib_env() -> LibraryEnvironment:
         corosync_conf_data,
         known_hosts_getter=read_known_hosts_file,
         request_timeout=pcs_options.get("--request-timeout"),
+        communication_timing=communication_timing,
+        wait_targeted="--wait-targeted" in pcs_options,
     )
 
 
@@ -2777,12 +2958,15 @@ def get_cli_env():
     Commandline options:
       * --debug
       * --request-timeout
+      * --wait-targeted
     """
     env = Env()
     env.user, env.groups = get_cib_user_groups()
     env.known_hosts_getter = read_known_hosts_file
     env.report_processor = get_report_processor()
     env.request_timeout = pcs_options.get("--request-timeout")
+    env.communication_timing = communication_timing
+    env.wait_targeted = "--wait-targeted" in pcs_options
     return env
 
 
@@ -0,0 +1,97 @@
+"""
+Benchmark of CIB heavy commands on a large synthetic CIB
+
+Usage: python3 -m pcs_test.benchmark [--size small|medium|large]
+    [--repeat N] [--scenario NAME]... [--output FILE] [--baseline FILE]
+    [--tolerance FRACTION] [--cib-cache]
+
+Results are printed and optionally stored as JSON. If a baseline (results
+of a previous run) is specified, scenarios slower than the baseline by more
+than the tolerance are reported and the exit code is 1.
+"""
+import argparse
+import sys
+import time
+
+from pcs import settings
+from pcs.lib.pacemaker import cib_cache
+
+from pcs_test.benchmark.cib_generator import (
+    SIZE_MAP,
+    generate_cib,
+    generate_crm_mon,
+)
+from pcs_test.benchmark.environment import BenchmarkEnvironment, FakeRunner
+from pcs_test.benchmark.results import save_and_compare, summarize_time
+from pcs_test.benchmark.scenarios import SCENARIO_LIST
+
+
+def run_scenario(scenario, cib_xml, state_xml, repeat):
+    time_list = []
+    for _ in range(repeat):
+        runner = FakeRunner(cib_xml, state_xml)
+        env = BenchmarkEnvironment(runner)
+        start = time.perf_counter()
+        scenario.run(env, runner)
+        time_list.append(time.perf_counter() - start)
+    return summarize_time(time_list)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python3 -m pcs_test.benchmark",
+        description="Benchmark CIB heavy pcs commands",
+    )
+    parser.add_argument("--size", choices=sorted(SIZE_MAP), default="medium")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIO_LIST],
+        help="run only the scenario, may be specified several times",
+    )
+    parser.add_argument("--output", help="store results to the file")
+    parser.add_argument("--baseline", help="compare results to the file")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument(
+        "--cib-cache",
+        action="store_true",
+        help="reuse a snapshot of the CIB like the pcs CLI does",
+    )
+    args = parser.parse_args(argv)
+    if args.cib_cache:
+        cib_cache.enable()
+
+    size = SIZE_MAP[args.size]
+    cib_xml = generate_cib(size, seed=args.seed)
+    state_xml = generate_crm_mon(cib_xml)
+    results = {
+        "pcs_version": settings.pcs_version,
+        "size": args.size,
+        "cib": dict(
+            size._asdict(),
+            seed=args.seed,
+            bytes=len(cib_xml),
+            cib_cache=args.cib_cache,
+        ),
+        "scenarios": {},
+    }
+    for scenario in SCENARIO_LIST:
+        if args.scenario and scenario.name not in args.scenario:
+            continue
+        result = run_scenario(scenario, cib_xml, state_xml, args.repeat)
+        results["scenarios"][scenario.name] = result
+        print(
+            "{name:45} min {min:8.4f}s  median {median:8.4f}s".format(
+                name=scenario.name, **result
+            )
+        )
+
+    return save_and_compare(
+        results, args.output, args.baseline, args.tolerance, "cib"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
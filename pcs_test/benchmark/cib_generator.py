@@ -0,0 +1,375 @@
+"""
+Generator of large synthetic CIBs
+
+The generated CIB is deterministic for the same parameters, so benchmark
+results of different runs and pcs versions are comparable.
+"""
+from collections import namedtuple
+import itertools
+import random
+
+from lxml import etree
+
+from pcs_test.tools.misc import read_test_resource
+
+from pcs.lib.xml_tools import etree_to_str
+
+
+class CibSize(
+    namedtuple(
+        "CibSize",
+        [
+            "nodes",
+            "primitives",
+            "groups",
+            "group_size",
+            "clones",
+            "bundles",
+            "constraints",
+            "rules",
+            "tags",
+            "tag_size",
+        ],
+    )
+):
+    """
+    Number of elements of each kind in a generated CIB
+
+    primitives -- standalone primitives, primitives in groups and clones are
+        not counted in
+    constraints -- number of location, colocation and order constraints each
+    rules -- number of location constraints with a rule
+    """
+
+
+SIZE_MAP = {
+    "small": CibSize(
+        nodes=3,
+        primitives=20,
+        groups=5,
+        group_size=3,
+        clones=5,
+        bundles=2,
+        constraints=10,
+        rules=5,
+        tags=5,
+        tag_size=5,
+    ),
+    "medium": CibSize(
+        nodes=16,
+        primitives=300,
+        groups=50,
+        group_size=4,
+        clones=50,
+        bundles=20,
+        constraints=150,
+        rules=50,
+        tags=50,
+        tag_size=10,
+    ),
+    "large": CibSize(
+        nodes=32,
+        primitives=2000,
+        groups=300,
+        group_size=5,
+        clones=200,
+        bundles=50,
+        constraints=1000,
+        rules=300,
+        tags=200,
+        tag_size=20,
+    ),
+}
+
+
+def node_name(index):
+    return f"node-{index}"
+
+
+def primitive_id(index):
+    return f"R-{index}"
+
+
+def _sub(parent, tag, **attrib):
+    return etree.SubElement(parent, tag, attrib)
+
+
+def _append_primitive(parent, resource_id):
+    primitive = _sub(
+        parent,
+        "primitive",
+        id=resource_id,
+        **{"class": "ocf", "provider": "heartbeat", "type": "Dummy"},
+    )
+    instance_attrs = _sub(
+        primitive, "instance_attributes", id=f"{resource_id}-instance_attrs"
+    )
+    _sub(
+        instance_attrs,
+        "nvpair",
+        id=f"{resource_id}-instance_attrs-fake",
+        name="fake",
+        value=resource_id,
+    )
+    meta_attrs = _sub(
+        primitive, "meta_attributes", id=f"{resource_id}-meta_attributes"
+    )
+    _sub(
+        meta_attrs,
+        "nvpair",
+        id=f"{resource_id}-meta_attributes-target-role",
+        name="target-role",
+        value="Started",
+    )
+    operations = _sub(primitive, "operations")
+    for name, interval in (("monitor", "10s"), ("start", "0s"), ("stop", "0s")):
+        _sub(
+            operations,
+            "op",
+            id=f"{resource_id}-{name}-interval-{interval}",
+            name=name,
+            interval=interval,
+            timeout="20s",
+        )
+    return primitive
+
+
+def _append_rule(parent, rule_id, node_count, rng):
+    rule = _sub(parent, "rule", id=rule_id, score="INFINITY")
+    rule.set("boolean-op", "or")
+    _sub(
+        rule,
+        "expression",
+        id=f"{rule_id}-expr",
+        attribute="#uname",
+        operation="eq",
+        value=node_name(rng.randrange(node_count)),
+    )
+    _sub(
+        rule,
+        "expression",
+        id=f"{rule_id}-expr-1",
+        attribute="pool",
+        operation="gt",
+        type="integer",
+        value=str(rng.randrange(100)),
+    )
+    return rule
+
+
+def generate_cib(size: CibSize, seed: int = 0) -> str:
+    """
+    Return a CIB with resources, constraints and tags as specified by size
+    """
+    # pylint: disable=too-many-locals
+    rng = random.Random(seed)
+    cib = etree.fromstring(read_test_resource("cib-empty-3.5.xml"))
+    nodes = cib.find("configuration/nodes")
+    resources = cib.find("configuration/resources")
+    constraints = cib.find("configuration/constraints")
+    configuration = cib.find("configuration")
+
+    for index in range(1, size.nodes + 1):
+        node = _sub(nodes, "node", id=str(index), uname=node_name(index))
+        attrs = _sub(node, "instance_attributes", id=f"nodes-{index}")
+        _sub(
+            attrs,
+            "nvpair",
+            id=f"nodes-{index}-pool",
+            name="pool",
+            value=str(rng.randrange(100)),
+        )
+
+    primitive_list = []
+    counter = 0
+    for _ in range(size.primitives):
+        counter += 1
+        primitive_list.append(
+            _append_primitive(resources, primitive_id(counter)).get("id")
+        )
+    for group_index in range(size.groups):
+        group = _sub(resources, "group", id=f"G-{group_index}")
+        for _ in range(size.group_size):
+            counter += 1
+            _append_primitive(group, primitive_id(counter))
+    for clone_index in range(size.clones):
+        clone = _sub(resources, "clone", id=f"C-{clone_index}")
+        counter += 1
+        _append_primitive(clone, primitive_id(counter))
+    for bundle_index in range(size.bundles):
+        bundle = _sub(resources, "bundle", id=f"B-{bundle_index}")
+        _sub(bundle, "docker", image="pcs:test", replicas="2", network="bridge")
+
+    node_count = max(1, size.nodes)
+    for index in range(size.constraints):
+        _sub(
+            constraints,
+            "rsc_location",
+            id=f"location-{index}",
+            rsc=rng.choice(primitive_list),
+            node=node_name(rng.randrange(node_count) + 1),
+            score=str(rng.randrange(-100, 100)),
+        )
+        first, then = rng.sample(primitive_list, 2)
+        _sub(
+            constraints,
+            "rsc_colocation",
+            id=f"colocation-{index}",
+            rsc=first,
+            **{"with-rsc": then, "score": "INFINITY"},
+        )
+        _sub(
+            constraints,
+            "rsc_order",
+            id=f"order-{index}",
+            first=first,
+            then=then,
+            kind="Mandatory",
+        )
+    for index in range(size.rules):
+        location = _sub(
+            constraints,
+            "rsc_location",
+            id=f"location-rule-{index}",
+            rsc=rng.choice(primitive_list),
+        )
+        _append_rule(location, f"location-rule-{index}-rule", node_count, rng)
+
+    if size.tags:
+        tags = _sub(configuration, "tags")
+        for index in range(size.tags):
+            tag = _sub(tags, "tag", id=f"T-{index}")
+            for resource_id in rng.sample(
+                primitive_list, min(size.tag_size, len(primitive_list))
+            ):
+                _sub(tag, "obj_ref", id=resource_id)
+
+    rsc_defaults = _sub(configuration, "rsc_defaults")
+    meta_attrs = _sub(rsc_defaults, "meta_attributes", id="rsc-defaults")
+    rule = _sub(meta_attrs, "rule", id="rsc-defaults-rule")
+    rule.set("boolean-op", "and")
+    _sub(
+        rule,
+        "rsc_expression",
+        id="rsc-defaults-rule-rsc",
+        **{"class": "ocf", "provider": "heartbeat", "type": "Dummy"},
+    )
+    _sub(
+        meta_attrs,
+        "nvpair",
+        id="rsc-defaults-stickiness",
+        name="resource-stickiness",
+        value="100",
+    )
+    return etree_to_str(cib)
+
+
+def _status_resource(parent, resource_id, node):
+    resource = _sub(
+        parent,
+        "resource",
+        id=resource_id,
+        resource_agent="ocf::heartbeat:Dummy",
+        role="Started",
+        active="true",
+        orphaned="false",
+        managed="true",
+        failed="false",
+        failure_ignored="false",
+        nodes_running_on="1",
+    )
+    _sub(resource, "node", name=node.get("uname"), id=node.get("id"))
+    resource[0].set("cached", "false")
+    return resource
+
+
+def _status_nodes(nodes, node_list):
+    for node in node_list:
+        _sub(
+            nodes,
+            "node",
+            name=node.get("uname"),
+            id=node.get("id"),
+            online="true",
+            standby="false",
+            standby_onfail="false",
+            maintenance="false",
+            pending="false",
+            unclean="false",
+            shutdown="false",
+            expected_up="true",
+            is_dc="false",
+            resources_running="0",
+            type="member",
+        )
+
+
+def _status_bundle(resources, element, node_cycle):
+    docker = element.find("docker")
+    bundle = _sub(
+        resources,
+        "bundle",
+        id=element.get("id"),
+        type="docker",
+        image=docker.get("image"),
+        unique="false",
+        managed="true",
+        failed="false",
+    )
+    for index in range(int(docker.get("replicas", "1"))):
+        replica = _sub(bundle, "replica", id=str(index))
+        _status_resource(
+            replica, f"{element.get('id')}-docker-{index}", next(node_cycle),
+        )
+
+
+def generate_crm_mon(cib_xml: str) -> str:
+    """
+    Return crm_mon xml output with all resources of the CIB started
+    """
+    cib = etree.fromstring(cib_xml)
+    node_list = cib.findall("configuration/nodes/node")
+    state = etree.fromstring(read_test_resource("crm_mon.minimal.xml"))
+    state.find("summary/nodes_configured").set("number", str(len(node_list)))
+    _status_nodes(state.find("nodes"), node_list)
+    if not node_list:
+        return etree_to_str(state)
+
+    resources = _sub(state, "resources")
+    node_cycle = itertools.cycle(node_list)
+    for element in cib.find("configuration/resources"):
+        if element.tag == "primitive":
+            _status_resource(resources, element.get("id"), next(node_cycle))
+        elif element.tag == "group":
+            group = _sub(
+                resources,
+                "group",
+                id=element.get("id"),
+                number_resources=str(len(element.findall("primitive"))),
+                managed="true",
+                disabled="false",
+            )
+            node = next(node_cycle)
+            for primitive in element.findall("primitive"):
+                _status_resource(group, primitive.get("id"), node)
+        elif element.tag == "clone":
+            clone = _sub(
+                resources,
+                "clone",
+                id=element.get("id"),
+                multi_state="false",
+                unique="false",
+                managed="true",
+                disabled="false",
+                failed="false",
+                failure_ignored="false",
+            )
+            clone_primitive_id = element.find("primitive").get("id")
+            for node in node_list:
+                _status_resource(clone, clone_primitive_id, node)
+        elif element.tag == "bundle":
+            _status_bundle(resources, element, node_cycle)
+    state.find("summary/resources_configured").set(
+        "number", str(len(resources.findall(".//resource")))
+    )
+    return etree_to_str(state)
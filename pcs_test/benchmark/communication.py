@@ -0,0 +1,265 @@
+"""
+Benchmark of communication with many nodes using a fake pcsd fleet
+
+Usage: python3 -m pcs_test.benchmark.communication [--nodes N]
+    [--latency SECONDS] [--error-nodes N] [--payload-size BYTES]
+    [--pending-polls N] [--blackhole] [--request-timeout SECONDS]
+    [--repeat N] [--scenario NAME]... [--output FILE] [--baseline FILE]
+    [--tolerance FRACTION]
+
+For each scenario, wall time, connections opened and TLS handshakes done on
+the fleet side, and peak memory allocated by the client are reported. Peak
+memory is measured in an extra run, as tracing allocations slows the client
+down. Results are stored and compared to a baseline the same way as in the CIB
+benchmark.
+"""
+import argparse
+from collections import namedtuple
+import logging
+import resource
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+from unittest import mock
+
+from pcs import settings
+from pcs.common.address_health import AddressHealthCache
+from pcs.common.node_communicator import (
+    MultiaddressCommunicator,
+    NodeCommunicatorFactory,
+    RequestTarget,
+)
+from pcs.common.host import Destination
+from pcs.common.reports import ReportItemSeverity
+from pcs.lib import node_communication_format
+from pcs.lib.commands import cluster
+from pcs.lib.communication.nodes import (
+    CheckAuth,
+    DistributeFilesWithoutForces,
+    GetHostInfo,
+)
+from pcs.lib.communication.tools import run as run_com
+from pcs.lib.node_communication import LibCommunicatorLogger
+
+from pcs_test.benchmark.environment import ReportCollector
+from pcs_test.benchmark.fake_pcsd import (
+    FakePcsdFleet,
+    FleetOptions,
+    dead_addr,
+    node_addr,
+    node_name,
+)
+from pcs_test.benchmark.results import save_and_compare, summarize_time
+
+Scenario = namedtuple("Scenario", "name run")
+
+_logger = logging.getLogger("pcs_test.benchmark")
+# keep retry warnings of communicators out of the output
+_logger.addHandler(logging.NullHandler())
+
+
+class _Context(
+    namedtuple(
+        "_Context",
+        "fleet_options request_timeout report_processor communicator_factory",
+    )
+):
+    def get_target_list(self, dead_first=False):
+        port = self.fleet_options.port
+        target_list = []
+        for index in range(1, self.fleet_options.node_count + 1):
+            dest_list = [Destination(node_addr(index), port)]
+            if dead_first:
+                dest_list.insert(0, Destination(dead_addr(index), port))
+            target_list.append(
+                RequestTarget(
+                    node_name(index), token="fake-token", dest_list=dest_list
+                )
+            )
+        return target_list
+
+
+def _run_command(context, com_cmd):
+    com_cmd.set_targets(context.get_target_list())
+    return run_com(context.communicator_factory.get_communicator(), com_cmd)
+
+
+def _check_auth(context):
+    _run_command(context, CheckAuth(context.report_processor))
+
+
+def _get_host_info(context):
+    _run_command(context, GetHostInfo(context.report_processor))
+
+
+def _distribute_files(context):
+    authkey = b"a" * max(256, context.fleet_options.payload_size)
+    _run_command(
+        context,
+        DistributeFilesWithoutForces(
+            context.report_processor,
+            node_communication_format.pcmk_authkey_file(authkey),
+        ),
+    )
+
+
+def _wait_for_pacemaker_start(context):
+    # The interval between polls is not interesting, only the requests are.
+    fake_time = SimpleNamespace(time=time.time, sleep=lambda seconds: None)
+    with mock.patch.object(cluster, "time", fake_time):
+        # pylint: disable=protected-access
+        cluster._wait_for_pacemaker_to_start(
+            context.communicator_factory.get_communicator(),
+            context.report_processor,
+            context.get_target_list(),
+        )
+
+
+def _multiaddress_failover(context):
+    # fresh address health, each node fails over from its dead address
+    communicator = MultiaddressCommunicator(
+        LibCommunicatorLogger(_logger, context.report_processor),
+        None,
+        None,
+        request_timeout=context.request_timeout,
+        address_health=AddressHealthCache(),
+    )
+    com_cmd = CheckAuth(context.report_processor)
+    com_cmd.set_targets(context.get_target_list(dead_first=True))
+    run_com(communicator, com_cmd)
+
+
+SCENARIO_LIST = [
+    Scenario("check_auth", _check_auth),
+    Scenario("get_host_info", _get_host_info),
+    Scenario("distribute_files", _distribute_files),
+    Scenario("wait_for_pacemaker_start", _wait_for_pacemaker_start),
+    Scenario("multiaddress_failover", _multiaddress_failover),
+]
+
+
+def _get_context(fleet_options, request_timeout):
+    report_processor = ReportCollector()
+    return _Context(
+        fleet_options,
+        request_timeout,
+        report_processor,
+        NodeCommunicatorFactory(
+            LibCommunicatorLogger(_logger, report_processor),
+            None,
+            None,
+            request_timeout,
+        ),
+    )
+
+
+def run_scenario(scenario, fleet, request_timeout, repeat):
+    time_list = []
+    for _ in range(repeat):
+        fleet.reset()
+        context = _get_context(fleet.options, request_timeout)
+        start = time.perf_counter()
+        scenario.run(context)
+        time_list.append(time.perf_counter() - start)
+    # statistics of the fleet are the same for all runs, take the last one
+    fleet_stats = fleet.get_stats()
+    errors = len(
+        [
+            item
+            for item in context.report_processor.items
+            if item.severity.level == ReportItemSeverity.ERROR
+        ]
+    )
+
+    fleet.reset()
+    context = _get_context(fleet.options, request_timeout)
+    tracemalloc.start()
+    try:
+        scenario.run(context)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return dict(
+        summarize_time(time_list),
+        connections=fleet_stats.get("connections", 0),
+        handshakes=fleet_stats.get("handshakes", 0),
+        requests=sum(fleet_stats.get("requests", {}).values()),
+        errors=errors,
+        peak_memory=peak_memory,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python3 -m pcs_test.benchmark.communication",
+        description="Benchmark communication with a fake pcsd fleet",
+    )
+    parser.add_argument("--nodes", type=int, default=100)
+    parser.add_argument("--port", type=int, default=22240)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--error-nodes", type=int, default=0)
+    parser.add_argument("--payload-size", type=int, default=1024)
+    parser.add_argument("--pending-polls", type=int, default=2)
+    parser.add_argument(
+        "--blackhole",
+        action="store_true",
+        help="dead addresses do not respond instead of refusing connections",
+    )
+    parser.add_argument("--request-timeout", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIO_LIST],
+        help="run only the scenario, may be specified several times",
+    )
+    parser.add_argument("--output", help="store results to the file")
+    parser.add_argument("--baseline", help="compare results to the file")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    fleet_options = FleetOptions(
+        node_count=args.nodes,
+        port=args.port,
+        latency=args.latency,
+        error_nodes=args.error_nodes,
+        payload_size=args.payload_size,
+        pending_polls=args.pending_polls,
+        blackhole=args.blackhole,
+    )
+    results = {
+        "pcs_version": settings.pcs_version,
+        "fleet": dict(
+            fleet_options._asdict(), request_timeout=args.request_timeout
+        ),
+        "scenarios": {},
+    }
+    with FakePcsdFleet(fleet_options) as fleet:
+        for scenario in SCENARIO_LIST:
+            if args.scenario and scenario.name not in args.scenario:
+                continue
+            result = run_scenario(
+                scenario, fleet, args.request_timeout, args.repeat
+            )
+            results["scenarios"][scenario.name] = result
+            print(
+                "{name:26} min {min:8.4f}s  median {median:8.4f}s  "
+                "requests {requests:5}  connections {connections:5}  "
+                "handshakes {handshakes:5}  "
+                "peak memory {peak_kib:8.0f} KiB  errors {errors}".format(
+                    name=scenario.name,
+                    peak_kib=result["peak_memory"] / 1024,
+                    **result,
+                )
+            )
+    results["max_rss_kib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return save_and_compare(
+        results, args.output, args.baseline, args.tolerance, "fleet"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
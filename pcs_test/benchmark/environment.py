@@ -0,0 +1,159 @@
+"""
+Library environment running commands against an in-memory CIB
+
+Pacemaker tools are not run, FakeRunner answers the calls library commands do
+when loading and pushing a CIB and loading resource agents' metadata. The time
+spent in pcs is measured this way, not the time spent in pacemaker.
+"""
+import io
+import logging
+import os.path
+
+from lxml import etree
+
+from pcs_test.tools.command_env.mock_runner import COMMAND_COMPLETIONS
+from pcs_test.tools.misc import read_test_resource
+
+from pcs import settings
+from pcs.common.reports import ReportProcessor
+from pcs.lib.env import LibraryEnvironment
+
+
+class FakeRunnerError(Exception):
+    pass
+
+
+class ReportCollector(ReportProcessor):
+    def __init__(self):
+        super().__init__()
+        self.items = []
+
+    def _do_report(self, report_item):
+        self.items.append(report_item)
+
+
+class FakeRunner:
+    """
+    Stateful replacement of CommandRunner keeping the CIB in memory
+    """
+
+    def __init__(self, cib_xml, state_xml=None):
+        self.cib_xml = cib_xml
+        self.state_xml = state_xml or read_test_resource("crm_mon.minimal.xml")
+        self._pending_cib_xml = None
+        self.call_count = 0
+        self._handlers = {
+            COMMAND_COMPLETIONS["cibadmin"]: self._cibadmin,
+            COMMAND_COMPLETIONS["crm_diff"]: self._crm_diff,
+            COMMAND_COMPLETIONS["crm_resource"]: self._crm_resource,
+            COMMAND_COMPLETIONS["crm_mon"]: self._crm_mon,
+            os.path.join(
+                settings.pacemaker_binaries, "pacemaker-fenced"
+            ): self._fenced,
+        }
+
+    @property
+    def env_vars(self):
+        return {}
+
+    def run(
+        self, args, stdin_string=None, env_extend=None, binary_output=False
+    ):
+        # pylint: disable=unused-argument
+        self.call_count += 1
+        handler = self._handlers.get(args[0])
+        if handler is None:
+            raise FakeRunnerError(f"Unexpected command: {' '.join(args)}")
+        return handler(args[1:], stdin_string)
+
+    def run_stream(self, args, consume_stdout, env_extend=None):
+        # pylint: disable=unused-argument
+        stdout, stderr, retval = self.run(args)
+        result = consume_stdout(io.BytesIO(stdout.encode("utf-8")))
+        return result, stdout, stderr, retval
+
+    def run_legacy(
+        self,
+        args,
+        ignore_stderr=False,
+        string_for_stdin=None,
+        env_extend=None,
+        binary_output=False,
+    ):
+        """
+        Replacement of pcs.utils.run
+        """
+        # pylint: disable=unused-argument
+        args = [COMMAND_COMPLETIONS.get(args[0], args[0])] + [
+            {"-Q": "--query", "-l": "--local"}.get(arg, arg) for arg in args[1:]
+        ]
+        stdout, stderr, retval = self.run(args, stdin_string=string_for_stdin)
+        return (stdout if ignore_stderr else stdout + stderr), retval
+
+    def _cibadmin(self, args, stdin_string):
+        if "--query" in args and "--no-children" in args:
+            cib = etree.fromstring(self.cib_xml)
+            return (
+                etree.tostring(etree.Element(cib.tag, cib.attrib)).decode(),
+                "",
+                0,
+            )
+        if "--query" in args:
+            return self.cib_xml, "", 0
+        if "--patch" in args:
+            if self._pending_cib_xml is None:
+                raise FakeRunnerError("CIB patch without a diff")
+            self._commit(self._pending_cib_xml)
+            return "", "", 0
+        if "--replace" in args:
+            self._commit(stdin_string)
+            return "", "", 0
+        raise FakeRunnerError(f"Unexpected cibadmin call: {args}")
+
+    def _crm_diff(self, args, stdin_string):
+        # pylint: disable=unused-argument
+        with open(args[args.index("--new") + 1]) as new_cib_file:
+            self._pending_cib_xml = new_cib_file.read()
+        # the diff itself is not used, cibadmin --patch takes the new CIB
+        return "<diff/>", "", 1
+
+    def _crm_resource(self, args, stdin_string):
+        # pylint: disable=no-self-use, unused-argument
+        if "--show-metadata" in args:
+            return (
+                read_test_resource("resource_agent_ocf_heartbeat_dummy.xml"),
+                "",
+                0,
+            )
+        raise FakeRunnerError(f"Unexpected crm_resource call: {args}")
+
+    def _crm_mon(self, args, stdin_string):
+        # pylint: disable=unused-argument
+        return self.state_xml, "", 0
+
+    def _fenced(self, args, stdin_string):
+        # pylint: disable=no-self-use, unused-argument
+        return read_test_resource("fenced_metadata.xml"), "", 0
+
+    def _commit(self, cib_xml):
+        # pacemaker bumps epoch on each change, commands check it
+        cib = etree.fromstring(cib_xml)
+        cib.set("epoch", str(int(cib.get("epoch", "0")) + 1))
+        self.cib_xml = etree.tostring(cib).decode()
+        self._pending_cib_xml = None
+
+
+class BenchmarkEnvironment(LibraryEnvironment):
+    """
+    Live-like library environment using FakeRunner
+    """
+
+    def __init__(self, runner: FakeRunner):
+        self.report_collector = ReportCollector()
+        super().__init__(
+            logging.getLogger("pcs_test.benchmark"), self.report_collector,
+        )
+        self._fake_runner = runner
+
+    def cmd_runner(self):
+        return self._fake_runner
@@ -0,0 +1,330 @@
+"""
+Fleet of fake pcsd instances running on localhost
+
+Each fake node listens on its own loopback address (127.1.x.y) so requests to
+hundreds of nodes can be simulated on one machine. The fleet runs in a separate
+process for its CPU time and memory not to be accounted to the client being
+measured. It is controlled and its statistics are read over plain HTTP on
+127.0.0.1.
+
+Behavior of the nodes is configurable: latency of responses, nodes responding
+with an error, size of responses and number of status polls before pacemaker
+is reported as started. Dead addresses (127.2.x.y) either refuse connections
+or, in the blackhole mode, accept them on the TCP level but never respond, the
+same way an unreachable host makes a client wait for a timeout.
+"""
+from collections import Counter, namedtuple
+import json
+import multiprocessing
+import os.path
+import socket
+import ssl
+import tempfile
+from urllib import request as urllib_request
+
+from tornado.httpserver import HTTPServer
+from tornado.ioloop import IOLoop
+from tornado.web import Application, RequestHandler
+from tornado import gen
+
+from pcs.daemon.ssl import CertKeyPair
+
+
+class FleetOptions(
+    namedtuple(
+        "FleetOptions",
+        [
+            "node_count",
+            "port",
+            "latency",
+            "error_nodes",
+            "payload_size",
+            "pending_polls",
+            "blackhole",
+        ],
+    )
+):
+    """
+    Configuration of a fake pcsd fleet
+
+    latency -- seconds each node waits before responding
+    error_nodes -- number of nodes responding with HTTP 500
+    payload_size -- number of padding bytes added to each response
+    pending_polls -- number of pacemaker status requests a node answers with
+        "pending" before it reports pacemaker as started
+    blackhole -- if True, dead addresses accept connections and never respond,
+        otherwise they refuse connections
+    """
+
+    def __new__(
+        cls,
+        node_count,
+        port=22240,
+        latency=0.0,
+        error_nodes=0,
+        payload_size=0,
+        pending_polls=0,
+        blackhole=False,
+    ):
+        # pylint: disable=too-many-arguments
+        return super().__new__(
+            cls,
+            node_count,
+            port,
+            latency,
+            error_nodes,
+            payload_size,
+            pending_polls,
+            blackhole,
+        )
+
+
+def _loopback_addr(network, index):
+    # skip .0 and .255 in the last octet, they may confuse some tools
+    return "127.{0}.{1}.{2}".format(
+        network, (index - 1) // 250, (index - 1) % 250 + 1
+    )
+
+
+def node_addr(index):
+    """
+    Return an address of a live fake node, nodes are indexed from 1
+    """
+    return _loopback_addr(1, index)
+
+
+def dead_addr(index):
+    """
+    Return an address belonging to a node where no pcsd responds
+    """
+    return _loopback_addr(2, index)
+
+
+def node_name(index):
+    return f"fake-node-{index}"
+
+
+class _Fleet:
+    """
+    State of the fleet in the server process
+    """
+
+    def __init__(self, options):
+        self.options = options
+        self.addr_index = {
+            node_addr(index): index
+            for index in range(1, options.node_count + 1)
+        }
+        self.padding = "x" * options.payload_size
+        self.stats = Counter()
+        self.requests = Counter()
+        self.polls = Counter()
+
+    def reset(self):
+        self.stats.clear()
+        self.requests.clear()
+        self.polls.clear()
+
+    def is_error_node(self, index):
+        return index <= self.options.error_nodes
+
+    def get_stats(self):
+        return dict(self.stats, requests=dict(self.requests))
+
+
+class _NodeServer(HTTPServer):
+    # pylint: disable=abstract-method
+    fleet = None
+
+    def handle_stream(self, stream, address):
+        self.fleet.stats["connections"] += 1
+
+        def on_handshake(future):
+            if future.exception() is None:
+                self.fleet.stats["handshakes"] += 1
+
+        stream.wait_for_handshake().add_done_callback(on_handshake)
+        super().handle_stream(stream, address)
+
+
+class _NodeHandler(RequestHandler):
+    # pylint: disable=abstract-method
+    def initialize(self, fleet):
+        # pylint: disable=arguments-differ, attribute-defined-outside-init
+        self.fleet = fleet
+
+    async def get(self, url):
+        await self._respond(url)
+
+    async def post(self, url):
+        await self._respond(url)
+
+    async def _respond(self, url):
+        fleet = self.fleet
+        local_addr = self.request.connection.stream.socket.getsockname()[0]
+        index = fleet.addr_index[local_addr]
+        fleet.requests[url] += 1
+        fleet.stats["bytes_received"] += len(self.request.body)
+        if fleet.options.latency:
+            await gen.sleep(fleet.options.latency)
+        if fleet.is_error_node(index):
+            self.set_status(500)
+            self.finish("fake pcsd error")
+            return
+        response = self._get_response(url, index)
+        if response is None:
+            self.set_status(404)
+            self.finish()
+            return
+        response["padding"] = fleet.padding
+        body = json.dumps(response)
+        fleet.stats["bytes_sent"] += len(body)
+        self.finish(body)
+
+    def _get_response(self, url, index):
+        if url == "check_auth":
+            return {"success": True, "node_list": [node_name(index)]}
+        if url == "check_host":
+            return {
+                "services": {
+                    service: {
+                        "installed": True,
+                        "enabled": False,
+                        "running": False,
+                        "version": "2.0.5",
+                    }
+                    for service in ("pacemaker", "corosync", "pcsd")
+                },
+                "cluster_configuration_exists": False,
+            }
+        if url == "put_file":
+            file_dict = json.loads(self.get_argument("data_json"))
+            return {
+                "files": {
+                    key: {"code": "written", "message": ""} for key in file_dict
+                }
+            }
+        if url == "pacemaker_node_status":
+            self.fleet.polls[index] += 1
+            if self.fleet.polls[index] <= self.fleet.options.pending_polls:
+                return {"online": False, "pending": True}
+            return {"online": True, "pending": False}
+        return None
+
+
+class _ControlHandler(RequestHandler):
+    # pylint: disable=abstract-method
+    def initialize(self, fleet):
+        # pylint: disable=arguments-differ, attribute-defined-outside-init
+        self.fleet = fleet
+
+    def get(self):
+        self.finish(json.dumps(self.fleet.get_stats()))
+
+    def post(self):
+        self.fleet.reset()
+        self.finish("{}")
+
+
+def _listen_blackhole(options):
+    socket_list = []
+    for index in range(1, options.node_count + 1):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((dead_addr(index), options.port))
+        # connections are queued by the kernel but never accepted
+        sock.listen(128)
+        socket_list.append(sock)
+    return socket_list
+
+
+def _serve(options, cert_location, key_location, ready):
+    fleet = _Fleet(options)
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    ssl_context.load_cert_chain(cert_location, key_location)
+
+    _NodeServer.fleet = fleet
+    node_server = _NodeServer(
+        Application(
+            [(r"/remote/(.*)", _NodeHandler, dict(fleet=fleet))],
+            # do not log each request, errors are responded on purpose
+            log_function=lambda handler: None,
+        ),
+        ssl_options=ssl_context,
+    )
+    for addr in fleet.addr_index:
+        node_server.listen(options.port, address=addr)
+    control_server = HTTPServer(
+        Application([(r"/fleet", _ControlHandler, dict(fleet=fleet))])
+    )
+    control_server.listen(options.port, address="127.0.0.1")
+    # keep the sockets open while serving
+    blackhole_list = _listen_blackhole(options) if options.blackhole else []
+    ready.set()
+    try:
+        IOLoop.current().start()
+    finally:
+        for sock in blackhole_list:
+            sock.close()
+
+
+class FakePcsdFleet:
+    """
+    Context manager running a fake pcsd fleet in a separate process
+    """
+
+    def __init__(self, options: FleetOptions):
+        self.options = options
+        self._process = None
+        self._tmpdir = None
+
+    def __enter__(self):
+        self._tmpdir = tempfile.TemporaryDirectory(prefix="pcs_fake_pcsd_")
+        cert_key = CertKeyPair(
+            os.path.join(self._tmpdir.name, "pcsd.crt"),
+            os.path.join(self._tmpdir.name, "pcsd.key"),
+        )
+        cert_key.regenerate("localhost", key_length=2048)
+        ready = multiprocessing.Event()
+        self._process = multiprocessing.Process(
+            target=_serve,
+            args=(
+                self.options,
+                cert_key.cert_location,
+                cert_key.key_location,
+                ready,
+            ),
+            daemon=True,
+        )
+        self._process.start()
+        if not ready.wait(30):
+            self.__exit__(None, None, None)
+            raise RuntimeError("Fake pcsd fleet did not start")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+
+    def _control(self, data=None):
+        with urllib_request.urlopen(
+            f"http://127.0.0.1:{self.options.port}/fleet", data=data, timeout=10
+        ) as response:
+            return json.loads(response.read())
+
+    def get_stats(self):
+        """
+        Return counts of connections, TLS handshakes, bytes and requests
+        """
+        return self._control()
+
+    def reset(self):
+        """
+        Reset statistics and the state of pacemaker status polling
+        """
+        self._control(data=b"")
@@ -0,0 +1,58 @@
+"""
+Storing benchmark results and comparing them to a baseline
+"""
+import json
+import statistics
+
+
+def summarize_time(time_list):
+    return {
+        "repeat": len(time_list),
+        "min": min(time_list),
+        "median": statistics.median(time_list),
+        "max": max(time_list),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Return names of scenarios slower than in the baseline
+    """
+    regression_list = []
+    for name, result in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        # min is the least noisy measure of what the code costs
+        if result["min"] > base["min"] * (1 + tolerance):
+            regression_list.append(name)
+    return regression_list
+
+
+def save_and_compare(results, output_path, baseline_path, tolerance, setup):
+    """
+    Store results and report regressions, return an exit code
+
+    string setup -- key of results describing the benchmark setup, results
+        measured with a different setup are not comparable
+    """
+    if output_path:
+        with open(output_path, "w") as output_file:
+            json.dump(results, output_file, indent=2, sort_keys=True)
+
+    if not baseline_path:
+        return 0
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline.get(setup) != results[setup]:
+        print(f"Warning: the baseline was measured with a different {setup}")
+    regression_list = compare(results, baseline, tolerance)
+    for name in regression_list:
+        print(
+            "Regression: {name} {current:.4f}s, baseline {base:.4f}s".format(
+                name=name,
+                current=results["scenarios"][name]["min"],
+                base=baseline["scenarios"][name]["min"],
+            )
+        )
+    return 1 if regression_list else 0
@@ -0,0 +1,145 @@
+"""
+Timed scenarios
+
+Each scenario gets a fresh environment with the generated CIB, only the
+command itself is timed.
+"""
+from collections import namedtuple
+from contextlib import redirect_stdout
+import io
+from types import SimpleNamespace
+from unittest import mock
+
+from pcs import (
+    config,
+    constraint,
+    utils,
+)
+from pcs.cli.common.parse_args import InputModifiers
+from pcs.lib.commands import (
+    alert,
+    cib_options,
+    fencing_topology,
+    resource,
+    tag,
+)
+from pcs.lib.commands.constraint import (
+    colocation,
+    order,
+    ticket,
+)
+
+from pcs_test.benchmark.cib_generator import primitive_id
+from pcs_test.benchmark.environment import BenchmarkEnvironment
+
+Scenario = namedtuple("Scenario", "name run")
+
+
+def _legacy(runner, command):
+    """
+    Run a legacy command with its pacemaker calls going to the fake runner
+    """
+    with mock.patch.object(utils, "run", runner.run_legacy), mock.patch.object(
+        utils, "pcs_options", {}
+    ), redirect_stdout(io.StringIO()):
+        command()
+
+
+def _lib_wrapper(runner):
+    # Only what config show uses. Like in the real lib wrapper, each command
+    # gets its own environment as the environment loads the CIB only once.
+    def wrap(command):
+        def run(*args, **kwargs):
+            return command(BenchmarkEnvironment(runner), *args, **kwargs)
+
+        return run
+
+    return SimpleNamespace(
+        alert=SimpleNamespace(get_all_alerts=wrap(alert.get_all_alerts)),
+        cib_options=SimpleNamespace(
+            resource_defaults_config=wrap(cib_options.resource_defaults_config),
+            operation_defaults_config=wrap(
+                cib_options.operation_defaults_config
+            ),
+        ),
+        constraint_colocation=SimpleNamespace(show=wrap(colocation.show)),
+        constraint_order=SimpleNamespace(show=wrap(order.show)),
+        constraint_ticket=SimpleNamespace(show=wrap(ticket.show)),
+        fencing_topology=SimpleNamespace(
+            get_config=wrap(fencing_topology.get_config)
+        ),
+        tag=SimpleNamespace(config=wrap(tag.config)),
+    )
+
+
+def _resource_create(env, runner):
+    del runner
+    resource.create(
+        env, "R-new", "ocf:heartbeat:Dummy", [], {}, {"fake": "value"}
+    )
+
+
+def _resource_disable(env, runner):
+    del runner
+    resource.disable(env, [primitive_id(1)])
+
+
+def _resource_enable(env, runner):
+    del runner
+    resource.enable(env, [primitive_id(1)])
+
+
+def _constraint_order_create(env, runner):
+    del runner
+    order.create_with_set(
+        env,
+        [{"ids": [primitive_id(1), primitive_id(2)], "options": {}}],
+        {"kind": "Optional"},
+    )
+
+
+def _constraint_remove(env, runner):
+    del env
+    _legacy(
+        runner,
+        lambda: constraint.constraint_rm(
+            None, ["location-0", "colocation-0", "order-0"], InputModifiers({}),
+        ),
+    )
+
+
+def _tag_create(env, runner):
+    del runner
+    tag.create(env, "T-new", [primitive_id(1), primitive_id(2)])
+
+
+def _resource_relations_tree(env, runner):
+    del runner
+    resource.get_resource_relations_tree(env, primitive_id(1))
+
+
+def _config_show(env, runner):
+    del env
+    _legacy(
+        runner,
+        # pylint: disable=protected-access
+        lambda: config._config_show_cib_lines(_lib_wrapper(runner)),
+    )
+
+
+def _resource_defaults_config(env, runner):
+    del runner
+    cib_options.resource_defaults_config(env, False)
+
+
+SCENARIO_LIST = [
+    Scenario("resource.create", _resource_create),
+    Scenario("resource.disable", _resource_disable),
+    Scenario("resource.enable", _resource_enable),
+    Scenario("constraint.order.create", _constraint_order_create),
+    Scenario("constraint.remove", _constraint_remove),
+    Scenario("tag.create", _tag_create),
+    Scenario("resource.get_resource_relations_tree", _resource_relations_tree),
+    Scenario("config.show", _config_show),
+    Scenario("cib_options.resource_defaults_config", _resource_defaults_config),
+]
@@ -575,6 +575,7 @@ class InputModifiersTest(TestCase):
             "--simulate",
             "--skip-offline",
             "--start",
+            "--wait-targeted",
         ]
         self.val_opts = [
             "--after",
@@ -586,9 +587,11 @@ class InputModifiersTest(TestCase):
             "--group",
             "--name",
             "--node",
+            "--output-format",
             "--request-timeout",
             "--to",
             # "--wait", # --wait is a special case, it has its own tests
+            # "--watch", # --watch is the same case as --wait
             "-f",
             "-p",
             "-u",
@@ -747,3 +750,20 @@ class InputModifiersTest(TestCase):
                 {"a": 1, "b": 2, "c": 3, "d": 4}
             ).ensure_not_incompatible("a", ["d", "b"])
         self.assertEqual(str(cm.exception), "'a' cannot be used with 'b', 'd'")
+
+    def test_dependency_satisfied(self):
+        InputModifiers({"a": 1, "b": 2}).ensure_dependency_satisfied(
+            "a", ["b", "c"]
+        )
+
+    def test_dependency_dependent_not_defined(self):
+        InputModifiers({"c": 1}).ensure_dependency_satisfied("a", ["b"])
+
+    def test_dependency_not_satisfied(self):
+        with self.assertRaises(CmdLineInputError) as cm:
+            InputModifiers(
+                {"b": 1, "c": 2, "d": 3}
+            ).ensure_dependency_satisfied("a", ["c", "b"])
+        self.assertEqual(
+            str(cm.exception), "'b', 'c' can be used only together with 'a'"
+        )
@@ -46,6 +46,9 @@ class CliReportMessageTestBase(TestCase):
             cli_messages.report_item_msg_from_dto(msg_obj.to_dto()).message,
             expected_msg,
         )
+        self.assertEqual(
+            cli_messages.report_item_msg_text(msg_obj), expected_msg,
+        )
 
 
 class ResourceManagedNoMonitorEnabled(CliReportMessageTestBase):
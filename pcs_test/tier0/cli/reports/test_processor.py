@@ -0,0 +1,46 @@
+from unittest import TestCase, mock
+
+from pcs.common.reports import (
+    ReportItem,
+    messages,
+)
+from pcs.cli.reports.processor import ReportProcessorToConsole
+
+
+@mock.patch("pcs.cli.reports.processor.print")
+class ReportProcessorToConsoleTest(TestCase):
+    def setUp(self):
+        self.report = ReportItem.debug(
+            messages.RunExternalProcessStarted("cmd", "stdin", {})
+        )
+
+    def test_debug_not_rendered_without_debug(self, mock_print):
+        with mock.patch.object(
+            messages.RunExternalProcessStarted, "to_dto"
+        ) as mock_to_dto, mock.patch(
+            "pcs.cli.reports.processor.report_item_msg_text"
+        ) as mock_msg_text:
+            ReportProcessorToConsole().report(self.report)
+        mock_to_dto.assert_not_called()
+        mock_msg_text.assert_not_called()
+        mock_print.assert_not_called()
+
+    def test_debug_printed_with_debug(self, mock_print):
+        ReportProcessorToConsole(debug=True).report(self.report)
+        mock_print.assert_called_once_with(
+            "Running: cmd\nEnvironment:\n--Debug Input Start--\nstdin\n"
+            "--Debug Input End--\n"
+        )
+
+    def test_message_without_cli_text_not_converted(self, mock_print):
+        # pylint: disable=no-self-use
+        with mock.patch.object(
+            messages.CibUpgradeSuccessful, "to_dto"
+        ) as mock_to_dto:
+            ReportProcessorToConsole().report(
+                ReportItem.info(messages.CibUpgradeSuccessful())
+            )
+        mock_to_dto.assert_not_called()
+        mock_print.assert_called_once_with(
+            "CIB has been upgraded to the latest schema version."
+        )
@@ -0,0 +1,69 @@
+from unittest import mock, TestCase
+
+from pcs import node
+from pcs.cli.common.errors import CmdLineInputError
+from pcs.cli.common.parse_args import InputModifiers
+from pcs.common import reports
+
+
+class NodeAttributeSet(TestCase):
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=["node"])
+        self.node = mock.Mock(spec_set=["update_nodes_attrs"])
+        self.lib.node = self.node
+
+    def call_cmd(self, argv, modifiers=None):
+        node.node_attribute_cmd(self.lib, argv, InputModifiers(modifiers or {}))
+
+    def test_one_node(self):
+        self.call_cmd(["node1", "rack=1", "room="])
+        self.node.update_nodes_attrs.assert_called_once_with(
+            {"node1": {"rack": "1", "room": ""}}, force_flags=[]
+        )
+
+    def test_more_nodes(self):
+        self.call_cmd(["node1", "node2", "rack=1", "room="])
+        self.node.update_nodes_attrs.assert_called_once_with(
+            {
+                "node1": {"rack": "1", "room": ""},
+                "node2": {"rack": "1", "room": ""},
+            },
+            force_flags=[],
+        )
+
+    def test_force(self):
+        for argv in (["node1", "room="], ["node1", "node2", "room="]):
+            with self.subTest(argv=argv):
+                self.node.reset_mock()
+                self.call_cmd(argv, {"--force": ""})
+                self.node.update_nodes_attrs.assert_called_once_with(
+                    {name: {"room": ""} for name in argv[:-1]},
+                    force_flags=[reports.codes.FORCE],
+                )
+
+    def test_no_options(self):
+        with self.assertRaises(CmdLineInputError):
+            self.call_cmd(["node1", "node2"])
+        self.node.update_nodes_attrs.assert_not_called()
+
+
+class NodeUtilizationSet(TestCase):
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=["node"])
+        self.node = mock.Mock(spec_set=["update_nodes_attrs"])
+        self.lib.node = self.node
+
+    def call_cmd(self, argv):
+        node.node_utilization_cmd(self.lib, argv, InputModifiers({}))
+
+    def test_one_node(self):
+        self.call_cmd(["node1", "cpu=1", "ram="])
+        self.node.update_nodes_attrs.assert_called_once_with(
+            {}, node_utilization={"node1": {"cpu": "1", "ram": ""}}
+        )
+
+    def test_more_nodes(self):
+        self.call_cmd(["node1", "node2", "cpu=1"])
+        self.node.update_nodes_attrs.assert_called_once_with(
+            {}, node_utilization={"node1": {"cpu": "1"}, "node2": {"cpu": "1"}},
+        )
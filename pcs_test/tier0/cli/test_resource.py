@@ -1,15 +1,23 @@
+# pylint: disable=too-many-lines
+from datetime import datetime
+import json
 from random import shuffle
 from textwrap import dedent
 from unittest import mock, TestCase
 
 from pcs_test.tools.assertions import (
     ac,
+    assert_xml_equal,
     AssertPcsMixin,
 )
-from pcs_test.tools.misc import dict_to_modifiers
+from pcs_test.tools.misc import (
+    dict_to_modifiers,
+    read_test_resource,
+)
 
 from pcs import resource
 from pcs.cli.common.errors import CmdLineInputError
+from pcs.lib.xml_tools import etree_to_str
 
 
 class FailcountShow(TestCase):
@@ -279,6 +287,87 @@ class FailcountShow(TestCase):
         )
 
 
+@mock.patch("pcs.resource.print")
+class FailcountSummary(TestCase):
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=["resource"])
+        self.resource = mock.Mock(spec_set=["get_failcounts_summary"])
+        self.lib.resource = self.resource
+        self.resource.get_failcounts_summary.return_value = {
+            "resources": [
+                {
+                    "resource": "R2",
+                    "fail_count": "INFINITY",
+                    "last_failure": 20,
+                },
+                {"resource": "R1", "fail_count": 3, "last_failure": 10},
+            ],
+            "nodes": [
+                {"node": "node1", "fail_count": "INFINITY", "last_failure": 20},
+            ],
+        }
+
+    def _call_cmd(self, argv, modifiers=None):
+        resource.resource_failcount(
+            self.lib, ["summary"] + argv, dict_to_modifiers(modifiers or {})
+        )
+
+    @staticmethod
+    def _fixture_time(timestamp):
+        return datetime.fromtimestamp(timestamp).isoformat(sep=" ")
+
+    def test_text(self, mock_print):
+        self._call_cmd(["R1", "node=node1", "within=1h", "top=2"])
+        self.resource.get_failcounts_summary.assert_called_once_with(
+            resource="R1", node="node1", within="1h", top="2"
+        )
+        mock_print.assert_called_once_with(
+            dedent(
+                f"""\
+                Resources with most failures:
+                  R2: INFINITY (last failure {self._fixture_time(20)})
+                  R1: 3 (last failure {self._fixture_time(10)})
+                Failures per node:
+                  node1: INFINITY (last failure {self._fixture_time(20)})"""
+            )
+        )
+
+    def test_json(self, mock_print):
+        self._call_cmd(["operation=start"], {"output-format": "json"})
+        self.resource.get_failcounts_summary.assert_called_once_with(
+            resource=None, operation="start"
+        )
+        self.assertEqual(
+            json.loads(mock_print.call_args[0][0]),
+            self.resource.get_failcounts_summary.return_value,
+        )
+
+    def test_no_failcounts(self, mock_print):
+        self.resource.get_failcounts_summary.return_value = {
+            "resources": [],
+            "nodes": [],
+        }
+        self._call_cmd(["R1"])
+        mock_print.assert_called_once_with("No failcounts for resource 'R1'")
+
+    def test_bad_output_format(self, mock_print):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd([], {"output-format": "xml"})
+        self.assertEqual(
+            cm.exception.message,
+            "Unknown output format 'xml', supported formats are: text, json",
+        )
+        self.resource.get_failcounts_summary.assert_not_called()
+        mock_print.assert_not_called()
+
+    def test_unknown_option(self, mock_print):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd(["since=1h"])
+        self.assertEqual(cm.exception.message, "Unknown option 'since'")
+        self.resource.get_failcounts_summary.assert_not_called()
+        mock_print.assert_not_called()
+
+
 class GroupAdd(TestCase, AssertPcsMixin):
     def setUp(self):
         self.lib = mock.Mock(spec_set=["resource"])
@@ -362,6 +451,436 @@ class GroupAdd(TestCase, AssertPcsMixin):
         )
 
 
+def _fixture_primitive(resource_id):
+    return f"""
+        <primitive id="{resource_id}" class="ocf" provider="heartbeat"
+            type="Dummy"
+        />
+    """
+
+
+@mock.patch("pcs.resource.resource_disable")
+@mock.patch("pcs.utils.replace_cib_configuration")
+@mock.patch("pcs.utils.get_cib")
+@mock.patch("pcs.utils.usefile", True)
+@mock.patch("pcs.utils.pcs_options", {})
+class ResourceRemove(TestCase):
+    # pylint: disable=no-self-use
+    def _prepare(self, mock_get_cib, resources, constraints="", extra=""):
+        mock_get_cib.return_value = (
+            read_test_resource("cib-empty.xml")
+            .replace("<resources/>", f"<resources>{resources}</resources>")
+            .replace(
+                "<constraints/>", f"<constraints>{constraints}</constraints>"
+            )
+            .replace("</configuration>", f"{extra}</configuration>")
+        )
+
+    def _assert_pushed(self, mock_push, resources, constraints=""):
+        mock_push.assert_called_once()
+        cib = mock_push.call_args[0][0].cib
+        assert_xml_equal(
+            f"<resources>{resources}</resources>",
+            etree_to_str(cib.find("configuration/resources")),
+        )
+        assert_xml_equal(
+            f"<constraints>{constraints}</constraints>",
+            etree_to_str(cib.find("configuration/constraints")),
+        )
+
+    @mock.patch("builtins.print")
+    def test_primitive_in_clone(
+        self, mock_print, mock_get_cib, mock_push, mock_disable
+    ):
+        self._prepare(
+            mock_get_cib,
+            f"""
+                <clone id="D1-clone">{_fixture_primitive("D1")}</clone>
+                {_fixture_primitive("D2")}
+            """,
+            """
+                <rsc_location id="l-clone" rsc="D1-clone" node="n1"
+                    score="INFINITY"
+                />
+                <rsc_location id="l-D1" rsc="D1" node="n1" score="INFINITY"/>
+                <rsc_location id="l-D2" rsc="D2" node="n1" score="INFINITY"/>
+            """,
+        )
+        self.assertTrue(resource.resource_remove("D1-clone"))
+        self._assert_pushed(
+            mock_push,
+            _fixture_primitive("D2"),
+            """
+                <rsc_location id="l-D2" rsc="D2" node="n1" score="INFINITY"/>
+            """,
+        )
+        self.assertEqual(
+            mock_print.call_args_list,
+            [
+                mock.call("Removing Constraint - l-clone"),
+                mock.call("Removing Constraint - l-D1"),
+                mock.call("Deleting Resource - D1"),
+            ],
+        )
+        mock_disable.assert_not_called()
+
+    @mock.patch("builtins.print")
+    def test_primitive_in_set(
+        self, mock_print, mock_get_cib, mock_push, mock_disable
+    ):
+        self._prepare(
+            mock_get_cib,
+            _fixture_primitive("D1")
+            + _fixture_primitive("D2")
+            + _fixture_primitive("D3"),
+            """
+                <rsc_order id="o">
+                    <resource_set id="o-set1">
+                        <resource_ref id="D1"/>
+                        <resource_ref id="D2"/>
+                    </resource_set>
+                    <resource_set id="o-set2">
+                        <resource_ref id="D3"/>
+                    </resource_set>
+                </rsc_order>
+            """,
+        )
+        resource.resource_remove("D3")
+        self._assert_pushed(
+            mock_push,
+            _fixture_primitive("D1") + _fixture_primitive("D2"),
+            """
+                <rsc_order id="o">
+                    <resource_set id="o-set1">
+                        <resource_ref id="D1"/>
+                        <resource_ref id="D2"/>
+                    </resource_set>
+                </rsc_order>
+            """,
+        )
+        self.assertEqual(
+            mock_print.call_args_list,
+            [
+                mock.call("Removing D3 from set o-set2"),
+                mock.call("Removing set o-set2"),
+                mock.call("Deleting Resource - D3"),
+            ],
+        )
+        mock_disable.assert_not_called()
+
+    @mock.patch("builtins.print")
+    def test_primitive_in_last_set(
+        self, mock_print, mock_get_cib, mock_push, mock_disable
+    ):
+        self._prepare(
+            mock_get_cib,
+            _fixture_primitive("D1"),
+            """
+                <rsc_ticket id="t" ticket="T">
+                    <resource_set id="t-set">
+                        <resource_ref id="D1"/>
+                    </resource_set>
+                </rsc_ticket>
+            """,
+        )
+        resource.resource_remove("D1")
+        self._assert_pushed(mock_push, "")
+        self.assertEqual(
+            mock_print.call_args_list,
+            [
+                mock.call("Removing D1 from set t-set"),
+                mock.call("Removing set t-set"),
+                mock.call("Removing constraint t"),
+                mock.call("Deleting Resource - D1"),
+            ],
+        )
+        mock_disable.assert_not_called()
+
+    @mock.patch("builtins.print")
+    def test_last_primitive_in_cloned_group(
+        self, mock_print, mock_get_cib, mock_push, mock_disable
+    ):
+        self._prepare(
+            mock_get_cib,
+            f"""
+                <clone id="G-clone">
+                    <group id="G">{_fixture_primitive("D1")}</group>
+                </clone>
+            """,
+            """
+                <rsc_location id="l-G" rsc="G" node="n1" score="INFINITY"/>
+                <rsc_location id="l-clone" rsc="G-clone" node="n1"
+                    score="INFINITY"
+                />
+            """,
+        )
+        resource.resource_remove("D1")
+        self._assert_pushed(mock_push, "")
+        self.assertEqual(
+            mock_print.call_args_list,
+            [
+                mock.call("Removing Constraint - l-clone"),
+                mock.call("Deleting Resource (and group and clone) - D1"),
+            ],
+        )
+        mock_disable.assert_not_called()
+
+    @mock.patch("builtins.print")
+    def test_group(self, mock_print, mock_get_cib, mock_push, mock_disable):
+        self._prepare(
+            mock_get_cib,
+            f"""
+                <group id="G">
+                    {_fixture_primitive("D1")}
+                    {_fixture_primitive("D2")}
+                </group>
+            """,
+            """
+                <rsc_location id="l-D2" rsc="D2" node="n1" score="INFINITY"/>
+            """,
+            """
+                <fencing-topology>
+                    <fencing-level id="fl" index="1" target="n1"
+                        devices="D1"
+                    />
+                </fencing-topology>
+            """,
+        )
+        with self.assertRaises(SystemExit) as cm:
+            resource.resource_remove("G")
+        self.assertEqual(cm.exception.code, 0)
+        self._assert_pushed(mock_push, "")
+        self.assertIsNone(
+            mock_push.call_args[0][0].cib.find("configuration/fencing-topology")
+        )
+        self.assertEqual(
+            mock_print.call_args_list,
+            [
+                mock.call("Removing group: G (and all resources within group)"),
+                mock.call("Stopping all resources in group: G..."),
+                mock.call("Deleting Resource - D1"),
+                mock.call("Removing Constraint - l-D2"),
+                mock.call("Deleting Resource (and group) - D2"),
+            ],
+        )
+        mock_disable.assert_called_once_with(["G"])
+
+    @mock.patch("pcs.utils.err", side_effect=SystemExit(1))
+    def test_missing(self, mock_err, mock_get_cib, mock_push, mock_disable):
+        self._prepare(mock_get_cib, _fixture_primitive("D1"))
+        with self.assertRaises(SystemExit):
+            resource.resource_remove("D2")
+        mock_err.assert_called_once_with("Resource 'D2' does not exist.")
+        mock_push.assert_not_called()
+        mock_disable.assert_not_called()
+
+
+@mock.patch("pcs.utils.replace_cib_configuration")
+@mock.patch("pcs.utils.get_cib")
+@mock.patch("pcs.utils.usefile", True)
+@mock.patch("pcs.utils.pcs_options", {})
+class ResourceUpdate(TestCase):
+    # pylint: disable=no-self-use
+    def _prepare(self, mock_get_cib, resources, constraints=""):
+        mock_get_cib.return_value = (
+            read_test_resource("cib-empty.xml")
+            .replace("<resources/>", f"<resources>{resources}</resources>")
+            .replace(
+                "<constraints/>", f"<constraints>{constraints}</constraints>"
+            )
+        )
+
+    def _assert_pushed(self, mock_push, resources, constraints=""):
+        mock_push.assert_called_once()
+        cib = mock_push.call_args[0][0].cib
+        assert_xml_equal(
+            f"<resources>{resources}</resources>",
+            etree_to_str(cib.find("configuration/resources")),
+        )
+        assert_xml_equal(
+            f"<constraints>{constraints}</constraints>",
+            etree_to_str(cib.find("configuration/constraints")),
+        )
+
+    @mock.patch(
+        "pcs.resource.primitive.validate_resource_instance_attributes_update",
+        lambda *args, **kwargs: [],
+    )
+    @mock.patch("pcs.resource.lib_ra.ResourceAgent", mock.Mock())
+    def test_primitive(self, mock_get_cib, mock_push):
+        self._prepare(
+            mock_get_cib,
+            """
+                <primitive id="R" class="ocf" provider="heartbeat"
+                    type="Dummy"
+                >
+                    <instance_attributes id="R-instance_attributes">
+                        <nvpair id="R-instance_attributes-a" name="a"
+                            value="1"
+                        />
+                        <nvpair id="R-instance_attributes-b" name="b"
+                            value="2"
+                        />
+                    </instance_attributes>
+                    <operations>
+                        <op id="R-monitor-interval-10s" name="monitor"
+                            interval="10s"
+                        />
+                        <op id="R-start-interval-0s" name="start"
+                            interval="0s" timeout="20s"
+                        />
+                    </operations>
+                </primitive>
+            """,
+        )
+        resource.resource_update(
+            None,
+            [
+                "R",
+                "a=3",
+                "b=",
+                "meta",
+                "m=x",
+                "op",
+                "monitor",
+                "interval=20s",
+                "stop",
+                "timeout=30s",
+            ],
+            dict_to_modifiers({}),
+        )
+        self._assert_pushed(
+            mock_push,
+            """
+                <primitive id="R" class="ocf" provider="heartbeat"
+                    type="Dummy"
+                >
+                    <instance_attributes id="R-instance_attributes">
+                        <nvpair id="R-instance_attributes-a" name="a"
+                            value="3"
+                        />
+                    </instance_attributes>
+                    <operations>
+                        <op id="R-monitor-interval-20s" name="monitor"
+                            interval="20s"
+                        />
+                        <op id="R-start-interval-0s" name="start"
+                            interval="0s" timeout="20s"
+                        />
+                        <op id="R-stop-interval-0s" name="stop"
+                            interval="0s" timeout="30s"
+                        />
+                    </operations>
+                    <meta_attributes id="R-meta_attributes">
+                        <nvpair id="R-meta_attributes-m" name="m" value="x"/>
+                    </meta_attributes>
+                </primitive>
+            """,
+        )
+
+    def test_master(self, mock_get_cib, mock_push):
+        self._prepare(
+            mock_get_cib,
+            f"""<master id="R-master">{_fixture_primitive("R")}</master>""",
+        )
+        resource.resource_update(
+            None, ["R-master", "meta", "m=x"], dict_to_modifiers({})
+        )
+        self._assert_pushed(
+            mock_push,
+            f"""
+                <clone id="R-master">
+                    {_fixture_primitive("R")}
+                    <meta_attributes id="R-master-meta_attributes">
+                        <nvpair id="R-master-meta_attributes-promotable"
+                            name="promotable" value="true"
+                        />
+                        <nvpair id="R-master-meta_attributes-m" name="m"
+                            value="x"
+                        />
+                    </meta_attributes>
+                </clone>
+            """,
+        )
+
+    def test_meta_master(self, mock_get_cib, mock_push):
+        self._prepare(
+            mock_get_cib,
+            f"""<master id="R-master">{_fixture_primitive("R")}</master>""",
+        )
+        resource.resource_meta(None, ["R-master", "m=x"], dict_to_modifiers({}))
+        self._assert_pushed(
+            mock_push,
+            f"""
+                <clone id="R-master">
+                    {_fixture_primitive("R")}
+                    <meta_attributes id="R-master-meta_attributes">
+                        <nvpair id="R-master-meta_attributes-promotable"
+                            name="promotable" value="true"
+                        />
+                        <nvpair id="R-master-meta_attributes-m" name="m"
+                            value="x"
+                        />
+                    </meta_attributes>
+                </clone>
+            """,
+        )
+
+    def test_clone_last_primitive_in_group(self, mock_get_cib, mock_push):
+        self._prepare(
+            mock_get_cib,
+            f"""<group id="G">{_fixture_primitive("R")}</group>""",
+            """
+                <rsc_location id="l-R" rsc="R" node="n1" score="INFINITY"/>
+            """,
+        )
+        resource.resource_clone(None, ["R", "m=x"], dict_to_modifiers({}))
+        self._assert_pushed(
+            mock_push,
+            f"""
+                <clone id="R-clone">
+                    {_fixture_primitive("R")}
+                    <meta_attributes id="R-clone-meta_attributes">
+                        <nvpair id="R-clone-meta_attributes-m" name="m"
+                            value="x"
+                        />
+                    </meta_attributes>
+                </clone>
+            """,
+            """
+                <rsc_location id="l-R" rsc="R-clone" node="n1"
+                    score="INFINITY"
+                />
+            """,
+        )
+
+    @mock.patch("pcs.utils.err", side_effect=SystemExit(1))
+    def test_op_add_duplicate(self, mock_err, mock_get_cib, mock_push):
+        self._prepare(
+            mock_get_cib,
+            """
+                <primitive id="R" class="ocf" provider="heartbeat"
+                    type="Dummy"
+                >
+                    <operations>
+                        <op id="R-monitor-interval-10s" name="monitor"
+                            interval="10s"
+                        />
+                    </operations>
+                </primitive>
+            """,
+        )
+        with self.assertRaises(SystemExit):
+            resource.resource_op_add_cmd(
+                None, ["R", "monitor", "interval=10"], dict_to_modifiers({})
+            )
+        mock_err.assert_called_once_with(
+            "operation monitor with interval 10s already specified for R:\n"
+            "monitor interval=10s (R-monitor-interval-10s)"
+        )
+        mock_push.assert_not_called()
+
+
 class ResourceMoveBanMixin:
     def test_no_args(self):
         with self.assertRaises(CmdLineInputError) as cm:
@@ -459,6 +978,29 @@ class ResourceMoveBanMixin:
             "resource", lifetime="P1h", master=True, node="node", wait="10"
         )
 
+    def test_wait_targeted(self):
+        self.cli_command(
+            self.lib,
+            ["resource"],
+            dict_to_modifiers({"wait": "10", "wait-targeted": True}),
+        )
+        self.lib_command.assert_called_once_with(
+            "resource", lifetime=None, master=False, node=None, wait="10"
+        )
+
+    def test_wait_targeted_without_wait(self):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self.cli_command(
+                self.lib,
+                ["resource"],
+                dict_to_modifiers({"wait-targeted": True}),
+            )
+        self.assertEqual(
+            cm.exception.message,
+            "'--wait-targeted' can be used only together with '--wait'",
+        )
+        self.lib_command.assert_not_called()
+
 
 class ResourceMove(ResourceMoveBanMixin, TestCase):
     def setUp(self):
@@ -600,6 +1142,21 @@ class ResourceDisable(TestCase):
         self.resource.disable.assert_not_called()
         self.resource.disable_simulate.assert_not_called()
 
+    def test_wait_targeted_without_wait(self):
+        with self.assertRaises(CmdLineInputError) as cm:
+            resource.resource_disable_cmd(
+                self.lib,
+                ["R1", "R2"],
+                dict_to_modifiers({"wait-targeted": True}),
+            )
+        self.assertEqual(
+            cm.exception.message,
+            "'--wait-targeted' can be used only together with '--wait'",
+        )
+        self.resource.disable.assert_not_called()
+        self.resource.disable_safe.assert_not_called()
+        self.resource.disable_simulate.assert_not_called()
+
     def test_safe_no_strict(self):
         resource.resource_disable_cmd(
             self.lib, ["R1", "R2"], dict_to_modifiers({"no-strict": True})
@@ -0,0 +1,154 @@
+from datetime import datetime
+import io
+import json
+from unittest import mock, TestCase
+
+from pcs import status
+from pcs.cli.common.errors import CmdLineInputError
+from pcs.cli.common.parse_args import InputModifiers
+from pcs.common.reports import (
+    ReportItem,
+    messages,
+)
+from pcs.lib.errors import LibraryError
+
+
+class _StopWatching(Exception):
+    pass
+
+
+class WatchStatus(TestCase):
+    def setUp(self):
+        self.sleep = mock.Mock(side_effect=[None, None, None, _StopWatching()])
+
+    def watch(self, status_list, json_lines):
+        get_status = mock.Mock(side_effect=status_list)
+        stdout = io.StringIO()
+        with mock.patch("sys.stdout", stdout), self.assertRaises(_StopWatching):
+            status.watch_status(
+                get_status,
+                1.5,
+                json_lines,
+                sleep=self.sleep,
+                now=lambda: datetime(2020, 1, 2, 3, 4, 5),
+            )
+        self.assertEqual(get_status.call_count, 4)
+        self.sleep.assert_called_with(1.5)
+        return stdout.getvalue()
+
+    def test_print_changes_only(self):
+        self.assertEqual(
+            self.watch(["status A", "status A", "status B", "status B"], False),
+            (
+                "Last change: 2020-01-02T03:04:05\n\nstatus A\n\n"
+                "Last change: 2020-01-02T03:04:05\n\nstatus B\n\n"
+            ),
+        )
+
+    def test_crm_mon_times_ignored(self):
+        status_template = (
+            "Cluster name: test\n"
+            "Cluster Summary:\n"
+            "  * Stack: corosync\n"
+            "  * Current DC: node1 (version 2.0.5) - partition with quorum\n"
+            "  * Last updated: Mon Jan  6 10:00:0{second} 2020\n"
+            "  * Last change:  Mon Jan  6 09:{minute}:00 2020 by root via "
+            "cibadmin on node1\n"
+            "  * 2 nodes configured\n"
+            "\n"
+            "Node List:\n"
+            "  * Online: [ node1 node2 ]\n"
+            "\n"
+            "Full List of Resources:\n"
+            "  * dummy\t(ocf::pacemaker:Dummy):\t {state} node1\n"
+        )
+        status_list = [
+            status_template.format(second=0, minute=10, state="Started"),
+            status_template.format(second=2, minute=10, state="Started"),
+            status_template.format(second=4, minute=11, state="Started"),
+            status_template.format(second=6, minute=12, state="Stopped"),
+        ]
+        self.assertEqual(
+            self.watch(status_list, False),
+            (
+                f"Last change: 2020-01-02T03:04:05\n\n{status_list[0]}\n\n"
+                f"Last change: 2020-01-02T03:04:05\n\n{status_list[3]}\n\n"
+            ),
+        )
+
+    def test_old_crm_mon_times_ignored(self):
+        status_list = [
+            f"Stack: corosync\nLast updated: Mon Jan  6 10:00:0{second} 2020\n"
+            "Last change: Mon Jan  6 09:00:00 2020 by root via cibadmin on "
+            "node1\n\n2 nodes configured\n"
+            for second in range(4)
+        ]
+        output = self.watch(status_list, True)
+        event_list = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(len(event_list), 1)
+        self.assertEqual(event_list[0]["status"], status_list[0])
+
+    def test_json_lines(self):
+        error = LibraryError(
+            ReportItem.error(messages.CrmMonError("crm_mon failed"))
+        )
+        output = self.watch(["status A", error, error, "status A"], True)
+        event_list = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(len(event_list), 3)
+        self.assertEqual(event_list[0]["status"], "status A")
+        self.assertEqual(event_list[0]["time"], "2020-01-02T03:04:05")
+        self.assertEqual(
+            event_list[1]["errors"],
+            ["error running crm_mon, is pacemaker running?\n  crm_mon failed"],
+        )
+        self.assertNotIn("status", event_list[1])
+        self.assertEqual(event_list[2], event_list[0])
+
+
+class FullStatusWatchOptions(TestCase):
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=["status"])
+
+    def assert_error(self, options, message):
+        with self.assertRaises(CmdLineInputError) as cm:
+            status.full_status(self.lib, [], InputModifiers(options))
+        self.assertEqual(cm.exception.message, message)
+        self.lib.status.full_cluster_status_plaintext.assert_not_called()
+
+    def test_output_format_without_watch(self):
+        self.assert_error(
+            {"--output-format": "json"},
+            "'--output-format' can be used only together with '--watch'",
+        )
+
+    def test_bad_interval(self):
+        self.assert_error(
+            {"--watch": "often"},
+            "'often' is not a valid --watch value, use a positive number",
+        )
+        self.assert_error(
+            {"--watch": "0"},
+            "'0' is not a valid --watch value, use a positive number",
+        )
+
+    def test_bad_output_format(self):
+        self.assert_error(
+            {"--watch": None, "--output-format": "xml"},
+            "Unknown output format 'xml', supported formats are: text, json",
+        )
+
+    @mock.patch("pcs.status.watch_status")
+    def test_interrupted(self, mock_watch):
+        mock_watch.side_effect = KeyboardInterrupt()
+        status.full_status(
+            self.lib, [], InputModifiers({"--watch": "5", "--full": ""})
+        )
+        get_status, interval, json_lines = mock_watch.call_args[0]
+        self.assertEqual(interval, 5)
+        self.assertFalse(json_lines)
+        get_status()
+        self.lib.status.full_cluster_status_plaintext.assert_called_once_with(
+            hide_inactive_resources=False,
+            verbose=True,
+            slow_sources_cache=mock.ANY,
+        )
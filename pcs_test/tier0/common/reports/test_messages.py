@@ -585,6 +585,18 @@ class NodeCommunicationFinished(NameBuildTest):
         )
 
 
+class DebugReportsDropped(NameBuildTest):
+    def test_one(self):
+        self.assert_message_from_report(
+            "1 debug report dropped", reports.DebugReportsDropped(1)
+        )
+
+    def test_more(self):
+        self.assert_message_from_report(
+            "3 debug reports dropped", reports.DebugReportsDropped(3)
+        )
+
+
 class NodeCommunicationDebugInfo(NameBuildTest):
     def test_all(self):
         self.assert_message_from_report(
@@ -2055,6 +2067,14 @@ class ResourceOperationIntervalAdapted(NameBuildTest):
         )
 
 
+class NodeAttributeNotFound(NameBuildTest):
+    def test_build_message(self):
+        self.assert_message_from_report(
+            "Attribute 'rack' does not exist for node 'node1'",
+            reports.NodeAttributeNotFound("node1", "rack"),
+        )
+
+
 class NodeNotFound(NameBuildTest):
     def test_build_messages(self):
         self.assert_message_from_report(
@@ -3496,6 +3516,20 @@ class ClusterEnableSuccess(NameBuildTest):
         )
 
 
+class ConfigRestoreNodeFinished(NameBuildTest):
+    def test_success(self):
+        self.assert_message_from_report(
+            "node1: Succeeded (1/3)",
+            reports.ConfigRestoreNodeFinished("node1", "Succeeded", 1, 3),
+        )
+
+    def test_failure(self):
+        self.assert_message_from_report(
+            "node1: Failed (2/3)",
+            reports.ConfigRestoreNodeFinished("node1", None, 2, 3),
+        )
+
+
 class ClusterStartStarted(NameBuildTest):
     def test_multiple_hosts(self):
         self.assert_message_from_report(
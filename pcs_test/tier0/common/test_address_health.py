@@ -0,0 +1,112 @@
+import os.path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pcs.common.address_health import AddressHealthCache
+from pcs.common.host import Destination
+
+DEST_1 = Destination("addr1", None)
+DEST_2 = Destination("addr2", None)
+DEST_3 = Destination("addr3", 2225)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class SortDestList(TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.cache = AddressHealthCache(expiry=60, get_time=self.clock)
+
+    def assert_order(self, expected_dest_list, host_label="node1"):
+        self.assertEqual(
+            self.cache.sort_dest_list(host_label, [DEST_1, DEST_2, DEST_3]),
+            expected_dest_list,
+        )
+
+    def test_unknown(self):
+        self.assert_order([DEST_1, DEST_2, DEST_3])
+
+    def test_unhealthy_last_healthy_first(self):
+        self.cache.mark_unhealthy("node1", DEST_1)
+        self.cache.mark_healthy("node1", DEST_3)
+        self.assert_order([DEST_3, DEST_2, DEST_1])
+
+    def test_other_host(self):
+        self.cache.mark_unhealthy("node1", DEST_1)
+        self.assert_order([DEST_1, DEST_2, DEST_3], host_label="node2")
+
+    def test_port_matters(self):
+        self.cache.mark_unhealthy("node1", Destination("addr3", None))
+        self.assert_order([DEST_1, DEST_2, DEST_3])
+
+    def test_expired(self):
+        self.cache.mark_unhealthy("node1", DEST_1)
+        self.clock.now += 60
+        self.assert_order([DEST_1, DEST_2, DEST_3])
+
+    def test_recovered(self):
+        self.cache.mark_unhealthy("node1", DEST_1)
+        self.cache.mark_healthy("node1", DEST_1)
+        self.assert_order([DEST_1, DEST_2, DEST_3])
+
+
+class Storage(TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, "dir", "address-health")
+        self.clock = Clock()
+
+    def get_cache(self):
+        return AddressHealthCache(
+            self.path, expiry=60, get_time=self.clock
+        ).load()
+
+    def test_shared_across_instances(self):
+        cache = self.get_cache()
+        cache.mark_unhealthy("node1", DEST_1)
+        cache.mark_healthy("node1", DEST_3)
+        cache.save()
+        self.assertEqual(
+            self.get_cache().sort_dest_list("node1", [DEST_1, DEST_2, DEST_3]),
+            [DEST_3, DEST_2, DEST_1],
+        )
+
+    def test_expired_not_saved(self):
+        cache = self.get_cache()
+        cache.mark_unhealthy("node1", DEST_1)
+        self.clock.now += 30
+        cache.mark_unhealthy("node1", DEST_2)
+        self.clock.now += 40
+        cache.save()
+        with open(self.path) as storage:
+            self.assertEqual(
+                storage.read(), '[["node1", "addr2", null, false, 1030.0]]'
+            )
+
+    def test_not_saved_when_not_changed(self):
+        self.get_cache().save()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_broken_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as storage:
+            storage.write('[["node1"]]')
+        self.assertEqual(
+            self.get_cache().sort_dest_list("node1", [DEST_1, DEST_2]),
+            [DEST_1, DEST_2],
+        )
+
+    def test_not_writable(self):
+        with open(os.path.join(self.tmp_dir.name, "dir"), "w"):
+            pass
+        cache = self.get_cache()
+        cache.mark_unhealthy("node1", DEST_1)
+        cache.save()
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["dir"])
@@ -0,0 +1,114 @@
+from unittest import TestCase
+
+from pcs_test.tools.custom_mock import MockCurl
+
+from pcs.common import pcs_pycurl as pycurl
+from pcs.common.communication_timing import (
+    CommunicationTiming,
+    RequestTiming,
+)
+from pcs.common.host import Destination
+from pcs.common.node_communicator import (
+    Request,
+    RequestData,
+    RequestTarget,
+    Response,
+)
+
+
+def fixture_timing(host_label, total, attempt=0, was_connected=True):
+    return RequestTiming(
+        host_label=host_label,
+        addr=host_label,
+        port=None,
+        was_connected=was_connected,
+        attempt=attempt,
+        namelookup=0.0,
+        connect=0.0,
+        tls=0.0,
+        transfer=total,
+        total=total,
+        bytes_sent=10,
+        bytes_received=20,
+    )
+
+
+class RequestTimingFromResponse(TestCase):
+    def setUp(self):
+        self.request = Request(
+            RequestTarget(
+                "node1",
+                dest_list=[Destination("addr1", None), Destination("addr2", 1)],
+            ),
+            RequestData("action", [("data", "value")]),
+        )
+        self.info = {
+            pycurl.NAMELOOKUP_TIME: 0.1,
+            pycurl.CONNECT_TIME: 0.3,
+            pycurl.APPCONNECT_TIME: 0.6,
+            pycurl.PRETRANSFER_TIME: 0.65,
+            pycurl.TOTAL_TIME: 1.65,
+            pycurl.SIZE_DOWNLOAD: 100.0,
+        }
+
+    def get_timing(self, response_factory):
+        return RequestTiming.from_response(
+            response_factory(MockCurl(info=self.info, request=self.request))
+        )
+
+    def test_phases(self):
+        timing = self.get_timing(Response.connection_successful)
+        self.assertEqual(timing.host_label, "node1")
+        self.assertEqual((timing.addr, timing.port), ("addr1", None))
+        self.assertTrue(timing.was_connected)
+        self.assertEqual(timing.attempt, 0)
+        self.assertAlmostEqual(timing.namelookup, 0.1)
+        self.assertAlmostEqual(timing.connect, 0.2)
+        self.assertAlmostEqual(timing.tls, 0.3)
+        self.assertAlmostEqual(timing.transfer, 1.0)
+        self.assertAlmostEqual(timing.total, 1.65)
+        self.assertEqual(timing.bytes_sent, len("data=value"))
+        self.assertEqual(timing.bytes_received, 100)
+
+    def test_not_connected_to_second_address(self):
+        self.request.next_dest()
+        self.info = {pycurl.NAMELOOKUP_TIME: 0.1, pycurl.TOTAL_TIME: 0.5}
+        timing = self.get_timing(
+            lambda handle: Response.connection_failure(handle, 7, "reason")
+        )
+        self.assertFalse(timing.was_connected)
+        self.assertEqual((timing.addr, timing.port), ("addr2", 1))
+        self.assertEqual(timing.attempt, 1)
+        self.assertEqual(
+            (timing.connect, timing.tls, timing.transfer), (0, 0, 0)
+        )
+        self.assertEqual(timing.bytes_received, 0)
+
+
+class CommunicationTimingSummary(TestCase):
+    def test_empty(self):
+        self.assertEqual(CommunicationTiming().get_summary(), {})
+
+    def test_summary(self):
+        timing = CommunicationTiming()
+        for total in range(1, 21):
+            timing.add(fixture_timing("node1", float(total)))
+        timing.add(fixture_timing("node2", 0.5, was_connected=False))
+        timing.add(fixture_timing("node2", 1.5, attempt=1))
+        summary = timing.get_summary()
+        self.assertEqual(list(summary.keys()), ["node1", "node2"])
+        self.assertEqual(summary["node1"]["requests"], 20)
+        self.assertEqual(summary["node1"]["retries"], 0)
+        self.assertEqual(summary["node1"]["bytes_sent"], 200)
+        self.assertEqual(summary["node1"]["bytes_received"], 400)
+        self.assertEqual(
+            summary["node1"]["total"], {"p50": 10.0, "p95": 19.0, "max": 20.0}
+        )
+        self.assertEqual(
+            summary["node1"]["tls"], {"p50": 0.0, "p95": 0.0, "max": 0.0}
+        )
+        self.assertEqual(summary["node2"]["retries"], 1)
+        self.assertEqual(summary["node2"]["connection_failures"], 1)
+        self.assertEqual(
+            summary["node2"]["total"], {"p50": 0.5, "p95": 1.5, "max": 1.5}
+        )
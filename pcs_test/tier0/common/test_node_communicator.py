@@ -11,6 +11,7 @@ from pcs.common import (
     host,
     pcs_pycurl as pycurl,
 )
+from pcs.common.address_health import AddressHealthCache
 from pcs.common.host import Destination
 import pcs.common.node_communicator as lib
 
@@ -56,6 +57,55 @@ class NodeTargetFactory(TestCase):
             [host.Destination(self.unknown_name, PORT)], target.dest_list
         )
 
+    def test_get_target_by_address(self):
+        target = self.factory.get_target("addr")
+        self.assertEqual("addr", target.label)
+        self.assertEqual(self.known_host.token, target.token)
+        self.assertEqual(self.known_host.dest_list, target.dest_list)
+
+    def test_get_target_normalized_name(self):
+        target = self.factory.get_target("NODE.")
+        self.assertEqual("NODE.", target.label)
+        self.assertEqual(self.known_host.token, target.token)
+
+
+class KnownHostsIndex(TestCase):
+    def setUp(self):
+        self.host_list = [
+            host.PcsKnownHost(
+                "node1",
+                "token1",
+                [
+                    host.Destination("10.0.0.1", 2224),
+                    host.Destination("fe80::1", 2224),
+                ],
+            ),
+            host.PcsKnownHost(
+                "node2", "token2", [host.Destination("10.0.0.2", 2224)]
+            ),
+            host.PcsKnownHost(
+                "node3", "token3", [host.Destination("10.0.0.2", 2224)]
+            ),
+            host.PcsKnownHost(
+                "10.0.0.1", "token4", [host.Destination("10.0.0.9", 2224)]
+            ),
+        ]
+        self.index = host.KnownHostsIndex(
+            {known_host.name: known_host for known_host in self.host_list}
+        )
+
+    def test_name_wins(self):
+        self.assertEqual(self.index.get("10.0.0.1").token, "token4")
+
+    def test_address(self):
+        self.assertEqual(self.index.get("[FE80::1]").token, "token1")
+
+    def test_ambiguous_address(self):
+        self.assertIsNone(self.index.get("10.0.0.2"))
+
+    def test_not_found(self):
+        self.assertIsNone(self.index.get("node4"))
+
 
 class RequestDataUrlEncodeTest(TestCase):
     def test_no_data(self):
@@ -64,6 +114,7 @@ class RequestDataUrlEncodeTest(TestCase):
         self.assertEqual(action, data.action)
         self.assertEqual(0, len(data.structured_data))
         self.assertEqual("", data.data)
+        self.assertEqual(b"", data.encoded_data)
 
     def test_with_data(self):
         action = "action"
@@ -81,6 +132,7 @@ class RequestDataUrlEncodeTest(TestCase):
             "%5D%28%29%2A%5E%24%23%40%21~%60%7B%3A%7D%3C%3E",
         )
         self.assertTrue(data.data in expected_raw_data_variants)
+        self.assertEqual(data.data.encode("utf-8"), data.encoded_data)
 
 
 def _addr_list_to_dest(addr_list, port=None):
@@ -305,7 +357,7 @@ class CreateRequestHandleTest(TestCase):
             pycurl.COOKIE: "name1=val1;name2=val2;token=token_val".encode(
                 "utf-8"
             ),
-            pycurl.COPYPOSTFIELDS: "data=value".encode("utf-8"),
+            pycurl.POSTFIELDS: "data=value".encode("utf-8"),
         }
         expected_opts.update(self._common_opts)
         self.assertLessEqual(
@@ -337,7 +389,7 @@ class CreateRequestHandleTest(TestCase):
             set(expected_opts.items()), set(handle.opts.items())
         )
         self.assertFalse(pycurl.COOKIE in handle.opts)
-        self.assertFalse(pycurl.COPYPOSTFIELDS in handle.opts)
+        self.assertFalse(pycurl.POSTFIELDS in handle.opts)
         self.assertIs(request, handle.request_obj)
         self.assertEqual("", handle.output_buffer.getvalue().decode("utf-8"))
         self.assertEqual("", handle.debug_buffer.getvalue().decode("utf-8"))
@@ -403,6 +455,13 @@ class CommunicatorSimpleTest(CommunicatorBaseTest):
         response = self.get_response(com, mock_create_handle, MockCurl())
         self.assert_common_checks(com, response)
 
+    def test_timing(self, mock_create_handle, _):
+        timing = mock.Mock(spec_set=["add_response"])
+        com = lib.Communicator(self.mock_com_log, None, None, timing=timing)
+        response = self.get_response(com, mock_create_handle, MockCurl())
+        self.assert_common_checks(com, response)
+        timing.add_response.assert_called_once_with(response)
+
     def test_failure(self, mock_create_handle, _):
         com = self.get_communicator()
         expected_reason = "expected reason"
@@ -631,3 +690,66 @@ class MultiaddressCommunicatorTest(CommunicatorBaseTest):
         self.assertEqual(logger_calls, self.mock_com_log.mock_calls)
         # pylint: disable=no-member, protected-access
         com._multi_handle.assert_no_handle_left()
+
+
+@mock.patch(
+    "pcs.common.node_communicator.pycurl.CurlMulti",
+    side_effect=lambda: MockCurlMulti([1, 1, 1]),
+)
+@mock.patch("pcs.common.node_communicator._create_request_handle")
+class MultiaddressCommunicatorAddressHealthTest(CommunicatorBaseTest):
+    def setUp(self):
+        super().setUp()
+        self.address_health = AddressHealthCache()
+        self.handle_list = []
+
+    def _create_handle(self, request, _, __):
+        handle = MockCurl(
+            error=(
+                (pycurl.E_OPERATION_TIMEDOUT, "timeout")
+                if request.dest.addr == "ring0"
+                else None
+            ),
+            request=request,
+        )
+        self.handle_list.append(handle)
+        return handle
+
+    def _run(self, mock_create_handle):
+        mock_create_handle.side_effect = self._create_handle
+        com = lib.MultiaddressCommunicator(
+            self.mock_com_log, None, None, address_health=self.address_health,
+        )
+        request = lib.Request(
+            lib.RequestTarget(
+                "label", dest_list=_addr_list_to_dest(["ring0", "ring1"]),
+            ),
+            lib.RequestData("action"),
+        )
+        com.add_requests([request])
+        response_list = list(com.start_loop())
+        self.assertEqual(1, len(response_list))
+        self.assertTrue(response_list[0].was_connected)
+        return request
+
+    def test_dead_address_tried_last_next_time(self, mock_create_handle, _):
+        request = self._run(mock_create_handle)
+        self.assertEqual(Destination("ring1", None), request.dest)
+        self.assertEqual(1, request.attempt)
+        self.assertEqual(
+            [
+                handle.opts.get(pycurl.CONNECTTIMEOUT)
+                for handle in self.handle_list
+            ],
+            [settings.multiaddress_connect_timeout, None],
+        )
+
+        self.handle_list = []
+        request = self._run(mock_create_handle)
+        self.assertEqual(Destination("ring1", None), request.dest)
+        self.assertEqual(0, request.attempt)
+        self.assertEqual(1, len(self.handle_list))
+        self.assertEqual(
+            settings.multiaddress_connect_timeout,
+            self.handle_list[0].opts.get(pycurl.CONNECTTIMEOUT),
+        )
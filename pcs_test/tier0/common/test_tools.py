@@ -1,6 +1,11 @@
+import io
 import time
 from unittest import TestCase
 
+from lxml import etree
+
+from pcs_test.tools.assertions import assert_xml_equal
+
 from pcs.common import tools
 
 
@@ -134,3 +139,53 @@ class VersionTest(TestCase):
         self.assert_lt_tuple((2, 0), (3, 5, 1))
         self.assert_lt_tuple((2, 5), (3, 5, 1))
         self.assert_lt_tuple((3, 5), (3, 5, 1))
+
+
+class XmlFromstream(TestCase):
+    xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <cib>
+            <configuration/>
+            <status>
+                <node_state id="1">
+                    <lrm><lrm_resources><lrm_resource id="R">
+                        <lrm_rsc_op id="R_last_0"/>text
+                    </lrm_resource></lrm_resources></lrm>
+                    <transient_attributes id="1"/>
+                </node_state>
+            </status>
+        </cib>
+    """
+
+    def parse(self, skip_children_of=()):
+        return etree.tostring(
+            tools.xml_fromstream(io.BytesIO(self.xml), skip_children_of)
+        ).decode()
+
+    def test_whole(self):
+        assert_xml_equal(self.xml.decode().split("?>", 1)[1], self.parse())
+
+    def test_skip_children(self):
+        assert_xml_equal(
+            """
+            <cib>
+                <configuration/>
+                <status>
+                    <node_state id="1">
+                        <lrm/>
+                        <transient_attributes id="1"/>
+                    </node_state>
+                </status>
+            </cib>
+            """,
+            self.parse(["lrm"]),
+        )
+
+    def test_skip_children_nested(self):
+        assert_xml_equal(
+            "<cib><configuration/><status/></cib>",
+            self.parse(["status", "lrm"]),
+        )
+
+    def test_syntax_error(self):
+        with self.assertRaises(etree.XMLSyntaxError):
+            tools.xml_fromstream(io.BytesIO(b"<cib><status></cib>"))
@@ -0,0 +1,117 @@
+import json
+import logging
+
+from pcs_test.tier0.daemon.app import fixtures_app
+
+from pcs.daemon import cluster_status as status_cache, ruby_pcsd
+from pcs.daemon.app import cluster_status
+
+# Don't write errors to test output.
+logging.getLogger("tornado.access").setLevel(logging.CRITICAL)
+
+STATUS = {"nodes": [{"name": "node1"}], "resources": [{"id": "R1"}]}
+URL = "/remote/cluster_status_structured"
+
+
+class RubyPcsdWrapper(fixtures_app.RubyPcsdWrapper):
+    def __init__(self):
+        super().__init__(ruby_pcsd.SINATRA_REMOTE)
+        self.body = json.dumps(
+            {"username": fixtures_app.USER, "usergroups": fixtures_app.GROUPS}
+        ).encode()
+        self.path_list = []
+
+    async def run_ruby(self, request_type, http_request=None, payload=None):
+        self.path_list.append((http_request.path, http_request.query))
+        return await super().run_ruby(request_type, http_request, payload)
+
+
+class ClusterStatus(fixtures_app.AppTest):
+    def setUp(self):
+        self.wrapper = RubyPcsdWrapper()
+        self.load_list = []
+        self.load_error = None
+        self.status_cache = status_cache.StatusCache(max_age=60, load=self.load)
+        super().setUp()
+
+    def get_routes(self):
+        return cluster_status.get_routes(self.wrapper, self.status_cache)
+
+    def load(self, username, groups):
+        self.load_list.append((username, groups))
+        if self.load_error:
+            raise self.load_error
+        return STATUS
+
+    def test_success(self):
+        response = self.get(URL)
+        self.assertEqual(response.code, 200)
+        self.assertEqual(json.loads(response.body), STATUS)
+        self.assertEqual(response.headers["Content-Type"], "application/json")
+        self.assertTrue(response.headers["Etag"])
+        self.assertEqual(
+            self.wrapper.path_list,
+            [("/remote/check_permission", "permission=read")],
+        )
+        self.assertEqual(
+            self.load_list, [(fixtures_app.USER, fixtures_app.GROUPS)]
+        )
+
+    def test_status_shared(self):
+        first = self.get(URL)
+        second = self.get(URL)
+        self.assertEqual(first.body, second.body)
+        self.assertEqual(len(self.load_list), 1)
+        # permissions are checked for each request
+        self.assertEqual(len(self.wrapper.path_list), 2)
+
+    def test_not_modified(self):
+        etag = self.get(URL).headers["Etag"]
+        response = self.get(URL, headers={"If-None-Match": etag})
+        self.assertEqual(response.code, 304)
+        self.assertEqual(response.body, b"")
+        self.assertEqual(response.headers["Etag"], etag)
+
+    def test_modified(self):
+        response = self.get(URL, headers={"If-None-Match": '"outdated"'})
+        self.assertEqual(response.code, 200)
+        self.assertEqual(json.loads(response.body), STATUS)
+
+    def test_select_fields(self):
+        self.assertEqual(
+            json.loads(self.get(f"{URL}?fields=nodes").body),
+            {"nodes": STATUS["nodes"]},
+        )
+        self.assertEqual(
+            json.loads(self.get(f"{URL}?fields=resources").body),
+            {"resources": STATUS["resources"]},
+        )
+        self.assertEqual(
+            json.loads(self.get(f"{URL}?fields=resources,nodes").body), STATUS,
+        )
+        self.assertEqual(len(self.load_list), 1)
+
+    def test_unknown_fields(self):
+        response = self.get(f"{URL}?fields=nodes,tickets")
+        self.assertEqual(response.code, 400)
+        self.assertEqual(
+            response.body,
+            b"Unknown fields 'tickets', supported fields are 'nodes', "
+            b"'resources'",
+        )
+        self.assertEqual(self.wrapper.path_list, [])
+        self.assertEqual(self.load_list, [])
+
+    def test_permission_denied(self):
+        self.wrapper.status_code = 403
+        self.wrapper.body = b"Permission denied"
+        self.assert_wrappers_response(self.get(URL))
+        self.assertEqual(self.load_list, [])
+
+    def test_load_error(self):
+        self.load_error = status_cache.StatusLoadError([{"report": "data"}])
+        response = self.get(URL)
+        self.assertEqual(response.code, 500)
+        self.assertEqual(
+            json.loads(response.body), {"report_list": [{"report": "data"}]}
+        )
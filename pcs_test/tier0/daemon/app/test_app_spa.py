@@ -1,3 +1,4 @@
+import gzip
 import logging
 import os
 
@@ -51,6 +52,75 @@ class Static(AppTest):
             self.get(f"{PREFIX}"), self.index_content,
         )
 
+    def test_index_not_modified(self):
+        response = self.get(f"{PREFIX}")
+        self.assertEqual(response.headers["Cache-Control"], "no-cache")
+        response = self.get(
+            f"{PREFIX}", headers={"If-None-Match": response.headers["Etag"]},
+        )
+        self.assertEqual(response.code, 304)
+
+    def test_index_changed(self):
+        self.get(f"{PREFIX}")
+        with open(self.index_path, "w") as index:
+            index.write("<html>changed</html>")
+        os.utime(self.index_path, ns=(1, 1))
+        self.assert_success_response(
+            self.get(f"{PREFIX}"), "<html>changed</html>",
+        )
+
+
+class StaticAssets(AppTest):
+    def setUp(self):
+        super().setUp()
+        static_dir = os.path.join(self.spa_dir_path, "static")
+        os.makedirs(static_dir)
+        self.js_content = "var a = 1;"
+        for name in ["main.js", "main.0123abcd.chunk.js"]:
+            path = os.path.join(static_dir, name)
+            with open(path, "w") as js_file:
+                js_file.write(self.js_content)
+            with gzip.open(f"{path}.gz", "wt") as js_file:
+                js_file.write(self.js_content)
+
+    def get_asset(self, name, accept_encoding):
+        return self.get(
+            f"{PREFIX}static/{name}",
+            headers={"Accept-Encoding": accept_encoding},
+            decompress_response=False,
+        )
+
+    def test_plain_variant(self):
+        response = self.get_asset("main.js", "identity")
+        self.assert_success_response(response, self.js_content)
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertEqual(response.headers["Vary"], "Accept-Encoding")
+        self.assertNotIn("Cache-Control", response.headers)
+
+    def test_precompressed_variant(self):
+        response = self.get_asset("main.js", "br;q=0, gzip")
+        self.assertEqual(response.code, 200)
+        self.assertEqual(gzip.decompress(response.body).decode(), "var a = 1;")
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(
+            response.headers["Content-Type"],
+            self.get_asset("main.js", "identity").headers["Content-Type"],
+        )
+
+    def test_etag_differs_for_variants(self):
+        self.assertNotEqual(
+            self.get_asset("main.js", "identity").headers["Etag"],
+            self.get_asset("main.js", "gzip").headers["Etag"],
+        )
+
+    def test_hashed_name_is_immutable(self):
+        response = self.get_asset("main.0123abcd.chunk.js", "gzip")
+        self.assertEqual(response.code, 200)
+        self.assertEqual(
+            response.headers["Cache-Control"],
+            "public, max-age=31536000, immutable",
+        )
+
 
 class Fallback(AppTest):
     def setUp(self):
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import logging
+import threading
+from unittest import TestCase
+
+from tornado.testing import AsyncTestCase, gen_test
+
+from pcs.daemon import cluster_status
+
+# Don't write errors to test output.
+logging.getLogger("pcs.daemon").setLevel(logging.CRITICAL)
+
+STATUS = {"nodes": [{"name": "node1"}], "resources": [{"id": "R1"}]}
+
+
+class StatusSnapshot(TestCase):
+    def setUp(self):
+        self.snapshot = cluster_status.StatusSnapshot(STATUS)
+
+    def test_render_selected_fields(self):
+        body, dummy_etag = self.snapshot.render(["nodes"])
+        self.assertEqual(json.loads(body), {"nodes": [{"name": "node1"}]})
+
+    def test_etag_depends_on_fields(self):
+        dummy_body, etag_nodes = self.snapshot.render(["nodes"])
+        dummy_body, etag_all = self.snapshot.render(["nodes", "resources"])
+        self.assertNotEqual(etag_nodes, etag_all)
+
+    def test_etag_does_not_depend_on_fields_order(self):
+        self.assertEqual(
+            self.snapshot.render(["resources", "nodes"]),
+            self.snapshot.render(["nodes", "resources", "nodes"]),
+        )
+
+    def test_etag_same_for_same_status(self):
+        self.assertEqual(
+            self.snapshot.render(["nodes"]),
+            cluster_status.StatusSnapshot(dict(STATUS)).render(["nodes"]),
+        )
+
+
+class StatusCache(AsyncTestCase):
+    def setUp(self):
+        super().setUp()
+        self.now = 100
+        self.load_list = []
+        self.cache = cluster_status.StatusCache(
+            max_age=2, load=self.load, get_time=lambda: self.now
+        )
+
+    def load(self, username, groups):
+        self.load_list.append((username, groups))
+        return dict(STATUS, load_count=len(self.load_list))
+
+    @gen_test
+    async def test_reuse_until_expired(self):
+        snapshot = await self.cache.get("user", ["group"])
+        self.assertEqual(snapshot.status["load_count"], 1)
+        self.now = 101
+        self.assertIs(await self.cache.get("user", ["group"]), snapshot)
+        self.now = 102
+        snapshot = await self.cache.get("user", ["group"])
+        self.assertEqual(snapshot.status["load_count"], 2)
+
+    @gen_test
+    async def test_users_independent(self):
+        await self.cache.get("user", ["group"])
+        await self.cache.get("user", ["other"])
+        await self.cache.get("other", ["group"])
+        await self.cache.get("user", ["group"])
+        self.assertEqual(
+            self.load_list,
+            [("user", ["group"]), ("user", ["other"]), ("other", ["group"])],
+        )
+
+    @gen_test
+    async def test_failure_not_shared(self):
+        def load(username, groups):
+            if not self.load_list:
+                self.load_list.append((username, groups))
+                raise cluster_status.StatusLoadError([])
+            return self.load(username, groups)
+
+        cache = cluster_status.StatusCache(max_age=2, load=load)
+        with self.assertRaises(cluster_status.StatusLoadError):
+            await cache.get("user", [])
+        snapshot = await cache.get("user", [])
+        self.assertEqual(snapshot.status["load_count"], 2)
+
+    @gen_test
+    async def test_status_being_loaded_is_shared(self):
+        release = threading.Event()
+
+        def load(username, groups):
+            release.wait(5)
+            return self.load(username, groups)
+
+        cache = cluster_status.StatusCache(
+            max_age=2, load=load, get_time=lambda: self.now
+        )
+        first = asyncio.ensure_future(cache.get("user", []))
+        await asyncio.sleep(0)
+        # loading takes longer than the status is shared
+        self.now = 110
+        second = asyncio.ensure_future(cache.get("user", []))
+        await asyncio.sleep(0)
+        release.set()
+        self.assertIs(await first, await second)
+        self.assertEqual(len(self.load_list), 1)
@@ -0,0 +1,69 @@
+import logging
+from unittest import TestCase, mock
+
+from tornado.locks import Lock
+from tornado.testing import AsyncTestCase, gen_test
+
+from pcs.daemon import config_sync
+from pcs.daemon.ruby_pcsd import SyncConfigsResult
+
+# Don't write errors to test output.
+logging.getLogger("pcs.daemon").setLevel(logging.CRITICAL)
+
+
+class Backoff(TestCase):
+    def setUp(self):
+        self.backoff = config_sync.Backoff(max_multiplier=4)
+
+    def get_delay(self, unchanged):
+        return self.backoff.get_delay(100, SyncConfigsResult(160, unchanged))
+
+    def test_changed(self):
+        self.assertEqual(self.get_delay(False), 60)
+        self.assertEqual(self.get_delay(False), 60)
+
+    def test_unchanged_grows_to_limit(self):
+        self.assertEqual(
+            [self.get_delay(True) for _ in range(4)], [60, 120, 240, 240]
+        )
+
+    def test_change_resets(self):
+        self.get_delay(True)
+        self.get_delay(True)
+        self.assertEqual(self.get_delay(False), 60)
+        self.assertEqual(self.get_delay(True), 60)
+
+    def test_next_run_in_past(self):
+        self.assertEqual(
+            self.backoff.get_delay(100, SyncConfigsResult(90, True)), 0
+        )
+
+    def test_limit_default_from_settings(self):
+        with mock.patch("pcs.settings.pcsd_config_sync_max_backoff", 2):
+            backoff = config_sync.Backoff()
+        delays = [
+            backoff.get_delay(100, SyncConfigsResult(110, True))
+            for _ in range(3)
+        ]
+        self.assertEqual(delays, [10, 20, 20])
+
+
+class ConfigSync(AsyncTestCase):
+    @mock.patch("pcs.daemon.config_sync.now", lambda: 100)
+    @gen_test
+    async def test_schedules_next_run(self):
+        wrapper = mock.Mock()
+
+        async def sync_configs_result():
+            return SyncConfigsResult(130, True)
+
+        wrapper.sync_configs_result = sync_configs_result
+        backoff = config_sync.Backoff(max_multiplier=4)
+        with mock.patch.object(self.io_loop, "call_later") as call_later:
+            synchronization = config_sync.config_sync(Lock(), wrapper, backoff)
+            await synchronization()
+            await synchronization()
+        self.assertEqual(
+            call_later.mock_calls,
+            [mock.call(30, synchronization), mock.call(60, synchronization),],
+        )
@@ -41,6 +41,8 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
             env.PCSD_DEBUG: False,
             env.PCSD_DISABLE_GUI: False,
             env.PCSD_SESSION_LIFETIME: settings.gui_session_lifetime_seconds,
+            env.PCSD_SESSION_MAX_COUNT: settings.gui_session_max_count,
+            env.PCSD_SESSION_PERSISTENT: False,
             env.PCSD_STATIC_FILES_DIR: pcsd_dir(env.PCSD_STATIC_FILES_DIR_NAME),
             env.PCSD_DEV: False,
             "has_errors": False,
@@ -71,6 +73,8 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
             env.PCSD_DEBUG: "true",
             env.PCSD_DISABLE_GUI: "true",
             env.PCSD_SESSION_LIFETIME: str(session_lifetime),
+            env.PCSD_SESSION_MAX_COUNT: "20",
+            env.PCSD_SESSION_PERSISTENT: "true",
             env.PCSD_DEV: "true",
             env.PCSD_DEV: "true",
         }
@@ -85,6 +89,8 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
                 env.PCSD_DEBUG: True,
                 env.PCSD_DISABLE_GUI: True,
                 env.PCSD_SESSION_LIFETIME: session_lifetime,
+                env.PCSD_SESSION_MAX_COUNT: 20,
+                env.PCSD_SESSION_PERSISTENT: True,
                 env.PCSD_STATIC_FILES_DIR: pcsd_dir(
                     env.PCSD_STATIC_FILES_DIR_NAME
                 ),
@@ -103,6 +109,20 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
             ],
         )
 
+    def test_error_on_invalid_session_max_count(self):
+        for value in ["invalid", "0"]:
+            with self.subTest(value=value):
+                self.logger = Logger()
+                environ = {env.PCSD_SESSION_MAX_COUNT: value}
+                self.assert_environ_produces_modified_pcsd_env(
+                    environ,
+                    specific_env_values={**environ, "has_errors": True},
+                    errors=[
+                        f"Invalid PCSD_SESSION_MAX_COUNT value '{value}'"
+                        " (it must be a positive integer)"
+                    ],
+                )
+
     def test_report_invalid_ssl_ciphers(self):
         environ = {env.PCSD_SSL_CIPHERS: "invalid ;@{}+ ciphers"}
         self.assert_environ_produces_modified_pcsd_env(
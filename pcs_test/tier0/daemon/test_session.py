@@ -1,5 +1,7 @@
-from unittest import TestCase
+import os
 from contextlib import contextmanager
+from tempfile import TemporaryDirectory
+from unittest import TestCase
 
 from pcs_test.tools.misc import create_setup_patch_mixin
 
@@ -65,6 +67,11 @@ class SessionTest(TestCase, AssertMixin, PatchSessionMixin):
         with self.refresh_test() as session1:
             session1.ajax_id
 
+    def test_is_authenticated_no_refresh(self):
+        self.now.return_value = 10.1
+        self.assertFalse(self.session.is_authenticated_no_refresh)
+        self.assertTrue(self.session.was_unused_last(10))
+
 
 class StorageTest(TestCase, AssertMixin, PatchSessionMixin):
     def setUp(self):
@@ -131,3 +138,76 @@ class StorageTest(TestCase, AssertMixin, PatchSessionMixin):
         session2 = self.storage.rejected_user(session1.sid, USER)
         self.assert_login_failed_session(session2, USER)
         self.assertEqual(session1.sid, session2.sid)
+
+    def test_does_not_drop_refreshed_session(self):
+        session1 = self.storage.provide()
+        self.now.return_value = 8
+        self.storage.provide(session1.sid)
+        self.now.return_value = 12
+        self.storage.drop_expired()
+        self.assertIs(self.storage.provide(session1.sid), session1)
+        self.now.return_value = 23
+        self.storage.drop_expired()
+        self.assertIsNot(self.storage.provide(session1.sid), session1)
+
+
+class StorageMaxCountTest(TestCase, PatchSessionMixin):
+    def setUp(self):
+        self.now = self.setup_patch("now", return_value=0)
+        self.storage = session.Storage(lifetime_seconds=10, max_count=2)
+
+    def test_evicts_least_recently_used_session(self):
+        session1 = self.storage.provide()
+        session2 = self.storage.provide()
+        self.assertIs(self.storage.provide(session1.sid), session1)
+        session3 = self.storage.provide()
+        self.assertIs(self.storage.provide(session1.sid), session1)
+        self.assertIs(self.storage.provide(session3.sid), session3)
+        self.assertIsNot(self.storage.provide(session2.sid), session2)
+
+
+class StoragePersistenceTest(TestCase, AssertMixin, PatchSessionMixin):
+    def setUp(self):
+        self.now = self.setup_patch("now", return_value=0)
+        self.tmp_dir = TemporaryDirectory()
+        self.storage_file = os.path.join(self.tmp_dir.name, "sessions")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def make_storage(self):
+        return session.Storage(
+            lifetime_seconds=10, storage_file=self.storage_file
+        ).load()
+
+    def test_restores_authenticated_sessions(self):
+        storage1 = self.make_storage()
+        session1 = storage1.login(sid=None, username=USER, groups=GROUPS)
+        session2 = storage1.provide()
+        self.now.return_value = 5
+        storage2 = self.make_storage()
+        self.assert_authenticated_session(
+            storage2.provide(session1.sid), USER, GROUPS
+        )
+        self.assertNotEqual(storage2.provide(session2.sid).sid, session2.sid)
+
+    def test_does_not_restore_destroyed_session(self):
+        storage1 = self.make_storage()
+        session1 = storage1.login(sid=None, username=USER, groups=GROUPS)
+        storage1.destroy(session1.sid)
+        self.assertNotEqual(
+            self.make_storage().provide(session1.sid).sid, session1.sid
+        )
+
+    def test_does_not_restore_expired_session(self):
+        storage1 = self.make_storage()
+        session1 = storage1.login(sid=None, username=USER, groups=GROUPS)
+        self.now.return_value = 11
+        self.assertNotEqual(
+            self.make_storage().provide(session1.sid).sid, session1.sid
+        )
+
+    def test_ignores_damaged_storage_file(self):
+        with open(self.storage_file, "w") as file:
+            file.write("not a json")
+        self.assert_vanila_session(self.make_storage().provide())
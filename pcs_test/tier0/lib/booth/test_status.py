@@ -3,6 +3,7 @@ from unittest import mock, TestCase
 from pcs_test.tools.assertions import assert_raise_library_error
 
 from pcs import settings
+from pcs.common.booth import BoothTicketStatusDto
 from pcs.common.reports import ReportItemSeverity as Severities
 from pcs.common.reports import codes as report_codes
 from pcs.lib.external import CommandRunner
@@ -115,3 +116,65 @@ class GetPeersStatusTest(TestCase):
         self.mock_run.run.assert_called_once_with(
             [settings.booth_binary, "peers"]
         )
+
+
+class ParseDaemonStatus(TestCase):
+    def test_success(self):
+        self.assertEqual(
+            lib.parse_daemon_status(
+                "booth_lockfile='/var/run/booth/booth.pid' booth_lockpid=1234 "
+                "booth_daemon=1 booth_cfg_name='booth' booth_addr_string="
+                "'10.0.0.1' booth_port=9929 booth_type=site "
+                "booth_state=started\n"
+            ),
+            {
+                "booth_lockfile": "/var/run/booth/booth.pid",
+                "booth_lockpid": "1234",
+                "booth_daemon": "1",
+                "booth_cfg_name": "booth",
+                "booth_addr_string": "10.0.0.1",
+                "booth_port": "9929",
+                "booth_type": "site",
+                "booth_state": "started",
+            },
+        )
+
+    def test_empty(self):
+        self.assertEqual(lib.parse_daemon_status(""), {})
+
+    def test_unparsable(self):
+        self.assertEqual(lib.parse_daemon_status("booth_state='started"), {})
+
+
+class ParseTicketsStatus(TestCase):
+    def test_success(self):
+        self.assertEqual(
+            lib.parse_tickets_status(
+                "ticket: T1, leader: 10.0.0.1, expires: 2021-03-05 12:27:09, "
+                "commit: 2021-03-05 12:26:44\n"
+                "ticket: T2, leader: NONE\n"
+                "ticket: T3, leader: fe80::1, expires: 2021-03-05 12:27:10\n"
+                "\n"
+                "some unexpected line\n"
+            ),
+            [
+                BoothTicketStatusDto(
+                    ticket="T1",
+                    leader="10.0.0.1",
+                    expires="2021-03-05 12:27:09",
+                    commit="2021-03-05 12:26:44",
+                ),
+                BoothTicketStatusDto(
+                    ticket="T2", leader=None, expires=None, commit=None,
+                ),
+                BoothTicketStatusDto(
+                    ticket="T3",
+                    leader="fe80::1",
+                    expires="2021-03-05 12:27:10",
+                    commit=None,
+                ),
+            ],
+        )
+
+    def test_empty(self):
+        self.assertEqual(lib.parse_tickets_status(""), [])
@@ -0,0 +1,101 @@
+import os.path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pcs.common.booth import (
+    BoothInstanceStatusDto,
+    BoothTicketStatusDto,
+)
+from pcs.lib.booth import status_cache
+
+
+def fixture_status(instance_name, leader="10.0.0.1"):
+    return BoothInstanceStatusDto(
+        instance_name=instance_name,
+        host_name=None,
+        status_successfully_obtained=True,
+        daemon_running=True,
+        daemon_type="site",
+        address="10.0.0.1",
+        ticket_list=[
+            BoothTicketStatusDto(
+                ticket="T1",
+                leader=leader,
+                expires="2021-03-05 12:27:09",
+                commit=None,
+            )
+        ],
+        peers_plaintext="peers",
+    )
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class BoothStatusCache(TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, "dir", "booth-status")
+        self.clock = Clock()
+
+    def get_cache(self, max_age=5):
+        return status_cache.BoothStatusCache(
+            self.path, max_age=max_age, get_time=self.clock
+        ).load()
+
+    def test_shared_across_instances(self):
+        cache = self.get_cache()
+        cache.put(fixture_status("booth1"))
+        cache.save()
+        cache = self.get_cache()
+        self.assertEqual(cache.get("booth1"), fixture_status("booth1"))
+        self.assertIsNone(cache.get("booth2"))
+
+    def test_expired(self):
+        cache = self.get_cache()
+        cache.put(fixture_status("booth1"))
+        self.clock.now += 5
+        self.assertIsNone(cache.get("booth1"))
+
+    def test_expired_not_saved(self):
+        cache = self.get_cache()
+        cache.put(fixture_status("booth1"))
+        self.clock.now += 3
+        cache.put(fixture_status("booth2"))
+        self.clock.now += 3
+        cache.save()
+        self.clock.now -= 6
+        cache = self.get_cache()
+        self.assertIsNone(cache.get("booth1"))
+        self.assertEqual(cache.get("booth2"), fixture_status("booth2"))
+
+    def test_disabled(self):
+        cache = self.get_cache(max_age=0)
+        cache.put(fixture_status("booth1"))
+        cache.save()
+        self.assertIsNone(cache.get("booth1"))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_broken_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as storage:
+            storage.write('[[{"instance_name": "booth1"}, 1000]]')
+        self.assertIsNone(self.get_cache().get("booth1"))
+
+    def test_invalidate(self):
+        cache = self.get_cache()
+        cache.put(fixture_status("booth1"))
+        cache.save()
+        status_cache.invalidate(self.path)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertIsNone(self.get_cache().get("booth1"))
+
+    def test_invalidate_missing(self):
+        status_cache.invalidate(self.path)
+        self.assertFalse(os.path.exists(self.path))
@@ -4,6 +4,7 @@ from unittest import TestCase
 
 from pcs.common.str_tools import indent
 from pcs.lib.cib import rule
+from pcs.lib.cib.rule import parser
 from pcs.lib.cib.rule.expression_part import BoolExpr
 
 
@@ -892,3 +893,59 @@ class Parser(TestCase):
                     exception_data, (e.lineno, e.colno, e.pos, e.msg)
                 )
                 self.assertEqual(rule_string, e.rule_string)
+
+
+class FastParser(TestCase):
+    # pylint: disable=protected-access
+    def test_same_result_as_grammar(self):
+        supported_list = [
+            "defined pingd",
+            "NOT_DEFINED pingd",
+            "#uname eq node1",
+            "pingd gt integer 5 or #uname ne version 1.2.3",
+            "date gt 2014-06-26",
+            "date lt 2014-06-26 and date gt 2014-01-01",
+            "resource ocf:pacemaker:Dummy",
+            "resource ::",
+            "op monitor interval=10s",
+            "op start or (op monitor and resource ::Dummy) and defined a",
+            "((defined a)) or (#uname eq node1 and #uname eq node2)",
+        ]
+        for rule_string in supported_list:
+            with self.subTest(rule_string=rule_string):
+                self.assertIsNotNone(
+                    parser._FastRuleParser(rule_string).parse()
+                )
+                self.assertEqual(
+                    parser._FastRuleParser(rule_string).parse(),
+                    _parse_by_grammar(rule_string),
+                )
+
+    def test_unsupported_left_for_grammar(self):
+        unsupported_list = [
+            "date in_range 2014-06-26 to 2014-07-26",
+            "date-spec hours=1",
+            "date gt integer 5",
+            "a eq integer",
+            "defined date",
+            "a eq string-1",
+            "op monitor interval=10s5",
+            "(#uname eq node1",
+            "#uname eq node1 )",
+            "defined a\fand defined b",
+        ]
+        for rule_string in unsupported_list:
+            with self.subTest(rule_string=rule_string):
+                self.assertIsNone(parser._FastRuleParser(rule_string).parse())
+
+    def test_cached(self):
+        rule_string = "defined pingd and #uname eq node1"
+        self.assertIs(
+            rule.parse_rule(rule_string), rule.parse_rule(rule_string)
+        )
+
+
+def _parse_by_grammar(rule_string):
+    return getattr(parser, "__get_rule_parser")().parseString(
+        rule_string, parseAll=True
+    )[0]
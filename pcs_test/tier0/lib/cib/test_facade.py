@@ -0,0 +1,138 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs.lib.cib.facade import CibFacade
+
+FIXTURE_CIB = """
+    <cib>
+        <configuration>
+            <resources>
+                <primitive id="R1" class="ocf" provider="pacemaker"
+                    type="Dummy"
+                >
+                    <meta_attributes id="R1-meta">
+                        <nvpair id="R1-meta-rn" name="remote-node"
+                            value="guest1"
+                        />
+                    </meta_attributes>
+                </primitive>
+                <clone id="C1">
+                    <primitive id="R2" class="ocf" provider="pacemaker"
+                        type="Dummy"
+                    />
+                </clone>
+            </resources>
+            <constraints>
+                <rsc_location id="L1" rsc="R1" node="node1" score="100"/>
+                <rsc_location id="L2" rsc="R2">
+                    <rule id="L2-rule" score="INFINITY">
+                        <expression id="L2-rule-expr" attribute="a"
+                            operation="defined"
+                        />
+                    </rule>
+                </rsc_location>
+            </constraints>
+            <tags>
+                <tag id="T1">
+                    <obj_ref id="R1"/>
+                </tag>
+            </tags>
+        </configuration>
+        <status>
+            <node_state id="S1">
+                <lrm_resource id="R-deleted"/>
+            </node_state>
+        </status>
+    </cib>
+"""
+
+
+class CibFacadeTest(TestCase):
+    def setUp(self):
+        self.cib = CibFacade.from_string(FIXTURE_CIB)
+
+    def test_get_element_by_id(self):
+        self.assertEqual(self.cib.get_element_by_id("L1").tag, "rsc_location")
+        self.assertIsNone(self.cib.get_element_by_id("L1", "primitive"))
+        self.assertIsNone(self.cib.get_element_by_id("missing"))
+
+    def test_obj_ref_is_not_an_id(self):
+        self.assertEqual(self.cib.get_element_by_id("R1").tag, "primitive")
+        self.assertEqual(len(self.cib.get_elements_by_id("R1")), 1)
+
+    def test_resources(self):
+        self.assertEqual(self.cib.get_resource("R2").get("id"), "R2")
+        self.assertEqual(self.cib.get_clone("C1").get("id"), "C1")
+        self.assertIsNone(self.cib.get_group("C1"))
+        self.assertEqual(self.cib.get_any_resource("C1").tag, "clone")
+        self.assertIsNone(self.cib.get_any_resource("L1"))
+
+    def test_get_elements_by_tag(self):
+        self.assertEqual(
+            [el.get("id") for el in self.cib.get_elements_by_tag("primitive")],
+            ["R1", "R2"],
+        )
+
+    def test_does_id_exist(self):
+        self.assertTrue(self.cib.does_id_exist("L2-rule-expr"))
+        self.assertTrue(self.cib.does_id_exist("guest1"))
+        self.assertFalse(self.cib.does_id_exist("S1"))
+        self.assertFalse(self.cib.does_id_exist("R-deleted"))
+
+    def test_find_unique_id(self):
+        self.assertEqual(self.cib.find_unique_id("new"), "new")
+        self.assertEqual(self.cib.find_unique_id("R1"), "R1-1")
+        self.assertEqual(
+            self.cib.find_unique_id("R1", reserved_ids=["R1-1"]), "R1-2"
+        )
+
+    def test_append_updates_indexes(self):
+        self.cib.does_id_exist("R1")
+        self.cib.append(
+            self.cib.get_section("configuration/constraints"),
+            etree.fromstring('<rsc_order id="O1" first="R1" then="R2"/>'),
+        )
+        self.assertTrue(self.cib.does_id_exist("O1"))
+        self.assertEqual(self.cib.find_unique_id("O1"), "O1-1")
+
+    def test_append_before(self):
+        resources = self.cib.get_section("configuration/resources")
+        self.cib.append(
+            resources,
+            etree.fromstring('<group id="G1"/>'),
+            before=self.cib.get_clone("C1"),
+        )
+        self.assertTrue(self.cib.does_id_exist("G1"))
+        self.assertEqual(
+            [el.get("id") for el in resources], ["R1", "G1", "C1"],
+        )
+
+    def test_set_attribute_updates_indexes(self):
+        self.assertTrue(self.cib.does_id_exist("guest1"))
+        self.cib.set_attribute(
+            self.cib.get_element_by_id("R1-meta-rn"), "value", "guest2"
+        )
+        self.assertFalse(self.cib.does_id_exist("guest1"))
+        self.assertTrue(self.cib.does_id_exist("guest2"))
+
+    def test_remove_updates_indexes(self):
+        self.assertTrue(self.cib.does_id_exist("guest1"))
+        self.cib.remove(self.cib.get_resource("R1"))
+        self.assertFalse(self.cib.does_id_exist("R1"))
+        self.assertFalse(self.cib.does_id_exist("R1-meta-rn"))
+        self.assertFalse(self.cib.does_id_exist("guest1"))
+        self.assertEqual(
+            [el.get("id") for el in self.cib.get_elements_by_tag("primitive")],
+            ["R2"],
+        )
+        self.assertNotIn('<primitive id="R1"', self.cib.to_string())
+
+    def test_invalidate(self):
+        self.cib.does_id_exist("R1")
+        etree.SubElement(
+            self.cib.get_section("configuration/resources"), "group", id="G1",
+        )
+        self.assertFalse(self.cib.does_id_exist("G1"))
+        self.cib.invalidate()
+        self.assertEqual(self.cib.get_group("G1").get("id"), "G1")
@@ -325,3 +325,106 @@ class FilterResourceFailcounts(TestCase):
             ),
             [self.fail_03, self.fail_07],
         )
+
+
+def _fixture_failure(
+    node, resource, operation, interval, fail_count, last_failure
+):
+    # pylint: disable=too-many-arguments
+    return {
+        "node": node,
+        "resource": resource,
+        "clone_id": None,
+        "operation": operation,
+        "interval": interval,
+        "fail_count": fail_count,
+        "last_failure": last_failure,
+    }
+
+
+class FilterResourcesFailcountsSince(TestCase):
+    def setUp(self):
+        self.fail_01 = _fixture_failure("nodeA", "resA", "start", "0", 1, 100)
+        self.fail_02 = _fixture_failure(
+            "nodeA", "resB", "monitor", "1000", 2, 200
+        )
+        self.fail_03 = _fixture_failure(
+            "nodeB", "resA", "monitor", "1000", 3, 300
+        )
+        self.failures = [self.fail_01, self.fail_02, self.fail_03]
+
+    def test_since(self):
+        self.assertEqual(
+            status.filter_resources_failcounts(self.failures, since=200),
+            [self.fail_02, self.fail_03],
+        )
+
+    def test_since_and_resource(self):
+        self.assertEqual(
+            status.filter_resources_failcounts(
+                self.failures, resource="resA", since=150
+            ),
+            [self.fail_03],
+        )
+
+    def test_since_no_match(self):
+        self.assertEqual(
+            status.filter_resources_failcounts(self.failures, since=301), []
+        )
+
+
+class GetFailcountsTotals(TestCase):
+    def setUp(self):
+        self.failures = [
+            _fixture_failure("nodeA", "resA", "start", "0", 1, 100),
+            _fixture_failure("nodeA", "resB", "monitor", "1000", 5, 200),
+            _fixture_failure("nodeB", "resA", "monitor", "1000", 3, 300),
+            _fixture_failure("nodeB", "resC", "start", "0", "INFINITY", 50),
+            _fixture_failure("nodeC", "resB", "start", "0", 2, 150),
+        ]
+
+    def test_no_failures(self):
+        self.assertEqual(status.get_failcounts_totals([], "resource"), [])
+
+    def test_per_resource(self):
+        self.assertEqual(
+            status.get_failcounts_totals(self.failures, "resource"),
+            [
+                {
+                    "resource": "resC",
+                    "fail_count": "INFINITY",
+                    "last_failure": 50,
+                },
+                {"resource": "resB", "fail_count": 7, "last_failure": 200},
+                {"resource": "resA", "fail_count": 4, "last_failure": 300},
+            ],
+        )
+
+    def test_per_node(self):
+        self.assertEqual(
+            status.get_failcounts_totals(self.failures, "node"),
+            [
+                {
+                    "node": "nodeB",
+                    "fail_count": "INFINITY",
+                    "last_failure": 300,
+                },
+                {"node": "nodeA", "fail_count": 6, "last_failure": 200},
+                {"node": "nodeC", "fail_count": 2, "last_failure": 150},
+            ],
+        )
+
+    def test_same_count_sorted_by_name(self):
+        self.assertEqual(
+            [
+                total["node"]
+                for total in status.get_failcounts_totals(
+                    [
+                        _fixture_failure("n2", "r", "start", "0", 1, 1),
+                        _fixture_failure("n1", "r", "start", "0", 1, 1),
+                    ],
+                    "node",
+                )
+            ],
+            ["n1", "n2"],
+        )
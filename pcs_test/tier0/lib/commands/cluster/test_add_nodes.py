@@ -446,16 +446,19 @@ class LocalConfig:
             ]
         )
 
-    def get_host_info(self, node_labels):
+    def get_host_info(self, node_labels, pcsd_capabilities=None):
+        output_data = dict(
+            services={
+                service: dict(installed=True, enabled=False, running=False)
+                for service in ("corosync", "pacemaker", "pcsd")
+            },
+            cluster_configuration_exists=False,
+        )
+        if pcsd_capabilities is not None:
+            output_data["pcsd_capabilities"] = pcsd_capabilities
         self.config.http.host.get_host_info(
             node_labels=node_labels,
-            output_data=dict(
-                services={
-                    service: dict(installed=True, enabled=False, running=False)
-                    for service in ("corosync", "pacemaker", "pcsd")
-                },
-                cluster_configuration_exists=False,
-            ),
+            output_data=output_data,
             name="local.get_host_info.http.host.get_host_info",
         )
 
@@ -696,7 +699,7 @@ class AddNodesSuccessMinimal(TestCase):
         self.new_nodes = ()
         self.expected_reports = []
 
-    def set_up(self, existing_nodes_num, new_nodes_num):
+    def set_up(self, existing_nodes_num, new_nodes_num, pcsd_capabilities=None):
         self.existing_nodes, self.new_nodes = generate_nodes(
             existing_nodes_num, new_nodes_num
         )
@@ -719,7 +722,9 @@ class AddNodesSuccessMinimal(TestCase):
             .http.host.check_auth(node_labels=self.existing_nodes)
             # SBD not installed
             .runner.systemctl.list_unit_files({}, name=get_unit_files_name)
-            .local.get_host_info(self.new_nodes)
+            .local.get_host_info(
+                self.new_nodes, pcsd_capabilities=pcsd_capabilities
+            )
             .local.pcsd_ssl_cert_sync_disabled()
             .http.host.update_known_hosts(
                 node_labels=self.new_nodes,
@@ -995,6 +1000,38 @@ class AddNodesSuccessMinimal(TestCase):
     def test_enable_start_1_existing_1_new(self):
         self._test_enable_start(1, 1)
 
+    def test_enable_start_batch(self):
+        self.set_up(2, 2, pcsd_capabilities=["pcs.request-batch"])
+        self.config.http.run_batch(
+            [("remote/cluster_enable", []), ("remote/cluster_start", [])],
+            node_labels=self.new_nodes,
+        )
+
+        cluster.add_nodes(
+            self.env_assist.get_env(),
+            [{"name": node} for node in self.new_nodes],
+            enable=True,
+            start=True,
+        )
+
+        self.env_assist.assert_reports(
+            self.expected_reports
+            + [
+                fixture.info(
+                    reports.codes.CLUSTER_ENABLE_STARTED,
+                    host_name_list=sorted(self.new_nodes),
+                ),
+                fixture.info(
+                    reports.codes.CLUSTER_START_STARTED,
+                    host_name_list=sorted(self.new_nodes),
+                ),
+            ]
+            + [
+                fixture.info(reports.codes.CLUSTER_ENABLE_SUCCESS, node=node)
+                for node in self.new_nodes
+            ]
+        )
+
     def test_enable_start_1_existing_2_new(self):
         self._test_enable_start(1, 2)
 
@@ -21,6 +21,7 @@ from pcs.common.ssl import (
     generate_cert,
     generate_key,
 )
+from pcs.lib import node_communication_format
 from pcs.lib.commands import cluster
 from pcs.lib.corosync import constants
 
@@ -3301,3 +3302,246 @@ class SetupLocal(TestCase):
                 fixture.error(reports.codes.COROSYNC_NODES_MISSING),
             ]
         )
+
+
+@mock.patch(
+    "pcs.lib.commands.cluster.generate_binary_key",
+    lambda random_bytes_count: RANDOM_KEY,
+)
+class SetupBatch(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+        self.config.env.set_known_nodes(NODE_LIST)
+        patch_getaddrinfo(self, NODE_LIST)
+        services_status = {
+            service: dict(
+                installed=True, enabled=False, running=False, version="1.0",
+            )
+            for service in SERVICE_LIST
+        }
+        auth_file_dict = {}
+        auth_file_dict.update(
+            node_communication_format.corosync_authkey_file(RANDOM_KEY)
+        )
+        auth_file_dict.update(
+            node_communication_format.pcmk_authkey_file(RANDOM_KEY)
+        )
+        self.prepare_action_list = [
+            ("remote/cluster_destroy", []),
+            (
+                "remote/known_hosts_change",
+                [
+                    (
+                        "data_json",
+                        json.dumps(
+                            dict(
+                                known_hosts_add={
+                                    node: dict(
+                                        dest_list=[
+                                            dict(
+                                                addr=node,
+                                                port=settings.pcsd_default_port,
+                                            )
+                                        ],
+                                        token=None,
+                                    )
+                                    for node in NODE_LIST
+                                },
+                                known_hosts_remove={},
+                            )
+                        ),
+                    )
+                ],
+            ),
+            (
+                "remote/remove_file",
+                [
+                    (
+                        "data_json",
+                        json.dumps(
+                            {"pcsd settings": {"type": "pcsd_settings"}}
+                        ),
+                    )
+                ],
+            ),
+            ("remote/put_file", [("data_json", json.dumps(auth_file_dict))]),
+        ]
+        self.prepare_result_list = [
+            (200, ""),
+            (200, ""),
+            (
+                200,
+                json.dumps(
+                    {
+                        "files": {
+                            "pcsd settings": dict(code="deleted", message="")
+                        }
+                    }
+                ),
+            ),
+            (
+                200,
+                json.dumps(
+                    {
+                        "files": {
+                            file_id: dict(code="written", message="")
+                            for file_id in auth_file_dict
+                        }
+                    }
+                ),
+            ),
+        ]
+        (
+            self.config.http.host.get_host_info(
+                node_labels=NODE_LIST,
+                output_data=dict(
+                    services=services_status,
+                    cluster_configuration_exists=False,
+                    pcsd_capabilities=["pcs.request-batch"],
+                ),
+            )
+            .fs.isfile(settings.pcsd_config, name="fs.isfile.pcsd_config")
+            .fs.open(
+                settings.pcsd_config,
+                mock.mock_open(
+                    read_data="PCSD_SSL_CERT_SYNC_ENABLED=false\n"
+                )(),
+                name="fs.open.pcsd_config",
+            )
+        )
+
+    def test_enable_start(self):
+        (
+            self.config.http.run_batch(
+                self.prepare_action_list,
+                node_labels=NODE_LIST,
+                result_list=self.prepare_result_list,
+                name="http.run_batch.prepare",
+            )
+            .http.files.put_files(
+                node_labels=NODE_LIST,
+                corosync_conf=corosync_conf_fixture(COROSYNC_NODE_LIST),
+                name="distribute_corosync_conf",
+            )
+            .http.run_batch(
+                [("remote/cluster_enable", []), ("remote/cluster_start", [])],
+                node_labels=NODE_LIST,
+                name="http.run_batch.enable_start",
+            )
+        )
+        cluster.setup(
+            self.env_assist.get_env(),
+            CLUSTER_NAME,
+            COMMAND_NODE_LIST,
+            enable=True,
+            start=True,
+        )
+        self.env_assist.assert_reports(
+            reports_success_minimal_fixture()
+            + [
+                fixture.info(
+                    reports.codes.CLUSTER_ENABLE_STARTED,
+                    host_name_list=sorted(NODE_LIST),
+                ),
+                fixture.info(
+                    reports.codes.CLUSTER_START_STARTED,
+                    host_name_list=sorted(NODE_LIST),
+                ),
+            ]
+            + [
+                fixture.info(reports.codes.CLUSTER_ENABLE_SUCCESS, node=node)
+                for node in NODE_LIST
+            ]
+        )
+
+    def test_enable_without_start(self):
+        (
+            self.config.http.run_batch(
+                self.prepare_action_list,
+                node_labels=NODE_LIST,
+                result_list=self.prepare_result_list,
+                name="http.run_batch.prepare",
+            )
+            .http.files.put_files(
+                node_labels=NODE_LIST,
+                corosync_conf=corosync_conf_fixture(COROSYNC_NODE_LIST),
+                name="distribute_corosync_conf",
+            )
+            .http.host.enable_cluster(NODE_LIST)
+        )
+        cluster.setup(
+            self.env_assist.get_env(),
+            CLUSTER_NAME,
+            COMMAND_NODE_LIST,
+            enable=True,
+        )
+        self.env_assist.assert_reports(
+            reports_success_minimal_fixture()
+            + [
+                fixture.info(
+                    reports.codes.CLUSTER_ENABLE_STARTED,
+                    host_name_list=sorted(NODE_LIST),
+                ),
+            ]
+            + [
+                fixture.info(reports.codes.CLUSTER_ENABLE_SUCCESS, node=node)
+                for node in NODE_LIST
+            ]
+        )
+
+    def test_failure_stops_the_batch(self):
+        self.config.http.run_batch(
+            self.prepare_action_list,
+            communication_list=[
+                dict(label=NODE_LIST[0]),
+                dict(
+                    label=NODE_LIST[1],
+                    output=json.dumps(
+                        dict(
+                            results=[
+                                dict(status_code=200, output=""),
+                                dict(status_code=400, output=REASON),
+                            ]
+                        )
+                    ),
+                ),
+                dict(label=NODE_LIST[2]),
+            ],
+            result_list=self.prepare_result_list,
+            name="http.run_batch.prepare",
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: cluster.setup(
+                self.env_assist.get_env(),
+                CLUSTER_NAME,
+                COMMAND_NODE_LIST,
+                enable=True,
+                start=True,
+            ),
+            [],
+        )
+        self.env_assist.assert_reports(
+            [
+                (severity, code, payload, forceable)
+                for severity, code, payload, forceable in (
+                    reports_success_minimal_fixture()[:-5]
+                )
+                # the node stops running the batch on the failure
+                if not (
+                    payload.get("node") == NODE_LIST[1]
+                    and code
+                    in (
+                        reports.codes.FILE_REMOVE_FROM_NODE_SUCCESS,
+                        reports.codes.FILE_DISTRIBUTION_SUCCESS,
+                    )
+                )
+            ]
+            + [
+                fixture.error(
+                    reports.codes.NODE_COMMUNICATION_COMMAND_UNSUCCESSFUL,
+                    node=NODE_LIST[1],
+                    command="remote/known_hosts_change",
+                    reason=REASON,
+                ),
+            ]
+        )
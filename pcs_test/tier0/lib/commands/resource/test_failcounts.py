@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import mock, TestCase
 
 from pcs_test.tools import fixture
 from pcs_test.tools.command_env import get_env_tools
@@ -14,9 +14,16 @@ class GetFailcounts(TestCase):
     @staticmethod
     def fixture_cib():
         return """
-        <cib>
             <status>
                 <node_state uname="node1">
+                    <lrm>
+                        <lrm_resources>
+                            <lrm_resource id="resource">
+                                <lrm_rsc_op id="resource_last_0"
+                                    operation="start" rc-code="1"/>
+                            </lrm_resource>
+                        </lrm_resources>
+                    </lrm>
                     <transient_attributes>
                         <instance_attributes>
                             <nvpair name="fail-count-resource#start_0"
@@ -37,7 +44,6 @@ class GetFailcounts(TestCase):
                     </transient_attributes>
                 </node_state>
             </status>
-        </cib>
         """
 
     def test_operation_requires_interval(self):
@@ -100,8 +106,18 @@ class GetFailcounts(TestCase):
             expected_in_processor=False,
         )
 
+    def test_load_error(self):
+        self.config.runner.cib.load_content(
+            "", returncode=1, stderr="an error", scope="status"
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.get_failcounts(self.env_assist.get_env()),
+            [fixture.error(report_codes.CIB_LOAD_ERROR, reason="an error"),],
+            expected_in_processor=False,
+        )
+
     def test_get_all(self):
-        self.config.runner.cib.load_content(self.fixture_cib())
+        self.config.runner.cib.load_content(self.fixture_cib(), scope="status")
         self.assertEqual(
             resource.get_failcounts(self.env_assist.get_env()),
             [
@@ -127,7 +143,7 @@ class GetFailcounts(TestCase):
         )
 
     def test_filter_node(self):
-        self.config.runner.cib.load_content(self.fixture_cib())
+        self.config.runner.cib.load_content(self.fixture_cib(), scope="status")
         self.assertEqual(
             resource.get_failcounts(self.env_assist.get_env(), node="node2"),
             [
@@ -144,7 +160,7 @@ class GetFailcounts(TestCase):
         )
 
     def test_filter_interval(self):
-        self.config.runner.cib.load_content(self.fixture_cib())
+        self.config.runner.cib.load_content(self.fixture_cib(), scope="status")
         self.assertEqual(
             resource.get_failcounts(
                 self.env_assist.get_env(), operation="monitor", interval="5"
@@ -161,3 +177,155 @@ class GetFailcounts(TestCase):
                 },
             ],
         )
+
+
+class GetFailcountsSummary(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+
+    def test_validation(self):
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.get_failcounts_summary(
+                self.env_assist.get_env(),
+                interval="1000",
+                within="recently",
+                top="0",
+            ),
+            [
+                fixture.error(
+                    report_codes.PREREQUISITE_OPTION_IS_MISSING,
+                    option_name="interval",
+                    option_type=None,
+                    prerequisite_name="operation",
+                    prerequisite_type=None,
+                ),
+                fixture.error(
+                    report_codes.INVALID_OPTION_VALUE,
+                    option_name="within",
+                    option_value="recently",
+                    allowed_values="time interval (e.g. 1, 2s, 3m, 4h, ...)",
+                    cannot_be_empty=False,
+                    forbidden_characters=None,
+                ),
+                fixture.error(
+                    report_codes.INVALID_OPTION_VALUE,
+                    option_name="top",
+                    option_value="0",
+                    allowed_values="a positive integer",
+                    cannot_be_empty=False,
+                    forbidden_characters=None,
+                ),
+            ],
+            expected_in_processor=False,
+        )
+
+    def test_summary(self):
+        self.config.runner.cib.load_content(
+            GetFailcounts.fixture_cib(), scope="status"
+        )
+        self.assertEqual(
+            resource.get_failcounts_summary(self.env_assist.get_env()),
+            {
+                "resources": [
+                    {
+                        "resource": "resource",
+                        "fail_count": "INFINITY",
+                        "last_failure": 1528871946,
+                    },
+                ],
+                "nodes": [
+                    {
+                        "node": "node1",
+                        "fail_count": "INFINITY",
+                        "last_failure": 1528871936,
+                    },
+                    {
+                        "node": "node2",
+                        "fail_count": 10,
+                        "last_failure": 1528871946,
+                    },
+                ],
+            },
+        )
+
+    def test_filter_operation(self):
+        self.config.runner.cib.load_content(
+            GetFailcounts.fixture_cib(), scope="status"
+        )
+        self.assertEqual(
+            resource.get_failcounts_summary(
+                self.env_assist.get_env(), operation="monitor", interval="5s"
+            ),
+            {
+                "resources": [
+                    {
+                        "resource": "resource",
+                        "fail_count": 10,
+                        "last_failure": 1528871946,
+                    },
+                ],
+                "nodes": [
+                    {
+                        "node": "node2",
+                        "fail_count": 10,
+                        "last_failure": 1528871946,
+                    },
+                ],
+            },
+        )
+
+    @mock.patch(
+        "pcs.lib.commands.resource.time.time", lambda: 1528871946 + 3600
+    )
+    def test_within(self):
+        self.config.runner.cib.load_content(
+            GetFailcounts.fixture_cib(), scope="status"
+        )
+        self.assertEqual(
+            resource.get_failcounts_summary(
+                self.env_assist.get_env(), within="3605"
+            ),
+            {
+                "resources": [
+                    {
+                        "resource": "resource",
+                        "fail_count": 10,
+                        "last_failure": 1528871946,
+                    },
+                ],
+                "nodes": [
+                    {
+                        "node": "node2",
+                        "fail_count": 10,
+                        "last_failure": 1528871946,
+                    },
+                ],
+            },
+        )
+
+    def test_top(self):
+        self.config.runner.cib.load_content(
+            """
+            <status>
+                <node_state uname="node1">
+                    <transient_attributes>
+                        <instance_attributes>
+                            <nvpair name="fail-count-R1#start_0" value="1"/>
+                            <nvpair name="fail-count-R2#start_0" value="3"/>
+                            <nvpair name="fail-count-R3#start_0" value="2"/>
+                        </instance_attributes>
+                    </transient_attributes>
+                </node_state>
+            </status>
+            """,
+            scope="status",
+        )
+        self.assertEqual(
+            resource.get_failcounts_summary(self.env_assist.get_env(), top="2")[
+                "resources"
+            ],
+            [
+                {"resource": "R2", "fail_count": 3, "last_failure": 0},
+                {"resource": "R3", "fail_count": 2, "last_failure": 0},
+            ],
+        )
@@ -1,5 +1,6 @@
 # pylint: disable=too-many-lines
 # pylint: disable=line-too-long
+from functools import partial
 from unittest import mock, TestCase
 
 from pcs_test.tier0.lib.commands.tag.tag_common import fixture_tags_xml
@@ -16,6 +17,7 @@ from pcs.common.reports import ReportItemSeverity as severities
 from pcs.common.reports import codes as report_codes
 from pcs.lib.commands import resource
 from pcs.lib.errors import LibraryError
+from pcs.lib.pacemaker.live import wait_for_cluster_state
 
 
 TIMEOUT = 10
@@ -1086,6 +1088,167 @@ class Wait(TestCase):
         )
 
 
+@mock.patch.object(settings, "crm_mon_schema", rc("crm_mon_rng/crm_mon.rng"))
+@mock.patch.object(settings, "cluster_state_poll_interval_min", 0)
+class WaitTargeted(TestCase):
+    fixture_status_running = Wait.fixture_status_running
+    fixture_status_stopped = Wait.fixture_status_stopped
+    fixture_status_failed = """
+        <resources>
+            <resource id="A" managed="true" role="Stopped" failed="true">
+            </resource>
+            <resource id="B" managed="true" role="Stopped">
+            </resource>
+        </resources>
+    """
+
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+        self.config.env.set_wait_targeted(True)
+
+    def test_enable_resource_started(self):
+        (
+            self.config.runner.cib.load(
+                resources=fixture_two_primitives_cib_disabled_both
+            )
+            .runner.pcmk.load_state(resources=self.fixture_status_stopped)
+            .env.push_cib(
+                resources=fixture_two_primitives_cib_enabled_with_meta_both,
+            )
+            .runner.pcmk.load_state(
+                name="poll.1", resources=self.fixture_status_stopped,
+            )
+            .runner.pcmk.load_state(
+                name="poll.2", resources=self.fixture_status_running,
+            )
+        )
+
+        resource.enable(self.env_assist.get_env(), ["A", "B"], TIMEOUT)
+
+        self.env_assist.assert_reports(
+            [
+                fixture.report_resource_running("A", {"Started": ["node1"]}),
+                fixture.report_resource_running("B", {"Started": ["node2"]}),
+            ]
+        )
+
+    def test_disable_resource_stopped(self):
+        (
+            self.config.runner.cib.load(
+                resources=fixture_two_primitives_cib_enabled
+            )
+            .runner.pcmk.load_state(resources=self.fixture_status_running)
+            .env.push_cib(resources=fixture_two_primitives_cib_disabled_both)
+            .runner.pcmk.load_state(
+                name="poll.1", resources=self.fixture_status_stopped,
+            )
+        )
+
+        resource.disable(self.env_assist.get_env(), ["A", "B"], TIMEOUT)
+
+        self.env_assist.assert_reports(
+            [
+                fixture.report_resource_not_running("A"),
+                fixture.report_resource_not_running("B"),
+            ]
+        )
+
+    def test_enable_resource_failed(self):
+        (
+            self.config.runner.cib.load(
+                resources=fixture_two_primitives_cib_disabled_both
+            )
+            .runner.pcmk.load_state(resources=self.fixture_status_stopped)
+            .env.push_cib(
+                resources=fixture_two_primitives_cib_enabled_with_meta_both,
+            )
+            .runner.pcmk.load_state(
+                name="poll.1", resources=self.fixture_status_failed,
+            )
+            .runner.pcmk.wait(timeout=TIMEOUT)
+            .runner.pcmk.load_state(
+                name="state.after_idle", resources=self.fixture_status_stopped,
+            )
+        )
+
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.enable(
+                self.env_assist.get_env(), ["A", "B"], TIMEOUT
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.report_resource_not_running("A", severities.ERROR),
+                fixture.report_resource_not_running("B", severities.ERROR),
+            ]
+        )
+
+    def test_enable_timeout(self):
+        (
+            self.config.runner.cib.load(
+                resources=fixture_two_primitives_cib_disabled_both
+            )
+            .runner.pcmk.load_state(resources=self.fixture_status_stopped)
+            .env.push_cib(
+                resources=fixture_two_primitives_cib_enabled_with_meta_both,
+            )
+            .runner.pcmk.load_state(
+                name="poll.1", resources=self.fixture_status_stopped,
+            )
+            .runner.pcmk.load_state(
+                name="poll.2", resources=self.fixture_status_stopped,
+            )
+        )
+
+        with mock.patch(
+            "pcs.lib.commands.resource.wait_for_cluster_state",
+            partial(
+                wait_for_cluster_state,
+                get_time=mock.Mock(side_effect=[0, TIMEOUT - 1, TIMEOUT + 1]),
+                sleep=mock.Mock(),
+            ),
+        ):
+            self.env_assist.assert_raise_library_error(
+                lambda: resource.enable(
+                    self.env_assist.get_env(), ["A", "B"], TIMEOUT
+                )
+            )
+        self.env_assist.assert_reports(
+            [
+                fixture.report_resource_not_running("A", severities.ERROR),
+                fixture.report_resource_not_running("B", severities.ERROR),
+                fixture.report_wait_for_idle_timed_out(
+                    "Resource(s) not in the expected state: 'A', 'B'"
+                ),
+            ]
+        )
+
+    def test_not_targeted_by_default(self):
+        self.config.env.set_wait_targeted(False)
+        (
+            self.config.runner.cib.load(
+                resources=fixture_two_primitives_cib_enabled
+            )
+            .runner.pcmk.load_state(resources=self.fixture_status_running)
+            .env.push_cib(
+                resources=fixture_two_primitives_cib_disabled_both,
+                wait=TIMEOUT,
+            )
+            .runner.pcmk.load_state(
+                name="state.after_idle", resources=self.fixture_status_stopped,
+            )
+        )
+
+        resource.disable(self.env_assist.get_env(), ["A", "B"], TIMEOUT)
+
+        self.env_assist.assert_reports(
+            [
+                fixture.report_resource_not_running("A"),
+                fixture.report_resource_not_running("B"),
+            ]
+        )
+
+
 @mock.patch.object(settings, "crm_mon_schema", rc("crm_mon_rng/crm_mon.rng"))
 class WaitClone(TestCase):
     fixture_status_running = """
@@ -2224,6 +2387,125 @@ class DisableSimulate(DisableSafeFixturesMixin, TestCase):
         )
 
 
+@mock.patch("pcs.lib.pacemaker.live.write_tmpfile")
+@mock.patch.object(settings, "crm_mon_schema", rc("crm_mon_rng/crm_mon.rng"))
+@mock.patch.object(settings, "simulate_max_workers", 1)
+class DisableSimulateBatch(DisableSafeFixturesMixin, TestCase):
+    @staticmethod
+    def fixture_tmpfile(name, content):
+        tmpfile = mock.MagicMock()
+        tmpfile.name = rc(name)
+        tmpfile.read.return_value = content
+        return tmpfile
+
+    def test_not_live(self, mock_write_tmpfile):
+        mock_write_tmpfile.side_effect = [
+            AssertionError("No other write_tmpfile call expected")
+        ]
+        self.config.env.set_cib_data("<cib />")
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.disable_simulate_batch(
+                self.env_assist.get_env(), [["A"]], True
+            ),
+            [
+                fixture.error(
+                    report_codes.LIVE_ENVIRONMENT_REQUIRED,
+                    forbidden_options=["CIB"],
+                ),
+            ],
+            expected_in_processor=False,
+        )
+
+    def test_nonexistent_resource(self, mock_write_tmpfile):
+        mock_write_tmpfile.side_effect = [
+            AssertionError("No other write_tmpfile call expected")
+        ]
+        self.config.runner.cib.load(
+            resources=fixture_two_primitives_cib_enabled
+        )
+        self.config.runner.pcmk.load_state(
+            resources=fixture_two_primitives_status_managed
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.disable_simulate_batch(
+                self.env_assist.get_env(), [["A"], ["X"], ["Y"]], True
+            ),
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.report_not_resource_or_tag("X"),
+                fixture.report_not_resource_or_tag("Y"),
+            ],
+        )
+
+    def test_success(self, mock_write_tmpfile):
+        tmpfile_list = [
+            self.fixture_tmpfile("new_cib_A.tmp", "<new-cib/>"),
+            self.fixture_tmpfile(
+                "transitions_A.tmp", self.fixture_transitions_one_migrated
+            ),
+            self.fixture_tmpfile("new_cib_B.tmp", "<new-cib/>"),
+            self.fixture_tmpfile(
+                "transitions_B.tmp", self.fixture_transitions_both_stopped
+            ),
+        ]
+        mock_write_tmpfile.side_effect = tmpfile_list + [
+            AssertionError("No other write_tmpfile call expected"),
+        ]
+        (
+            self.config.runner.cib.load(
+                resources=fixture_two_primitives_cib_enabled
+            )
+            .runner.pcmk.load_state(
+                resources=fixture_two_primitives_status_managed
+            )
+            .runner.pcmk.simulate_cib(
+                tmpfile_list[0].name,
+                tmpfile_list[1].name,
+                stdout="simulate output A",
+                resources=fixture_two_primitives_cib_disabled,
+                name="runner.pcmk.simulate_cib.A",
+            )
+            .runner.pcmk.simulate_cib(
+                tmpfile_list[2].name,
+                tmpfile_list[3].name,
+                stdout="simulate output B",
+                resources=get_fixture_two_primitives_cib(
+                    primitive2_disabled=True
+                ),
+                name="runner.pcmk.simulate_cib.B",
+            )
+        )
+
+        # the same scenario is simulated only once
+        result = resource.disable_simulate_batch(
+            self.env_assist.get_env(), [["A"], ["B"], ["A"]], False
+        )
+        result_a = dict(
+            disabled_resource_list=["A"],
+            plaintext_simulated_status="simulate output A",
+            other_affected_resource_list=[],
+            stopped_resource_list=[],
+            demoted_resource_list=[],
+            moved_resource_list=["B"],
+        )
+        self.assertEqual(
+            result,
+            [
+                result_a,
+                dict(
+                    disabled_resource_list=["B"],
+                    plaintext_simulated_status="simulate output B",
+                    other_affected_resource_list=["A"],
+                    stopped_resource_list=["A"],
+                    demoted_resource_list=[],
+                    moved_resource_list=[],
+                ),
+                result_a,
+            ],
+        )
+
+
 class DisableSafeMixin(DisableSafeFixturesMixin):
     def test_not_live(self, mock_write_tmpfile):
         mock_write_tmpfile.side_effect = [
@@ -30,6 +30,12 @@ resources_promotable = """
 """
 
 
+def _prepare_state(state):
+    return etree_to_str(
+        fixture.complete_state_resources(etree.fromstring(state))
+    )
+
+
 def _action_kwargs(kwargs):
     defaulted = dict(
         resource="A",
@@ -478,21 +484,15 @@ class MoveBanWaitMixin:
             ]
         )
 
-    @staticmethod
-    def _prepare_state(state):
-        return etree_to_str(
-            fixture.complete_state_resources(etree.fromstring(state))
-        )
-
     def success_config(self, state_before, state_after, action_node=None):
         self.config.runner.pcmk.load_state(
-            resources=self._prepare_state(state_before)
+            resources=_prepare_state(state_before)
         )
         self.config_pcmk_action(node=action_node)
         self.config.runner.pcmk.wait(timeout=10)
         self.config.runner.pcmk.load_state(
             name="runner.pcmk.load_state.after",
-            resources=self._prepare_state(state_after),
+            resources=_prepare_state(state_after),
         )
 
 
@@ -543,6 +543,44 @@ class MoveWait(MoveMixin, MoveBanWaitMixin, TestCase):
         )
 
 
+@mock.patch.object(settings, "crm_mon_schema", rc("crm_mon_rng/crm_mon.rng"))
+@mock.patch.object(settings, "cluster_state_poll_interval_min", 0)
+class MoveWaitTargeted(MoveMixin, TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+        self.config.env.set_wait_targeted(True)
+        self.config.runner.cib.load(resources=resources_primitive)
+
+    def test_running_on_specified_node(self):
+        self.config.runner.pcmk.load_state(
+            resources=_prepare_state(MoveBanWaitMixin.state_running_node1)
+        )
+        self.config_pcmk_action(node="node2")
+        for index, state in enumerate(
+            [
+                MoveBanWaitMixin.state_running_node1,
+                MoveBanWaitMixin.state_not_running,
+                MoveBanWaitMixin.state_running_node2,
+            ]
+        ):
+            self.config.runner.pcmk.load_state(
+                name=f"runner.pcmk.load_state.poll.{index}",
+                resources=_prepare_state(state),
+            )
+        self.lib_action(self.env_assist.get_env(), "A", node="node2", wait="10")
+        self.env_assist.assert_reports(
+            [
+                fixture.info(
+                    self.report_code_pcmk_success,
+                    resource_id="A",
+                    stdout="pcmk std out",
+                    stderr="pcmk std err",
+                ),
+                fixture.report_resource_running("A", {"Started": ["node2"]},),
+            ]
+        )
+
+
 @mock.patch.object(settings, "crm_mon_schema", rc("crm_mon_rng/crm_mon.rng"))
 class BanWait(BanMixin, MoveBanWaitMixin, TestCase):
     def test_running_on_specified_node(self):
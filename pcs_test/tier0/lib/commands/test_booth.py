@@ -1,5 +1,6 @@
 # pylint: disable=too-many-lines
 import os
+from tempfile import TemporaryDirectory
 from textwrap import dedent
 from unittest import mock, TestCase
 
@@ -3438,3 +3439,226 @@ class GetStatus(TestCase):
             ],
             expected_in_processor=False,
         )
+
+
+DAEMON_STATUS_STARTED = (
+    "booth_lockfile='/var/run/booth/booth.pid' booth_lockpid=1234 "
+    "booth_addr_string='10.0.0.1' booth_type=site booth_state=started"
+)
+
+
+def fixture_instance_status(
+    instance_name,
+    host_name=None,
+    status_successfully_obtained=True,
+    daemon_running=True,
+    ticket_list=None,
+):
+    return {
+        "instance_name": instance_name,
+        "host_name": host_name,
+        "status_successfully_obtained": status_successfully_obtained,
+        "daemon_running": daemon_running,
+        "daemon_type": "site" if daemon_running else None,
+        "address": "10.0.0.1" if daemon_running else None,
+        "ticket_list": (
+            ticket_list
+            if ticket_list is not None
+            else (
+                [
+                    {
+                        "ticket": "T1",
+                        "leader": "10.0.0.1",
+                        "expires": "2021-03-05 12:27:09",
+                        "commit": None,
+                    }
+                ]
+                if daemon_running and status_successfully_obtained
+                else []
+            )
+        ),
+        "peers_plaintext": (
+            "peers" if daemon_running and status_successfully_obtained else ""
+        ),
+    }
+
+
+@mock.patch.object(settings, "booth_status_max_workers", 1)
+class GetStatusAll(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache_path = os.path.join(self.tmp_dir.name, "booth-status")
+        for patcher in (
+            mock.patch.object(
+                settings, "booth_status_cache_location", self.cache_path
+            ),
+            mock.patch(
+                "pcs.lib.booth.config_files.get_all_configs_file_names",
+                lambda: ["booth2.conf", "booth1.conf"],
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def fixture_running(self, instance_name):
+        (
+            self.config.runner.booth.status_daemon(
+                instance_name,
+                stdout=DAEMON_STATUS_STARTED,
+                name=f"status_daemon.{instance_name}",
+            )
+            .runner.booth.status_tickets(
+                instance_name,
+                stdout=(
+                    "ticket: T1, leader: 10.0.0.1, "
+                    "expires: 2021-03-05 12:27:09\n"
+                ),
+                name=f"status_tickets.{instance_name}",
+            )
+            .runner.booth.status_peers(
+                instance_name,
+                stdout="peers",
+                name=f"status_peers.{instance_name}",
+            )
+        )
+
+    def test_not_live(self):
+        self.config.env.set_cib_data("<cib/>")
+        self.env_assist.assert_raise_library_error(
+            lambda: commands.get_status_all(self.env_assist.get_env()),
+            [
+                fixture.error(
+                    reports.codes.LIVE_ENVIRONMENT_REQUIRED,
+                    forbidden_options=[file_type_codes.CIB],
+                ),
+            ],
+            expected_in_processor=False,
+        )
+
+    def test_success(self):
+        self.fixture_running("booth1")
+        self.config.runner.booth.status_daemon(
+            "booth2", stdout="", returncode=7
+        )
+        self.assertEqual(
+            commands.get_status_all(self.env_assist.get_env()),
+            [
+                fixture_instance_status("booth1"),
+                fixture_instance_status("booth2", daemon_running=False),
+            ],
+        )
+
+    def test_cached(self):
+        self.fixture_running("booth1")
+        self.fixture_running("booth2")
+        env = self.env_assist.get_env()
+        self.assertEqual(
+            commands.get_status_all(env),
+            [
+                fixture_instance_status("booth1"),
+                fixture_instance_status("booth2"),
+            ],
+        )
+        # no more booth processes are run
+        self.assertEqual(
+            commands.get_status_all(env),
+            [
+                fixture_instance_status("booth1"),
+                fixture_instance_status("booth2"),
+            ],
+        )
+
+    @mock.patch.object(settings, "booth_status_cache_max_age", 0)
+    def test_cache_disabled(self):
+        self.fixture_running("booth1")
+        self.fixture_running("booth2")
+        commands.get_status_all(self.env_assist.get_env())
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_instance_failure(self):
+        self.config.runner.booth.status_daemon(
+            "booth1", stdout="some output", stderr="some error", returncode=1,
+        )
+        self.fixture_running("booth2")
+        self.config.runner.booth.status_daemon(
+            "booth1", stdout="", returncode=7, name="status_daemon.again"
+        )
+        env = self.env_assist.get_env()
+        self.assertEqual(
+            commands.get_status_all(env),
+            [
+                fixture_instance_status(
+                    "booth1",
+                    status_successfully_obtained=False,
+                    daemon_running=False,
+                ),
+                fixture_instance_status("booth2"),
+            ],
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.warn(
+                    reports.codes.BOOTH_DAEMON_STATUS_ERROR,
+                    reason="some error\nsome output",
+                ),
+            ]
+        )
+        # failures are not cached
+        self.assertEqual(
+            commands.get_status_all(env),
+            [
+                fixture_instance_status("booth1", daemon_running=False),
+                fixture_instance_status("booth2"),
+            ],
+        )
+
+    def test_remote_hosts(self):
+        self.config.env.set_known_nodes(["arbitrator1", "arbitrator2"])
+        self.fixture_running("booth1")
+        self.fixture_running("booth2")
+        self.config.http.booth.get_status_all(
+            status_list=[fixture_instance_status("booth")],
+            communication_list=[
+                dict(label="arbitrator1"),
+                dict(
+                    label="arbitrator2", response_code=400, output="an error",
+                ),
+            ],
+        )
+        self.assertEqual(
+            commands.get_status_all(
+                self.env_assist.get_env(),
+                host_list=["arbitrator1", "arbitrator2"],
+            ),
+            [
+                fixture_instance_status("booth1"),
+                fixture_instance_status("booth2"),
+                fixture_instance_status("booth", host_name="arbitrator1"),
+            ],
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.warn(
+                    reports.codes.NODE_COMMUNICATION_COMMAND_UNSUCCESSFUL,
+                    node="arbitrator2",
+                    command="remote/booth_get_status_all",
+                    reason="an error",
+                ),
+            ]
+        )
+
+    def test_unknown_host(self):
+        self.env_assist.assert_raise_library_error(
+            lambda: commands.get_status_all(
+                self.env_assist.get_env(), host_list=["arbitrator1"],
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    reports.codes.HOST_NOT_FOUND, host_list=["arbitrator1"],
+                ),
+            ]
+        )
@@ -4,7 +4,9 @@ from unittest import mock, TestCase
 from functools import partial
 from lxml import etree
 
+from pcs_test.tools import fixture
 from pcs_test.tools.assertions import assert_raise_library_error
+from pcs_test.tools.command_env import get_env_tools
 from pcs_test.tools.custom_mock import MockLibraryReportProcessor
 from pcs_test.tools.misc import create_patcher
 
@@ -290,3 +292,132 @@ class CibRunnerNodes(TestCase):
 
         self.assertRaises(LibraryError, run)
         push_cib.assert_not_called()
+
+
+class UpdateNodesAttrs(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+        self.config.runner.pcmk.load_state(
+            nodes=[
+                dict(id="1", name="node1"),
+                dict(id="2", name="node2"),
+                dict(id="3", name="remote1", type="remote"),
+            ]
+        )
+
+    def test_success(self):
+        self.config.runner.cib.load(
+            replace={
+                "./configuration/nodes": """
+                    <nodes>
+                        <node id="1" uname="node1">
+                            <instance_attributes id="nodes-1">
+                                <nvpair id="nodes-1-rack" name="rack"
+                                    value="r0"
+                                />
+                            </instance_attributes>
+                        </node>
+                    </nodes>
+                """
+            }
+        )
+        self.config.env.push_cib(
+            replace={
+                "./configuration/nodes": """
+                    <nodes>
+                        <node id="1" uname="node1">
+                            <instance_attributes id="nodes-1">
+                                <nvpair id="nodes-1-rack" name="rack"
+                                    value="r1"
+                                />
+                            </instance_attributes>
+                            <utilization id="nodes-1-utilization">
+                                <nvpair id="nodes-1-utilization-cpu"
+                                    name="cpu" value="4"
+                                />
+                            </utilization>
+                        </node>
+                        <node id="2" uname="node2" type="member">
+                            <instance_attributes id="nodes-2">
+                                <nvpair id="nodes-2-rack" name="rack"
+                                    value="r2"
+                                />
+                            </instance_attributes>
+                        </node>
+                    </nodes>
+                """
+            }
+        )
+        lib.update_nodes_attrs(
+            self.env_assist.get_env(),
+            {"node1": {"rack": "r1"}, "node2": {"rack": "r2"}},
+            node_utilization={"node1": {"cpu": "4"}, "remote1": {"cpu": ""}},
+        )
+
+    def test_errors(self):
+        self.config.runner.cib.load()
+        self.env_assist.assert_raise_library_error(
+            lambda: lib.update_nodes_attrs(
+                self.env_assist.get_env(),
+                {"node1": {"rack": "r1"}, "nodeX": {"rack": "r2"}},
+                node_utilization={"node2": {"cpu": "many", "ram": ""}},
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    report_codes.NODE_NOT_FOUND, node="nodeX", searched_types=[]
+                ),
+                fixture.error(
+                    report_codes.INVALID_OPTION_VALUE,
+                    option_name="cpu",
+                    option_value="many",
+                    allowed_values="an integer",
+                    cannot_be_empty=False,
+                    forbidden_characters=None,
+                ),
+            ]
+        )
+
+    def test_remove_missing_attribute(self):
+        self.config.runner.cib.load()
+        self.env_assist.assert_raise_library_error(
+            lambda: lib.update_nodes_attrs(
+                self.env_assist.get_env(),
+                {"node1": {"rack": "", "room": "1"}, "node2": {"rack": ""}},
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    report_codes.NODE_ATTRIBUTE_NOT_FOUND,
+                    force_code=report_codes.FORCE,
+                    node=node,
+                    attribute="rack",
+                )
+                for node in ("node1", "node2")
+            ]
+        )
+
+    def test_remove_missing_attribute_forced(self):
+        self.config.runner.cib.load()
+        self.config.env.push_cib(
+            replace={
+                "./configuration/nodes": """
+                    <nodes>
+                        <node id="1" uname="node1" type="member">
+                            <instance_attributes id="nodes-1">
+                                <nvpair id="nodes-1-room" name="room"
+                                    value="1"
+                                />
+                            </instance_attributes>
+                        </node>
+                    </nodes>
+                """
+            }
+        )
+        lib.update_nodes_attrs(
+            self.env_assist.get_env(),
+            {"node1": {"rack": "", "room": "1"}, "node2": {"rack": ""}},
+            force_flags=[report_codes.FORCE],
+        )
@@ -249,6 +249,30 @@ class FullClusterStatusPlaintext(TestCase):
             ),
         )
 
+    def test_success_live_slow_sources_cached(self):
+        self._fixture_config_live_minimal()
+        self.config.remove("runner.systemctl.is_active.sbd")
+        cache = status.StatusSourceCache(30, get_time=lambda: 100)
+        cache.get("sbd_running", lambda: False)
+        cache.get(
+            "local_services",
+            # pylint: disable=protected-access
+            lambda: [status._ServiceStatus("corosync", True, False, True)],
+        )
+        self.assertEqual(
+            status.full_cluster_status_plaintext(
+                self.env_assist.get_env(), slow_sources_cache=cache
+            ),
+            dedent(
+                """\
+                Cluster name: test99
+                crm_mon cluster status
+
+                Daemon Status:
+                  corosync: active/disabled"""
+            ),
+        )
+
     def test_success_live_verbose(self):
         (
             self.config.env.set_known_nodes(self.node_name_list)
@@ -794,3 +818,68 @@ class FullClusterStatusPlaintext(TestCase):
                   pcsd: inactive/disabled"""
             ),
         )
+
+
+class StatusSourceCache(TestCase):
+    def setUp(self):
+        self.now = 100
+        self.cache = status.StatusSourceCache(30, get_time=lambda: self.now)
+        self.load_count = 0
+
+    def load(self):
+        self.load_count += 1
+        return self.load_count
+
+    def test_reuse_until_expired(self):
+        self.assertEqual(self.cache.get("a", self.load), 1)
+        self.now = 129
+        self.assertEqual(self.cache.get("a", self.load), 1)
+        self.now = 130
+        self.assertEqual(self.cache.get("a", self.load), 2)
+
+    def test_names_independent(self):
+        self.assertEqual(self.cache.get("a", self.load), 1)
+        self.assertEqual(self.cache.get("b", self.load), 2)
+        self.assertEqual(self.cache.get("a", self.load), 1)
+
+
+class ClusterStatusStructured(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+
+    def test_success(self):
+        self.config.runner.pcmk.load_state(
+            resources="""
+                <resources>
+                    <resource id="R1">
+                        <node name="node1" id="1" cached="false"/>
+                    </resource>
+                </resources>
+            """,
+            nodes=[fixture.state_node("1", "node1")],
+        )
+        result = status.cluster_status_structured(self.env_assist.get_env())
+        self.assertEqual(["node1"], [node["name"] for node in result["nodes"]])
+        self.assertTrue(result["nodes"][0]["online"])
+        self.assertEqual(
+            [("R1", ["node1"])],
+            [
+                (resource["id"], [node["name"] for node in resource["nodes"]])
+                for resource in result["resources"]
+            ],
+        )
+
+    def test_crm_mon_error(self):
+        self.config.runner.pcmk.load_state(
+            stdout="crm_mon output", stderr="crm_mon error", returncode=1
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: status.cluster_status_structured(self.env_assist.get_env()),
+            [
+                fixture.error(
+                    report_codes.CRM_MON_ERROR,
+                    reason="crm_mon error\ncrm_mon output",
+                )
+            ],
+            expected_in_processor=False,
+        )
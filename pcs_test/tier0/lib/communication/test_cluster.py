@@ -1,5 +1,20 @@
 from unittest import TestCase
 
+from pcs_test.tools import fixture
+from pcs_test.tools.custom_mock import (
+    MockCurlSimple,
+    MockLibraryReportProcessor,
+)
+
+from pcs.common import pcs_pycurl as pycurl
+from pcs.common import reports
+from pcs.common.node_communicator import (
+    RequestTarget,
+    Response,
+)
+from pcs.lib.communication.cluster import RestoreConfig
+from pcs.lib.communication.tools import run
+
 
 class Destroy(TestCase):
     """
@@ -29,3 +44,81 @@ class GetQuorumStatus(TestCase):
         pcs_test.tier0.lib.commands.cluster.test_remove_nodes.QuorumCheck
         pcs_test.tier0.lib.commands.cluster.test_remove_nodes.FailureQuorumLoss
     """
+
+
+class Communicator:
+    """
+    Runs requests one at a time, responds with a configured status code
+    """
+
+    def __init__(self, status_code_map):
+        self.queue = []
+        self.status_code_map = status_code_map
+
+    def add_requests(self, request_list):
+        self.queue.extend(request_list)
+
+    def start_loop(self):
+        while self.queue:
+            request = self.queue.pop(0)
+            status_code = self.status_code_map[request.target.label]
+            yield Response.connection_successful(
+                MockCurlSimple(
+                    info={pycurl.RESPONSE_CODE: status_code},
+                    output=(
+                        b"Succeeded\n" if status_code == 200 else b"an error"
+                    ),
+                    request=request,
+                )
+            )
+
+
+class RestoreConfigTest(TestCase):
+    def setUp(self):
+        self.report_processor = MockLibraryReportProcessor()
+        self.cmd = RestoreConfig(self.report_processor, b"tarball")
+        self.cmd.set_targets([RequestTarget("node1"), RequestTarget("node2")])
+
+    def test_success(self):
+        run(Communicator({"node1": 200, "node2": 200}), self.cmd)
+        self.assertFalse(self.cmd.has_errors)
+        self.report_processor.assert_reports(
+            [
+                fixture.info(
+                    reports.codes.CONFIG_RESTORE_NODE_FINISHED,
+                    node=node,
+                    node_result="Succeeded",
+                    finished_count=count,
+                    node_count=2,
+                )
+                for count, node in enumerate(["node1", "node2"], 1)
+            ]
+        )
+
+    def test_failure(self):
+        run(Communicator({"node1": 400, "node2": 200}), self.cmd)
+        self.assertTrue(self.cmd.has_errors)
+        self.report_processor.assert_reports(
+            [
+                fixture.info(
+                    reports.codes.CONFIG_RESTORE_NODE_FINISHED,
+                    node="node1",
+                    node_result=None,
+                    finished_count=1,
+                    node_count=2,
+                ),
+                fixture.error(
+                    reports.codes.NODE_COMMUNICATION_COMMAND_UNSUCCESSFUL,
+                    node="node1",
+                    command="remote/config_restore",
+                    reason="an error",
+                ),
+                fixture.info(
+                    reports.codes.CONFIG_RESTORE_NODE_FINISHED,
+                    node="node2",
+                    node_result="Succeeded",
+                    finished_count=2,
+                    node_count=2,
+                ),
+            ]
+        )
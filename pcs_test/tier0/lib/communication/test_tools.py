@@ -0,0 +1,230 @@
+import json
+from unittest import TestCase
+from urllib.parse import parse_qs
+
+from pcs_test.tools import fixture
+from pcs_test.tools.custom_mock import (
+    MockCurlSimple,
+    MockLibraryReportProcessor,
+)
+
+from pcs.common import pcs_pycurl as pycurl
+from pcs.common import reports
+from pcs.common.node_communicator import (
+    RequestData,
+    RequestTarget,
+    Response,
+)
+from pcs.lib.communication.nodes import (
+    EnableCluster,
+    StartCluster,
+)
+from pcs.lib.communication.tools import (
+    AllAtOnceStrategyMixin,
+    AllSameDataMixin,
+    LimitedParallelStrategyMixin,
+    RunBatch,
+    RunRemotelyBase,
+    run,
+)
+
+
+class LimitedParallelCommand(
+    AllSameDataMixin, LimitedParallelStrategyMixin, RunRemotelyBase
+):
+    _max_parallel = 2
+
+    def __init__(self):
+        super().__init__(None)
+        self.processed_list = []
+
+    def _get_request_data(self):
+        return RequestData("action")
+
+    def _process_response(self, response):
+        self.processed_list.append(response.request.target.label)
+        return self._get_next_list()
+
+
+class Communicator:
+    """
+    Runs requests one at a time and records how many were running at once
+    """
+
+    def __init__(self, output=""):
+        self.queue = []
+        self.max_running = 0
+        self.output = output
+
+    def add_requests(self, request_list):
+        self.queue.extend(request_list)
+        self.max_running = max(self.max_running, len(self.queue))
+
+    def start_loop(self):
+        while self.queue:
+            request = self.queue.pop(0)
+            yield Response.connection_successful(
+                MockCurlSimple(
+                    info={pycurl.RESPONSE_CODE: 200},
+                    output=self.output,
+                    request=request,
+                )
+            )
+
+
+class LimitedParallelStrategy(TestCase):
+    def setUp(self):
+        self.cmd = LimitedParallelCommand()
+        self.communicator = Communicator()
+
+    def test_limits_running_requests(self):
+        node_list = [f"node{i}" for i in range(5)]
+        self.cmd.set_targets([RequestTarget(node) for node in node_list])
+        run(self.communicator, self.cmd)
+        self.assertEqual(self.cmd.processed_list, node_list)
+        self.assertEqual(self.communicator.max_running, 2)
+
+    def test_less_targets_than_limit(self):
+        self.cmd.set_targets([RequestTarget("node1")])
+        self.assertEqual(len(self.cmd.get_initial_request_list()), 1)
+
+    def test_no_targets(self):
+        run(self.communicator, self.cmd)
+        self.assertEqual(self.cmd.processed_list, [])
+
+
+class AllSameDataCommand(
+    AllSameDataMixin, AllAtOnceStrategyMixin, RunRemotelyBase
+):
+    def __init__(self):
+        super().__init__(None)
+        self.data_call_count = 0
+
+    def _get_request_data(self):
+        self.data_call_count += 1
+        return RequestData("action", [("data", "payload")])
+
+    def _process_response(self, response):
+        pass
+
+
+class AllSameData(TestCase):
+    def test_data_serialized_once(self):
+        cmd = AllSameDataCommand()
+        cmd.set_targets([RequestTarget(f"node{i}") for i in range(3)])
+        request_list = cmd.get_initial_request_list()
+        self.assertEqual(cmd.data_call_count, 1)
+        self.assertEqual(len(request_list), 3)
+        self.assertEqual(
+            len({id(request.encoded_data) for request in request_list}), 1
+        )
+
+    def test_no_targets(self):
+        cmd = AllSameDataCommand()
+        self.assertEqual(cmd.get_initial_request_list(), [])
+        self.assertEqual(cmd.data_call_count, 0)
+
+
+def fixture_batch_output(*result_list):
+    return json.dumps(
+        {
+            "results": [
+                {"status_code": status_code, "output": output}
+                for status_code, output in result_list
+            ]
+        }
+    )
+
+
+class RunBatchTest(TestCase):
+    def setUp(self):
+        self.report_processor = MockLibraryReportProcessor()
+        self.cmd = RunBatch(
+            self.report_processor,
+            [
+                EnableCluster(self.report_processor),
+                StartCluster(self.report_processor),
+            ],
+        )
+        self.cmd.set_targets([RequestTarget("node1"), RequestTarget("node2")])
+        self.started_reports = [
+            fixture.info(
+                reports.codes.CLUSTER_ENABLE_STARTED,
+                host_name_list=["node1", "node2"],
+            ),
+            fixture.info(
+                reports.codes.CLUSTER_START_STARTED,
+                host_name_list=["node1", "node2"],
+            ),
+        ]
+
+    def test_one_request_per_target(self):
+        request_list = self.cmd.get_initial_request_list()
+        self.assertEqual(
+            [request.target.label for request in request_list],
+            ["node1", "node2"],
+        )
+        self.assertEqual(request_list[0].action, "remote/run_batch")
+        self.assertEqual(
+            json.loads(parse_qs(request_list[0].data)["data_json"][0]),
+            {
+                "actions": [
+                    {"command": "cluster_enable", "params": {}},
+                    {"command": "cluster_start", "params": {}},
+                ]
+            },
+        )
+
+    def test_success(self):
+        run(
+            Communicator(fixture_batch_output((200, ""), (200, ""))), self.cmd,
+        )
+        self.assertFalse(self.cmd.has_errors)
+        self.report_processor.assert_reports(
+            self.started_reports
+            + [
+                fixture.info(reports.codes.CLUSTER_ENABLE_SUCCESS, node=node)
+                for node in ["node1", "node2"]
+            ]
+        )
+
+    def test_failure(self):
+        # node stops running the requests once one of them fails
+        run(
+            Communicator(fixture_batch_output((400, "an error"))), self.cmd,
+        )
+        self.assertTrue(self.cmd.has_errors)
+        self.report_processor.assert_reports(
+            self.started_reports
+            + [
+                fixture.error(
+                    reports.codes.NODE_COMMUNICATION_COMMAND_UNSUCCESSFUL,
+                    node=node,
+                    command="remote/cluster_enable",
+                    reason="an error",
+                )
+                for node in ["node1", "node2"]
+            ]
+        )
+
+    def test_missing_results(self):
+        run(Communicator(fixture_batch_output((200, ""))), self.cmd)
+        self.assertTrue(self.cmd.has_errors)
+        self.report_processor.assert_reports(
+            self.started_reports
+            + [
+                fixture.error(reports.codes.INVALID_RESPONSE_FORMAT, node=node)
+                for node in ["node1", "node2"]
+            ]
+        )
+
+    def test_invalid_response(self):
+        run(Communicator("not json"), self.cmd)
+        self.assertTrue(self.cmd.has_errors)
+        self.report_processor.assert_reports(
+            self.started_reports
+            + [
+                fixture.error(reports.codes.INVALID_RESPONSE_FORMAT, node=node)
+                for node in ["node1", "node2"]
+            ]
+        )
@@ -0,0 +1,163 @@
+from unittest import mock, TestCase
+
+from pcs.lib.pacemaker import cib_cache
+from pcs.lib.pacemaker.cib_cache import CibSnapshotCache, CibVersion
+
+CIB_1 = '<cib admin_epoch="0" epoch="5" num_updates="2"><configuration/></cib>'
+CIB_2 = '<cib admin_epoch="0" epoch="6" num_updates="0"><configuration/></cib>'
+ROOT_1 = '<cib admin_epoch="0" epoch="5" num_updates="2"/>'
+ROOT_2 = '<cib admin_epoch="0" epoch="6" num_updates="0"/>'
+
+
+class GetCibVersion(TestCase):
+    def test_success(self):
+        self.assertEqual(
+            CibVersion(1, 5, 2),
+            cib_cache.get_cib_version(
+                """<?xml version="1.0"?>\n<cib num_updates='2'\n"""
+                """ validate-with="pacemaker-3.5" epoch="5" admin_epoch="1">"""
+                """<configuration/></cib>"""
+            ),
+        )
+
+    def test_defaults(self):
+        self.assertEqual(
+            CibVersion(0, 3, 0), cib_cache.get_cib_version('<cib epoch="3"/>')
+        )
+
+    def test_no_epoch(self):
+        self.assertIsNone(cib_cache.get_cib_version('<cib num_updates="1"/>'))
+
+    def test_not_cib(self):
+        self.assertIsNone(cib_cache.get_cib_version("<cibadmin epoch='1'/>"))
+        self.assertIsNone(cib_cache.get_cib_version("error"))
+
+
+class CibSnapshotCacheTest(TestCase):
+    def test_snapshot(self):
+        cache = CibSnapshotCache()
+        self.assertFalse(cache.has_snapshot("root:"))
+        cache.put("root:", CIB_1)
+        self.assertTrue(cache.has_snapshot("root:"))
+        self.assertFalse(cache.has_snapshot("user:"))
+        self.assertEqual(CIB_1, cache.get("root:", CibVersion(0, 5, 2)))
+        self.assertIsNone(cache.get("root:", CibVersion(0, 5, 3)))
+        self.assertIsNone(cache.get("user:", CibVersion(0, 5, 2)))
+        self.assertIsNone(cache.get("root:", None))
+
+    def test_not_cib(self):
+        cache = CibSnapshotCache()
+        cache.put("root:", "error")
+        self.assertFalse(cache.has_snapshot("root:"))
+
+
+class LoadCibXml(TestCase):
+    def setUp(self):
+        cib_cache.enable()
+        self.addCleanup(cib_cache.disable)
+        self.load_cib = mock.Mock(return_value=(CIB_1, True))
+        self.load_cib_element = mock.Mock(return_value=(ROOT_1, True))
+
+    def load(self, env_vars=None):
+        return cib_cache.load_cib_xml(
+            env_vars or {}, self.load_cib, self.load_cib_element
+        )
+
+    def test_disabled(self):
+        cib_cache.disable()
+        self.assertEqual((CIB_1, True), self.load())
+        self.assertEqual((CIB_1, True), self.load())
+        self.assertEqual(2, self.load_cib.call_count)
+        self.load_cib_element.assert_not_called()
+
+    def test_first_load_does_not_check_version(self):
+        self.assertEqual((CIB_1, True), self.load())
+        self.load_cib.assert_called_once_with()
+        self.load_cib_element.assert_not_called()
+
+    def test_snapshot_reused(self):
+        self.load()
+        self.assertEqual((CIB_1, True), self.load())
+        self.assertEqual((CIB_1, True), self.load())
+        self.load_cib.assert_called_once_with()
+        self.assertEqual(2, self.load_cib_element.call_count)
+
+    def test_cib_changed(self):
+        self.load()
+        self.load_cib.return_value = (CIB_2, True)
+        self.load_cib_element.return_value = (ROOT_2, True)
+        self.assertEqual((CIB_2, True), self.load())
+        self.assertEqual((CIB_2, True), self.load())
+        self.assertEqual(2, self.load_cib.call_count)
+
+    def test_version_check_failed(self):
+        self.load()
+        self.load_cib_element.return_value = ("unknown option", False)
+        self.assertEqual((CIB_1, True), self.load())
+        self.assertEqual(2, self.load_cib.call_count)
+
+    def test_load_failed(self):
+        self.load_cib.return_value = ("error", False)
+        self.assertEqual(("error", False), self.load())
+        self.load_cib.return_value = (CIB_1, True)
+        self.load()
+        self.load_cib_element.assert_not_called()
+
+    def test_different_user(self):
+        self.load()
+        self.load({"CIB_user": "user", "CIB_user_groups": "group"})
+        self.assertEqual(2, self.load_cib.call_count)
+        self.load_cib_element.assert_not_called()
+
+    def test_cib_file(self):
+        self.load({"CIB_file": "/tmp/cib.xml"})
+        self.load({"CIB_file": "/tmp/cib.xml"})
+        self.assertEqual(2, self.load_cib.call_count)
+        self.load_cib_element.assert_not_called()
+
+
+def _load_cib_1():
+    cib_cache.load_cib_xml(
+        {}, lambda: (CIB_1, True), mock.Mock(return_value=(ROOT_1, True))
+    )
+
+
+class GetSnapshotCibXml(TestCase):
+    def setUp(self):
+        cib_cache.enable()
+        self.addCleanup(cib_cache.disable)
+        self.load_cib_element = mock.Mock(return_value=(ROOT_1, True))
+
+    def get(self, env_vars=None):
+        return cib_cache.get_snapshot_cib_xml(
+            env_vars or {}, self.load_cib_element
+        )
+
+    def test_disabled(self):
+        cib_cache.disable()
+        self.assertIsNone(self.get())
+        self.load_cib_element.assert_not_called()
+
+    def test_no_snapshot(self):
+        self.assertIsNone(self.get())
+        self.load_cib_element.assert_not_called()
+
+    def test_snapshot_up_to_date(self):
+        _load_cib_1()
+        self.assertEqual(CIB_1, self.get())
+        self.load_cib_element.assert_called_once_with()
+
+    def test_cib_changed(self):
+        _load_cib_1()
+        self.load_cib_element.return_value = (ROOT_2, True)
+        self.assertIsNone(self.get())
+
+    def test_version_check_failed(self):
+        _load_cib_1()
+        self.load_cib_element.return_value = ("unknown option", False)
+        self.assertIsNone(self.get())
+
+    def test_different_user(self):
+        _load_cib_1()
+        self.assertIsNone(self.get({"CIB_user": "user"}))
+        self.load_cib_element.assert_not_called()
@@ -1,3 +1,5 @@
+# pylint: disable=too-many-lines
+import io
 import os.path
 from unittest import mock, TestCase
 from lxml import etree
@@ -18,6 +20,7 @@ from pcs.common.reports import codes as report_codes
 from pcs.common.tools import Version
 from pcs.common.types import CibRuleInEffectStatus
 import pcs.lib.pacemaker.live as lib
+from pcs.lib.pacemaker import cib_cache
 from pcs.lib.external import CommandRunner
 
 # pylint: disable=no-self-use
@@ -26,6 +29,16 @@ from pcs.lib.external import CommandRunner
 def get_runner(stdout="", stderr="", returncode=0, env_vars=None):
     runner = mock.MagicMock(spec_set=CommandRunner)
     runner.run.return_value = (stdout, stderr, returncode)
+    runner.run_stream.side_effect = lambda args, consume_stdout: (
+        (
+            consume_stdout(io.BytesIO(stdout.encode("utf-8")))
+            if returncode == 0
+            else None
+        ),
+        stdout,
+        stderr,
+        returncode,
+    )
     runner.env_vars = env_vars if env_vars else {}
     return runner
 
@@ -73,6 +86,40 @@ class GetClusterStatusXmlTest(LibraryPacemakerTest):
         mock_runner.run.assert_called_once_with(self.crm_mon_cmd())
 
 
+class GetClusterStatusDomTest(LibraryPacemakerTest):
+    def test_success(self):
+        with open(rc("crm_mon.minimal.xml")) as crm_mon_file:
+            mock_runner = get_runner(crm_mon_file.read())
+
+        dom = lib.get_cluster_status_dom(mock_runner)
+
+        mock_runner.run_stream.assert_called_once_with(
+            self.crm_mon_cmd(), mock.ANY
+        )
+        self.assertEqual(dom.tag, "crm_mon")
+        self.assertEqual(len(dom.findall("./nodes/node")), 0)
+
+    def test_error(self):
+        mock_runner = get_runner("some info", "some error", 1)
+
+        assert_raise_library_error(
+            lambda: lib.get_cluster_status_dom(mock_runner),
+            (
+                Severity.ERROR,
+                report_codes.CRM_MON_ERROR,
+                {"reason": "some error\nsome info"},
+            ),
+        )
+
+    def test_bad_xml(self):
+        mock_runner = get_runner("<crm_mon><nodes/>")
+
+        assert_raise_library_error(
+            lambda: lib.get_cluster_status_dom(mock_runner),
+            (Severity.ERROR, report_codes.BAD_CLUSTER_STATE_FORMAT, {}),
+        )
+
+
 class GetClusterStatusText(TestCase):
     def setUp(self):
         self.mock_fencehistory_supported = mock.patch(
@@ -329,6 +376,147 @@ class GetCibXmlTest(LibraryPacemakerTest):
         )
 
 
+class GetCibXmlCachedTest(LibraryPacemakerTest):
+    def setUp(self):
+        cib_cache.enable()
+        self.addCleanup(cib_cache.disable)
+        self.cib = '<cib epoch="2" num_updates="1" admin_epoch="0" />'
+
+    def test_reuse_snapshot(self):
+        mock_runner = get_runner(self.cib)
+        self.assertEqual(self.cib, lib.get_cib_xml(mock_runner))
+        self.assertEqual(self.cib, lib.get_cib_xml(mock_runner))
+        self.assertEqual(
+            [
+                mock.call([self.path("cibadmin"), "--local", "--query"]),
+                mock.call(
+                    [
+                        self.path("cibadmin"),
+                        "--local",
+                        "--query",
+                        "--xpath",
+                        "/cib",
+                        "--no-children",
+                    ]
+                ),
+            ],
+            mock_runner.run.mock_calls,
+        )
+
+    def test_error(self):
+        mock_runner = get_runner(self.cib)
+        lib.get_cib_xml(mock_runner)
+        mock_runner.run.side_effect = [
+            ('<cib epoch="3" num_updates="0" admin_epoch="0" />', "", 0),
+            ("some info", "some error", 1),
+        ]
+        assert_raise_library_error(
+            lambda: lib.get_cib_xml(mock_runner),
+            (
+                Severity.ERROR,
+                report_codes.CIB_LOAD_ERROR,
+                {"reason": "some error\nsome info"},
+            ),
+        )
+
+    def test_scope_not_cached(self):
+        mock_runner = get_runner(self.cib)
+        lib.get_cib_xml(mock_runner, "resources")
+        lib.get_cib_xml(mock_runner, "resources")
+        self.assertEqual(2, mock_runner.run.call_count)
+
+
+class GetCibDomTest(LibraryPacemakerTest):
+    cib = """
+        <cib epoch="1">
+            <configuration><resources/></configuration>
+            <status>
+                <node_state uname="node1">
+                    <lrm><lrm_resources><lrm_resource id="R"/></lrm_resources></lrm>
+                    <transient_attributes id="node1"/>
+                </node_state>
+            </status>
+        </cib>
+    """
+
+    def test_success(self):
+        mock_runner = get_runner(self.cib)
+
+        cib = lib.get_cib_dom(mock_runner)
+
+        mock_runner.run_stream.assert_called_once_with(
+            [self.path("cibadmin"), "--local", "--query"], mock.ANY
+        )
+        assert_xml_equal(self.cib, etree_to_str(cib))
+
+    def test_skip_children(self):
+        mock_runner = get_runner(self.cib)
+
+        cib = lib.get_cib_dom(mock_runner, skip_children_of=["lrm"])
+
+        assert_xml_equal(
+            """
+            <cib epoch="1">
+                <configuration><resources/></configuration>
+                <status>
+                    <node_state uname="node1">
+                        <lrm/>
+                        <transient_attributes id="node1"/>
+                    </node_state>
+                </status>
+            </cib>
+            """,
+            etree_to_str(cib),
+        )
+
+    def test_scope(self):
+        mock_runner = get_runner("<status/>")
+
+        cib = lib.get_cib_dom(mock_runner, scope="status")
+
+        mock_runner.run_stream.assert_called_once_with(
+            [self.path("cibadmin"), "--local", "--query", "--scope=status"],
+            mock.ANY,
+        )
+        self.assertEqual(cib.tag, "status")
+
+    def test_scope_error(self):
+        mock_runner = get_runner("some info", "some error", 105)
+
+        assert_raise_library_error(
+            lambda: lib.get_cib_dom(mock_runner, scope="status"),
+            fixture.error(
+                report_codes.CIB_LOAD_ERROR_SCOPE_MISSING,
+                scope="status",
+                reason="some error\nsome info",
+            ),
+        )
+
+    def test_error(self):
+        mock_runner = get_runner("some info", "some error", 1)
+
+        assert_raise_library_error(
+            lambda: lib.get_cib_dom(mock_runner),
+            fixture.error(
+                report_codes.CIB_LOAD_ERROR, reason="some error\nsome info",
+            ),
+        )
+
+    @mock.patch("pcs.lib.pacemaker.live.xml_fromstream")
+    def test_invalid_xml(self, xml_fromstream_mock):
+        reason = "custom reason"
+        xml_fromstream_mock.side_effect = etree.XMLSyntaxError(reason, 1, 1, 1)
+        mock_runner = get_runner("<cib>")
+
+        assert_raise_library_error(
+            lambda: lib.get_cib_dom(mock_runner),
+            fixture.error(
+                report_codes.CIB_LOAD_ERROR_BAD_FORMAT,
+                reason=f"{reason} (line 1)",
+            ),
+        )
+
+
 class GetCibTest(LibraryPacemakerTest):
     def test_success(self):
         xml = "<xml />"
@@ -1300,6 +1488,50 @@ class ResourcesWaitingTest(LibraryPacemakerTest):
         )
 
 
+class WaitForClusterStateTest(LibraryPacemakerTest):
+    def setUp(self):
+        with open(rc("crm_mon.minimal.xml")) as crm_mon_file:
+            self.runner = get_runner(crm_mon_file.read())
+        self.now = 100.0
+        self.sleep_list = []
+
+    def get_time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleep_list.append(seconds)
+        self.now += seconds
+
+    def wait(self, done_list, timeout=None):
+        is_done = mock.Mock(side_effect=done_list)
+        state, remaining = lib.wait_for_cluster_state(
+            self.runner,
+            is_done,
+            timeout,
+            get_time=self.get_time,
+            sleep=self.sleep,
+        )
+        self.assertEqual(state.tag, "crm_mon")
+        self.assertEqual(is_done.call_count, self.runner.run_stream.call_count)
+        return remaining
+
+    def test_done_at_once(self):
+        self.assertEqual(self.wait([True], timeout=10), 10)
+        self.runner.run_stream.assert_called_once_with(
+            self.crm_mon_cmd(), mock.ANY
+        )
+        self.assertEqual(self.sleep_list, [])
+
+    def test_interval_grows(self):
+        self.assertIsNone(self.wait([False] * 6 + [True]))
+        self.assertEqual(self.sleep_list, [0.25, 0.5, 1, 2, 2, 2])
+
+    def test_timeout(self):
+        self.assertEqual(self.wait([False] * 10, timeout=1), 0)
+        self.assertEqual(self.sleep_list, [0.25, 0.5, 0.25])
+        self.assertEqual(self.runner.run_stream.call_count, 4)
+
+
 class IsInPcmkToolHelp(TestCase):
     # pylint: disable=protected-access
     def test_all_in_stderr(self):
@@ -0,0 +1,77 @@
+import os
+import os.path
+from tempfile import TemporaryDirectory
+from unittest import mock, TestCase
+
+from pcs.lib.pacemaker import metadata_cache
+
+
+class GetCached(TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        patcher = mock.patch(
+            "pcs.settings.pacemaker_metadata_cache_location", self.cache_dir
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.daemon = os.path.join(self.tmp_dir.name, "daemon")
+        self._write_daemon("binary")
+        self.loader = mock.Mock(return_value={"prop": {"default": "1"}})
+
+    def _write_daemon(self, content):
+        with open(self.daemon, "w") as daemon_file:
+            daemon_file.write(content)
+
+    def _get(self):
+        return metadata_cache.get_cached("test", [self.daemon], self.loader)
+
+    def test_loaded_once(self):
+        self.assertEqual(self._get(), {"prop": {"default": "1"}})
+        self.assertEqual(self._get(), {"prop": {"default": "1"}})
+        self.loader.assert_called_once_with()
+        self.assertTrue(
+            os.path.exists(os.path.join(self.cache_dir, "test.json"))
+        )
+
+    def test_reloaded_when_daemon_changes(self):
+        self._get()
+        self._write_daemon("upgraded binary")
+        self.loader.return_value = {}
+        self.assertEqual(self._get(), {})
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_reloaded_when_pcs_changes(self):
+        self._get()
+        self.loader.return_value = {}
+        with mock.patch("pcs.settings.pcs_version", "upgraded"):
+            self.assertEqual(self._get(), {})
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_missing_daemon_not_cached(self):
+        os.remove(self.daemon)
+        self._get()
+        self._get()
+        self.assertEqual(self.loader.call_count, 2)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_broken_cache_file(self):
+        os.makedirs(self.cache_dir)
+        with open(os.path.join(self.cache_dir, "test.json"), "w") as cache:
+            cache.write("not a json")
+        self.assertEqual(self._get(), {"prop": {"default": "1"}})
+        self.assertEqual(self._get(), {"prop": {"default": "1"}})
+        self.loader.assert_called_once_with()
+
+    def test_not_writable(self):
+        with open(self.cache_dir, "w"):
+            pass
+        self.assertEqual(self._get(), {"prop": {"default": "1"}})
+        self.assertEqual(os.listdir(self.tmp_dir.name).count("cache"), 1)
+
+    def test_loader_error_not_cached(self):
+        self.loader.side_effect = RuntimeError()
+        with self.assertRaises(RuntimeError):
+            self._get()
+        self.assertFalse(os.path.exists(self.cache_dir))
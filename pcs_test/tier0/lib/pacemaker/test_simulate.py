@@ -386,3 +386,45 @@ class GetResourcesLeftDemoted(GetResourcesLeftStoppedDemotedMixin, TestCase):
                 ]
             ),
         )
+
+
+def _operation(primitive_id, operation, on_node):
+    return {
+        "primitive_id": primitive_id,
+        "primitive_long_id": primitive_id,
+        "operation": operation,
+        "on_node": on_node,
+    }
+
+
+class GetResourcesMoved(TestCase):
+    operations = [
+        # moved
+        _operation("dummy1", "stop", "node1"),
+        _operation("dummy1", "start", "node2"),
+        # restarted
+        _operation("dummy2", "stop", "node1"),
+        _operation("dummy2", "start", "node1"),
+        # stopped
+        _operation("dummy3", "stop", "node1"),
+        # started
+        _operation("dummy4", "start", "node1"),
+        # migrated
+        _operation("dummy5", "migrate_to", "node2"),
+        _operation("dummy5", "migrate_from", "node3"),
+        _operation("dummy5", "stop", "node2"),
+    ]
+
+    def test_no_operations(self):
+        self.assertEqual([], simulate.get_resources_moved([]))
+
+    def test_some_operations(self):
+        self.assertEqual(
+            ["dummy1", "dummy5"], simulate.get_resources_moved(self.operations),
+        )
+
+    def test_some_operations_exclude(self):
+        self.assertEqual(
+            ["dummy5"],
+            simulate.get_resources_moved(self.operations, exclude={"dummy1"}),
+        )
@@ -498,6 +498,26 @@ class GetPrimitivesForStateCheck(TestCase):
         self.assert_primitives("B2-R2", ["B2-R2", "B2-R2"], False)
 
 
+class IsResourceFailed(TestCase):
+    status_xml = GetPrimitivesForStateCheck.status_xml
+
+    def test_primitive(self):
+        self.assertFalse(state.is_resource_failed(self.status_xml, "R01"))
+        self.assertTrue(state.is_resource_failed(self.status_xml, "R02"))
+
+    def test_group(self):
+        self.assertFalse(state.is_resource_failed(self.status_xml, "G1"))
+        self.assertTrue(state.is_resource_failed(self.status_xml, "G2"))
+
+    def test_clone(self):
+        self.assertFalse(state.is_resource_failed(self.status_xml, "R07"))
+        self.assertTrue(state.is_resource_failed(self.status_xml, "R08"))
+        self.assertTrue(state.is_resource_failed(self.status_xml, "R11"))
+
+    def test_missing(self):
+        self.assertFalse(state.is_resource_failed(self.status_xml, "X"))
+
+
 class CommonResourceState(TestCase):
     resource_id = "R"
 
@@ -972,3 +992,120 @@ class IsResourceManaged(TestCase):
         self.assert_managed("R46", False)
         self.assert_managed("R47", False)
         self.assert_managed("R48", False)
+
+
+class GetNodesStatus(TestCase):
+    def test_no_nodes(self):
+        self.assertEqual(
+            [], state.get_nodes_status(etree.fromstring("<crm_mon/>"))
+        )
+
+    def test_convert_attributes(self):
+        self.assertEqual(
+            [
+                {
+                    "id": "1",
+                    "name": "node1",
+                    "type": "member",
+                    "online": True,
+                    "standby": False,
+                    "pending": False,
+                    "is_dc": True,
+                    "resources_running": 3,
+                },
+            ],
+            state.get_nodes_status(
+                etree.fromstring(
+                    """
+                    <crm_mon>
+                        <nodes>
+                            <node id="1" name="node1" type="member"
+                                online="true" standby="false" pending="false"
+                                is_dc="true" resources_running="3"
+                            />
+                        </nodes>
+                    </crm_mon>
+                    """
+                )
+            ),
+        )
+
+
+class GetResourcesStatus(TestCase):
+    def test_no_resources(self):
+        self.assertEqual(
+            [], state.get_resources_status(etree.fromstring("<crm_mon/>"))
+        )
+
+    def test_resource_tree(self):
+        self.assertEqual(
+            [
+                {
+                    "kind": "resource",
+                    "id": "R1",
+                    "role": "Started",
+                    "active": True,
+                    "pending": "Starting",
+                    "nodes_running_on": 1,
+                    "nodes": [{"name": "node1", "id": "1", "cached": False}],
+                },
+                {
+                    "kind": "clone",
+                    "id": "G-clone",
+                    "multi_state": False,
+                    "members": [
+                        {
+                            "kind": "group",
+                            "id": "G:0",
+                            "number_resources": 1,
+                            "members": [
+                                {
+                                    "kind": "resource",
+                                    "id": "R2",
+                                    "failed": True,
+                                    "nodes": [],
+                                },
+                            ],
+                        },
+                    ],
+                },
+                {
+                    "kind": "bundle",
+                    "id": "B",
+                    "type": "podman",
+                    "replicas": [
+                        {
+                            "id": "0",
+                            "members": [
+                                {"kind": "resource", "id": "R3", "nodes": []},
+                            ],
+                        },
+                    ],
+                },
+            ],
+            state.get_resources_status(
+                etree.fromstring(
+                    """
+                    <crm_mon>
+                        <resources>
+                            <resource id="R1" role="Started" active="true"
+                                pending="Starting" nodes_running_on="1"
+                            >
+                                <node name="node1" id="1" cached="false"/>
+                            </resource>
+                            <clone id="G-clone" multi_state="false">
+                                <group id="G:0" number_resources="1">
+                                    <resource id="R2" failed="true"/>
+                                </group>
+                            </clone>
+                            <bundle id="B" type="podman">
+                                <replica id="0">
+                                    <resource id="R3"/>
+                                </replica>
+                            </bundle>
+                        </resources>
+                    </crm_mon>
+                    """
+                )
+            ),
+        )
@@ -1,5 +1,6 @@
 import logging
 from subprocess import DEVNULL
+import sys
 from unittest import mock, TestCase
 
 from pcs_test.tools.assertions import (
@@ -372,6 +373,107 @@ class CommandRunnerTest(TestCase):
         )
 
 
+class CommandRunnerStreamTest(TestCase):
+    def setUp(self):
+        self.mock_logger = mock.MagicMock(logging.Logger)
+        self.mock_reporter = MockLibraryReportProcessor()
+        self.runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+
+    @staticmethod
+    def command(code):
+        return [sys.executable, "-c", code]
+
+    def test_success(self):
+        stdout_list = []
+        result, stdout, stderr, retval = self.runner.run_stream(
+            self.command(
+                "import sys; print('line1'); print('line2');"
+                "print('error', file=sys.stderr)"
+            ),
+            lambda stream: stdout_list.append(stream.read()) or "result",
+        )
+        self.assertEqual(result, "result")
+        self.assertEqual(stdout_list, [b"line1\nline2\n"])
+        self.assertEqual(stdout, "line1\nline2\n")
+        self.assertEqual(stderr, "error\n")
+        self.assertEqual(retval, 0)
+
+    def test_stdout_head_kept_only(self):
+        # Not consuming stdout does not block the process, the rest of stdout
+        # is read and dropped.
+        result, stdout, dummy_stderr, retval = self.runner.run_stream(
+            self.command(
+                "import sys; sys.stdout.write('a' * 100000);"
+                "sys.stderr.write('b' * 100000)"
+            ),
+            lambda stream: stream.read(10),
+        )
+        self.assertEqual(result, b"a" * 10)
+        self.assertEqual(stdout, "a" * 4096 + "\n... (100000 bytes in total)")
+        self.assertEqual(retval, 0)
+        assert_report_item_list_equal(
+            self.mock_reporter.report_item_list,
+            [
+                (
+                    severity.DEBUG,
+                    report_codes.RUN_EXTERNAL_PROCESS_STARTED,
+                    {
+                        "command": mock.ANY,
+                        "stdin": None,
+                        "environment": dict(),
+                    },
+                ),
+                (
+                    severity.DEBUG,
+                    report_codes.RUN_EXTERNAL_PROCESS_FINISHED,
+                    {
+                        "command": mock.ANY,
+                        "return_value": 0,
+                        "stdout": stdout,
+                        "stderr": "b" * 100000,
+                    },
+                ),
+            ],
+        )
+
+    def test_consume_error_process_failed(self):
+        def consume(stream):
+            raise ValueError(stream.read())
+
+        result, stdout, stderr, retval = self.runner.run_stream(
+            self.command(
+                "import sys; print('info'); print('error', file=sys.stderr);"
+                "sys.exit(3)"
+            ),
+            consume,
+        )
+        self.assertIsNone(result)
+        self.assertEqual(stdout, "info\n")
+        self.assertEqual(stderr, "error\n")
+        self.assertEqual(retval, 3)
+
+    def test_consume_error_process_succeeded(self):
+        def consume(stream):
+            raise ValueError(stream.read(1))
+
+        with self.assertRaises(ValueError) as cm:
+            self.runner.run_stream(self.command("print('info')"), consume)
+        self.assertEqual(cm.exception.args, (b"i",))
+
+    def test_popen_error(self):
+        assert_raise_library_error(
+            lambda: self.runner.run_stream(["/nonexistent/command"], bytes),
+            (
+                severity.ERROR,
+                report_codes.RUN_EXTERNAL_PROCESS_ERROR,
+                {
+                    "command": "/nonexistent/command",
+                    "reason": "No such file or directory",
+                },
+            ),
+        )
+
+
 @mock.patch("pcs.lib.external.is_systemctl")
 @mock.patch("pcs.lib.external.is_service_installed")
 class DisableServiceTest(TestCase):
@@ -803,6 +803,38 @@ class ValueCorosyncValue(TestCase):
                 )
 
 
+class CorosyncValues(TestCase):
+    def test_values_ok(self):
+        assert_report_item_list_equal(
+            validate.CorosyncValues().validate(
+                {"a": "valid_value", "b": "", "c": "\\n\\r"}
+            ),
+            [],
+        )
+
+    def test_forbidden_characters_reported(self):
+        assert_report_item_list_equal(
+            validate.CorosyncValues().validate(
+                {
+                    "a": "bad{value",
+                    "b": "good value",
+                    "c": validate.ValuePair("bad\nvalue", "bad\nvalue"),
+                }
+            ),
+            [
+                fixture.error(
+                    reports.codes.INVALID_OPTION_VALUE,
+                    option_value=value,
+                    option_name=name,
+                    allowed_values=None,
+                    cannot_be_empty=False,
+                    forbidden_characters=r"{}\n\r",
+                )
+                for name, value in (("a", "bad{value"), ("c", "bad\nvalue"))
+            ],
+        )
+
+
 class ValueFloat(TestCase):
     # The real code only calls ValuePredicateBase and is_float which are both
     # heavily tested on their own => only basic tests here.
@@ -1585,6 +1617,19 @@ class MatchesRegexp(TestCase):
         )
 
 
+class IsCorosyncValue(TestCase):
+    def test_valid(self):
+        self.assertTrue(validate.is_corosync_value("value"))
+        self.assertTrue(validate.is_corosync_value(""))
+        self.assertTrue(validate.is_corosync_value("\\n\\r"))
+        self.assertTrue(validate.is_corosync_value(None))
+
+    def test_not_valid(self):
+        for value in ("{", "}", "a\nb", "a\rb"):
+            with self.subTest(value=value):
+                self.assertFalse(validate.is_corosync_value(value))
+
+
 class IsEmptyString(TestCase):
     def test_empty_string(self):
         self.assertTrue(validate.is_empty_string(""))
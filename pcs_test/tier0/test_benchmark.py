@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs_test.benchmark.cib_generator import (
+    SIZE_MAP,
+    generate_cib,
+    generate_crm_mon,
+)
+from pcs_test.benchmark.environment import BenchmarkEnvironment, FakeRunner
+from pcs_test.benchmark.fake_pcsd import dead_addr, node_addr
+from pcs_test.benchmark.scenarios import SCENARIO_LIST
+from pcs_test.tools.misc import get_test_resource as rc
+
+from pcs.common.reports import ReportItemSeverity
+
+
+class GenerateCib(TestCase):
+    def test_deterministic(self):
+        self.assertEqual(
+            generate_cib(SIZE_MAP["small"], seed=1),
+            generate_cib(SIZE_MAP["small"], seed=1),
+        )
+
+    def test_ids_unique(self):
+        cib = etree.fromstring(generate_cib(SIZE_MAP["small"]))
+        id_list = cib.xpath("//*[local-name() != 'obj_ref']/@id")
+        self.assertEqual(len(id_list), len(set(id_list)))
+
+    def test_size(self):
+        size = SIZE_MAP["small"]
+        cib = etree.fromstring(generate_cib(size))
+        self.assertEqual(
+            len(cib.findall(".//primitive")),
+            size.primitives + size.groups * size.group_size + size.clones,
+        )
+        self.assertEqual(len(cib.findall(".//rsc_order")), size.constraints)
+        self.assertEqual(len(cib.findall(".//tag")), size.tags)
+
+    def test_crm_mon_valid(self):
+        # pylint: disable=no-self-use
+        state = etree.fromstring(
+            generate_crm_mon(generate_cib(SIZE_MAP["small"]))
+        )
+        etree.RelaxNG(file=rc("crm_mon_rng/crm_mon.rng")).assertValid(state)
+
+
+class Scenarios(TestCase):
+    def test_run_without_errors(self):
+        cib_xml = generate_cib(SIZE_MAP["small"])
+        state_xml = generate_crm_mon(cib_xml)
+        for scenario in SCENARIO_LIST:
+            with self.subTest(scenario=scenario.name):
+                runner = FakeRunner(cib_xml, state_xml)
+                env = BenchmarkEnvironment(runner)
+                scenario.run(env, runner)
+                self.assertEqual(
+                    [
+                        item
+                        for item in env.report_collector.items
+                        if item.severity.level == ReportItemSeverity.ERROR
+                    ],
+                    [],
+                )
+
+
+class FakePcsdAddresses(TestCase):
+    def test_unique_for_many_nodes(self):
+        addr_list = [node_addr(index) for index in range(1, 1001)]
+        self.assertEqual(len(addr_list), len(set(addr_list)))
+        self.assertEqual(node_addr(1), "127.1.0.1")
+        self.assertEqual(node_addr(250), "127.1.0.250")
+        self.assertEqual(node_addr(251), "127.1.1.1")
+
+    def test_dead_addresses_differ_from_nodes(self):
+        self.assertEqual(dead_addr(1), "127.2.0.1")
+        self.assertFalse(
+            {node_addr(index) for index in range(1, 501)}
+            & {dead_addr(index) for index in range(1, 501)}
+        )
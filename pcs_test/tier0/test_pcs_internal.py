@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from pcs.common.reports import (
+    ReportItem,
+    messages,
+)
+from pcs.pcs_internal import LibraryReportProcessor
+
+
+class LibraryReportProcessorTest(TestCase):
+    @staticmethod
+    def _debug(index):
+        return ReportItem.debug(
+            messages.RunExternalProcessStarted(f"cmd{index}", "", {})
+        )
+
+    def test_items_not_shared(self):
+        processor = LibraryReportProcessor()
+        processor.report(self._debug(1))
+        self.assertEqual(LibraryReportProcessor().processed_items, [])
+        self.assertEqual(len(processor.processed_items), 1)
+
+    def test_no_limit(self):
+        processor = LibraryReportProcessor()
+        report_list = [self._debug(index) for index in range(5)]
+        processor.report_list(report_list)
+        self.assertEqual(processor.processed_items, report_list)
+        self.assertEqual(processor.debug_dropped, 0)
+        self.assertEqual(processor.get_report_list(), report_list)
+
+    def test_limit_debug_only(self):
+        processor = LibraryReportProcessor(debug_limit=2)
+        warning = ReportItem.warning(messages.CibUpgradeSuccessful())
+        debug_list = [self._debug(index) for index in range(4)]
+        processor.report_list(debug_list + [warning])
+        self.assertEqual(processor.processed_items, debug_list[:2] + [warning])
+        self.assertEqual(processor.debug_dropped, 2)
+        self.assertFalse(processor.has_errors)
+        self.assertEqual(
+            processor.get_report_list(),
+            debug_list[:2]
+            + [warning, ReportItem.debug(messages.DebugReportsDropped(2))],
+        )
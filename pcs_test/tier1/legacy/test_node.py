@@ -190,14 +190,15 @@ Node Utilization:
     def test_refuse_unknown_node(self):
         self.assert_pcs_fail(
             "node utilization rh7-0 test=10".split(),
-            "Error: Unable to find a node: rh7-0\n",
+            "Error: Node 'rh7-0' does not appear to exist in configuration\n"
+            "Error: Errors have occurred, therefore pcs is unable to continue\n",
         )
 
     def test_refuse_value_not_int(self):
         self.assert_pcs_fail(
             "node utilization rh7-1 test1=10 test=int".split(),
-            "Error: Value of utilization attribute must be integer: "
-            "'test=int'\n",
+            "Error: 'int' is not a valid test value, use an integer\n"
+            "Error: Errors have occurred, therefore pcs is unable to continue\n",
         )
 
     def test_keep_empty_nvset(self):
@@ -795,10 +796,28 @@ Node Attributes:
             ["rh7-1", "rh7-2"],
             {"rh7-1": {"IP": "192.168.1.1",}, "rh7-2": {"IP": "192.168.1.2",},},
         )
-        self.assert_pcs_result(
+        self.assert_pcs_fail(
             "node attribute rh7-1 missing=".split(),
-            "Error: attribute: 'missing' doesn't exist for node: 'rh7-1'\n",
-            returncode=2,
+            "Error: Attribute 'missing' does not exist for node 'rh7-1', use "
+            "--force to override\n"
+            "Error: Errors have occurred, therefore pcs is unable to continue\n",
+        )
+
+    def test_unset_nonexisting_more_nodes(self):
+        self.fixture_attrs(
+            ["rh7-1", "rh7-2"],
+            {"rh7-1": {"IP": "192.168.1.1",}, "rh7-2": {"IP": "192.168.1.2",},},
+        )
+        self.assert_pcs_fail(
+            "node attribute rh7-1 rh7-2 missing=".split(),
+            "Error: Attribute 'missing' does not exist for node 'rh7-1', use "
+            "--force to override\n"
+            "Error: Attribute 'missing' does not exist for node 'rh7-2', use "
+            "--force to override\n"
+            "Error: Errors have occurred, therefore pcs is unable to continue\n",
+        )
+        self.assert_pcs_success(
+            "node attribute rh7-1 rh7-2 missing= --force".split(), ""
         )
 
     def test_unset_nonexisting_forced(self):
@@ -821,14 +840,7 @@ Node Attributes:
         )
 
     def test_dont_create_nvset_on_removal(self):
-        # pcs does not actually do cib editing, it passes it to crm_node. So
-        # this behaves differently than the rest of pcs - instead of doing
-        # nothing it returns an error.
-        # Should be changed to be consistent with the rest of pcs.
-        output, retval = pcs(
-            self.temp_cib.name, "node attribute rh7-1 test=".split()
-        )
-        self.assertEqual(
-            output, "Error: attribute: 'test' doesn't exist for node: 'rh7-1'\n"
+        self.assert_effect(
+            "node attribute rh7-1 test= --force".split(),
+            self.fixture_xml_no_attrs(),
         )
-        self.assertEqual(retval, 2)
@@ -6,10 +6,12 @@ from unittest import mock, TestCase
 import xml.dom.minidom
 import xml.etree.ElementTree as ET
 
+from pcs_test.tools.assertions import assert_xml_equal
 from pcs_test.tools.xml import dom_get_child_elements
 from pcs_test.tools.misc import get_test_resource as rc
 
 from pcs import utils
+from pcs.lib.cib.facade import CibFacade
 
 # pylint: disable=line-too-long
 # pylint: disable=invalid-name
@@ -533,7 +535,14 @@ class UtilsTest(TestCase):
         self.assertEqual(None, utils.dom_get_parent_by_tag_names(cc1, ["ee"]))
 
     def testValidateConstraintResource(self):
-        dom = self.get_cib_resources()
+        self.assert_validate_constraint_resource(self.get_cib_resources())
+
+    def testValidateConstraintResourceFacade(self):
+        self.assert_validate_constraint_resource(
+            CibFacade.from_string(self.get_cib_resources().toxml())
+        )
+
+    def assert_validate_constraint_resource(self, dom):
         self.assertEqual(
             (True, "", "myClone"),
             utils.validate_constraint_resource(dom, "myClone"),
@@ -637,37 +646,39 @@ class UtilsTest(TestCase):
             utils.validate_constraint_resource(dom, "myBundledResource"),
         )
 
-        utils.pcs_options["--force"] = True
-        self.assertEqual(
-            (True, "", "myClone"),
-            utils.validate_constraint_resource(dom, "myClonedResource"),
-        )
-        self.assertEqual(
-            (True, "", "myGroupClone"),
-            utils.validate_constraint_resource(dom, "myClonedGroup"),
-        )
-        self.assertEqual(
-            (True, "", "myGroupClone"),
-            utils.validate_constraint_resource(dom, "myClonedGroupedResource"),
-        )
-        self.assertEqual(
-            (True, "", "myMaster"),
-            utils.validate_constraint_resource(dom, "myMasteredResource"),
-        )
-        self.assertEqual(
-            (True, "", "myGroupMaster"),
-            utils.validate_constraint_resource(dom, "myMasteredGroup"),
-        )
-        self.assertEqual(
-            (True, "", "myGroupMaster"),
-            utils.validate_constraint_resource(
-                dom, "myMasteredGroupedResource"
-            ),
-        )
-        self.assertEqual(
-            (True, "", "myBundle"),
-            utils.validate_constraint_resource(dom, "myBundledResource"),
-        )
+        with mock.patch.dict(utils.pcs_options, {"--force": True}):
+            self.assertEqual(
+                (True, "", "myClone"),
+                utils.validate_constraint_resource(dom, "myClonedResource"),
+            )
+            self.assertEqual(
+                (True, "", "myGroupClone"),
+                utils.validate_constraint_resource(dom, "myClonedGroup"),
+            )
+            self.assertEqual(
+                (True, "", "myGroupClone"),
+                utils.validate_constraint_resource(
+                    dom, "myClonedGroupedResource"
+                ),
+            )
+            self.assertEqual(
+                (True, "", "myMaster"),
+                utils.validate_constraint_resource(dom, "myMasteredResource"),
+            )
+            self.assertEqual(
+                (True, "", "myGroupMaster"),
+                utils.validate_constraint_resource(dom, "myMasteredGroup"),
+            )
+            self.assertEqual(
+                (True, "", "myGroupMaster"),
+                utils.validate_constraint_resource(
+                    dom, "myMasteredGroupedResource"
+                ),
+            )
+            self.assertEqual(
+                (True, "", "myBundle"),
+                utils.validate_constraint_resource(dom, "myBundledResource"),
+            )
 
     def testValidateXmlId(self):
         self.assertEqual((True, ""), utils.validate_xml_id("dummy"))
@@ -1651,6 +1662,66 @@ class UtilsTest(TestCase):
             dom_get_child_elements(u)[0].getAttribute("value"), "another_val"
         )
 
+    def test_facade_update_meta_attr_add(self):
+        cib = CibFacade.from_string('<resource id="test_id"/>')
+        utils.facade_update_meta_attr(
+            cib, cib.cib, [("name", ""), ("key", "test"), ("key2", "val")]
+        )
+        assert_xml_equal(
+            """
+            <resource id="test_id">
+                <meta_attributes id="test_id-meta_attributes">
+                    <nvpair id="test_id-meta_attributes-key" name="key"
+                        value="test"
+                    />
+                    <nvpair id="test_id-meta_attributes-key2" name="key2"
+                        value="val"
+                    />
+                </meta_attributes>
+            </resource>
+            """,
+            cib.to_string(),
+        )
+        self.assertTrue(cib.does_id_exist("test_id-meta_attributes-key2"))
+
+    def test_facade_update_meta_attr_update_remove(self):
+        cib = CibFacade.from_string(
+            """
+            <resource id="test_id">
+                <meta_attributes id="test_id-meta_attributes">
+                    <nvpair id="test_id-meta_attributes-key" name="key"
+                        value="test"
+                    />
+                    <nvpair id="test_id-meta_attributes-key2" name="key2"
+                        value="val"
+                    />
+                </meta_attributes>
+            </resource>
+            """
+        )
+        utils.facade_update_meta_attr(
+            cib, cib.cib, [("key", "another_val"), ("key2", "")]
+        )
+        assert_xml_equal(
+            """
+            <resource id="test_id">
+                <meta_attributes id="test_id-meta_attributes">
+                    <nvpair id="test_id-meta_attributes-key" name="key"
+                        value="another_val"
+                    />
+                </meta_attributes>
+            </resource>
+            """,
+            cib.to_string(),
+        )
+        self.assertFalse(cib.does_id_exist("test_id-meta_attributes-key2"))
+
+    def test_facade_update_meta_attr_only_removing(self):
+        cib = CibFacade.from_string('<resource id="test_id"/>')
+        utils.facade_update_meta_attr(cib, cib.cib, [("key", "")])
+        assert_xml_equal('<resource id="test_id"/>', cib.to_string())
+        self.assertFalse(cib.does_id_exist("test_id-meta_attributes"))
+
     def test_get_utilization(self):
         el = xml.dom.minidom.parseString(
             """
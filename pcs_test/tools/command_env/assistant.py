@@ -243,6 +243,7 @@ class EnvAssistant:
                 else self.__config.env.known_hosts_getter
             ),
             booth_files_data=self.__config.env.booth,
+            wait_targeted=self.__config.env.wait_targeted,
         )
         self.__unpatch = patch_env(
             self.__call_queue,
@@ -16,6 +16,7 @@ class EnvConfig:
         self.__corosync_conf_data = None
         self.__booth = None
         self.__known_hosts_getter = None
+        self.__wait_targeted = False
 
     def set_cib_data(self, cib_data, cib_tempfile="/fake/tmp/file"):
         self.__cib_data = cib_data
@@ -43,6 +44,13 @@ class EnvConfig:
     def corosync_conf_data(self):
         return self.__corosync_conf_data
 
+    def set_wait_targeted(self, wait_targeted):
+        self.__wait_targeted = wait_targeted
+
+    @property
+    def wait_targeted(self):
+        return self.__wait_targeted
+
     def set_known_nodes(self, host_name_list):
         """
         Set known hosts so that each host's address equals to the host's name
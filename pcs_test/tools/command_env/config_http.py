@@ -205,5 +205,58 @@ class HttpConfig:
             **kwargs,
         )
 
+    def run_batch(
+        self,
+        action_list,
+        node_labels=None,
+        communication_list=None,
+        result_list=None,
+        name="http.common.run_batch",
+    ):
+        """
+        Create a call for running several requests in one request per node
+
+        list action_list -- pairs of a pcsd url and its param_list, e.g.
+            [("remote/cluster_enable", []), ("remote/cluster_start", [])]
+        list node_labels -- create success responses from these nodes
+        list communication_list -- create custom responses
+        list result_list -- pairs of a http response code and an output of each
+            url run, all urls succeed with an empty output by default
+        string name -- the key of this call
+        """
+        if result_list is None:
+            result_list = [(200, "")] * len(action_list)
+        place_multinode_call(
+            self.__calls,
+            name,
+            node_labels,
+            communication_list,
+            action="remote/run_batch",
+            param_list=[
+                (
+                    "data_json",
+                    json.dumps(
+                        dict(
+                            actions=[
+                                dict(
+                                    command=action[len("remote/") :],
+                                    params=dict(param_list),
+                                )
+                                for action, param_list in action_list
+                            ]
+                        )
+                    ),
+                )
+            ],
+            output=json.dumps(
+                dict(
+                    results=[
+                        dict(status_code=status_code, output=output)
+                        for status_code, output in result_list
+                    ]
+                )
+            ),
+        )
+
     def place_multinode_call(self, *args, **kwargs):
         place_multinode_call(self.__calls, *args, **kwargs)
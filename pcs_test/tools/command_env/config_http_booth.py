@@ -94,3 +94,27 @@ class BoothShortcuts:
                 {"saved": saved, "existing": existing, "failed": failed,}
             ),
         )
+
+    def get_status_all(
+        self,
+        status_list=(),
+        node_labels=None,
+        communication_list=None,
+        name="http.booth.get_status_all",
+    ):
+        place_multinode_call(
+            self.__calls,
+            name,
+            node_labels,
+            communication_list,
+            action="remote/booth_get_status_all",
+            param_list=[("data_json", "{}")],
+            output=json.dumps(
+                {
+                    "status": "success",
+                    "status_msg": None,
+                    "report_list": [],
+                    "data": list(status_list),
+                }
+            ),
+        )
@@ -78,6 +78,7 @@ class CibShortcuts:
         name="runner.cib.load_content",
         instead=None,
         before=None,
+        scope=None,
     ):
         """
         Create call for loading CIB specified by its full content
@@ -89,8 +90,11 @@ class CibShortcuts:
         string instead -- key of call instead of which this new call is to be
             placed
         string before -- key of call before which this new call is to be placed
+        string scope -- section of the CIB to be loaded
         """
         command = ["cibadmin", "--local", "--query"]
+        if scope:
+            command.append(f"--scope={scope}")
         if returncode != 0:
             call = RunnerCall(command, stderr=stderr, returncode=returncode)
         else:
@@ -329,13 +329,27 @@ def _compare_request_data(expected, real):
         return False
 
     try:
-        expected_data = json.loads(expected[0][1])
-        real_data = json.loads(real[0][1])
+        expected_data = _load_batch_params(json.loads(expected[0][1]))
+        real_data = _load_batch_params(json.loads(real[0][1]))
         return expected_data == real_data
     except ValueError:
         return False
 
 
+def _load_batch_params(data):
+    # Requests run in a batch (remote/run_batch) carry their data_json params
+    # as strings in the data_json of the batch. Load them as well.
+    if not isinstance(data, dict) or not isinstance(data.get("actions"), list):
+        return data
+    action_list = []
+    for action in data["actions"]:
+        params = action.get("params", {})
+        if "data_json" in params:
+            params = dict(params, data_json=json.loads(params["data_json"]))
+        action_list.append(dict(action, params=params))
+    return dict(data, actions=action_list)
+
+
 class NodeCommunicator:
     def __init__(self, call_queue=None):
         self.__call_queue = call_queue
@@ -1,3 +1,4 @@
+import io
 from os import path
 
 from pcs import settings
@@ -132,3 +133,14 @@ class Runner:
 
         call.check_stdin(stdin_string, args, i)
         return call.stdout, call.stderr, call.returncode
+
+    def run_stream(self, args, consume_stdout, env_extend=None):
+        stdout, stderr, returncode = self.run(args, env_extend=env_extend)
+        try:
+            result = consume_stdout(io.BytesIO(stdout.encode("utf-8")))
+        # pylint: disable=broad-except
+        except Exception:
+            if returncode == 0:
+                raise
+            result = None
+        return result, stdout, stderr, returncode
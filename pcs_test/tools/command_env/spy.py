@@ -82,6 +82,19 @@ class Runner:
         print_line("returncode:{0}".format(returncode))
         return stdout, stderr, returncode
 
+    def run_stream(self, args, consume_stdout, env_extend=None):
+        print_call(self, "run_stream")
+        print_line("args: {0}".format(args))
+        if env_extend:
+            print_line("env_extend: {0}".format(env_extend))
+        result, stdout, stderr, returncode = self.__runner.run_stream(
+            args, consume_stdout, env_extend,
+        )
+        print_long_text("stdout", stdout)
+        print_long_text("stderr", stderr)
+        print_line("returncode:{0}".format(returncode))
+        return result, stdout, stderr, returncode
+
 
 def get_local_corosync_conf():
     print_caption("get_local_corosync_conf", indent=0)
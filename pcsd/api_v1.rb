@@ -5,6 +5,11 @@ require 'permissions.rb'
 
 def route_api_v1(auth_user, params, request)
   req_map = {
+    'booth-get-status-all/v1' => {
+      :cmd => 'booth.get_status_all',
+      :only_superuser => false,
+      :permissions => Permissions::READ,
+    },
     'cluster-add-nodes/v1' => {
       :cmd => 'cluster.add_nodes',
       :only_superuser => false,
@@ -31,6 +36,11 @@ def route_api_v1(auth_user, params, request)
       :only_superuser => false,
       :permissions => Permissions::WRITE,
     },
+    'node-update-attributes/v1' => {
+      :cmd => 'node.update_nodes_attrs',
+      :only_superuser => false,
+      :permissions => Permissions::WRITE,
+    },
     'resource-create/v1' => {
       :cmd => 'resource.create',
       :only_superuser => false,
@@ -51,6 +61,11 @@ def route_api_v1(auth_user, params, request)
       :only_superuser => false,
       :permissions => Permissions::WRITE,
     },
+    'resource-disable-simulate-batch/v1' => {
+      :cmd => 'resource.disable_simulate_batch',
+      :only_superuser => false,
+      :permissions => Permissions::READ,
+    },
     'resource-enable/v1' => {
       :cmd => 'resource.enable',
       :only_superuser => false,
@@ -100,5 +115,9 @@ def route_api_v1(auth_user, params, request)
       )),
     ]
   end
-  return pcs_internal_proxy(auth_user, request.body.read, cmd[:cmd])
+  options = {}
+  if params[:wait_targeted] == '1'
+    options[:wait_targeted] = true
+  end
+  return pcs_internal_proxy(auth_user, request.body.read, cmd[:cmd], options)
 end
@@ -602,8 +602,16 @@ module Cfgsync
     end
 
     def get_configs_cluster(nodes, cluster_name)
+      # Send versions and hashes of local configs, nodes having the same
+      # configs do not send their texts back.
+      configs_local = self.get_configs_local()
+      config_versions = {}
+      configs_local.each { |name, cfg|
+        config_versions[name] = {'version' => cfg.version, 'hash' => cfg.hash}
+      }
       data = {
         'cluster_name' => cluster_name,
+        'config_versions' => JSON.generate(config_versions),
       }
 
       $logger.debug 'Fetching configs from the cluster'
@@ -624,6 +632,11 @@ module Cfgsync
               parsed = JSON::parse(out)
               if 'ok' == parsed['status'] and cluster_name == parsed['cluster_name']
                 node_configs[node], _ = Cfgsync::sync_msg_to_configs(parsed)
+                node_configs[node].update(
+                  Cfgsync::unchanged_configs_from_sync_msg(
+                    parsed, configs_local
+                  )
+                )
               end
             rescue JSON::ParserError
             end
@@ -720,6 +733,22 @@ module Cfgsync
     return configs, unknown_config_names
   end
 
+  # Return local configs the sync message reports to be the same as local
+  # ones without sending their texts
+  def self.unchanged_configs_from_sync_msg(sync_msg, configs_local)
+    configs = {}
+    sync_msg['configs'].each { |name, data|
+      local_cfg = configs_local[name]
+      if (
+        local_cfg and 'file' == data['type'] and not data['text'] and
+        data['version'] == local_cfg.version and data['hash'] == local_cfg.hash
+      )
+        configs[name] = local_cfg
+      end
+    }
+    return configs
+  end
+
   def self.get_configs_local(with_missing=false)
     default = with_missing ? '' : nil
     configs = {}
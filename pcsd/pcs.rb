@@ -54,9 +54,12 @@ def add_fence_level(auth_user, level, devices, node, remove = false)
 end
 
 def add_node_attr(auth_user, node, key, value)
-  stdout, stderr, retval = run_cmd(
-    auth_user, PCS, "node", "attribute", node, key.to_s + '=' + value.to_s
-  )
+  cmd = ["node", "attribute", node, key.to_s + '=' + value.to_s]
+  if value.to_s == ""
+    # removing an attribute which does not exist is not an error here
+    cmd << "--force"
+  end
+  stdout, stderr, retval = run_cmd(auth_user, PCS, *cmd)
   return retval
 end
 
@@ -915,10 +918,48 @@ def is_cib_true(var)
   return ['true', 'on', 'yes', 'y', '1'].include?(var.downcase)
 end
 
+# Parsed known-hosts are kept in memory and the file is parsed again only when
+# it changes. The file may contain thousands of hosts and it is needed for
+# every request sent to other nodes.
+$known_hosts_cache = nil
+$known_hosts_cache_lock = Mutex.new
+# A file modified less than this many seconds before it was checked may change
+# again without its mtime changing, due to timestamp granularity.
+KNOWN_HOSTS_CACHE_RACY_SECONDS = 2
+
 def get_known_hosts()
-  return CfgKnownHosts.new(
-    Cfgsync::PcsdKnownHosts.from_file().text()
-  ).known_hosts
+  file_path = Cfgsync::PcsdKnownHosts.file_path
+  begin
+    stat = File.stat(file_path)
+    stat_key = [stat.ino, stat.size, stat.mtime.to_r]
+    stat_reliable = (Time.now - stat.mtime) > KNOWN_HOSTS_CACHE_RACY_SECONDS
+  rescue SystemCallError
+    stat_key = nil
+    stat_reliable = false
+  end
+  $known_hosts_cache_lock.synchronize {
+    cache = $known_hosts_cache
+    if (
+      stat_reliable and cache and cache[:path] == file_path and
+      cache[:stat_key] == stat_key
+    )
+      return cache[:known_hosts].dup
+    end
+    text = Cfgsync::PcsdKnownHosts.from_file().text()
+    digest = Digest::SHA1.hexdigest(text.to_s)
+    if cache and cache[:path] == file_path and cache[:digest] == digest
+      known_hosts = cache[:known_hosts]
+    else
+      known_hosts = CfgKnownHosts.new(text).known_hosts
+    end
+    $known_hosts_cache = {
+      :path => file_path,
+      :stat_key => stat_key,
+      :digest => digest,
+      :known_hosts => known_hosts,
+    }
+    return known_hosts.dup
+  }
 end
 
 def is_auth_against_nodes(auth_user, node_names, timeout=10)
@@ -1946,10 +1987,10 @@ def get_pcs_internal_output_format(status, status_msg=nil)
   }
 end
 
-def _pcs_internal_proxy(auth_user, data, cmd)
+def _pcs_internal_proxy(auth_user, data, cmd, options={})
   begin
     input_data = JSON.parse(data)
-    return run_pcs_internal(auth_user, cmd, input_data)
+    return run_pcs_internal(auth_user, cmd, input_data, nil, options)
   rescue JSON::ParserError => e
     $logger.error("Invalid input data format: #{e}")
     return get_pcs_internal_output_format(
@@ -1958,8 +1999,8 @@ def _pcs_internal_proxy(auth_user, data, cmd)
   end
 end
 
-def pcs_internal_proxy(auth_user, data, cmd)
-  return JSON.generate(_pcs_internal_proxy(auth_user, data, cmd))
+def pcs_internal_proxy(auth_user, data, cmd, options={})
+  return JSON.generate(_pcs_internal_proxy(auth_user, data, cmd, options))
 end
 
 def pcs_internal_proxy_old(auth_user, data, cmd)
@@ -1984,13 +2025,13 @@ def pcs_internal_proxy_old(auth_user, data, cmd)
   return JSON.generate(output)
 end
 
-def run_pcs_internal(auth_user, cmd, data, request_timeout=nil)
+def run_pcs_internal(auth_user, cmd, data, request_timeout=nil, options={})
   input_data = {
     :cmd => cmd,
     :cmd_data => data,
     :options => {
       :request_timeout => request_timeout,
-    },
+    }.merge(options),
   }
   stdout, stderr, return_val = run_cmd_options(
     auth_user,
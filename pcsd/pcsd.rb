@@ -80,8 +80,11 @@ configure do
   CAPABILITIES_PCSD = capabilities_pcsd.freeze
 end
 
+# Return the number of seconds to the next run and whether the run found
+# configs in sync with the cluster
 def run_cfgsync
   node_connected = true
+  unchanged = false
   if Cfgsync::ConfigSyncControl.sync_thread_allowed?()
     $logger.info('Config files sync started')
     begin
@@ -100,6 +103,7 @@ def run_cfgsync
         cfgs_to_save.each { |cfg_to_save|
           cfg_to_save.save()
         }
+        unchanged = (node_connected and cfgs_to_save.empty?)
         $logger.info('Config files sync finished')
       else
         $logger.info(
@@ -114,10 +118,11 @@ def run_cfgsync
     $logger.info('Config files sync is disabled or paused, skipping')
   end
   if node_connected
-    return Cfgsync::ConfigSyncControl.sync_thread_interval()
+    interval = Cfgsync::ConfigSyncControl.sync_thread_interval()
   else
-    return Cfgsync::ConfigSyncControl.sync_thread_interval_previous_not_connected()
+    interval = Cfgsync::ConfigSyncControl.sync_thread_interval_previous_not_connected()
   end
+  return interval, unchanged
 end
 
 helpers do
@@ -5,6 +5,7 @@ require 'set'
 require 'timeout'
 require 'rexml/document'
 require 'base64'
+require 'digest'
 require 'tempfile'
 
 require 'pcs.rb'
@@ -30,6 +31,7 @@ def remote(params, request, auth_user)
       :cluster_status_plaintext => method(:cluster_status_plaintext),
       :auth => method(:auth),
       :check_auth => method(:check_auth),
+      :check_permission => method(:check_permission),
       :cluster_setup => method(:cluster_setup),
       :get_quorum_info => method(:get_quorum_info),
       :get_cib => method(:get_cib),
@@ -82,9 +84,11 @@ def remote(params, request, auth_user)
       :booth_set_config => method(:booth_set_config),
       :booth_save_files => method(:booth_save_files),
       :booth_get_config => method(:booth_get_config),
+      :booth_get_status_all => method(:booth_get_status_all),
       :put_file => method(:put_file),
       :remove_file => method(:remove_file),
       :manage_services => method(:manage_services),
+      :run_batch => method(:run_batch),
       :check_host => method(:check_host),
       :reload_corosync_conf => method(:reload_corosync_conf),
       :remove_nodes_from_cib => method(:remove_nodes_from_cib),
@@ -340,9 +344,12 @@ end
 
 def config_restore(params, request, auth_user)
   if params[:name]
+    data = {:tarball => params[:tarball]}
+    if params[:tarball_sha256]
+      data[:tarball_sha256] = params[:tarball_sha256]
+    end
     code, response = send_request_with_token(
-      auth_user, params[:name], 'config_restore', true,
-      {:tarball => params[:tarball]}
+      auth_user, params[:name], 'config_restore', true, data
     )
   else
     if not allowed_for_local_cluster(auth_user, Permissions::FULL)
@@ -350,6 +357,13 @@ def config_restore(params, request, auth_user)
     end
     $logger.info "Restore node configuration"
     if params[:tarball] != nil and params[:tarball] != ""
+      if (
+        params[:tarball_sha256] and
+        Digest::SHA256.hexdigest(params[:tarball]) != params[:tarball_sha256]
+      )
+        $logger.info "Error: Tarball checksum mismatch"
+        return [400, "Error: Tarball checksum mismatch, the tarball is damaged"]
+      end
       out = ""
       errout = ""
       status = Open4::popen4(PCS, "config", "restore", "--local") { |pid, stdin, stdout, stderr|
@@ -580,11 +594,35 @@ def get_configs(params, request, auth_user)
     'cluster_name' => $cluster_name,
     'configs' => {},
   }
+  # The caller may send versions and hashes of configs it already has. Texts
+  # of configs which match them are not sent, only their version and hash.
+  known_versions = {}
+  if params[:config_versions]
+    begin
+      known_versions = JSON.parse(params[:config_versions])
+      known_versions = {} if not known_versions.is_a?(Hash)
+    rescue JSON::ParserError
+      known_versions = {}
+    end
+  end
   Cfgsync::get_configs_local.each { |name, cfg|
-    out['configs'][cfg.class.name] = {
-      'type' => 'file',
-      'text' => cfg.text,
-    }
+    cfg_name = cfg.class.name
+    known = known_versions[cfg_name]
+    if (
+      known.is_a?(Hash) and
+      known['version'] == cfg.version and known['hash'] == cfg.hash
+    )
+      out['configs'][cfg_name] = {
+        'type' => 'file',
+        'version' => cfg.version,
+        'hash' => cfg.hash,
+      }
+    else
+      out['configs'][cfg_name] = {
+        'type' => 'file',
+        'text' => cfg.text,
+      }
+    end
   }
   return JSON.generate(out)
 end
@@ -1205,6 +1243,21 @@ def check_auth(params, request, auth_user)
   return [200, '{"success":true}']
 end
 
+# Used by the python daemon for urls it serves itself while authentication and
+# permissions are still handled here
+def check_permission(params, request, auth_user)
+  if not Permissions::is_permission_type(params[:permission])
+    return 400, "Unknown permission '#{params[:permission]}'"
+  end
+  if not allowed_for_local_cluster(auth_user, params[:permission])
+    return 403, 'Permission denied'
+  end
+  return [200, JSON.generate({
+    :username => auth_user[:username],
+    :usergroups => auth_user[:usergroups] || [],
+  })]
+end
+
 # not used anymore, left here for backward compatability reasons
 def resource_status(params, request, auth_user)
   if not allowed_for_local_cluster(auth_user, Permissions::READ)
@@ -1537,8 +1590,7 @@ def add_node_attr_remote(params, request, auth_user)
   retval = add_node_attr(
     auth_user, params["node"], params["key"], params["value"]
   )
-  # retval = 2 if removing attr which doesn't exist
-  if retval == 0 or retval == 2
+  if retval == 0
     return [200, "Successfully added attribute to node"]
   else
     return [400, "Error adding attribute to node"]
@@ -2653,6 +2705,15 @@ def booth_save_files(params, request, auth_user)
   end
 end
 
+def booth_get_status_all(params, request, auth_user)
+  unless allowed_for_local_cluster(auth_user, Permissions::READ)
+    return 403, 'Permission denied'
+  end
+  # Status of remote hosts is not requested here, a host asked for its status
+  # must not spread the request further.
+  return pcs_internal_proxy(auth_user, "{}", "booth.get_status_all")
+end
+
 def booth_get_config(params, request, auth_user)
   unless allowed_for_local_cluster(auth_user, Permissions::READ)
     return 403, 'Permission denied'
@@ -2770,6 +2831,52 @@ def manage_services(params, request, auth_user)
   end
 end
 
+# Run several remote commands in one request to save network round trips.
+# The commands are run in the specified order. Running stops with the first
+# command which does not succeed, results of the commands run so far are
+# returned.
+def run_batch(params, request, auth_user)
+  begin
+    data = check_request_data_for_json(params, auth_user)
+    unless data.kind_of?(Hash) and data[:actions].kind_of?(Array)
+      raise PcsdRequestException.new("Missing required item 'actions'")
+    end
+    action_list = data[:actions].map { |action_data|
+      unless action_data.kind_of?(Hash) and action_data[:command]
+        raise PcsdRequestException.new("Missing required item 'command'")
+      end
+      command = action_data[:command].to_s
+      if command == 'run_batch'
+        raise PcsdRequestException.new('Batches cannot be nested')
+      end
+      # handlers access params by both strings and symbols
+      action_params = Sinatra::IndifferentHash[
+        (action_data[:params] || {}).map { |name, value|
+          [name.to_s, value.to_s]
+        }
+      ]
+      action_params[:command] = command
+      action_params
+    }
+  rescue PcsdRequestException => e
+    return e.code, e.message
+  end
+
+  result_list = []
+  action_list.each { |action_params|
+    # permissions are checked by each command on its own
+    result = remote(action_params, request, auth_user)
+    if result.kind_of?(Array)
+      status_code, output = result.first.to_i, result.last.to_s
+    else
+      status_code, output = 200, result.to_s
+    end
+    result_list << {'status_code' => status_code, 'output' => output}
+    break unless (200..299).include?(status_code)
+  }
+  return [200, JSON.generate({'results' => result_list})]
+end
+
 def _hash_to_argument_list(hash)
   result = []
   if hash.kind_of?(Hash)
@@ -2962,7 +3069,8 @@ def check_host(params, request, auth_user)
     :services => {},
     :cluster_configuration_exists => (
       File.exist?(Cfgsync::CorosyncConf.file_path) or File.exist?(CIB_PATH)
-    )
+    ),
+    :pcsd_capabilities => CAPABILITIES_PCSD,
   }
 
   service_checker = get_service_installed_checker
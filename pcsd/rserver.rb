@@ -40,8 +40,10 @@ class TornadoCommunicationMiddleware
       end
 
       if type == "sync_configs"
+        interval, unchanged = run_cfgsync()
         return pack_response({
-          :next => Time.now.to_i + run_cfgsync(),
+          :next => Time.now.to_i + interval,
+          :unchanged => unchanged,
           :logs => Thread.current[:pcsd_logger_container],
         })
       end